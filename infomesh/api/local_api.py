@@ -455,6 +455,14 @@ def create_admin_app(
         process_memory = runtime.get("process_memory_mb")
         if isinstance(process_memory, int | float):
             mc.set_gauge("process_memory_mb", float(process_memory))
+        from infomesh.resolver import shared_resolver
+
+        dns = shared_resolver().stats
+        mc.inc("dns_lookups_total", float(dns.lookups))
+        mc.inc("dns_queries_total", float(dns.queries))
+        mc.inc("dns_failures_total", float(dns.failures))
+        mc.set_gauge("dns_cache_hit_rate", round(dns.hit_rate, 4))
+        mc.set_gauge("dns_avg_query_ms", round(dns.avg_query_ms, 2))
         text = mc.format_prometheus()
         return JSONResponse(
             content={"metrics": text},
@@ -137,7 +137,18 @@ def index_import(
 
 @index_group.command("import-wet")
 @click.argument("path_or_url")
-def index_import_wet(path_or_url: str) -> None:
+@click.option(
+    "--workers", "-w", type=int, default=None, help="Parser processes (default: CPUs)"
+)
+@click.option(
+    "--lang",
+    "languages",
+    multiple=True,
+    help="Only import records in this language (repeatable, e.g. --lang en)",
+)
+def index_import_wet(
+    path_or_url: str, workers: int | None, languages: tuple[str, ...]
+) -> None:
     """Import documents from a Common Crawl WET file (local or URL)."""
 
     async def _do_import() -> None:
@@ -150,7 +161,9 @@ def index_import_wet(path_or_url: str) -> None:
             ctx.store, ctx.dedup, vector_store=ctx.vector_store
         )
         try:
-            stats = await importer.import_wet_file(path_or_url)
+            stats = await importer.import_wet_file(
+                path_or_url, workers=workers, languages=languages or None
+            )
         finally:
             ctx.close()
 
@@ -158,6 +171,8 @@ def index_import_wet(path_or_url: str) -> None:
         click.echo(f"  Total records:    {stats.total_records}")
         click.echo(f"  Skipped (dup):    {stats.skipped_duplicate}")
         click.echo(f"  Skipped (short):  {stats.skipped_too_short}")
+        if languages:
+            click.echo(f"  Skipped (lang):   {stats.skipped_language}")
         click.echo(f"  Skipped (error):  {stats.skipped_error}")
         click.echo(f"  Time: {stats.elapsed_ms:.0f}ms")
 
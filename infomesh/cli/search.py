@@ -68,22 +68,18 @@ def _format_local_search(
     config_vector = bool(getattr(index_config, "vector_search", False))
     if use_vector or config_vector:
         try:
-            from infomesh.index.vector_store import VectorStore
             from infomesh.search.query import search_hybrid
+            from infomesh.services import open_vector_backend
 
-            node_config = config.node
-            vec_store = VectorStore(
-                persist_dir=node_config.data_dir / "chroma",
-                model_name=index_config.embedding_model,
-            )
+            vec_store = open_vector_backend(config)
             try:
                 hybrid = search_hybrid(store, vec_store, query, limit=limit)  # type: ignore[arg-type]
                 return format_hybrid_results(hybrid)
             finally:
-                vec_store.close()
-        except ImportError:
+                vec_store.close()  # type: ignore[attr-defined]
+        except ImportError as exc:
             click.echo(
-                "Warning: chromadb not installed, falling back to keyword search.",
+                f"Warning: {exc} Falling back to keyword search.",
                 err=True,
             )
 
@@ -9,6 +9,7 @@ import signal
 import sys
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 import click
 import structlog
@@ -28,6 +29,9 @@ from infomesh.runtime import (
     write_runtime_status,
 )
 
+if TYPE_CHECKING:
+    from infomesh.crawler.robots import RobotsPeerStore
+
 logger = structlog.get_logger()
 
 _PID_FILE_NAME = "infomesh.pid"
@@ -365,7 +369,7 @@ def _run_foreground_crawl(config: Config, seed_category: str) -> None:
     # Try requested category first
     seed_urls = load_seeds(category=seed_category)
     if seed_urls and dedup is not None:
-        unseen_urls = [u for u in seed_urls if not dedup.is_url_seen(u)]
+        unseen_urls = dedup.filter_unseen(seed_urls)
 
     # If all seeds in requested category are seen, try others
     if not unseen_urls and dedup is not None:
@@ -373,7 +377,7 @@ def _run_foreground_crawl(config: Config, seed_category: str) -> None:
             if cat == seed_category:
                 continue
             cat_urls = load_seeds(category=cat)
-            cat_unseen = [u for u in cat_urls if not dedup.is_url_seen(u)]
+            cat_unseen = dedup.filter_unseen(cat_urls)
             if cat_unseen:
                 unseen_urls = cat_unseen
                 active_category = cat
@@ -697,9 +701,15 @@ def serve(seeds: str | None, role: str | None, no_crawl: bool) -> None:
 
         started_at = time.time()
 
-        async with AppContext(config) as ctx:
+        async with AppContext(config, persistent_frontier=True) as ctx:
             # Attach P2P components so MCP and search can use them
             ctx.distributed_index = _distributed_index
+            if (
+                p2p_node is not None
+                and ctx.robots is not None
+                and config.crawl.robots_peer_sharing
+            ):
+                ctx.robots.set_peers(cast("RobotsPeerStore", p2p_node))
             ctx.p2p_node = p2p_node
 
             republish_task: asyncio.Task[int] | None = None
@@ -74,6 +74,12 @@ class CrawlConfig:
     rss_default_interval: int = 900  # default poll interval (15 min)
     rss_max_feeds: int = 100  # max feeds to monitor simultaneously
     rss_discovery: bool = True  # auto-discover feeds from crawled pages
+    # Background conditional-GET recrawl of indexed pages
+    recrawl_enabled: bool = False  # opt-in: adds background traffic
+    recrawl_check_interval: int = 300  # seconds between recrawl cycles
+    recrawl_batch_size: int = 20  # documents recrawled per cycle
+    # Reuse robots.txt rules other nodes published to the DHT
+    robots_peer_sharing: bool = False  # opt-in: trusts peer-supplied rules
 
 
 @dataclass(frozen=True)
@@ -100,6 +106,11 @@ class IndexConfig:
     max_doc_size_kb: int = 100
     vector_search: bool = False
     embedding_model: str = "all-MiniLM-L6-v2"
+    vector_backend: str = "chroma"  # chroma | numpy (in-process, exact search)
+    vector_dtype: str = "float32"  # numpy backend storage: float32 | int8
+    embedding_batch_size: int = 32  # documents encoded per model call
+    embedding_batch_delay: float = 0.5  # max seconds a document waits for a batch
+    embedding_queue_size: int = 2048  # pending documents before backpressure
 
 
 @dataclass(frozen=True)
@@ -250,6 +261,9 @@ _VALUE_CONSTRAINTS: dict[str, tuple[float, float]] = {
     "download_limit_mbps": (0.1, 1000.0),
     "replication_factor": (1, 10),
     "max_doc_size_kb": (1, 10240),
+    "embedding_batch_size": (1, 1024),
+    "embedding_batch_delay": (0.0, 60.0),
+    "embedding_queue_size": (1, 1000000),
     "compression_level": (1, 22),
     "max_cache_size_mb": (10, 100000),
     "max_index_size_gb": (1, 10000),
@@ -270,6 +284,8 @@ _ALLOWED_VALUES: dict[str, frozenset[str]] = {
     "profile": frozenset({"minimal", "balanced", "contributor", "dedicated"}),
     "disk_io_priority": frozenset({"low", "normal", "high"}),
     "fts_tokenizer": frozenset({"unicode61", "ascii", "porter", "trigram"}),
+    "vector_backend": frozenset({"chroma", "numpy"}),
+    "vector_dtype": frozenset({"float32", "int8"}),
     "default_format": frozenset({"text", "json"}),
     "theme": frozenset(
         {
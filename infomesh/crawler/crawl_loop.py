@@ -6,7 +6,8 @@ and credit recording.  Indexing is delegated to
 ``services.index_document()``.
 
 Also manages RSS/Atom feed polling and priority recrawl queue
-for real-time content freshness (Issue #4).
+for real-time content freshness (Issue #4), and the background
+conditional-GET recrawl of already indexed pages.
 """
 
 from __future__ import annotations
@@ -27,6 +28,7 @@ from infomesh.resources.preflight import is_disk_critically_low
 if TYPE_CHECKING:
     from infomesh.crawler.feed_monitor import FeedMonitor
     from infomesh.crawler.freshness import PriorityRecrawlQueue
+    from infomesh.crawler.recrawl import RecrawlEngine
     from infomesh.services import AppContext
 
 logger = structlog.get_logger()
@@ -104,6 +106,48 @@ async def feed_poll_loop(
         await asyncio.sleep(5)
 
 
+# ── Adaptive recrawl loop ───────────────────────────────────────────────
+
+
+async def recrawl_loop(
+    ctx: AppContext,
+    engine: RecrawlEngine | None = None,
+) -> None:
+    """Periodically recrawl indexed pages whose adaptive interval elapsed.
+
+    Runs as a background task alongside the main crawl loop.  Requests
+    are conditional (ETag / If-Modified-Since), so unchanged pages cost
+    a 304 instead of a full fetch, parse and reindex.
+    """
+    _logger = structlog.get_logger()
+
+    if ctx.worker is None:
+        _logger.debug("recrawl_loop_disabled", reason="no crawler worker")
+        return
+
+    from infomesh.crawler.recrawl import RecrawlEngine
+
+    cfg = ctx.config.crawl
+    if engine is None:
+        engine = RecrawlEngine(
+            ctx.store,
+            vector_store=ctx.vector_store,
+            robots=ctx.robots if cfg.respect_robots else None,
+            max_batch=cfg.recrawl_batch_size,
+            scheduler=ctx.scheduler,
+            politeness_delay=cfg.politeness_delay,
+        )
+    _logger.info("recrawl_loop_started", interval=cfg.recrawl_check_interval)
+
+    while True:
+        await asyncio.sleep(cfg.recrawl_check_interval)
+        try:
+            client = await ctx.worker.get_http_client()
+            await engine.run_cycle(client)
+        except Exception:  # noqa: BLE001
+            _logger.exception("recrawl_cycle_error")
+
+
 # ── Priority recrawl processing ─────────────────────────────────────────
 
 
@@ -130,6 +174,7 @@ async def _process_priority_queue(
     batch_size = 5  # Process up to 5 priority items per cycle
 
     for _ in range(batch_size):
+        await _wait_for_embedding_capacity(ctx, _logger)
         item = queue.dequeue()
         if item is None:
             break
@@ -180,6 +225,24 @@ async def _process_priority_queue(
     return processed
 
 
+async def _wait_for_embedding_capacity(
+    ctx: AppContext,
+    _logger: structlog.stdlib.BoundLogger,
+) -> None:
+    """Pause crawling while the embedding queue is full.
+
+    Pages fetched faster than they can be embedded would otherwise be
+    dropped from the vector index.
+    """
+    from infomesh.index.embedding_queue import EmbeddingQueue
+
+    queue = ctx.vector_store
+    if not isinstance(queue, EmbeddingQueue) or await queue.wait_for_capacity(0):
+        return
+    _logger.info("embedding_backpressure", msg="Pausing crawl — embeddings behind")
+    await queue.wait_for_capacity()
+
+
 async def _apply_governor_backpressure(
     ctx: AppContext,
     _logger: structlog.stdlib.BoundLogger,
@@ -248,10 +311,8 @@ async def _reseed_queue(
                     resp = await client.get(url, timeout=30.0)
                     if resp.status_code < 400:
                         links = extract_links(resp.text, url)
-                        for link in links:
-                            if not ctx.dedup.is_url_seen(
-                                link
-                            ) and await ctx.scheduler.add_url(link, depth=1):
+                        for link in ctx.dedup.filter_unseen(links):
+                            if await ctx.scheduler.add_url(link, depth=1):
                                 added += 1
                 except (httpx.HTTPError, OSError):  # noqa: BLE001
                     _logger.debug("reseed_fetch_failed", url=url)
@@ -284,8 +345,17 @@ async def seed_and_crawl_loop(
         return
 
     # ── Phase 1: seed loading & rediscovery ────────────────
-    seed_urls = load_seeds(category=seed_category)
-    if seed_urls:
+    # A persistent frontier that still holds work resumes as-is instead
+    # of re-fetching every seed to rebuild the queue.
+    resumed = ctx.scheduler.pending_count
+    seed_urls = [] if resumed else load_seeds(category=seed_category)
+    if resumed:
+        _logger.info(
+            "frontier_resumed",
+            pending=resumed,
+            domains=ctx.scheduler.queued_domains,
+        )
+    elif seed_urls:
         queued = 0
         rediscovered = 0
         for url in seed_urls:
@@ -295,10 +365,8 @@ async def seed_and_crawl_loop(
                     resp = await client.get(url, timeout=30.0)
                     if resp.status_code < 400:
                         links = extract_links(resp.text, url)
-                        for link in links:
-                            if not ctx.dedup.is_url_seen(
-                                link
-                            ) and await ctx.scheduler.add_url(link, depth=1):
+                        for link in ctx.dedup.filter_unseen(links):
+                            if await ctx.scheduler.add_url(link, depth=1):
                                 rediscovered += 1
                 except (httpx.HTTPError, OSError):  # noqa: BLE001
                     _logger.debug("seed_rediscovery_failed", url=url)
@@ -328,6 +396,10 @@ async def seed_and_crawl_loop(
         feed_task = asyncio.create_task(feed_poll_loop(ctx))
         _logger.info("feed_poll_task_started")
 
+    recrawl_task: asyncio.Task[None] | None = None
+    if ctx.config.crawl.recrawl_enabled:
+        recrawl_task = asyncio.create_task(recrawl_loop(ctx))
+
     crawl_count = 0
     priority_count = 0
     disk_check_interval = 60
@@ -372,6 +444,8 @@ async def seed_and_crawl_loop(
                 except Exception:  # noqa: BLE001
                     _logger.exception("priority_queue_error")
 
+            await _wait_for_embedding_capacity(ctx, _logger)
+
             try:
                 url, depth = await asyncio.wait_for(
                     ctx.scheduler.get_url(),
@@ -494,8 +568,25 @@ async def seed_and_crawl_loop(
                     )
                 except Exception:  # noqa: BLE001
                     _logger.warning("fts5_optimize_error", exc_info=True)
+                # Checkpoint the URL-seen filter so restarts replay less
+                try:
+                    ctx.dedup.save_url_filter()
+                    _logger.info("url_filter_stats", **ctx.dedup.url_filter_stats())
+                except Exception:  # noqa: BLE001
+                    _logger.warning("url_filter_save_error", exc_info=True)
+                if ctx.robots is not None:
+                    try:
+                        expired = ctx.robots.cleanup_store()
+                        _logger.info(
+                            "robots_cache_stats",
+                            expired=expired,
+                            **ctx.robots.stats.to_dict(),
+                        )
+                    except Exception:  # noqa: BLE001
+                        _logger.warning("robots_cache_cleanup_error", exc_info=True)
     finally:
-        if feed_task is not None:
-            feed_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await feed_task
+        for task in (feed_task, recrawl_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
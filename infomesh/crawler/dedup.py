@@ -6,13 +6,24 @@ URL normalization + SHA-256 content hash + SimHash near-dedup.
 from __future__ import annotations
 
 import contextlib
+import functools
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import structlog
 
-from infomesh.crawler.simhash import SimHashIndex, simhash
+from infomesh.crawler.simhash import (
+    _HAS_NUMPY,
+    SimHashArrayIndex,
+    SimHashIndex,
+    simhash,
+)
 from infomesh.hashing import content_hash
+from infomesh.scalability import ScalableBloomFilter
 
 logger = structlog.get_logger()
 
@@ -34,6 +45,27 @@ def _to_unsigned64(val: int) -> int:
     return val & _MASK64
 
 
+# Rows fetched per batch when backfilling the SimHash array from SQLite
+_BACKFILL_BATCH = 50_000
+
+# URL-seen Bloom filter tier: first-stage capacity floor and target FP rate
+_URL_FILTER_MIN_CAPACITY = 100_000
+_URL_FILTER_FP_RATE = 0.001
+
+# Group commit: flush buffered seen_urls rows at this size or age
+_DEFAULT_BATCH_SIZE = 256
+_DEFAULT_BATCH_INTERVAL = 1.0  # seconds
+
+# Recent raw URL → URLKey entries kept to skip re-parsing and re-hashing
+_URL_KEY_CACHE_SIZE = 65_536
+
+
+def _url_doc_id(url_hash: str) -> int:
+    """Stable 31-bit pseudo doc_id derived from a URL hash."""
+    # hash() is non-deterministic across Python sessions (PYTHONHASHSEED).
+    return int(url_hash[:8], 16) & 0x7FFFFFFF
+
+
 # Common tracking parameters to strip
 _TRACKING_PARAMS = frozenset(
     {
@@ -89,6 +121,32 @@ def normalize_url(url: str) -> str:
     return urlunparse((scheme, netloc, path, parsed.params, sorted_query, ""))
 
 
+@dataclass(frozen=True)
+class URLKey:
+    """Normalized URL and its SHA-256 hash — the ``seen_urls`` primary key."""
+
+    normalized: str
+    url_hash: str
+
+
+@functools.lru_cache(maxsize=_URL_KEY_CACHE_SIZE)
+def url_key(url: str) -> URLKey:
+    """Normalize and hash *url* once, memoizing recent results.
+
+    Links repeat heavily within a page and across a site (navigation,
+    footers), so an LRU in front of :func:`normalize_url` + SHA-256 skips
+    most of that work.
+
+    Args:
+        url: Raw URL string.
+
+    Returns:
+        The :class:`URLKey` used by all dedup lookups and writes.
+    """
+    normalized = normalize_url(url)
+    return URLKey(normalized=normalized, url_hash=content_hash(normalized))
+
+
 class DeduplicatorDB:
     """URL and content hash based deduplication using SQLite.
 
@@ -96,9 +154,40 @@ class DeduplicatorDB:
       1. URL normalization (canonical form)
       2. SHA-256 exact content hash
       3. SimHash near-duplicate detection (Hamming distance ≤ 3)
+
+    When NumPy is installed, SimHash fingerprints are additionally kept in
+    a memory-mapped array next to the database (``<db>.simhash.fp`` /
+    ``<db>.simhash.ids``), so opening an existing database does not read
+    every ``seen_urls`` row back into Python.
+
+    ``is_url_seen`` is fronted by a scalable Bloom filter over URL hashes:
+    definite misses are answered in memory and only probable hits reach
+    SQLite.  The filter is saved to ``<db>.bloom`` together with the
+    highest ``seen_urls`` rowid it covers, so a restart only replays rows
+    inserted after the last save (or rebuilds it when the file is missing).
+
+    Writes are group-committed: ``mark_seen`` buffers rows and flushes
+    them in a single transaction once *batch_size* rows are pending or the
+    oldest is *batch_interval* seconds old, and on :meth:`flush`/
+    :meth:`close`.  The age limit is checked on every call and enforced
+    by a background timer armed with the first buffered row, so an idle
+    buffer is still committed.  Lookups consult the buffer, so callers
+    never observe the delay.  A crash loses at most the unflushed batch —
+    those URLs are simply crawled again — and never leaves a partial one.
+
+    Args:
+        db_path: SQLite path, or ``None`` for an in-memory database.
+        batch_size: Pending rows that trigger a group commit.
+        batch_interval: Max age in seconds of the oldest pending row.
     """
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        *,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        batch_interval: float = _DEFAULT_BATCH_INTERVAL,
+    ) -> None:
         import sqlite3
 
         resolved = db_path or ":memory:"
@@ -124,8 +213,38 @@ class DeduplicatorDB:
             "CREATE INDEX IF NOT EXISTS idx_content_hash ON seen_urls (content_hash)"
         )
         self._conn.commit()
-        self._simhash_index = SimHashIndex()
-        self._reload_simhash_index()
+        self._simhash_index: SimHashIndex | SimHashArrayIndex
+        if _HAS_NUMPY:
+            array_path = (
+                None
+                if resolved == ":memory:"
+                else Path(resolved).with_suffix(".simhash")
+            )
+            self._simhash_index = SimHashArrayIndex(array_path)
+            if array_path is not None and self._simhash_index.is_new:
+                self._backfill_simhash_array()
+        else:
+            self._simhash_index = SimHashIndex()
+            self._reload_simhash_index()
+
+        self._url_filter_path = (
+            None if resolved == ":memory:" else Path(resolved).with_suffix(".bloom")
+        )
+        self._url_lookups = 0
+        self._url_filter_negatives = 0
+        self._url_filter_false_positives = 0
+        self._url_filter = self._load_url_filter()
+
+        self._batch_size = max(1, batch_size)
+        self._batch_interval = batch_interval
+        # url_hash → row tuple for seen_urls, awaiting group commit
+        self._pending: dict[str, tuple[str, str, str, int | None, float]] = {}
+        self._pending_content: set[str] = set()
+        self._pending_since = 0.0
+        # Guards the buffer and connection against the commit timer thread
+        self._lock = threading.RLock()
+        self._commit_timer: threading.Timer | None = None
+        self._closed = False
 
     def _reload_simhash_index(self) -> None:
         """Reload SimHash fingerprints from SQLite into memory.
@@ -138,33 +257,190 @@ class DeduplicatorDB:
         ).fetchall()
         for url_hash_val, fp_signed in rows:
             fp = _to_unsigned64(fp_signed)
-            doc_id = int(url_hash_val[:8], 16) & 0x7FFFFFFF
-            self._simhash_index.add(doc_id, fp)
+            self._simhash_index.add(_url_doc_id(url_hash_val), fp)
         if rows:
-            import structlog
+            logger.info("simhash_index_reloaded", count=len(rows))
+
+    def _backfill_simhash_array(self) -> None:
+        """Populate a freshly created SimHash array from ``seen_urls``.
 
-            structlog.get_logger().info(
-                "simhash_index_reloaded",
-                count=len(rows),
+        Runs once, when upgrading a database created before the array
+        files existed; later startups only memory-map the files.
+        """
+        import numpy as np
+
+        assert isinstance(self._simhash_index, SimHashArrayIndex)
+        cursor = self._conn.execute(
+            "SELECT url_hash, simhash FROM seen_urls WHERE simhash IS NOT NULL"
+        )
+        total = 0
+        while rows := cursor.fetchmany(_BACKFILL_BATCH):
+            fps = np.array([fp for _, fp in rows], dtype=np.int64).view(np.uint64)
+            ids = np.array([_url_doc_id(h) for h, _ in rows], dtype=np.uint32)
+            self._simhash_index.add_many(ids, fps)
+            total += len(rows)
+        if total:
+            logger.info("simhash_array_backfilled", count=total)
+
+    def _max_rowid(self) -> int:
+        row = self._conn.execute("SELECT MAX(rowid) FROM seen_urls").fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
+
+    def _load_url_filter(self) -> ScalableBloomFilter:
+        """Load the persisted URL filter and replay rows added since its save.
+
+        Falls back to a full rebuild from ``seen_urls`` when the file is
+        missing or unreadable, or when its watermark is ahead of the
+        database (the database was replaced or restored from an older
+        copy, so the filter may hold URLs it no longer contains).
+        ``seen_urls`` rows are never deleted (only replaced under the same
+        key), so rowids above the saved watermark are exactly the URLs the
+        saved filter has not seen.
+        """
+        import msgpack  # type: ignore[import-untyped]
+
+        url_filter: ScalableBloomFilter | None = None
+        watermark = 0
+        path = self._url_filter_path
+        if path is not None and path.exists():
+            try:
+                envelope = msgpack.unpackb(path.read_bytes(), raw=False)
+                url_filter = ScalableBloomFilter.from_bytes(envelope["filter"])
+                watermark = int(envelope["watermark"])
+            except (ValueError, KeyError, TypeError, OSError) as exc:
+                logger.warning("url_filter_load_failed", path=str(path), error=str(exc))
+                url_filter = None
+                watermark = 0
+        if url_filter is not None and watermark > self._max_rowid():
+            logger.warning(
+                "url_filter_stale",
+                path=str(path),
+                watermark=watermark,
+                max_rowid=self._max_rowid(),
+            )
+            url_filter = None
+            watermark = 0
+
+        if url_filter is None:
+            url_filter = ScalableBloomFilter(
+                max(_URL_FILTER_MIN_CAPACITY, self._max_rowid() * 2),
+                _URL_FILTER_FP_RATE,
             )
 
+        cursor = self._conn.execute(
+            "SELECT url_hash FROM seen_urls WHERE rowid > ?", (watermark,)
+        )
+        replayed = 0
+        while rows := cursor.fetchmany(_BACKFILL_BATCH):
+            for (url_hash,) in rows:
+                url_filter.add(url_hash)
+            replayed += len(rows)
+        if replayed:
+            logger.info(
+                "url_filter_loaded",
+                replayed=replayed,
+                rebuilt=watermark == 0,
+                items=len(url_filter),
+            )
+        return url_filter
+
+    def save_url_filter(self) -> None:
+        """Persist the URL filter atomically (tmp file + rename).
+
+        Pending writes are committed first so the saved watermark never
+        covers rows that could still be rolled back.
+        """
+        import msgpack
+
+        if self._url_filter_path is None:
+            return
+        with self._lock:
+            self._commit_pending()
+            payload = msgpack.packb(
+                {
+                    "watermark": self._max_rowid(),
+                    "filter": self._url_filter.to_bytes(),
+                },
+                use_bin_type=True,
+            )
+        tmp_path = self._url_filter_path.with_suffix(".bloom.tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(self._url_filter_path)
+
+    def url_filter_stats(self) -> dict[str, float]:
+        """Return URL-filter effectiveness counters.
+
+        ``sqlite_lookups_saved`` counts lookups answered by the filter alone;
+        ``false_positive_rate`` is observed over lookups for unseen URLs.
+        """
+        negatives = self._url_filter_negatives
+        false_pos = self._url_filter_false_positives
+        unseen = negatives + false_pos
+        return {
+            "lookups": self._url_lookups,
+            "sqlite_lookups_saved": negatives,
+            "false_positives": false_pos,
+            "false_positive_rate": round(false_pos / unseen, 6) if unseen else 0.0,
+            "expected_false_positive_rate": round(
+                self._url_filter.estimated_fp_rate, 6
+            ),
+            "items": len(self._url_filter),
+            "stages": self._url_filter.num_stages,
+            "size_bytes": self._url_filter.size_bytes,
+        }
+
     def is_url_seen(self, url: str) -> bool:
         """Check if a normalized URL has been seen before."""
-        normalized = normalize_url(url)
-        url_hash = content_hash(normalized)
-        row = self._conn.execute(
-            "SELECT 1 FROM seen_urls WHERE url_hash = ?", (url_hash,)
-        ).fetchone()
+        return self.is_key_seen(url_key(url))
+
+    def is_key_seen(self, key: URLKey) -> bool:
+        """Check a pre-normalized :class:`URLKey` (see :func:`url_key`)."""
+        url_hash = key.url_hash
+        with self._lock:
+            self._maybe_flush()
+            self._url_lookups += 1
+            if url_hash not in self._url_filter:
+                self._url_filter_negatives += 1
+                return False
+            if url_hash in self._pending:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_urls WHERE url_hash = ?", (url_hash,)
+            ).fetchone()
+        if row is None:
+            self._url_filter_false_positives += 1
         return row is not None
 
+    def filter_unseen(self, urls: Iterable[str]) -> list[str]:
+        """Return the URLs in *urls* that have not been seen, in order.
+
+        URLs that normalize to the same key are reported once, so a page
+        linking the same target many times costs a single lookup.
+        """
+        unseen: list[str] = []
+        checked: set[str] = set()
+        for url in urls:
+            key = url_key(url)
+            if key.url_hash in checked:
+                continue
+            checked.add(key.url_hash)
+            if not self.is_key_seen(key):
+                unseen.append(url)
+        return unseen
+
     def is_content_seen(self, text_hash: str) -> bool:
         """Check if content with this hash has been seen before."""
-        row = self._conn.execute(
-            "SELECT 1 FROM seen_urls WHERE content_hash = ?", (text_hash,)
-        ).fetchone()
+        with self._lock:
+            if text_hash in self._pending_content:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_urls WHERE content_hash = ?", (text_hash,)
+            ).fetchone()
         return row is not None
 
-    def is_near_duplicate(self, text: str, *, threshold: int = 3) -> bool:
+    def is_near_duplicate(
+        self, text: str, *, threshold: int = 3, fingerprint: int | None = None
+    ) -> bool:
         """Check if text is a near-duplicate of any indexed document.
 
         Uses SimHash fingerprinting with Hamming distance comparison.
@@ -172,16 +448,23 @@ class DeduplicatorDB:
         Args:
             text: Document text to check.
             threshold: Max Hamming distance (default 3).
+            fingerprint: Pre-computed SimHash of *text*; skips rehashing.
 
         Returns:
             True if a near-duplicate exists.
         """
-        fp = simhash(text)
+        fp = fingerprint if fingerprint is not None else simhash(text)
         matches = self._simhash_index.find_near_duplicates(fp, threshold=threshold)
         return len(matches) > 0
 
     def mark_seen(
-        self, url: str, text_hash: str, text: str = "", *, commit: bool = True
+        self,
+        url: str,
+        text_hash: str,
+        text: str = "",
+        *,
+        commit: bool = True,
+        fingerprint: int | None = None,
     ) -> None:
         """Mark a URL and its content hash as seen.
 
@@ -191,43 +474,138 @@ class DeduplicatorDB:
             url: Page URL.
             text_hash: SHA-256 content hash.
             text: Optional extracted text for SimHash indexing.
-            commit: If ``False``, skip the SQLite commit (caller must
-                commit later). Useful for batch inserts.
+            commit: If ``False``, never group-commit as part of this call
+                (caller must :meth:`flush` later). Useful for batch inserts.
+            fingerprint: Pre-computed SimHash of *text*.  When given it is
+                stored as-is instead of being recomputed.
         """
-        import time
+        self.mark_key_seen(
+            url_key(url), text_hash, text, commit=commit, fingerprint=fingerprint
+        )
 
-        normalized = normalize_url(url)
-        url_hash = content_hash(normalized)
-        fp: int | None = None
-        if text:
+    def mark_key_seen(
+        self,
+        key: URLKey,
+        text_hash: str,
+        text: str = "",
+        *,
+        commit: bool = True,
+        fingerprint: int | None = None,
+    ) -> None:
+        """Buffer a ``seen_urls`` row for a pre-normalized :class:`URLKey`.
+
+        Same arguments as :meth:`mark_seen`, minus the URL parsing and
+        hashing.
+        """
+        fp: int | None = fingerprint
+        if fp is None and text:
             fp = simhash(text)
         # Convert unsigned 64-bit to signed for SQLite INTEGER storage
         fp_signed = _to_signed64(fp) if fp is not None else None
-        self._conn.execute(
-            "INSERT OR REPLACE INTO seen_urls"
-            " (url_hash, url, content_hash, simhash, crawled_at)"
-            " VALUES (?, ?, ?, ?, ?)",
-            (url_hash, normalized, text_hash, fp_signed, time.time()),
-        )
-        if commit:
-            self._conn.commit()
+        with self._lock:
+            if not self._pending:
+                self._pending_since = time.monotonic()
+                self._arm_commit_timer()
+            self._pending[key.url_hash] = (
+                key.url_hash,
+                key.normalized,
+                text_hash,
+                fp_signed,
+                time.time(),
+            )
+            self._pending_content.add(text_hash)
+            self._url_filter.add(key.url_hash)
 
-        # Add to in-memory SimHash index (use url_hash as pseudo doc_id)
-        if fp is not None:
-            # Use first 4 bytes of url_hash (hex) for a stable 31-bit doc_id.
-            # hash() is non-deterministic across Python sessions (PYTHONHASHSEED).
-            doc_id = int(url_hash[:8], 16) & 0x7FFFFFFF
-            self._simhash_index.add(doc_id, fp)
+            # Add to the SimHash index (use url_hash as pseudo doc_id)
+            if fp is not None:
+                self._simhash_index.add(_url_doc_id(key.url_hash), fp)
+
+            if commit:
+                self._maybe_flush()
 
     @property
-    def simhash_index(self) -> SimHashIndex:
-        """Access the in-memory SimHash index."""
+    def pending_writes(self) -> int:
+        """Number of buffered ``seen_urls`` rows not yet committed."""
+        return len(self._pending)
+
+    def _arm_commit_timer(self) -> None:
+        """Schedule a commit of the buffer once its oldest row expires."""
+        if self._commit_timer is not None or self._closed:
+            return
+        timer = threading.Timer(self._batch_interval, self._on_commit_timer)
+        timer.daemon = True
+        self._commit_timer = timer
+        timer.start()
+
+    def _on_commit_timer(self) -> None:
+        with self._lock:
+            self._commit_timer = None
+            if self._closed or not self._pending:
+                return
+            try:
+                self._commit_pending()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("dedup_timed_commit_failed", error=str(exc))
+
+    def _maybe_flush(self) -> None:
+        """Group-commit when the buffer is full or its oldest row is stale."""
+        if not self._pending:
+            return
+        if (
+            len(self._pending) >= self._batch_size
+            or time.monotonic() - self._pending_since >= self._batch_interval
+        ):
+            self._commit_pending()
+
+    def _commit_pending(self) -> None:
+        """Write all buffered rows in one transaction.
+
+        SimHash array appends are synced first, so every committed
+        ``seen_urls`` row has its fingerprint on disk: the array is only
+        backfilled when its files are missing, never after a crash.
+        """
+        with self._lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            if isinstance(self._simhash_index, SimHashArrayIndex):
+                self._simhash_index.sync()
+            if self._pending:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO seen_urls"
+                        " (url_hash, url, content_hash, simhash, crawled_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        list(self._pending.values()),
+                    )
+                self._pending.clear()
+                self._pending_content.clear()
+            else:
+                self._conn.commit()
+
+    @property
+    def simhash_index(self) -> SimHashIndex | SimHashArrayIndex:
+        """Access the SimHash near-duplicate index."""
         return self._simhash_index
 
     def flush(self) -> None:
         """Commit any pending database writes (for batch mode)."""
-        self._conn.commit()
+        with self._lock:
+            self._commit_pending()
+            if isinstance(self._simhash_index, SimHashArrayIndex):
+                self._simhash_index.flush()
 
     def close(self) -> None:
         """Close the database connection."""
+        with self._lock:
+            self._commit_pending()
+            self._closed = True
+        try:
+            self.save_url_filter()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("url_filter_save_failed", error=str(exc))
+        if self._url_filter_path is not None:
+            logger.info("url_filter_stats", **self.url_filter_stats())
+        if isinstance(self._simhash_index, SimHashArrayIndex):
+            self._simhash_index.close()
         self._conn.close()
@@ -0,0 +1,241 @@
+"""Crawl frontier storage — per-domain URL queues, in memory or on disk.
+
+The :class:`~infomesh.crawler.scheduler.Scheduler` decides *when* a
+domain may be crawled; a frontier decides *which* of that domain's URLs
+comes next and where pending URLs live.
+
+- :class:`MemoryFrontier` keeps everything in RAM and is lost on restart.
+- :class:`SQLiteFrontier` stores URLs on disk so pending work survives a
+  restart and the frontier can grow to millions of URLs without growing
+  the process.  Popped URLs are *leased* rather than deleted and only
+  removed by :meth:`SQLiteFrontier.complete`, so URLs that were in flight
+  when the process died are crawled again on the next start.
+
+Within a domain, URLs are served by descending priority, then FIFO.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import sqlite3
+import time
+from pathlib import Path
+from typing import Protocol
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Maximum URLs held by the in-memory frontier
+DEFAULT_MEMORY_FRONTIER_SIZE = 10_000
+
+
+class Frontier(Protocol):
+    """Storage interface used by the scheduler."""
+
+    def push(self, domain: str, url: str, depth: int, priority: int = 0) -> bool:
+        """Queue *url*; return False if it is already queued or full."""
+        ...
+
+    def pop(self, domain: str) -> tuple[str, int] | None:
+        """Return the next (url, depth) for *domain*, or None if empty."""
+        ...
+
+    def head_priority(self, domain: str) -> int | None:
+        """Priority of the URL :meth:`pop` would return next."""
+        ...
+
+    def complete(self, url: str) -> None:
+        """Forget a popped URL once it has been crawled."""
+        ...
+
+    def domain_counts(self) -> dict[str, int]:
+        """Queued URL count per domain (used to resume after restart)."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class MemoryFrontier:
+    """In-memory frontier: a priority heap per domain.
+
+    Args:
+        max_size: Maximum number of queued URLs across all domains.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MEMORY_FRONTIER_SIZE) -> None:
+        self._max_size = max_size
+        self._heaps: dict[str, list[tuple[int, int, str, int]]] = {}
+        self._urls: set[str] = set()
+        self._seq = itertools.count()
+
+    def push(self, domain: str, url: str, depth: int, priority: int = 0) -> bool:
+        if url in self._urls or len(self._urls) >= self._max_size:
+            return False
+        heap = self._heaps.setdefault(domain, [])
+        heapq.heappush(heap, (-priority, next(self._seq), url, depth))
+        self._urls.add(url)
+        return True
+
+    def pop(self, domain: str) -> tuple[str, int] | None:
+        heap = self._heaps.get(domain)
+        if not heap:
+            return None
+        _, _, url, depth = heapq.heappop(heap)
+        if not heap:
+            del self._heaps[domain]
+        self._urls.discard(url)
+        return url, depth
+
+    def head_priority(self, domain: str) -> int | None:
+        heap = self._heaps.get(domain)
+        return -heap[0][0] if heap else None
+
+    def complete(self, url: str) -> None:
+        """No-op: popped URLs are not retained in memory."""
+
+    def domain_counts(self) -> dict[str, int]:
+        return {domain: len(heap) for domain, heap in self._heaps.items()}
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def close(self) -> None:
+        self._heaps.clear()
+        self._urls.clear()
+
+
+class SQLiteFrontier:
+    """Disk-backed frontier that survives restarts.
+
+    Writes are group-committed: a transaction is committed after
+    *batch_size* changes or *batch_interval* seconds, whichever comes
+    first, and on :meth:`flush` / :meth:`close`.
+
+    Args:
+        db_path: Path to the SQLite database.
+        batch_size: Changes buffered before an automatic commit.
+        batch_interval: Maximum seconds between commits while dirty.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        batch_size: int = 256,
+        batch_interval: float = 1.0,
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+        self._batch_interval = batch_interval
+        self._dirty = 0
+        self._last_commit = time.monotonic()
+
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                id       INTEGER PRIMARY KEY AUTOINCREMENT,
+                url      TEXT NOT NULL UNIQUE,
+                domain   TEXT NOT NULL,
+                depth    INTEGER NOT NULL DEFAULT 0,
+                priority INTEGER NOT NULL DEFAULT 0,
+                leased   INTEGER NOT NULL DEFAULT 0,
+                added_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_frontier_next
+                ON frontier(domain, leased, priority DESC, id);
+        """)
+        # Leases held when the previous process stopped were never completed
+        released = self._conn.execute(
+            "UPDATE frontier SET leased = 0 WHERE leased = 1"
+        ).rowcount
+        self._conn.commit()
+        row = self._conn.execute("SELECT COUNT(*) FROM frontier").fetchone()
+        self._size = int(row[0])
+        if self._size or released:
+            logger.info(
+                "frontier_restored",
+                path=str(self._db_path),
+                queued=self._size,
+                released_leases=released,
+            )
+
+    def push(self, domain: str, url: str, depth: int, priority: int = 0) -> bool:
+        cur = self._conn.execute(
+            "INSERT OR IGNORE INTO frontier "
+            "(url, domain, depth, priority, added_at) VALUES (?, ?, ?, ?, ?)",
+            (url, domain, depth, priority, time.time()),
+        )
+        if cur.rowcount == 0:
+            return False
+        self._size += 1
+        self._touch()
+        return True
+
+    def pop(self, domain: str) -> tuple[str, int] | None:
+        row = self._conn.execute(
+            "SELECT id, url, depth FROM frontier "
+            "WHERE domain = ? AND leased = 0 "
+            "ORDER BY priority DESC, id LIMIT 1",
+            (domain,),
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute("UPDATE frontier SET leased = 1 WHERE id = ?", (row[0],))
+        self._size -= 1
+        self._touch()
+        return row[1], int(row[2])
+
+    def head_priority(self, domain: str) -> int | None:
+        row = self._conn.execute(
+            "SELECT priority FROM frontier "
+            "WHERE domain = ? AND leased = 0 "
+            "ORDER BY priority DESC, id LIMIT 1",
+            (domain,),
+        ).fetchone()
+        return int(row[0]) if row else None
+
+    def complete(self, url: str) -> None:
+        cur = self._conn.execute(
+            "DELETE FROM frontier WHERE url = ? AND leased = 1", (url,)
+        )
+        if cur.rowcount:
+            self._touch()
+
+    def domain_counts(self) -> dict[str, int]:
+        rows = self._conn.execute(
+            "SELECT domain, COUNT(*) FROM frontier WHERE leased = 0 GROUP BY domain"
+        ).fetchall()
+        return {str(domain): int(count) for domain, count in rows}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def flush(self) -> None:
+        """Commit buffered changes."""
+        if self._dirty:
+            self._conn.commit()
+            self._dirty = 0
+        self._last_commit = time.monotonic()
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def _touch(self) -> None:
+        self._dirty += 1
+        if (
+            self._dirty >= self._batch_size
+            or time.monotonic() - self._last_commit >= self._batch_interval
+        ):
+            self.flush()
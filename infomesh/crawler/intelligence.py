@@ -8,9 +8,14 @@ Features:
 
 from __future__ import annotations
 
+import json
+import math
 import re
+import sqlite3
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 
 import structlog
 
@@ -20,6 +25,25 @@ logger = structlog.get_logger()
 # ── #9: Robots.txt Cache ───────────────────────────────────────────
 
 
+# Raw robots.txt larger than this is cached in memory only (not persisted
+# or shared), keeping the on-disk cache and DHT records small.
+MAX_SHARED_ROBOTS_BYTES = 64 * 1024
+
+# Bounds on peer-supplied robots records; records outside them are skipped
+_MAX_SHARED_DOMAIN_LEN = 253
+_MAX_SHARED_CRAWL_DELAY = 3600.0
+_MAX_SHARED_SITEMAPS = 50
+_MAX_SHARED_SITEMAP_LEN = 2048
+
+
+def _shared_number(value: object) -> float | None:
+    """Return *value* as a finite float, or None (bools are rejected)."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    number = float(value)
+    return number if math.isfinite(number) else None
+
+
 @dataclass
 class RobotsCacheEntry:
     """Cached robots.txt parse result for a domain."""
@@ -30,22 +54,63 @@ class RobotsCacheEntry:
     sitemaps: list[str]
     cached_at: float
     expires_at: float
+    # Raw robots.txt body, so rules can be re-evaluated per URL.
+    # Empty means "no robots.txt" (everything allowed).
+    robots_txt: str = ""
 
 
 class RobotsCache:
-    """In-memory robots.txt result cache (shareable via DHT).
+    """robots.txt result cache, optionally persisted and shareable via DHT.
 
     Caches parsed robots.txt results to avoid re-fetching for
-    the same domain across crawl sessions.
+    the same domain across crawl sessions.  With *db_path*, entries are
+    written through to SQLite and survive restarts; expired rows are
+    ignored on read and removed by :meth:`cleanup`.
+
+    Args:
+        ttl_seconds: Lifetime of locally fetched entries.
+        db_path: Optional SQLite file for persistence.
+        max_entries: In-memory LRU bound (the database is unbounded).
     """
 
-    def __init__(self, ttl_seconds: float = 86400) -> None:
-        self._cache: dict[str, RobotsCacheEntry] = {}
+    def __init__(
+        self,
+        ttl_seconds: float = 86400,
+        *,
+        db_path: str | Path | None = None,
+        max_entries: int = 10_000,
+    ) -> None:
+        self._cache: OrderedDict[str, RobotsCacheEntry] = OrderedDict()
         self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._conn: sqlite3.Connection | None = None
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS robots_cache (
+                    domain      TEXT PRIMARY KEY,
+                    allowed     INTEGER NOT NULL,
+                    crawl_delay REAL NOT NULL DEFAULT 0,
+                    sitemaps    TEXT NOT NULL DEFAULT '[]',
+                    robots_txt  TEXT NOT NULL DEFAULT '',
+                    cached_at   REAL NOT NULL,
+                    expires_at  REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
 
     def get(self, domain: str) -> RobotsCacheEntry | None:
+        now = time.time()
         entry = self._cache.get(domain)
-        if entry and time.time() < entry.expires_at:
+        if entry is None and self._conn is not None:
+            entry = self._load(domain)
+            if entry is not None:
+                self._remember(entry)
+        if entry and now < entry.expires_at:
+            self._cache.move_to_end(domain)
             return entry
         if entry:
             del self._cache[domain]
@@ -57,6 +122,9 @@ class RobotsCache:
         allowed: bool,
         crawl_delay: float = 0.0,
         sitemaps: list[str] | None = None,
+        *,
+        robots_txt: str = "",
+        ttl: float | None = None,
     ) -> RobotsCacheEntry:
         now = time.time()
         entry = RobotsCacheEntry(
@@ -65,41 +133,97 @@ class RobotsCache:
             crawl_delay=crawl_delay,
             sitemaps=sitemaps or [],
             cached_at=now,
-            expires_at=now + self._ttl,
+            expires_at=now + (self._ttl if ttl is None else ttl),
+            robots_txt=robots_txt,
         )
-        self._cache[domain] = entry
+        self._remember(entry)
+        self._store(entry)
         return entry
 
     def export_for_dht(self) -> list[dict[str, object]]:
         """Export cache entries for DHT sharing."""
         now = time.time()
         return [
-            {
-                "domain": e.domain,
-                "allowed": e.allowed,
-                "crawl_delay": e.crawl_delay,
-                "sitemaps": e.sitemaps,
-                "cached_at": e.cached_at,
-            }
-            for e in self._cache.values()
-            if now < e.expires_at
+            self.export_entry(e) for e in self._cache.values() if now < e.expires_at
         ]
 
-    def import_from_dht(self, entries: list[dict[str, object]]) -> int:
-        """Import cache entries from DHT peer."""
+    @staticmethod
+    def export_entry(entry: RobotsCacheEntry) -> dict[str, object]:
+        """Serialize one entry for a DHT record."""
+        return {
+            "domain": entry.domain,
+            "allowed": entry.allowed,
+            "crawl_delay": entry.crawl_delay,
+            "sitemaps": entry.sitemaps,
+            "robots_txt": entry.robots_txt,
+            "cached_at": entry.cached_at,
+            "expires_at": entry.expires_at,
+        }
+
+    def import_from_dht(
+        self,
+        entries: list[dict[str, object]],
+        *,
+        max_ttl: float | None = None,
+    ) -> int:
+        """Import cache entries from DHT peer.
+
+        Entries keep the publisher's expiry, capped at *max_ttl* seconds
+        from now (defaults to this cache's TTL) so peer-supplied rules
+        are re-checked against the origin reasonably soon.  Records with
+        a missing, mistyped or out-of-range field are skipped.
+        """
+        now = time.time()
+        limit = self._ttl if max_ttl is None else max_ttl
         imported = 0
         for entry in entries:
-            domain = str(entry.get("domain", ""))
-            if domain and domain not in self._cache:
-                cd_raw = entry.get("crawl_delay", 0)
-                sm_raw = entry.get("sitemaps", [])
-                self.put(
-                    domain,
-                    bool(entry.get("allowed", True)),
-                    float(cd_raw) if isinstance(cd_raw, (int, float, str)) else 0.0,
-                    list(sm_raw) if isinstance(sm_raw, list) else [],
+            if not isinstance(entry, dict):
+                continue
+            domain = entry.get("domain")
+            if (
+                not isinstance(domain, str)
+                or not domain
+                or len(domain) > _MAX_SHARED_DOMAIN_LEN
+                or self.get(domain) is not None
+            ):
+                continue
+            allowed = entry.get("allowed", True)
+            robots_txt = entry.get("robots_txt", "")
+            if (
+                not isinstance(allowed, bool)
+                or not isinstance(robots_txt, str)
+                or len(robots_txt) > MAX_SHARED_ROBOTS_BYTES
+            ):
+                continue
+            crawl_delay = _shared_number(entry.get("crawl_delay", 0.0))
+            if crawl_delay is None or not 0 <= crawl_delay <= _MAX_SHARED_CRAWL_DELAY:
+                continue
+            sitemaps = entry.get("sitemaps", [])
+            if (
+                not isinstance(sitemaps, list)
+                or len(sitemaps) > _MAX_SHARED_SITEMAPS
+                or not all(
+                    isinstance(u, str) and len(u) <= _MAX_SHARED_SITEMAP_LEN
+                    for u in sitemaps
                 )
-                imported += 1
+            ):
+                continue
+            exp_raw = entry.get("expires_at")
+            expires_at = now + limit if exp_raw is None else _shared_number(exp_raw)
+            if expires_at is None:
+                continue
+            ttl = min(expires_at - now, limit)
+            if ttl <= 0:
+                continue
+            self.put(
+                domain,
+                allowed,
+                crawl_delay,
+                list(sitemaps),
+                robots_txt=robots_txt,
+                ttl=ttl,
+            )
+            imported += 1
         return imported
 
     @property
@@ -111,8 +235,71 @@ class RobotsCache:
         expired = [k for k, v in self._cache.items() if now >= v.expires_at]
         for k in expired:
             del self._cache[k]
+        if self._conn is not None:
+            cur = self._conn.execute(
+                "DELETE FROM robots_cache WHERE expires_at <= ?", (now,)
+            )
+            self._conn.commit()
+            return max(len(expired), cur.rowcount)
         return len(expired)
 
+    def close(self) -> None:
+        """Close the backing database, if any."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _remember(self, entry: RobotsCacheEntry) -> None:
+        self._cache[entry.domain] = entry
+        self._cache.move_to_end(entry.domain)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    def _store(self, entry: RobotsCacheEntry) -> None:
+        if self._conn is None or len(entry.robots_txt) > MAX_SHARED_ROBOTS_BYTES:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO robots_cache "
+                "(domain, allowed, crawl_delay, sitemaps, robots_txt,"
+                " cached_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.domain,
+                    int(entry.allowed),
+                    entry.crawl_delay,
+                    json.dumps(entry.sitemaps),
+                    entry.robots_txt,
+                    entry.cached_at,
+                    entry.expires_at,
+                ),
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            logger.warning("robots_cache_store_failed", domain=entry.domain)
+
+    def _load(self, domain: str) -> RobotsCacheEntry | None:
+        assert self._conn is not None
+        row = self._conn.execute(
+            "SELECT allowed, crawl_delay, sitemaps, robots_txt, cached_at,"
+            " expires_at FROM robots_cache WHERE domain = ?",
+            (domain,),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            sitemaps = [str(u) for u in json.loads(row[2])]
+        except (ValueError, TypeError):
+            sitemaps = []
+        return RobotsCacheEntry(
+            domain=domain,
+            allowed=bool(row[0]),
+            crawl_delay=float(row[1]),
+            sitemaps=sitemaps,
+            cached_at=float(row[4]),
+            expires_at=float(row[5]),
+            robots_txt=str(row[3]),
+        )
+
 
 # ── #13: Crawl Speed Auto-Tuning ──────────────────────────────────
 
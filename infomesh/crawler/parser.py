@@ -24,6 +24,9 @@ class ParsedPage:
     raw_html_hash: str  # SHA-256 of raw HTML
     text_hash: str  # SHA-256 of extracted text
     image_alt_texts: list[str] = ()  # type: ignore[assignment]
+    # HTTP validators from the fetch, stored for conditional recrawl
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 # Pattern for <img> alt attributes
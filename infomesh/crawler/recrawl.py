@@ -6,21 +6,34 @@ Learns per-URL change frequency and schedules re-crawls accordingly:
 - Deleted pages → progressive penalty then soft-delete.
 
 Uses HTTP conditional requests (ETag / If-Modified-Since) to save bandwidth.
+:class:`RecrawlEngine` ties this together for the background crawl loop:
+it picks due documents from the local store, recrawls them and writes
+the results (validators, learned change rate, new text) back.
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 import httpx
 import structlog
 
 from infomesh.crawler import MAX_RESPONSE_BYTES, create_ssl_context
+from infomesh.crawler.scheduler import Scheduler
 from infomesh.hashing import content_hash
 from infomesh.security import SSRFError, validate_url
 
+if TYPE_CHECKING:
+    from infomesh.crawler.parser import ParsedPage
+    from infomesh.crawler.robots import RobotsChecker
+    from infomesh.index.local_store import LocalStore
+    from infomesh.types import VectorStoreLike
+
 logger = structlog.get_logger()
 
 # ── Recrawl interval tiers ──────────────────────────────────────────────
@@ -62,6 +75,8 @@ class RecrawlOutcome:
     new_last_modified: str | None = None
     stale_count: int = 0
     elapsed_ms: float = 0.0
+    http_status: int = 0  # 0 when no response was received
+    bytes_received: int = 0
 
 
 # ── Interval computation ────────────────────────────────────────────────
@@ -206,25 +221,30 @@ async def _do_recrawl(
 
     elapsed = (time.monotonic() - start) * 1000
 
+    status_code = resp.status_code
+    received = len(resp.content)
+
     # 304 Not Modified — bandwidth saved, just refresh timestamp
-    if resp.status_code == 304:
+    if status_code == 304:
         logger.debug("recrawl_not_modified", url=url)
         return RecrawlOutcome(
             url=url,
             status="not_modified",
-            new_etag=etag,
-            new_last_modified=last_modified,
+            new_etag=resp.headers.get("etag") or etag,
+            new_last_modified=resp.headers.get("last-modified") or last_modified,
             stale_count=0,
             elapsed_ms=elapsed,
+            http_status=status_code,
+            bytes_received=received,
         )
 
     # 4xx / 5xx — page might be deleted or temporarily down
-    if resp.status_code >= 400:
+    if status_code >= 400:
         new_stale = stale_count + 1
         logger.info(
             "recrawl_error_status",
             url=url,
-            status=resp.status_code,
+            status=status_code,
             stale_count=new_stale,
         )
         status = "deleted" if new_stale >= STALE_THRESHOLD else "error"
@@ -233,6 +253,8 @@ async def _do_recrawl(
             status=status,
             stale_count=new_stale,
             elapsed_ms=elapsed,
+            http_status=status_code,
+            bytes_received=received,
         )
 
     # 2xx — content fetched
@@ -245,6 +267,8 @@ async def _do_recrawl(
             status="error",
             stale_count=stale_count,
             elapsed_ms=elapsed,
+            http_status=status_code,
+            bytes_received=received,
         )
     new_etag = resp.headers.get("etag")
     new_last_modified = resp.headers.get("last-modified")
@@ -258,6 +282,8 @@ async def _do_recrawl(
             status="error",
             stale_count=stale_count,
             elapsed_ms=elapsed,
+            http_status=status_code,
+            bytes_received=received,
         )
 
     new_hash = content_hash(text)
@@ -272,6 +298,8 @@ async def _do_recrawl(
             new_last_modified=new_last_modified,
             stale_count=0,
             elapsed_ms=elapsed,
+            http_status=status_code,
+            bytes_received=received,
         )
 
     logger.info(
@@ -285,6 +313,8 @@ async def _do_recrawl(
         new_last_modified=new_last_modified,
         stale_count=0,
         elapsed_ms=elapsed,
+        http_status=status_code,
+        bytes_received=received,
     )
 
 
@@ -323,3 +353,263 @@ def select_candidates(
     # Sort by most overdue first
     overdue.sort(key=lambda x: x[0], reverse=True)
     return [doc for _, doc in overdue[:max_batch]]
+
+
+# ── Background recrawl engine ───────────────────────────────────────────
+
+
+@dataclass
+class RecrawlStats:
+    """Counters for how much conditional recrawling saves.
+
+    ``bytes_saved`` credits each 304 with the mean size of the full
+    (200) recrawl responses seen so far, since the skipped body size is
+    unknown by definition.
+    """
+
+    attempts: int = 0
+    not_modified_304: int = 0
+    unchanged: int = 0  # 200 with identical text
+    updated: int = 0
+    deleted: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    bytes_saved: float = 0.0
+    full_responses: int = 0
+    full_response_bytes: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def not_modified_rate(self) -> float:
+        """Fraction of recrawls answered with ``304 Not Modified``."""
+        if self.attempts == 0:
+            return 0.0
+        return self.not_modified_304 / self.attempts
+
+    def bytes_saved_per_hour(self, now: float | None = None) -> float:
+        """Estimated bytes saved per hour since the stats were created."""
+        elapsed = (now if now is not None else time.monotonic()) - self.started_at
+        return self.bytes_saved / max(elapsed / 3600.0, 1 / 60)
+
+    def record(self, outcome: RecrawlOutcome) -> None:
+        """Account for one recrawl outcome."""
+        self.attempts += 1
+        self.bytes_received += outcome.bytes_received
+        if outcome.http_status == 304:
+            self.not_modified_304 += 1
+            if self.full_responses:
+                self.bytes_saved += self.full_response_bytes / self.full_responses
+        elif 200 <= outcome.http_status < 300:
+            self.full_responses += 1
+            self.full_response_bytes += outcome.bytes_received
+        if outcome.status == "updated":
+            self.updated += 1
+        elif outcome.status == "deleted":
+            self.deleted += 1
+        elif outcome.status == "error":
+            self.errors += 1
+        elif outcome.http_status != 304:
+            self.unchanged += 1
+
+    def to_dict(self) -> dict[str, float]:
+        """Flatten counters for logging / metrics export."""
+        return {
+            "attempts": self.attempts,
+            "not_modified_304": self.not_modified_304,
+            "unchanged": self.unchanged,
+            "updated": self.updated,
+            "deleted": self.deleted,
+            "errors": self.errors,
+            "not_modified_rate": round(self.not_modified_rate, 4),
+            "bytes_received": self.bytes_received,
+            "bytes_saved": round(self.bytes_saved),
+            "bytes_saved_per_hour": round(self.bytes_saved_per_hour()),
+        }
+
+
+class RecrawlEngine:
+    """Recrawl due documents from a :class:`LocalStore` with conditional GETs.
+
+    Each :meth:`run_cycle` selects documents whose adaptive interval has
+    elapsed, fetches them (one request at a time per domain, spaced by the
+    scheduler's politeness delay), and applies the outcome: unchanged
+    pages only get their timestamps and learned change rate refreshed,
+    changed pages are re-extracted and reindexed, and pages that keep
+    failing are soft-deleted (together with their vector entry).
+
+    Args:
+        store: Local index holding recrawl metadata.
+        vector_store: Optional vector store re-embedded on updates.
+        robots: Optional robots.txt checker; disallowed URLs are skipped.
+        max_batch: Maximum documents recrawled per cycle.
+        concurrency: Maximum concurrent requests (across domains).
+        scheduler: Crawl scheduler whose per-domain delays recrawls share.
+            Defaults to a private scheduler with *politeness_delay*.
+        politeness_delay: Per-domain delay in seconds when no *scheduler*
+            is given.
+    """
+
+    def __init__(
+        self,
+        store: LocalStore,
+        *,
+        vector_store: VectorStoreLike | None = None,
+        robots: RobotsChecker | None = None,
+        max_batch: int = 20,
+        concurrency: int = 4,
+        scheduler: Scheduler | None = None,
+        politeness_delay: float = 1.0,
+    ) -> None:
+        self._store = store
+        self._vector_store = vector_store
+        self._robots = robots
+        self._max_batch = max_batch
+        self._concurrency = concurrency
+        self._scheduler = scheduler or Scheduler(
+            politeness_delay=politeness_delay, urls_per_hour=0
+        )
+        self._stats = RecrawlStats()
+
+    @property
+    def stats(self) -> RecrawlStats:
+        return self._stats
+
+    async def run_cycle(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        now: float | None = None,
+    ) -> list[RecrawlOutcome]:
+        """Recrawl one batch of due documents.
+
+        Args:
+            client: HTTP client (should be the crawl worker's SSRF-pinned
+                client).
+            now: Current Unix timestamp (defaults to ``time.time()``).
+
+        Returns:
+            Outcomes of the recrawls performed.
+        """
+        now = now if now is not None else time.time()
+        rows = self._store.get_recrawl_candidates(limit=self._max_batch, due_before=now)
+        candidates = select_candidates(
+            [RecrawlCandidate(**row) for row in rows],  # type: ignore[arg-type]
+            now=now,
+            max_batch=self._max_batch,
+        )
+        if not candidates:
+            return []
+
+        by_domain: dict[str, list[RecrawlCandidate]] = {}
+        for cand in candidates:
+            by_domain.setdefault(urlparse(cand.url).netloc, []).append(cand)
+
+        sem = asyncio.Semaphore(self._concurrency)
+        outcomes: list[RecrawlOutcome] = []
+
+        async def _domain_worker(group: list[RecrawlCandidate]) -> None:
+            for cand in group:
+                await self._scheduler.wait_for_domain(cand.url)
+                async with sem:
+                    outcome = await self._recrawl_one(client, cand, now)
+                if outcome is not None:
+                    outcomes.append(outcome)
+
+        await asyncio.gather(*(_domain_worker(g) for g in by_domain.values()))
+
+        logger.info(
+            "recrawl_cycle",
+            recrawled=len(outcomes),
+            **self._stats.to_dict(),
+        )
+        return outcomes
+
+    async def _recrawl_one(
+        self,
+        client: httpx.AsyncClient,
+        cand: RecrawlCandidate,
+        now: float,
+    ) -> RecrawlOutcome | None:
+        if self._robots is not None and not await self._robots.is_allowed(
+            client, cand.url
+        ):
+            logger.info("recrawl_blocked_robots", url=cand.url)
+            return None
+
+        parsed: list[ParsedPage] = []
+
+        def _extract(html: str, url: str) -> str | None:
+            from infomesh.crawler.parser import extract_content
+
+            page = extract_content(html, url, raw_hash=content_hash(html))
+            if page is None:
+                return None
+            parsed.append(page)
+            return page.text
+
+        outcome = await recrawl_url(
+            cand.url,
+            cand.etag,
+            cand.last_modified,
+            cand.text_hash,
+            cand.stale_count,
+            client=client,
+            extract_fn=_extract,
+        )
+        self._stats.record(outcome)
+        try:
+            self._apply(cand, outcome, parsed[0] if parsed else None, now)
+        except Exception:  # noqa: BLE001
+            logger.exception("recrawl_apply_failed", url=cand.url)
+        return outcome
+
+    def _apply(
+        self,
+        cand: RecrawlCandidate,
+        outcome: RecrawlOutcome,
+        page: ParsedPage | None,
+        now: float,
+    ) -> None:
+        """Write one outcome back to the store."""
+        if outcome.status == "deleted":
+            self._store.soft_delete(cand.url)
+            if self._vector_store is not None:
+                self._vector_store.delete_document(cand.doc_id)
+            return
+        if outcome.status == "error":
+            # Back off for a full interval instead of retrying every cycle
+            self._store.update_document(
+                cand.url, stale_count=outcome.stale_count, last_recrawl_at=now
+            )
+            return
+
+        changed = outcome.status == "updated" and page is not None
+        freq = update_change_frequency(cand.change_frequency, changed)
+        common: dict[str, object] = {
+            "etag": outcome.new_etag,
+            "last_modified": outcome.new_last_modified,
+            "recrawl_interval": compute_recrawl_interval(freq),
+            "stale_count": 0,
+            "last_recrawl_at": now,
+            "change_frequency": freq,
+        }
+        if not changed or page is None:
+            self._store.update_document(cand.url, **common)  # type: ignore[arg-type]
+            return
+
+        self._store.update_document(
+            cand.url,
+            title=page.title,
+            text=page.text,
+            text_hash=page.text_hash,
+            raw_html_hash=page.raw_html_hash,
+            **common,  # type: ignore[arg-type]
+        )
+        if self._vector_store is not None:
+            self._vector_store.add_document(
+                doc_id=cand.doc_id,
+                url=cand.url,
+                title=page.title,
+                text=page.text,
+                language=page.language,
+            )
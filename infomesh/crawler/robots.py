@@ -2,6 +2,9 @@
 
 Features:
 - Per-domain caching with configurable TTL
+- Optional persistent cache (``RobotsCache``) so restarts skip re-fetching
+- Optional peer sharing via the DHT, so a cold node can reuse rules another
+  node already fetched (raced against the origin fetch, never awaited first)
 - Crawl-delay: extracts and applies per-domain crawl delay from robots.txt
 - Sitemap discovery: extracts Sitemap URLs from robots.txt
 """
@@ -11,14 +14,40 @@ from __future__ import annotations
 import asyncio
 import re
 import time
+from dataclasses import dataclass
+from typing import Any, Protocol
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import httpx
 import structlog
 
+from infomesh.crawler.intelligence import (
+    MAX_SHARED_ROBOTS_BYTES,
+    RobotsCache,
+    RobotsCacheEntry,
+)
+
 logger = structlog.get_logger()
 
+# Peer-supplied rules are trusted for at most this long before the origin's
+# robots.txt is fetched again (strict opt-out: a stale or bogus record from
+# a peer cannot suppress a site's current rules for long).
+PEER_ROBOTS_MAX_TTL = 600.0
+
+# Lifetime of robots.txt results fetched from the origin, in memory and in
+# the persistent store
+ROBOTS_CACHE_TTL = 3600
+
+
+class RobotsPeerStore(Protocol):
+    """Peer exchange for robots.txt records (e.g. :class:`~infomesh.p2p.node.Node`)."""
+
+    async def get_robots(self, domain: str) -> dict[str, Any] | None: ...
+
+    async def publish_robots(self, domain: str, record: dict[str, Any]) -> bool: ...
+
+
 # Regex to extract Sitemap URLs from robots.txt
 _SITEMAP_RE = re.compile(r"^Sitemap:\s*(\S+)", re.IGNORECASE | re.MULTILINE)
 
@@ -29,23 +58,93 @@ _CRAWL_DELAY_RE = re.compile(
 )
 
 
+@dataclass
+class RobotsStats:
+    """Where robots.txt lookups were answered from."""
+
+    lookups: int = 0
+    memory_hits: int = 0
+    store_hits: int = 0
+    peer_hits: int = 0
+    fetches: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "lookups": self.lookups,
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "peer_hits": self.peer_hits,
+            "fetches": self.fetches,
+        }
+
+
+def _parse_robots(
+    robots_url: str, raw_text: str
+) -> tuple[RobotFileParser, list[str], float | None]:
+    """Parse a robots.txt body into (parser, sitemap_urls, crawl_delay)."""
+    parser = RobotFileParser()
+    parser.set_url(robots_url)
+    parser.parse(raw_text.splitlines())
+    sitemaps = _SITEMAP_RE.findall(raw_text)
+    # Use the first Crawl-delay value found
+    delay_match = _CRAWL_DELAY_RE.search(raw_text)
+    crawl_delay = float(delay_match.group(1)) if delay_match else None
+    return parser, sitemaps, crawl_delay
+
+
 class RobotsChecker:
     """Async-friendly robots.txt checker with per-domain caching.
 
     Also extracts Sitemap URLs and Crawl-delay directives.
+
+    Lookups go memory → persistent *store* → origin fetch; with *peers*,
+    the DHT lookup runs concurrently with the fetch and a peer record is
+    only used if it arrives first.  Successful fetches (2xx, or 4xx
+    meaning "no robots.txt") are written to the store and published to
+    peers; transient failures are only cached in memory.  Peer-supplied
+    rules are used for at most :data:`PEER_ROBOTS_MAX_TTL` seconds, after
+    which the next lookup for that domain always goes to the origin.
+
+    Args:
+        user_agent: Crawler User-Agent used for rule matching.
+        cache_ttl: In-memory cache lifetime in seconds.
+        store: Optional persistent :class:`RobotsCache`.
+        peers: Optional peer exchange (asyncio-safe), usually the P2P node.
     """
 
     # Maximum cached domains to prevent unbounded memory growth
     MAX_CACHE_SIZE: int = 10_000
 
-    def __init__(self, user_agent: str, *, cache_ttl: int = 3600) -> None:
+    def __init__(
+        self,
+        user_agent: str,
+        *,
+        cache_ttl: int = ROBOTS_CACHE_TTL,
+        store: RobotsCache | None = None,
+        peers: RobotsPeerStore | None = None,
+    ) -> None:
         self._user_agent = user_agent
         self._cache_ttl = cache_ttl
+        # domain → (parser, monotonic expiry)
         self._cache: dict[str, tuple[RobotFileParser, float]] = {}
+        # Domains whose current rules came from a peer; refreshed from origin
+        self._peer_served: set[str] = set()
         self._locks: dict[str, asyncio.Lock] = {}
         # Extra caches for sitemap URLs and crawl-delay per domain
         self._sitemaps: dict[str, list[str]] = {}
         self._crawl_delays: dict[str, float | None] = {}
+        self._store = store
+        self._peers = peers
+        self._publish_tasks: set[asyncio.Task[None]] = set()
+        self._stats = RobotsStats()
+
+    @property
+    def stats(self) -> RobotsStats:
+        return self._stats
+
+    def set_peers(self, peers: RobotsPeerStore | None) -> None:
+        """Attach (or detach) peer exchange once the P2P node is up."""
+        self._peers = peers
 
     def _get_lock(self, domain: str) -> asyncio.Lock:
         # Use setdefault for thread-safe lock creation
@@ -53,17 +152,17 @@ class RobotsChecker:
 
     async def _fetch_robots(
         self, client: httpx.AsyncClient, base_url: str
-    ) -> tuple[RobotFileParser, list[str], float | None]:
+    ) -> tuple[RobotFileParser, list[str], float | None, str | None]:
         """Fetch and parse robots.txt for a domain.
 
         Returns:
-            Tuple of (parser, sitemap_urls, crawl_delay).
+            Tuple of (parser, sitemap_urls, crawl_delay, raw_text).
+            ``raw_text`` is None when the result must not be persisted or
+            shared (network error, server error); ``""`` means the site
+            has no robots.txt.
         """
         robots_url = f"{base_url}/robots.txt"
-        parser = RobotFileParser()
-        parser.set_url(robots_url)
-        sitemaps: list[str] = []
-        crawl_delay: float | None = None
+        self._stats.fetches += 1
 
         try:
             resp = await client.get(
@@ -73,43 +172,175 @@ class RobotsChecker:
             )
             if resp.status_code == 200:
                 raw_text = resp.text
-                parser.parse(raw_text.splitlines())
-
-                # Extract Sitemap URLs
-                sitemaps = _SITEMAP_RE.findall(raw_text)
-
-                # Extract Crawl-delay (use the first value found)
-                delay_match = _CRAWL_DELAY_RE.search(raw_text)
-                if delay_match:
-                    crawl_delay = float(delay_match.group(1))
-
+                parser, sitemaps, crawl_delay = _parse_robots(robots_url, raw_text)
                 logger.debug(
                     "robots_fetched",
                     url=robots_url,
                     sitemaps=len(sitemaps),
                     crawl_delay=crawl_delay,
                 )
-            else:
-                # If robots.txt not found, allow everything
-                parser.parse([])
-                logger.debug(
-                    "robots_not_found",
-                    url=robots_url,
-                    status=resp.status_code,
-                )
+                return parser, sitemaps, crawl_delay, raw_text
+
+            # If robots.txt not found, allow everything
+            parser, _, _ = _parse_robots(robots_url, "")
+            logger.debug(
+                "robots_not_found",
+                url=robots_url,
+                status=resp.status_code,
+            )
+            # 4xx is a stable "no robots.txt"; 5xx may be transient
+            cacheable = 400 <= resp.status_code < 500
+            return parser, [], None, "" if cacheable else None
         except (httpx.HTTPError, OSError, ValueError) as exc:
             # On fetch error (network, SSL, timeout, etc.) be permissive —
             # RFC 9309 §2.4: if robots.txt is unreachable, assume allowed.
             # Only an explicit Disallow in a successfully-fetched robots.txt
             # should block crawling.
-            parser.parse([])
             logger.warning(
                 "robots_fetch_error",
                 url=robots_url,
                 error=str(exc),
             )
+            parser, _, _ = _parse_robots(robots_url, "")
+            return parser, [], None, None
 
-        return parser, sitemaps, crawl_delay
+    def _lookup_store(
+        self, domain: str, base_url: str
+    ) -> tuple[RobotFileParser, list[str], float | None, float] | None:
+        """Answer from the persistent store, if possible.
+
+        Returns:
+            ``(parser, sitemaps, crawl_delay, expires_in)`` where
+            *expires_in* is the entry's remaining lifetime in seconds, or
+            ``None`` on a miss.
+        """
+        if self._store is None:
+            return None
+        entry = self._store.get(domain)
+        if entry is None:
+            return None
+        self._stats.store_hits += 1
+        return (
+            *_parse_robots(f"{base_url}/robots.txt", entry.robots_txt),
+            entry.expires_at - time.time(),
+        )
+
+    async def _lookup_peer(
+        self, peers: RobotsPeerStore, domain: str
+    ) -> RobotsCacheEntry | None:
+        """Fetch and validate a DHT peer's record for *domain*.
+
+        Any failure (lookup error, malformed record) is a miss.  The
+        record is not persisted here; see :meth:`_adopt_peer_entry`.
+        """
+        try:
+            record = await peers.get_robots(domain)
+            if not isinstance(record, dict):
+                return None
+            scratch = RobotsCache()
+            if not scratch.import_from_dht([record], max_ttl=PEER_ROBOTS_MAX_TTL):
+                return None
+            return scratch.get(domain)
+        except Exception:  # noqa: BLE001
+            logger.debug("robots_peer_lookup_failed", domain=domain)
+            return None
+
+    def _adopt_peer_entry(
+        self, domain: str, base_url: str, entry: RobotsCacheEntry
+    ) -> tuple[RobotFileParser, list[str], float | None, float]:
+        """Use a peer's record: persist it and parse its rules.
+
+        Returns:
+            Same shape as :meth:`_lookup_store`.
+        """
+        expires_in = min(entry.expires_at - time.time(), PEER_ROBOTS_MAX_TTL)
+        if self._store is not None:
+            self._store.put(
+                domain,
+                entry.allowed,
+                entry.crawl_delay,
+                entry.sitemaps,
+                robots_txt=entry.robots_txt,
+                ttl=expires_in,
+            )
+        self._stats.peer_hits += 1
+        self._peer_served.add(domain)
+        logger.debug("robots_from_peer", domain=domain)
+        return (
+            *_parse_robots(f"{base_url}/robots.txt", entry.robots_txt),
+            expires_in,
+        )
+
+    async def _race_peer_and_origin(
+        self,
+        client: httpx.AsyncClient,
+        peers: RobotsPeerStore,
+        domain: str,
+        base_url: str,
+    ) -> tuple[
+        RobotsCacheEntry | None,
+        tuple[RobotFileParser, list[str], float | None, str | None] | None,
+    ]:
+        """Query peers and the origin concurrently; keep the first answer.
+
+        A peer hit that arrives before the origin responds cancels the
+        fetch; otherwise the origin's result wins and the peer lookup is
+        cancelled, so peer sharing never delays a cold domain.
+
+        Returns:
+            ``(peer_entry, None)`` or ``(None, fetch_result)``.
+        """
+        peer_task = asyncio.create_task(self._lookup_peer(peers, domain))
+        fetch_task = asyncio.create_task(self._fetch_robots(client, base_url))
+        try:
+            done, _ = await asyncio.wait(
+                {peer_task, fetch_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if fetch_task not in done:
+                entry = peer_task.result()
+                if entry is not None:
+                    return entry, None
+            return None, await fetch_task
+        finally:
+            for task in (peer_task, fetch_task):
+                if not task.done():
+                    task.cancel()
+
+    async def _share(
+        self,
+        domain: str,
+        base_url: str,
+        parser: RobotFileParser,
+        sitemaps: list[str],
+        crawl_delay: float | None,
+        raw_text: str,
+    ) -> None:
+        """Persist a freshly fetched result and publish it to peers."""
+        if len(raw_text) > MAX_SHARED_ROBOTS_BYTES:
+            return
+        entry = (self._store or RobotsCache()).put(
+            domain,
+            parser.can_fetch(self._user_agent, f"{base_url}/"),
+            crawl_delay or 0.0,
+            sitemaps,
+            robots_txt=raw_text,
+        )
+        if self._peers is not None:
+            # Publish in the background; the crawl only needs the local copy
+            task = asyncio.create_task(
+                self._publish(self._peers, domain, RobotsCache.export_entry(entry))
+            )
+            self._publish_tasks.add(task)
+            task.add_done_callback(self._publish_tasks.discard)
+
+    @staticmethod
+    async def _publish(
+        peers: RobotsPeerStore, domain: str, record: dict[str, Any]
+    ) -> None:
+        try:
+            await peers.publish_robots(domain, record)
+        except Exception:  # noqa: BLE001
+            logger.debug("robots_publish_failed", domain=domain)
 
     async def is_allowed(self, client: httpx.AsyncClient, url: str) -> bool:
         """Check if URL is allowed by robots.txt.
@@ -127,21 +358,45 @@ class RobotsChecker:
 
         lock = self._get_lock(domain)
         async with lock:
+            self._stats.lookups += 1
             # Check cache
             if domain in self._cache:
-                parser, cached_at = self._cache[domain]
-                if time.monotonic() - cached_at < self._cache_ttl:
+                parser, expires_at = self._cache[domain]
+                if time.monotonic() < expires_at:
+                    self._stats.memory_hits += 1
                     return parser.can_fetch(self._user_agent, url)
 
-            # Fetch fresh
-            parser, sitemaps, crawl_delay = await self._fetch_robots(
-                client,
-                base_url,
-            )
+            shared = self._lookup_store(domain, base_url)
+            fetched = None
+            if shared is None:
+                peers = self._peers
+                # After one peer-served period the origin is always consulted
+                if peers is not None and domain not in self._peer_served:
+                    peer_entry, fetched = await self._race_peer_and_origin(
+                        client, peers, domain, base_url
+                    )
+                    if peer_entry is not None:
+                        shared = self._adopt_peer_entry(domain, base_url, peer_entry)
+                else:
+                    fetched = await self._fetch_robots(client, base_url)
+            ttl = float(self._cache_ttl)
+            if shared is not None:
+                parser, sitemaps, crawl_delay, expires_in = shared
+                ttl = min(ttl, expires_in)
+            else:
+                assert fetched is not None
+                self._peer_served.discard(domain)
+                parser, sitemaps, crawl_delay, raw_text = fetched
+                if raw_text is not None and (
+                    self._store is not None or self._peers is not None
+                ):
+                    await self._share(
+                        domain, base_url, parser, sitemaps, crawl_delay, raw_text
+                    )
             # Evict oldest entries if cache is full
             if len(self._cache) >= self.MAX_CACHE_SIZE:
                 self._evict_oldest()
-            self._cache[domain] = (parser, time.monotonic())
+            self._cache[domain] = (parser, time.monotonic() + ttl)
             self._sitemaps[domain] = sitemaps
             self._crawl_delays[domain] = crawl_delay
 
@@ -163,7 +418,7 @@ class RobotsChecker:
         return self._crawl_delays.get(domain)
 
     def _evict_oldest(self) -> None:
-        """Remove the oldest 10% of cache entries."""
+        """Remove the 10% of cache entries closest to expiry."""
         if not self._cache:
             return
         evict_count = max(1, len(self._cache) // 10)
@@ -174,11 +429,28 @@ class RobotsChecker:
         for domain, _ in oldest:
             self._cache.pop(domain, None)
             self._locks.pop(domain, None)
+            self._peer_served.discard(domain)
             self._sitemaps.pop(domain, None)
             self._crawl_delays.pop(domain, None)
 
     def clear_cache(self) -> None:
-        """Clear the robots.txt cache."""
+        """Clear the in-memory robots.txt cache (the persistent store is kept)."""
         self._cache.clear()
+        self._peer_served.clear()
         self._sitemaps.clear()
         self._crawl_delays.clear()
+
+    def cleanup_store(self) -> int:
+        """Drop expired entries from the persistent store.
+
+        Returns:
+            Number of entries removed.
+        """
+        if self._store is None:
+            return 0
+        return self._store.cleanup()
+
+    def close(self) -> None:
+        """Close the persistent store, if any."""
+        if self._store is not None:
+            self._store.close()
@@ -1,8 +1,19 @@
-"""URL scheduling — politeness, rate limiting, domain tracking."""
+"""URL scheduling — politeness, rate limiting, domain tracking.
+
+URLs are queued per domain in a :mod:`~infomesh.crawler.frontier`.  Domains
+with queued work wait in a min-heap keyed by the time they next become
+eligible under their politeness delay; once eligible they move to a
+ready heap ordered by the priority of their next URL.  ``get_url``
+serves the best ready domain, so a domain with a long Crawl-delay only
+holds back its own URLs instead of every URL queued behind it.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
+import itertools
 import time
 from collections import defaultdict
 from dataclasses import dataclass
@@ -10,6 +21,8 @@ from urllib.parse import urlparse
 
 import structlog
 
+from infomesh.crawler.frontier import Frontier, MemoryFrontier
+
 logger = structlog.get_logger()
 
 
@@ -35,10 +48,15 @@ class Scheduler:
     """URL scheduler with politeness delays and rate limiting.
 
     Enforces:
-    - Per-domain delay (default 1s)
+    - Per-domain delay (default 1s), without blocking other domains
     - Max pending URLs per domain
     - Global URLs-per-hour limit
     - Max crawl depth
+
+    Args:
+        frontier: URL storage.  Defaults to a bounded in-memory frontier;
+            pass a :class:`~infomesh.crawler.frontier.SQLiteFrontier` to
+            keep pending URLs across restarts.
     """
 
     def __init__(
@@ -48,6 +66,7 @@ class Scheduler:
         urls_per_hour: int = 60,
         pending_per_domain: int = 10,
         max_depth: int = 0,
+        frontier: Frontier | None = None,
     ) -> None:
         self._politeness_delay = politeness_delay
         self._urls_per_hour = urls_per_hour
@@ -55,16 +74,34 @@ class Scheduler:
         self._max_depth = max_depth  # 0 = unlimited
 
         self._domains: dict[str, DomainState] = defaultdict(DomainState)
-        self._queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue(maxsize=10_000)
+        self._frontier: Frontier = (
+            frontier if frontier is not None else MemoryFrontier()
+        )
+        # Queued URLs per domain.  Every domain in here has exactly one
+        # entry in either _waiting (eligible_at, seq, domain) or
+        # _ready (-priority, seq, domain).
+        self._queued: dict[str, int] = {}
+        self._waiting: list[tuple[float, int, str]] = []
+        self._ready: list[tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
         self._hourly_count: int = 0
         self._hour_start: float = time.monotonic()
 
-    async def add_url(self, url: str, depth: int = 0) -> bool:
+        # Resume domains left in a persistent frontier
+        for domain, count in self._frontier.domain_counts().items():
+            self._queued[domain] = count
+            self._domains[domain].pending_count = count
+            self._push_waiting(domain, 0.0)
+
+    async def add_url(self, url: str, depth: int = 0, *, priority: int = 0) -> bool:
         """Add a URL to the crawl queue.
 
         Args:
             url: URL to crawl.
             depth: Current crawl depth.
+            priority: Higher values are crawled first once their domain
+                is eligible.
 
         Returns:
             True if URL was added, False if rejected (rate limit, depth, etc.).
@@ -83,8 +120,16 @@ class Scheduler:
             logger.debug("scheduler_domain_full", url=url, domain=domain)
             return False
 
+        if not self._frontier.push(domain, url, depth, priority):
+            logger.debug("scheduler_frontier_rejected", url=url)
+            return False
+
         state.pending_count += 1
-        await self._queue.put((url, depth))
+        queued = self._queued.get(domain, 0)
+        self._queued[domain] = queued + 1
+        if queued == 0:
+            self._push_waiting(domain, state.last_request_at + self._delay_for(state))
+        self._wakeup.set()
         return True
 
     def set_urls_per_hour(self, limit: int) -> None:
@@ -116,51 +161,109 @@ class Scheduler:
 
         Uses per-domain Crawl-delay from robots.txt when available,
         otherwise falls back to the configured ``politeness_delay``.
+        Among domains that are already eligible, the one whose next URL
+        has the highest priority wins; the call only waits when no
+        domain is eligible yet.
 
         Returns:
             Tuple of (url, depth).
         """
         while True:
-            url, depth = await self._queue.get()
-            domain = urlparse(url).netloc
-            state = self._domains[domain]
-
-            # Use robots.txt Crawl-delay if available, else default
-            delay = (
-                state.crawl_delay
-                if state.crawl_delay is not None
-                else self._politeness_delay
-            )
+            now = time.monotonic()
+            self._promote_eligible(now)
+
+            if not self._ready:
+                # Sleep until the next domain becomes eligible, or until
+                # a new URL arrives for a domain that may be eligible sooner
+                self._wakeup.clear()
+                if not self._waiting:
+                    await self._wakeup.wait()
+                    continue
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), self._waiting[0][0] - now
+                    )
+                continue
 
-            # Enforce politeness delay
-            elapsed = time.monotonic() - state.last_request_at
-            if elapsed < delay:
-                wait = delay - elapsed
-                await asyncio.sleep(wait)
+            neg_priority, _, domain = heapq.heappop(self._ready)
+            state = self._domains[domain]
+            # The delay may have changed (robots.txt) since the domain was pushed
+            actual = state.last_request_at + self._delay_for(state)
+            if actual > now:
+                self._push_waiting(domain, actual)
+                continue
 
             # Check hourly rate limit (0 = unlimited)
             if self._urls_per_hour > 0:
                 self._refresh_hour()
                 if self._hourly_count >= self._urls_per_hour:
-                    remaining = 3600 - (time.monotonic() - self._hour_start)
+                    remaining = 3600 - (now - self._hour_start)
                     wait_secs = max(remaining, 1.0)
                     logger.info(
                         "scheduler_hourly_limit",
                         count=self._hourly_count,
                         wait_secs=round(wait_secs),
                     )
-                    # Put it back and wait until the hour resets
-                    await self._queue.put((url, depth))
+                    # Put the domain back and wait until the hour resets
+                    heapq.heappush(self._ready, (neg_priority, next(self._seq), domain))
                     await asyncio.sleep(wait_secs)
                     continue
 
-            state.last_request_at = time.monotonic()
+            item = self._frontier.pop(domain)
+            if item is None:
+                # Frontier and counters disagree; drop the stale entry
+                self._queued.pop(domain, None)
+                continue
+            remaining_urls = self._queued[domain] - 1
+            if remaining_urls > 0:
+                self._queued[domain] = remaining_urls
+                self._push_waiting(domain, now + self._delay_for(state))
+            else:
+                del self._queued[domain]
+            state.last_request_at = now
             if self._urls_per_hour > 0:
                 self._hourly_count += 1
-            return url, depth
+            return item
+
+    async def wait_for_domain(self, url: str) -> None:
+        """Wait out the politeness delay of *url*'s domain and claim it.
+
+        For requests made outside :meth:`get_url` (e.g. recrawls), so they
+        share the per-domain delay and robots.txt Crawl-delay with regular
+        crawling.  Does not count against the hourly URL limit.
+
+        Args:
+            url: URL about to be fetched.
+        """
+        state = self._domains[urlparse(url).netloc]
+        while True:
+            now = time.monotonic()
+            eligible_at = state.last_request_at + self._delay_for(state)
+            if eligible_at <= now:
+                state.last_request_at = now
+                return
+            await asyncio.sleep(eligible_at - now)
+
+    def _delay_for(self, state: DomainState) -> float:
+        """Politeness delay for a domain: robots.txt Crawl-delay or default."""
+        if state.crawl_delay is not None:
+            return state.crawl_delay
+        return self._politeness_delay
+
+    def _push_waiting(self, domain: str, eligible_at: float) -> None:
+        """Schedule *domain* to become ready once *eligible_at* is reached."""
+        heapq.heappush(self._waiting, (eligible_at, next(self._seq), domain))
+
+    def _promote_eligible(self, now: float) -> None:
+        """Move domains whose politeness delay has elapsed to the ready heap."""
+        while self._waiting and self._waiting[0][0] <= now:
+            _, seq, domain = heapq.heappop(self._waiting)
+            priority = self._frontier.head_priority(domain) or 0
+            heapq.heappush(self._ready, (-priority, seq, domain))
 
     def mark_done(self, url: str) -> None:
         """Mark a URL as done (reduce pending count)."""
+        self._frontier.complete(url)
         domain = urlparse(url).netloc
         state = self._domains.get(domain)
         if state is None:
@@ -205,4 +308,13 @@ class Scheduler:
     @property
     def pending_count(self) -> int:
         """Total number of URLs in the queue."""
-        return self._queue.qsize()
+        return len(self._frontier)
+
+    @property
+    def queued_domains(self) -> int:
+        """Number of domains that currently have queued URLs."""
+        return len(self._queued)
+
+    def close(self) -> None:
+        """Close the frontier (flushing a persistent one to disk)."""
+        self._frontier.close()
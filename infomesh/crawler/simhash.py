@@ -10,6 +10,11 @@ The implementation follows Charikar's 2002 algorithm:
   3. Build a weighted bit-vector (counts).
   4. Collapse to a 64-bit fingerprint (majority vote per bit).
 
+When NumPy is available, steps 2–4 run as one batch: the shingle hashes
+are packed into a ``uint64`` array, unpacked into a bit matrix and
+column-summed, instead of looping 64 times per shingle in Python.  Both
+paths produce bit-identical fingerprints.
+
 Usage::
 
     fp = simhash("The quick brown fox jumps over the lazy dog")
@@ -22,11 +27,22 @@ import contextlib
 import hashlib
 import re
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
 import structlog
 
 logger = structlog.get_logger()
 
+# NumPy is optional — it ships with the ``vector`` extra.
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+    _HAS_NUMPY = False
+
 # Default near-duplicate threshold (Hamming distance ≤ 3)
 HAMMING_THRESHOLD: int = 3
 
@@ -62,20 +78,36 @@ def _hash64(data: str) -> int:
     return int.from_bytes(digest[:8], byteorder="big")
 
 
-def simhash(text: str, *, shingle_width: int = _SHINGLE_WIDTH) -> int:
-    """Compute the 64-bit SimHash fingerprint of *text*.
+def _hash64_bytes(shingles: list[str]) -> bytes:
+    """Concatenate the 8-byte big-endian MD5 prefixes of all *shingles*.
 
-    Args:
-        text: Document text.
-        shingle_width: Word n-gram size for shingling.
-
-    Returns:
-        64-bit unsigned integer fingerprint.
+    MD5 is kept (rather than a faster non-cryptographic hash) so that
+    fingerprints stay identical to those already stored in ``seen_urls``;
+    ``hashlib`` runs in C, so the per-shingle cost is small once the
+    bit loop is gone.
     """
-    shingles = _tokenize(text, width=shingle_width)
-    if not shingles:
-        return 0
-
+    md5 = hashlib.md5
+    return b"".join(
+        md5(s.encode("utf-8")).digest()[:8]  # noqa: S324
+        for s in shingles
+    )
+
+
+def _fingerprint_numpy(shingles: list[str]) -> int:
+    """Vectorized fingerprint: hash array → bit matrix → column sums."""
+    hashes = np.frombuffer(_hash64_bytes(shingles), dtype=">u8").astype("<u8")
+    # Column i of the bit matrix is bit i of every hash (LSB first)
+    bits = np.unpackbits(
+        hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little"
+    )
+    ones = bits.sum(axis=0, dtype=np.int64)
+    # Weight per bit is ones - zeros; a bit is set when the weight is ≥ 0
+    mask = (2 * ones >= len(shingles)).astype(np.uint8)
+    return int(np.packbits(mask, bitorder="little").view("<u8")[0])
+
+
+def _fingerprint_python(shingles: list[str]) -> int:
+    """Reference fingerprint used when NumPy is not installed."""
     # Weighted bit-vector: +1 for each 1-bit, -1 for each 0-bit
     vector = [0] * _NUM_BITS
 
@@ -96,6 +128,24 @@ def simhash(text: str, *, shingle_width: int = _SHINGLE_WIDTH) -> int:
     return fingerprint
 
 
+def simhash(text: str, *, shingle_width: int = _SHINGLE_WIDTH) -> int:
+    """Compute the 64-bit SimHash fingerprint of *text*.
+
+    Args:
+        text: Document text.
+        shingle_width: Word n-gram size for shingling.
+
+    Returns:
+        64-bit unsigned integer fingerprint.
+    """
+    shingles = _tokenize(text, width=shingle_width)
+    if not shingles:
+        return 0
+    if _HAS_NUMPY:
+        return _fingerprint_numpy(shingles)
+    return _fingerprint_python(shingles)
+
+
 def hamming_distance(a: int, b: int) -> int:
     """Count the number of differing bits between two integers.
 
@@ -211,3 +261,241 @@ class SimHashIndex:
             "unique_fingerprints": len(self._entries),
             "total_documents": total_docs,
         }
+
+
+# ── Array-backed index ──────────────────────────────────────────────
+
+# On-disk layout: two parallel little-endian arrays, appended in lockstep.
+_FP_DTYPE = "<u8"
+_ID_DTYPE = "<u4"
+_FP_SUFFIX = ".fp"
+_ID_SUFFIX = ".ids"
+
+# doc_id written over removed rows (real doc_ids are 31-bit)
+_REMOVED_ID = 0xFFFFFFFF
+
+# Rows scanned per vectorized block (bounds temporary arrays to ~8 MB)
+_SCAN_BLOCK = 1 << 20
+
+# Per-byte popcount table for NumPy builds without ``bitwise_count``
+_POPCOUNT8: Any = (
+    np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    if _HAS_NUMPY
+    else None
+)
+
+
+def _popcount64(values: Any) -> Any:
+    """Vectorized popcount of a ``uint64`` array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return _POPCOUNT8[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+class SimHashArrayIndex:
+    """Near-duplicate index stored as parallel NumPy ``uint64``/``uint32`` arrays.
+
+    With a *path*, fingerprints and doc IDs live in two append-only files
+    (``<path>.fp`` and ``<path>.ids``) that are memory-mapped on open, so
+    startup cost is independent of the number of stored fingerprints and
+    no per-row Python objects are created.  New entries are appended to
+    the files immediately and kept in a small pending buffer until the
+    next remap; :meth:`sync` pushes the appends to the OS so callers can
+    make them durable in step with their own commits.  Without a *path*
+    the arrays live purely in memory.
+
+    Lookups are a vectorized linear scan (XOR + popcount) over the mapped
+    arrays, roughly 2 ms per million rows with ``np.bitwise_count`` (a few
+    times that on older NumPy).  Unlike :class:`SimHashIndex` there is no
+    eviction cap: the files grow by 12 bytes per added row and removed
+    rows are only tombstoned.  Requires NumPy.
+
+    ``is_new`` is ``True`` when the backing files did not exist before this
+    instance was opened, so callers can backfill from another source once.
+    """
+
+    def __init__(self, path: Path | None = None, *, remap_every: int = 4096) -> None:
+        if not _HAS_NUMPY:
+            msg = "SimHashArrayIndex requires numpy"
+            raise ImportError(msg)
+        self._path = path
+        self._remap_every = remap_every
+        self._fps: Any = np.zeros(0, dtype=_FP_DTYPE)
+        self._ids: Any = np.zeros(0, dtype=_ID_DTYPE)
+        self._pending_fps: list[int] = []
+        self._pending_ids: list[int] = []
+        self._fp_file: Any = None
+        self._id_file: Any = None
+        self.is_new = True
+        if path is not None:
+            self.is_new = not self._fp_path.exists()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._map()
+            self._fp_file = open(self._fp_path, "ab")  # noqa: SIM115
+            self._id_file = open(self._id_path, "ab")  # noqa: SIM115
+
+    @property
+    def _fp_path(self) -> Path:
+        assert self._path is not None
+        return self._path.with_name(self._path.name + _FP_SUFFIX)
+
+    @property
+    def _id_path(self) -> Path:
+        assert self._path is not None
+        return self._path.with_name(self._path.name + _ID_SUFFIX)
+
+    def _map(self) -> None:
+        """Memory-map the backing files, repairing a torn trailing append."""
+        fp_path, id_path = self._fp_path, self._id_path
+        fp_path.touch(exist_ok=True)
+        id_path.touch(exist_ok=True)
+        rows = min(fp_path.stat().st_size // 8, id_path.stat().st_size // 4)
+        # A crash between the two appends leaves one file longer — truncate
+        for file_path, width in ((fp_path, 8), (id_path, 4)):
+            if file_path.stat().st_size != rows * width:
+                with open(file_path, "r+b") as f:
+                    f.truncate(rows * width)
+        if rows == 0:
+            self._fps = np.zeros(0, dtype=_FP_DTYPE)
+            self._ids = np.zeros(0, dtype=_ID_DTYPE)
+            return
+        self._fps = np.memmap(fp_path, dtype=_FP_DTYPE, mode="r+", shape=(rows,))
+        self._ids = np.memmap(id_path, dtype=_ID_DTYPE, mode="r+", shape=(rows,))
+
+    @property
+    def size(self) -> int:
+        """Total number of stored fingerprint rows (including removed)."""
+        return len(self._fps) + len(self._pending_fps)
+
+    def add(self, doc_id: int, fingerprint: int) -> None:
+        """Append a document fingerprint to the index.
+
+        Args:
+            doc_id: Unique document identifier (31-bit).
+            fingerprint: SimHash 64-bit fingerprint.
+        """
+        self._pending_fps.append(fingerprint)
+        self._pending_ids.append(doc_id)
+        if self._fp_file is not None:
+            self._fp_file.write(fingerprint.to_bytes(8, "little"))
+            self._id_file.write(doc_id.to_bytes(4, "little"))
+        if len(self._pending_fps) >= self._remap_every:
+            self.flush()
+
+    def add_many(self, doc_ids: Any, fingerprints: Any) -> None:
+        """Append many rows at once from array-likes (no per-row Python ints).
+
+        Args:
+            doc_ids: Sequence or array of doc IDs.
+            fingerprints: Sequence or array of unsigned 64-bit fingerprints.
+        """
+        self.flush()
+        fps = np.asarray(fingerprints, dtype=_FP_DTYPE)
+        ids = np.asarray(doc_ids, dtype=_ID_DTYPE)
+        if self._fp_file is not None:
+            self._fp_file.write(fps.tobytes())
+            self._id_file.write(ids.tobytes())
+            self.flush(remap=True)
+        else:
+            self._fps = np.concatenate([self._fps, fps])
+            self._ids = np.concatenate([self._ids, ids])
+
+    def sync(self) -> None:
+        """Write buffered appends through to the backing files.
+
+        Cheaper than :meth:`flush`: the arrays are not remapped, so pending
+        rows stay in the in-memory buffer for lookups.
+        """
+        if self._fp_file is not None:
+            self._fp_file.flush()
+            self._id_file.flush()
+
+    def flush(self, *, remap: bool = False) -> None:
+        """Fold pending appends into the mapped arrays.
+
+        Args:
+            remap: Force a remap even when nothing is pending.
+        """
+        if not self._pending_fps and not remap:
+            return
+        if self._fp_file is not None:
+            self._fp_file.flush()
+            self._id_file.flush()
+            self._map()
+        else:
+            self._fps = np.concatenate(
+                [self._fps, np.array(self._pending_fps, dtype=_FP_DTYPE)]
+            )
+            self._ids = np.concatenate(
+                [self._ids, np.array(self._pending_ids, dtype=_ID_DTYPE)]
+            )
+        self._pending_fps.clear()
+        self._pending_ids.clear()
+
+    def remove(self, doc_id: int, fingerprint: int) -> None:
+        """Tombstone a document fingerprint.
+
+        Args:
+            doc_id: Document identifier to remove.
+            fingerprint: The fingerprint that was indexed.
+        """
+        self.flush()
+        hit = (self._ids == doc_id) & (self._fps == np.uint64(fingerprint))
+        self._ids[hit] = _REMOVED_ID
+
+    def find_near_duplicates(
+        self,
+        fingerprint: int,
+        *,
+        threshold: int = HAMMING_THRESHOLD,
+    ) -> list[int]:
+        """Find document IDs whose fingerprints are within *threshold* of *fingerprint*.
+
+        Args:
+            fingerprint: Query fingerprint.
+            threshold: Maximum Hamming distance.
+
+        Returns:
+            List of matching document IDs (may be empty).
+        """
+        query = np.uint64(fingerprint)
+        matches: list[int] = []
+        segments = [(self._fps, self._ids)]
+        if self._pending_fps:
+            segments.append(
+                (
+                    np.array(self._pending_fps, dtype=_FP_DTYPE),
+                    np.array(self._pending_ids, dtype=_ID_DTYPE),
+                )
+            )
+        for fps, ids in segments:
+            for lo in range(0, len(fps), _SCAN_BLOCK):
+                block_fps = fps[lo : lo + _SCAN_BLOCK]
+                block_ids = ids[lo : lo + _SCAN_BLOCK]
+                hit = (_popcount64(block_fps ^ query) <= threshold) & (
+                    block_ids != _REMOVED_ID
+                )
+                if hit.any():
+                    matches.extend(block_ids[hit].tolist())
+        return matches
+
+    def get_stats(self) -> dict[str, int]:
+        """Return index statistics."""
+        self.flush()
+        live = self._ids != _REMOVED_ID
+        return {
+            "unique_fingerprints": int(np.unique(self._fps[live]).size),
+            "total_documents": int(live.sum()),
+        }
+
+    def close(self) -> None:
+        """Flush pending appends and close the backing files."""
+        self.flush()
+        if self._fp_file is not None:
+            self._fp_file.close()
+            self._id_file.close()
+            self._fp_file = None
+            self._id_file = None
+        # Drop the maps so the files can be removed/replaced
+        self._fps = np.zeros(0, dtype=_FP_DTYPE)
+        self._ids = np.zeros(0, dtype=_ID_DTYPE)
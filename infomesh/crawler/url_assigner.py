@@ -11,10 +11,27 @@ owner of that URL.
 This module bridges the gap between the local ``Scheduler`` and the
 distributed DHT: instead of every node blindly crawling any URL, nodes
 check whether they are the closest known peer for a URL before crawling.
+
+Peer hashes are kept as a sorted array of integers, updated in place as
+peers join and leave.  Peers sharing a bit prefix form a contiguous run
+of that array, so the closest peer is found by walking down the implicit
+binary trie: at each level the highest bit on which the run disagrees
+splits it in two (located by bisection), and the half matching the URL
+hash's bit is kept.  A lookup is O(log² n) instead of a scan over every
+known peer.
+
+For batches, the same walk is precomputed over the top bits of the key
+space into a flat prefix table (a few entries per peer), so most URLs
+resolve with one index after hashing.  The table is rebuilt lazily on
+the first lookup after the peer set changes.
 """
 
 from __future__ import annotations
 
+import bisect
+import hashlib
+from collections.abc import Iterable
+
 import structlog
 
 from infomesh.hashing import content_hash
@@ -22,6 +39,13 @@ from infomesh.p2p.protocol import CrawlAssignment
 
 logger = structlog.get_logger()
 
+_HASH_BITS = 256
+# Prefix table size: 2**(bit_length(peers) + _TABLE_EXTRA_BITS) entries,
+# enough that almost every prefix resolves to a single peer
+_TABLE_EXTRA_BITS = 4
+_TABLE_MAX_BITS = 18
+_UNRESOLVED = -1
+
 
 def _xor_distance(hex_a: str, hex_b: str) -> int:
     """Compute XOR distance between two hex-encoded hashes.
@@ -42,12 +66,17 @@ def _xor_distance(hex_a: str, hex_b: str) -> int:
     return int_a ^ int_b
 
 
+def _hash_int(value: str) -> int:
+    """SHA-256 of *value* as a big-endian integer (same as ``content_hash``)."""
+    return int.from_bytes(hashlib.sha256(value.encode("utf-8")).digest(), "big")
+
+
 class UrlAssigner:
     """Assigns URLs to the closest known peer using Kademlia XOR distance.
 
-    Maintains a set of known peer IDs (hex-encoded) and determines
-    ownership of URLs by computing ``hash(url) XOR hash(peer_id)``
-    for each known peer, selecting the closest.
+    Maintains the known peer IDs and determines ownership of URLs by
+    minimising ``hash(url) XOR hash(peer_id)`` over all known peers,
+    using a sorted array of peer hashes (see module docstring).
 
     Args:
         local_peer_id: This node's peer ID string.
@@ -60,6 +89,12 @@ class UrlAssigner:
         self._peers: dict[str, str] = {
             local_peer_id: self._local_hash,
         }
+        # Routing array: peer hashes as ints, sorted, with owners aligned
+        self._ring: list[int] = [int(self._local_hash, 16)]
+        self._ring_peers: list[str] = [local_peer_id]
+        # Prefix table over the routing array; None until (re)built
+        self._table: list[int] | None = None
+        self._table_bits = 0
 
     def add_peer(self, peer_id: str) -> None:
         """Register a known peer for URL assignment.
@@ -68,7 +103,13 @@ class UrlAssigner:
             peer_id: The peer's ID string.
         """
         if peer_id not in self._peers:
-            self._peers[peer_id] = content_hash(peer_id)
+            peer_hash = content_hash(peer_id)
+            self._peers[peer_id] = peer_hash
+            key = int(peer_hash, 16)
+            pos = bisect.bisect_left(self._ring, key)
+            self._ring.insert(pos, key)
+            self._ring_peers.insert(pos, peer_id)
+            self._table = None
 
     def remove_peer(self, peer_id: str) -> None:
         """Remove a disconnected peer from consideration.
@@ -76,14 +117,81 @@ class UrlAssigner:
         Args:
             peer_id: The peer's ID string (never removes local).
         """
-        if peer_id != self._local_peer_id:
-            self._peers.pop(peer_id, None)
+        if peer_id == self._local_peer_id:
+            return
+        peer_hash = self._peers.pop(peer_id, None)
+        if peer_hash is not None:
+            pos = bisect.bisect_left(self._ring, int(peer_hash, 16))
+            del self._ring[pos]
+            del self._ring_peers[pos]
+            self._table = None
 
     @property
     def known_peers(self) -> int:
         """Number of known peers (including local)."""
         return len(self._peers)
 
+    def _closest_index(self, key: int) -> int:
+        """Index in the routing array of the peer XOR-closest to *key*."""
+        ring = self._ring
+        lo, hi = 0, len(ring)
+        while hi - lo > 1:
+            # Highest bit on which peers in ring[lo:hi] disagree; all
+            # higher bits are shared, so they cannot affect the choice
+            bit = (ring[lo] ^ ring[hi - 1]).bit_length() - 1
+            # First peer in the run with that bit set
+            split = bisect.bisect_left(ring, (ring[hi - 1] >> bit) << bit, lo, hi)
+            if (key >> bit) & 1:
+                lo = split
+            else:
+                hi = split
+        return lo
+
+    def _build_table(self) -> list[int]:
+        """Precompute :meth:`_closest_index` for every top-bits key prefix.
+
+        Walks the key-prefix trie alongside the routing array: a node is
+        a prefix range of the table plus the run of peers keys in that
+        range descend to.  Once the run is a single peer the whole range
+        is filled at once; ranges still ambiguous at full table depth are
+        marked unresolved and fall back to the bisection walk.
+        """
+        ring = self._ring
+        bits = min(len(ring).bit_length() + _TABLE_EXTRA_BITS, _TABLE_MAX_BITS)
+        table = [_UNRESOLVED] * (1 << bits)
+        # (first table slot, free key bits below the prefix, peer run)
+        stack = [(0, bits, 0, len(ring))]
+        while stack:
+            start, free, lo, hi = stack.pop()
+            if hi - lo == 1:
+                table[start : start + (1 << free)] = [lo] * (1 << free)
+                continue
+            if free == 0:
+                continue
+            free -= 1
+            bit = _HASH_BITS - bits + free
+            # The run agrees on all bits above *bit*; find where it flips
+            split = bisect.bisect_left(
+                ring, ((ring[lo] >> (bit + 1)) << (bit + 1)) | (1 << bit), lo, hi
+            )
+            if split in (lo, hi):
+                # Unanimous bit: both halves of the key range keep the run
+                stack.append((start, free, lo, hi))
+                stack.append((start + (1 << free), free, lo, hi))
+            else:
+                stack.append((start, free, lo, split))
+                stack.append((start + (1 << free), free, split, hi))
+        self._table = table
+        self._table_bits = bits
+        return table
+
+    def _lookup(self, key: int) -> int:
+        table = self._table
+        if table is None:
+            table = self._build_table()
+        index = table[key >> (_HASH_BITS - self._table_bits)]
+        return index if index != _UNRESOLVED else self._closest_index(key)
+
     def closest_peer(self, url: str) -> str:
         """Find the closest peer to a URL by XOR distance.
 
@@ -93,17 +201,31 @@ class UrlAssigner:
         Returns:
             Peer ID of the closest node.
         """
-        url_hash = content_hash(url)
-        best_peer = self._local_peer_id
-        best_dist = _xor_distance(url_hash, self._local_hash)
+        return self._ring_peers[self._lookup(_hash_int(url))]
 
-        for peer_id, peer_hash in self._peers.items():
-            dist = _xor_distance(url_hash, peer_hash)
-            if dist < best_dist:
-                best_dist = dist
-                best_peer = peer_id
+    def closest_peers(self, urls: Iterable[str]) -> list[str]:
+        """Find the closest peer for each of *urls* (batch form).
 
-        return best_peer
+        Args:
+            urls: URLs to assign.
+
+        Returns:
+            Peer IDs aligned with *urls*.
+        """
+        table = self._table
+        if table is None:
+            table = self._build_table()
+        shift = _HASH_BITS - self._table_bits
+        peers = self._ring_peers
+        sha256 = hashlib.sha256
+        result = []
+        for url in urls:
+            key = int.from_bytes(sha256(url.encode("utf-8")).digest(), "big")
+            index = table[key >> shift]
+            if index == _UNRESOLVED:
+                index = self._closest_index(key)
+            result.append(peers[index])
+        return result
 
     def is_local_owner(self, url: str) -> bool:
         """Check if this node is the closest peer for a URL.
@@ -137,6 +259,24 @@ class UrlAssigner:
             assigner_peer_id=owner,
         )
 
+    def assign_many(
+        self, urls: Iterable[str], *, depth: int = 0
+    ) -> list[CrawlAssignment]:
+        """Create a CrawlAssignment for each URL of a discovered link list.
+
+        Args:
+            urls: URLs to assign.
+            depth: Crawl depth shared by all URLs.
+
+        Returns:
+            Assignments aligned with *urls*.
+        """
+        urls = list(urls)
+        return [
+            CrawlAssignment(url=url, depth=depth, assigner_peer_id=owner)
+            for url, owner in zip(urls, self.closest_peers(urls), strict=True)
+        ]
+
     def filter_local_urls(self, urls: list[str]) -> list[str]:
         """Filter a list of URLs to only those owned by this node.
 
@@ -149,4 +289,11 @@ class UrlAssigner:
         Returns:
             Subset of URLs owned by this node.
         """
-        return [url for url in urls if self.is_local_owner(url)]
+        if len(self._ring) == 1:
+            return list(urls)
+        local = self._local_peer_id
+        return [
+            url
+            for url, owner in zip(urls, self.closest_peers(urls), strict=True)
+            if owner == local
+        ]
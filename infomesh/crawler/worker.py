@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -13,7 +13,7 @@ import structlog
 
 from infomesh.config import CrawlConfig
 from infomesh.crawler import MAX_RESPONSE_BYTES, create_ssl_context
-from infomesh.crawler.dedup import DeduplicatorDB
+from infomesh.crawler.dedup import DeduplicatorDB, url_key
 from infomesh.crawler.parser import (
     ParsedPage,
     extract_canonical,
@@ -22,8 +22,10 @@ from infomesh.crawler.parser import (
 )
 from infomesh.crawler.robots import RobotsChecker
 from infomesh.crawler.scheduler import Scheduler
+from infomesh.crawler.simhash import simhash
 from infomesh.hashing import content_hash
-from infomesh.security import SSRFError, validate_url
+from infomesh.resolver import AsyncResolver, PinnedDNSTransport, shared_resolver
+from infomesh.security import SSRFError, validate_url, validate_url_async
 
 if TYPE_CHECKING:
     from infomesh.crawler.js_detect import JSDetectionResult
@@ -69,6 +71,7 @@ class CrawlWorker:
         *,
         dht: InfoMeshDHT | None = None,
         js_renderer: JSRenderer | None = None,
+        resolver: AsyncResolver | None = None,
     ) -> None:
         self._config = config
         self._scheduler = scheduler
@@ -76,6 +79,8 @@ class CrawlWorker:
         self._robots = robots
         self._dht = dht
         self._js_renderer = js_renderer
+        # Shared by SSRF validation and the HTTP transport (one lookup per host)
+        self._resolver = resolver or shared_resolver()
         self._client: httpx.AsyncClient | None = None
         self._scope_domain: str | None = None
         self._scope_path: str | None = None
@@ -111,10 +116,13 @@ class CrawlWorker:
                 headers={"User-Agent": self._config.user_agent},
                 follow_redirects=True,
                 timeout=30.0,
-                verify=create_ssl_context(),
-                limits=httpx.Limits(
-                    max_connections=self._config.max_concurrent,
-                    max_keepalive_connections=self._config.max_concurrent,
+                transport=PinnedDNSTransport(
+                    self._resolver,
+                    verify=create_ssl_context(),
+                    limits=httpx.Limits(
+                        max_connections=self._config.max_concurrent,
+                        max_keepalive_connections=self._config.max_concurrent,
+                    ),
                 ),
             )
         return self._client
@@ -123,6 +131,11 @@ class CrawlWorker:
         """Public accessor for the shared HTTP client."""
         return await self._get_client()
 
+    @property
+    def resolver(self) -> AsyncResolver:
+        """DNS resolver shared by SSRF checks and the HTTP transport."""
+        return self._resolver
+
     async def crawl_url(
         self, url: str, depth: int = 0, *, force: bool = False
     ) -> CrawlResult:
@@ -178,9 +191,11 @@ class CrawlWorker:
         force: bool = False,
     ) -> CrawlResult:
         """Inner crawl logic, separated to ensure lock release in finally."""
-        # SSRF protection — validate URL before any network request
+        # SSRF protection — validate URL before any network request.
+        # DNS is resolved asynchronously and cached; the transport then
+        # connects to the same validated address.
         try:
-            validate_url(url, resolve_dns=True)
+            await validate_url_async(url, resolver=self._resolver)
         except SSRFError as exc:
             logger.warning("crawl_ssrf_blocked", url=url, reason=str(exc))
             self._scheduler.mark_done(url)
@@ -191,8 +206,11 @@ class CrawlWorker:
                 elapsed_ms=_elapsed(start),
             )
 
+        # Normalize + hash once; every dedup call below reuses the key
+        key = url_key(url)
+
         # Check dedup (URL) — skip when force=True
-        if not force and self._dedup.is_url_seen(url):
+        if not force and self._dedup.is_key_seen(key):
             self._scheduler.mark_done(url)
             return CrawlResult(
                 url=url,
@@ -309,6 +327,18 @@ class CrawlWorker:
                 js_required=js_required,
             )
 
+        # Keep HTTP validators so the page can later be recrawled with a
+        # conditional GET (only for the fetched body, not a JS render)
+        if not js_rendered:
+            page = replace(
+                page,
+                etag=resp.headers.get("etag"),
+                last_modified=resp.headers.get("last-modified"),
+            )
+
+        # SimHash once per page; reused by every dedup call below
+        fingerprint = simhash(page.text)
+
         # Canonical tag — if the page declares a different canonical URL,
         # skip indexing this URL to avoid duplicate content.
         canonical = extract_canonical(html, url)
@@ -319,7 +349,9 @@ class CrawlWorker:
                 canonical=canonical,
             )
             # Mark current URL as seen so we don't revisit it
-            self._dedup.mark_seen(url, page.text_hash, page.text)
+            self._dedup.mark_key_seen(
+                key, page.text_hash, page.text, fingerprint=fingerprint
+            )
             self._scheduler.mark_done(url)
             # Schedule the canonical URL for crawling instead
             if not self._dedup.is_url_seen(canonical):
@@ -334,7 +366,9 @@ class CrawlWorker:
         # Check dedup (content hash) — skip when force=True
         if not force and self._dedup.is_content_seen(page.text_hash):
             logger.debug("crawl_duplicate_content", url=url)
-            self._dedup.mark_seen(url, page.text_hash, page.text)
+            self._dedup.mark_key_seen(
+                key, page.text_hash, page.text, fingerprint=fingerprint
+            )
             self._scheduler.mark_done(url)
             return CrawlResult(
                 url=url,
@@ -344,9 +378,13 @@ class CrawlWorker:
             )
 
         # Check near-duplicate (SimHash) — skip when force=True
-        if not force and self._dedup.is_near_duplicate(page.text):
+        if not force and self._dedup.is_near_duplicate(
+            page.text, fingerprint=fingerprint
+        ):
             logger.debug("crawl_near_duplicate", url=url)
-            self._dedup.mark_seen(url, page.text_hash, page.text)
+            self._dedup.mark_key_seen(
+                key, page.text_hash, page.text, fingerprint=fingerprint
+            )
             self._scheduler.mark_done(url)
             return CrawlResult(
                 url=url,
@@ -356,7 +394,9 @@ class CrawlWorker:
             )
 
         # Mark as seen
-        self._dedup.mark_seen(url, page.text_hash, page.text)
+        self._dedup.mark_key_seen(
+            key, page.text_hash, page.text, fingerprint=fingerprint
+        )
         self._scheduler.mark_done(url)
 
         # Extract and schedule child links (BFS)
@@ -364,13 +404,11 @@ class CrawlWorker:
         if self._config.max_depth == 0 or depth < self._config.max_depth:
             discovered = extract_links(html, url)
             scheduled = 0
-            for link in discovered:
-                if not self._in_scope(link):
-                    continue
-                if not self._dedup.is_url_seen(link):
-                    added = await self._scheduler.add_url(link, depth=depth + 1)
-                    if added:
-                        scheduled += 1
+            in_scope = [link for link in discovered if self._in_scope(link)]
+            for link in self._dedup.filter_unseen(in_scope):
+                added = await self._scheduler.add_url(link, depth=depth + 1)
+                if added:
+                    scheduled += 1
             if scheduled:
                 logger.info(
                     "links_scheduled",
@@ -423,8 +461,6 @@ class CrawlWorker:
             ``httpx.Response`` on success, or ``CrawlResult`` on
             permanent failure.
         """
-        from infomesh.security import validate_url_post_redirect
-
         last_error: str = ""
         resp: httpx.Response | None = None
 
@@ -433,7 +469,7 @@ class CrawlWorker:
             try:
                 resp = await client.get(url, timeout=30.0)
                 resp.raise_for_status()
-                validate_url_post_redirect(str(resp.url))
+                await validate_url_async(str(resp.url), resolver=self._resolver)
                 return resp
             except SSRFError as exc:
                 final_url = str(resp.url) if resp is not None else url
@@ -540,11 +576,10 @@ class CrawlWorker:
                     re.IGNORECASE,
                 )
 
-                for loc_url in loc_urls:
-                    if not self._dedup.is_url_seen(loc_url):
-                        added = await self._scheduler.add_url(loc_url, depth=0)
-                        if added:
-                            total_scheduled += 1
+                for loc_url in self._dedup.filter_unseen(loc_urls):
+                    added = await self._scheduler.add_url(loc_url, depth=0)
+                    if added:
+                        total_scheduled += 1
 
             except SSRFError:
                 logger.debug(
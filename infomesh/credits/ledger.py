@@ -24,11 +24,22 @@ Grace Period + Debt:
     positive again, the debt state resets.
 
     No credit card.  No dollars.  No subscription.
+
+Running totals:
+    Earned / spent / per-action totals are materialized in
+    ``credit_totals`` and ``credit_action_totals`` by triggers, so they
+    are updated in the same transaction as each entry and balance
+    lookups never scan the ledger.  Every *checkpoint_interval* entries
+    a hash-chained checkpoint of those totals is written; entries
+    covered by a checkpoint can be removed with :meth:`CreditLedger.compact`
+    without changing any total.
 """
 
 from __future__ import annotations
 
 import contextlib
+import json
+import math
 import time
 from pathlib import Path
 
@@ -45,13 +56,16 @@ from infomesh.credits.types import (
     TIER_THRESHOLDS,
     ActionType,
     ContributionTier,
+    CreditCheckpoint,
     CreditEntry,
+    CreditEpoch,
     CreditState,
     LedgerStats,
     SearchAllowance,
 )
 from infomesh.db import SQLiteStore
 from infomesh.hashing import content_hash
+from infomesh.trust.merkle import MerkleMountainRange, MerkleProof
 from infomesh.types import KeyPairLike
 
 logger = structlog.get_logger()
@@ -62,7 +76,9 @@ __all__ = [
     "ACTION_WEIGHTS",
     "ActionType",
     "ContributionTier",
+    "CreditCheckpoint",
     "CreditEntry",
+    "CreditEpoch",
     "CreditLedger",
     "CreditState",
     "DEBT_COST_MULTIPLIER",
@@ -75,6 +91,75 @@ __all__ = [
 ]
 
 
+# Entries recorded between automatic checkpoints (0 disables them)
+DEFAULT_CHECKPOINT_INTERVAL = 10_000
+# Epoch mode: entries per sealed epoch, and the longest an epoch stays open
+DEFAULT_EPOCH_SIZE = 1_000
+DEFAULT_EPOCH_MAX_AGE = 600.0
+
+_LLM_ACTION_VALUES = frozenset(a.value for a in _LLM_ACTIONS)
+_LLM_ACTION_SQL = ", ".join(f"'{a}'" for a in sorted(_LLM_ACTION_VALUES))
+_MAX_ROWID = 2**63 - 1
+
+# Epochs sealed over a standalone per-epoch tree (before the mountain range)
+_LEGACY_EPOCHS_SQL = (
+    "SELECT epoch_id FROM credit_epochs"
+    " WHERE sealed_at IS NOT NULL AND leaf_count = 0 AND signature != ''"
+)
+
+# (earned, spent, llm, non_llm, entries, spends, per-action credits)
+type _Totals = tuple[float, float, float, float, int, int, dict[str, float]]
+
+# Materialized totals.  Created (and backfilled) by ``_migrate`` rather
+# than ``_SCHEMA`` so an existing ledger is summed once before the
+# triggers start counting.  Entries are append-only; the only deletion
+# is :meth:`CreditLedger.compact`, which must not change the totals, so
+# there are no delete triggers.
+_TOTALS_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS credit_totals (
+        id          INTEGER PRIMARY KEY CHECK (id = 1),
+        earned      REAL    NOT NULL DEFAULT 0,
+        spent       REAL    NOT NULL DEFAULT 0,
+        llm_earned  REAL    NOT NULL DEFAULT 0,
+        other_earned REAL   NOT NULL DEFAULT 0,
+        entries     INTEGER NOT NULL DEFAULT 0,
+        spends      INTEGER NOT NULL DEFAULT 0
+    );
+    INSERT OR IGNORE INTO credit_totals (id) VALUES (1);
+
+    CREATE TABLE IF NOT EXISTS credit_action_totals (
+        action      TEXT    PRIMARY KEY,
+        credits     REAL    NOT NULL,
+        entries     INTEGER NOT NULL
+    );
+
+    CREATE TRIGGER IF NOT EXISTS credit_totals_entry_ai
+    AFTER INSERT ON credit_entries BEGIN
+        UPDATE credit_totals SET
+            earned = earned + new.credits,
+            llm_earned = llm_earned + CASE
+                WHEN new.action IN ({_LLM_ACTION_SQL}) THEN new.credits ELSE 0 END,
+            other_earned = other_earned + CASE
+                WHEN new.action IN ({_LLM_ACTION_SQL}) THEN 0 ELSE new.credits END,
+            entries = entries + 1
+        WHERE id = 1;
+        INSERT INTO credit_action_totals (action, credits, entries)
+        VALUES (new.action, new.credits, 1)
+        ON CONFLICT(action) DO UPDATE SET
+            credits = credits + excluded.credits,
+            entries = entries + 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS credit_totals_spend_ai
+    AFTER INSERT ON credit_spending BEGIN
+        UPDATE credit_totals SET
+            spent = spent + new.amount,
+            spends = spends + 1
+        WHERE id = 1;
+    END;
+"""
+
+
 # --- Ledger ---------------------------------------------------------------
 
 
@@ -96,7 +181,20 @@ class CreditLedger(SQLiteStore):
             note        TEXT    NOT NULL DEFAULT '',
             entry_hash  TEXT    NOT NULL DEFAULT '',
             signature   TEXT    NOT NULL DEFAULT '',
-            owner_email TEXT    NOT NULL DEFAULT ''
+            owner_email TEXT    NOT NULL DEFAULT '',
+            epoch_id    INTEGER,
+            mmr_leaf    INTEGER
+        );
+
+        CREATE TABLE IF NOT EXISTS credit_epochs (
+            epoch_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+            opened_at   REAL    NOT NULL,
+            sealed_at   REAL,
+            entry_count INTEGER NOT NULL DEFAULT 0,
+            merkle_root TEXT    NOT NULL DEFAULT '',
+            signature   TEXT    NOT NULL DEFAULT '',
+            peer_id     TEXT    NOT NULL DEFAULT '',
+            leaf_count  INTEGER NOT NULL DEFAULT 0
         );
 
         CREATE TABLE IF NOT EXISTS credit_spending (
@@ -112,6 +210,25 @@ class CreditLedger(SQLiteStore):
         );
         INSERT OR IGNORE INTO credit_grace (id, grace_start) VALUES (1, NULL);
 
+        CREATE TABLE IF NOT EXISTS credit_checkpoints (
+            checkpoint_id   INTEGER PRIMARY KEY AUTOINCREMENT,
+            last_entry_id   INTEGER NOT NULL,
+            last_spend_id   INTEGER NOT NULL,
+            entries         INTEGER NOT NULL,
+            spends          INTEGER NOT NULL,
+            total_earned    REAL    NOT NULL,
+            total_spent     REAL    NOT NULL,
+            llm_earned      REAL    NOT NULL,
+            other_earned    REAL    NOT NULL,
+            action_totals   TEXT    NOT NULL,
+            segment_hash    TEXT    NOT NULL,
+            prev_hash       TEXT    NOT NULL,
+            checkpoint_hash TEXT    NOT NULL,
+            signature       TEXT    NOT NULL DEFAULT '',
+            timestamp       REAL    NOT NULL,
+            compacted       INTEGER NOT NULL DEFAULT 0
+        );
+
         CREATE INDEX IF NOT EXISTS idx_entries_action
             ON credit_entries(action);
         CREATE INDEX IF NOT EXISTS idx_entries_ts
@@ -123,10 +240,37 @@ class CreditLedger(SQLiteStore):
         db_path: Path | str | None = None,
         *,
         owner_email: str = "",
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        epoch_size: int = 0,
+        epoch_max_age: float = DEFAULT_EPOCH_MAX_AGE,
     ) -> None:
         self._owner_email = owner_email
-        super().__init__(db_path, extra_pragmas=["PRAGMA foreign_keys=ON"])
+        self._checkpoint_interval = checkpoint_interval
+        self._epoch_size = epoch_size
+        self._epoch_max_age = epoch_max_age
+        pragmas = ["PRAGMA foreign_keys=ON"]
+        if epoch_size > 0:
+            # Entries of the open epoch are unsigned until it is sealed
+            # anyway; skip the per-commit WAL fsync.
+            pragmas.append("PRAGMA synchronous=NORMAL")
+        super().__init__(db_path, extra_pragmas=pragmas)
+        # Append-only Merkle mountain range over every provable entry,
+        # in the order entries became provable (see ``mmr_leaf``)
+        self._mmr = MerkleMountainRange(self._conn, table="credit_mmr")
         self._migrate()
+        last = self.last_checkpoint()
+        self._checkpoint_entries = last.entries if last else 0
+        # Open epoch as (epoch_id, opened_at, entries), or None
+        self._epoch: tuple[int, float, int] | None = None
+        row = self._conn.execute(
+            "SELECT e.epoch_id, e.opened_at,"
+            " (SELECT COUNT(*) FROM credit_entries c"
+            "  WHERE c.epoch_id = e.epoch_id)"
+            " FROM credit_epochs e WHERE e.sealed_at IS NULL"
+            " ORDER BY e.epoch_id DESC LIMIT 1"
+        ).fetchone()
+        if row is not None:
+            self._epoch = (int(row[0]), float(row[1]), int(row[2]))
 
     @property
     def owner_email(self) -> str:
@@ -143,7 +287,8 @@ class CreditLedger(SQLiteStore):
     def _migrate(self) -> None:
         """Add entry_hash / signature columns.
 
-        Also adds credit_grace table for existing databases.
+        Also adds credit_grace table for existing databases, and creates
+        the running-total tables, backfilling them from existing entries.
         """
         cursor = self._conn.execute("PRAGMA table_info(credit_entries)")
         columns = {row[1] for row in cursor.fetchall()}
@@ -165,6 +310,26 @@ class CreditLedger(SQLiteStore):
                 " ADD COLUMN owner_email TEXT"
                 " NOT NULL DEFAULT ''"
             )
+        if "epoch_id" not in columns:
+            self._conn.execute("ALTER TABLE credit_entries ADD COLUMN epoch_id INTEGER")
+        if "mmr_leaf" not in columns:
+            self._conn.execute("ALTER TABLE credit_entries ADD COLUMN mmr_leaf INTEGER")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_epoch"
+            " ON credit_entries(epoch_id) WHERE epoch_id IS NOT NULL"
+        )
+        self._conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_entries_mmr_leaf"
+            " ON credit_entries(mmr_leaf) WHERE mmr_leaf IS NOT NULL"
+        )
+        epoch_columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(credit_epochs)")
+        }
+        if "leaf_count" not in epoch_columns:
+            self._conn.execute(
+                "ALTER TABLE credit_epochs"
+                " ADD COLUMN leaf_count INTEGER NOT NULL DEFAULT 0"
+            )
 
         # Ensure credit_grace table exists (for databases created before debt system)
         self._conn.execute(
@@ -177,6 +342,100 @@ class CreditLedger(SQLiteStore):
         )
         self._conn.commit()
 
+        has_totals = self._conn.execute(
+            "SELECT 1 FROM sqlite_master"
+            " WHERE type = 'table' AND name = 'credit_totals'"
+        ).fetchone()
+        if not has_totals:
+            self._backfill_totals()
+        self._backfill_mmr()
+
+    def _backfill_mmr(self) -> None:
+        """Make entries recorded before the mountain range existed provable.
+
+        Individually signed entries are appended in chronological order.
+        Entries of epochs sealed over a standalone per-epoch tree carry no
+        signature of their own, so they are moved into the open epoch (one
+        is opened if needed); the next :meth:`seal_epoch` appends them and
+        signs them against the mountain range.  The legacy epoch rows keep
+        their original root and signature.
+        """
+        pending = self._conn.execute(
+            "SELECT entry_id, entry_hash FROM credit_entries"
+            " WHERE mmr_leaf IS NULL AND entry_hash != '' AND signature != ''"
+            " ORDER BY timestamp, entry_id"
+        ).fetchall()
+        legacy = self._conn.execute(
+            "SELECT COUNT(*) FROM credit_entries WHERE mmr_leaf IS NULL"
+            f" AND epoch_id IN ({_LEGACY_EPOCHS_SQL})"
+        ).fetchone()[0]
+        if not pending and not legacy:
+            return
+        try:
+            for entry_id, entry_hash in pending:
+                self._conn.execute(
+                    "UPDATE credit_entries SET mmr_leaf = ? WHERE entry_id = ?",
+                    (self._mmr.append(entry_hash), entry_id),
+                )
+            if legacy:
+                row = self._conn.execute(
+                    "SELECT epoch_id FROM credit_epochs WHERE sealed_at IS NULL"
+                    " ORDER BY epoch_id DESC LIMIT 1"
+                ).fetchone()
+                open_id = (
+                    row[0]
+                    if row is not None
+                    else self._conn.execute(
+                        "INSERT INTO credit_epochs (opened_at) VALUES (?)",
+                        (time.time(),),
+                    ).lastrowid
+                )
+                self._conn.execute(
+                    "UPDATE credit_entries SET epoch_id = ? WHERE mmr_leaf IS NULL"
+                    f" AND epoch_id IN ({_LEGACY_EPOCHS_SQL})",
+                    (open_id,),
+                )
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            self._mmr.reload()
+            raise
+        logger.info(
+            "credit_mmr_backfilled", entries=len(pending), legacy_entries=legacy
+        )
+
+    def _backfill_totals(self) -> None:
+        """Create the running-total tables and sum the existing ledger once.
+
+        Tables, backfill and triggers are created in one transaction so no
+        entry can be counted twice or missed.
+        """
+        try:
+            self._conn.executescript(
+                f"""BEGIN IMMEDIATE;
+                {_TOTALS_SCHEMA}
+                UPDATE credit_totals SET
+                    earned = (SELECT COALESCE(SUM(credits), 0) FROM credit_entries),
+                    llm_earned = (SELECT COALESCE(SUM(credits), 0)
+                                  FROM credit_entries
+                                  WHERE action IN ({_LLM_ACTION_SQL})),
+                    other_earned = (SELECT COALESCE(SUM(credits), 0)
+                                    FROM credit_entries
+                                    WHERE action NOT IN ({_LLM_ACTION_SQL})),
+                    entries = (SELECT COUNT(*) FROM credit_entries),
+                    spent = (SELECT COALESCE(SUM(amount), 0) FROM credit_spending),
+                    spends = (SELECT COUNT(*) FROM credit_spending)
+                WHERE id = 1;
+                INSERT INTO credit_action_totals (action, credits, entries)
+                    SELECT action, SUM(credits), COUNT(*)
+                    FROM credit_entries GROUP BY action;
+                COMMIT;"""
+            )
+        except Exception:
+            with contextlib.suppress(Exception):
+                self._conn.execute("ROLLBACK")
+            raise
+
     # --- Earning -----------------------------------------------------------
 
     def record_action(
@@ -197,7 +456,9 @@ class CreditLedger(SQLiteStore):
             note: Free-text annotation.
             key_pair: Optional key pair for signing the entry (enables P2P
                 verification).  When provided, the entry's canonical data is
-                hashed and signed with Ed25519.
+                hashed and signed with Ed25519 — or, in epoch mode, the
+                entry joins the open epoch and is covered by the epoch's
+                root signature once the epoch is sealed.
 
         Returns:
             Credits earned (after weight × quantity × multiplier).
@@ -228,33 +489,61 @@ class CreditLedger(SQLiteStore):
         )
         entry_hash = content_hash(canonical)
         sig_hex = ""
-        if key_pair is not None:
-            sig_hex = key_pair.sign(canonical).hex()
+        epoch_id: int | None = None
+        mmr_leaf: int | None = None
+        try:
+            if key_pair is not None:
+                if self._epoch_size > 0:
+                    epoch_id = self._open_epoch(now)
+                else:
+                    sig_hex = key_pair.sign(canonical).hex()
+                    mmr_leaf = self._mmr.append(entry_hash)
 
-        self._conn.execute(
-            """INSERT INTO credit_entries
-               (action, quantity, weight, multiplier, credits, timestamp, note,
-                entry_hash, signature, owner_email)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                action.value,
-                quantity,
-                weight,
-                multiplier,
-                earned,
-                now,
-                note,
-                entry_hash,
-                sig_hex,
-                self._owner_email,
-            ),
-        )
-        self._conn.commit()
+            self._conn.execute(
+                """INSERT INTO credit_entries
+                   (action, quantity, weight, multiplier, credits, timestamp,
+                    note, entry_hash, signature, owner_email, epoch_id, mmr_leaf)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    action.value,
+                    quantity,
+                    weight,
+                    multiplier,
+                    earned,
+                    now,
+                    note,
+                    entry_hash,
+                    sig_hex,
+                    self._owner_email,
+                    epoch_id,
+                    mmr_leaf,
+                ),
+            )
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            self._mmr.reload()
+            if epoch_id is not None and self._epoch and self._epoch[2] == 0:
+                self._epoch = None  # opened by this call; rolled back too
+            raise
 
         # Check if earning credits restored a positive balance → clear debt
-        if self.balance() > 0:
+        totals = self._totals()
+        if totals[0] - totals[1] > 0:
             self._clear_grace()
 
+        if (
+            self._checkpoint_interval > 0
+            and totals[4] - self._checkpoint_entries >= self._checkpoint_interval
+        ):
+            self.checkpoint(key_pair=key_pair)
+
+        if key_pair is not None and self._epoch is not None:
+            _, opened_at, count = self._epoch
+            self._epoch = (self._epoch[0], opened_at, count + 1)
+            if count + 1 >= self._epoch_size or now - opened_at >= self._epoch_max_age:
+                self.seal_epoch(key_pair)
+
         logger.debug(
             "credit_earned",
             action=action.value,
@@ -264,6 +553,153 @@ class CreditLedger(SQLiteStore):
         )
         return earned
 
+    # --- Epochs ------------------------------------------------------------
+
+    def _open_epoch(self, now: float) -> int:
+        """Return the open epoch's id, opening one if needed.
+
+        Runs inside the caller's transaction so the epoch row and its
+        first entry are committed together.
+        """
+        if self._epoch is None:
+            cursor = self._conn.execute(
+                "INSERT INTO credit_epochs (opened_at) VALUES (?)", (now,)
+            )
+            self._epoch = (int(cursor.lastrowid or 0), now, 0)
+        return self._epoch[0]
+
+    def seal_epoch(self, key_pair: KeyPairLike) -> CreditEpoch | None:
+        """Append the open epoch to the Merkle mountain range and sign it.
+
+        The signature covers the range's root right after the epoch's
+        entries were appended (and the leaf count it spans), so one
+        signature vouches for every entry of the epoch — and the history
+        before it.
+
+        Called automatically once the epoch holds *epoch_size* entries or
+        is *epoch_max_age* seconds old; call it on shutdown and before
+        building proofs so no entry stays unsigned.
+
+        Returns:
+            The sealed epoch, or ``None`` if no epoch was open.
+        """
+        if self._epoch is None:
+            return None
+        epoch_id, opened_at, _ = self._epoch
+        now = time.time()
+        try:
+            entries = self._conn.execute(
+                "SELECT entry_id, entry_hash FROM credit_entries"
+                " WHERE epoch_id = ? ORDER BY entry_id",
+                (epoch_id,),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE credit_entries SET mmr_leaf = ? WHERE entry_id = ?",
+                [
+                    (self._mmr.append(entry_hash), entry_id)
+                    for entry_id, entry_hash in entries
+                ],
+            )
+            leaf_count = self._mmr.leaf_count
+            root = self._mmr.root()
+            signature = (
+                key_pair.sign(
+                    _epoch_canonical(epoch_id, root, leaf_count, key_pair.peer_id)
+                ).hex()
+                if entries
+                else ""
+            )
+            self._conn.execute(
+                "UPDATE credit_epochs SET sealed_at = ?, entry_count = ?,"
+                " merkle_root = ?, signature = ?, peer_id = ?, leaf_count = ?"
+                " WHERE epoch_id = ?",
+                (
+                    now,
+                    len(entries),
+                    root,
+                    signature,
+                    key_pair.peer_id,
+                    leaf_count,
+                    epoch_id,
+                ),
+            )
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            self._mmr.reload()
+            raise
+        self._epoch = None
+        logger.debug(
+            "credit_epoch_sealed",
+            epoch_id=epoch_id,
+            entries=len(entries),
+            root=root[:16],
+        )
+        return CreditEpoch(
+            epoch_id=epoch_id,
+            entry_count=len(entries),
+            merkle_root=root,
+            signature=signature,
+            peer_id=key_pair.peer_id,
+            opened_at=opened_at,
+            sealed_at=now,
+            leaf_count=leaf_count,
+        )
+
+    def get_epoch(self, epoch_id: int) -> CreditEpoch | None:
+        """Look up an epoch (open or sealed) by id."""
+        row = self._conn.execute(
+            "SELECT epoch_id, entry_count, merkle_root, signature, peer_id,"
+            " opened_at, sealed_at, leaf_count"
+            " FROM credit_epochs WHERE epoch_id = ?",
+            (epoch_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return CreditEpoch(
+            epoch_id=row[0],
+            entry_count=row[1],
+            merkle_root=row[2],
+            signature=row[3],
+            peer_id=row[4],
+            opened_at=row[5],
+            sealed_at=row[6],
+            leaf_count=row[7],
+        )
+
+    # --- Merkle proofs -----------------------------------------------------
+
+    @property
+    def proof_leaf_count(self) -> int:
+        """Number of provable entries in the Merkle mountain range."""
+        return self._mmr.leaf_count
+
+    def proof_root(self, leaf_count: int | None = None) -> str:
+        """Merkle root over the first *leaf_count* provable entries."""
+        return self._mmr.root(leaf_count)
+
+    def entry_proof(
+        self, leaf_index: int, *, leaf_count: int | None = None
+    ) -> MerkleProof:
+        """Membership proof of a provable entry (see ``CreditEntry.leaf_index``)."""
+        return self._mmr.get_proof(leaf_index, leaf_count=leaf_count)
+
+    def first_proof_leaf(self) -> int:
+        """Lowest leaf index whose entry has not been compacted away."""
+        row = self._conn.execute(
+            "SELECT MIN(mmr_leaf) FROM credit_entries WHERE mmr_leaf IS NOT NULL"
+        ).fetchone()
+        return int(row[0]) if row[0] is not None else self._mmr.leaf_count
+
+    def entries_at_leaves(self, leaf_indices: list[int]) -> list[CreditEntry]:
+        """Provable entries at the given leaf indices (compacted ones skipped)."""
+        if not leaf_indices:
+            return []
+        marks = ",".join("?" * len(leaf_indices))
+        return self._entry_rows(
+            f"WHERE c.mmr_leaf IN ({marks}) ORDER BY c.mmr_leaf", tuple(leaf_indices)
+        )
+
     # --- Spending ----------------------------------------------------------
 
     def spend(self, amount: float, *, reason: str = "search") -> bool:
@@ -331,26 +767,33 @@ class CreditLedger(SQLiteStore):
 
     # --- Queries -----------------------------------------------------------
 
-    def total_earned(self) -> float:
-        """Sum of all credits earned."""
+    def _totals(self) -> tuple[float, float, float, float, int, int]:
+        """Materialized ``(earned, spent, llm, non_llm, entries, spends)``."""
         row = self._conn.execute(
-            "SELECT COALESCE(SUM(credits), 0) FROM credit_entries"
+            "SELECT earned, spent, llm_earned, other_earned, entries, spends"
+            " FROM credit_totals WHERE id = 1"
         ).fetchone()
-        return float(row[0])
+        return (
+            float(row[0]),
+            float(row[1]),
+            float(row[2]),
+            float(row[3]),
+            int(row[4]),
+            int(row[5]),
+        )
+
+    def total_earned(self) -> float:
+        """Sum of all credits earned."""
+        return self._totals()[0]
 
     def total_spent(self) -> float:
         """Sum of all credits spent."""
-        row = self._conn.execute(
-            "SELECT COALESCE(SUM(amount), 0) FROM credit_spending"
-        ).fetchone()
-        return float(row[0])
+        return self._totals()[1]
 
     def balance(self) -> float:
         """Current credit balance (earned − spent).  Can be negative (debt)."""
         row = self._conn.execute(
-            "SELECT"
-            " (SELECT COALESCE(SUM(credits), 0) FROM credit_entries)"
-            " - (SELECT COALESCE(SUM(amount), 0) FROM credit_spending)"
+            "SELECT earned - spent FROM credit_totals WHERE id = 1"
         ).fetchone()
         return float(row[0])
 
@@ -435,36 +878,8 @@ class CreditLedger(SQLiteStore):
 
         LLM credits are capped at 60 % of total to prevent LLM-only farming.
         """
-        row = self._conn.execute(
-            "SELECT COALESCE(SUM(credits), 0)"
-            " FROM credit_entries"
-            " WHERE action IN (?, ?)",
-            (
-                ActionType.LLM_SUMMARIZE_OWN.value,
-                ActionType.LLM_SUMMARIZE_PEER.value,
-            ),
-        ).fetchone()
-        llm_raw = float(row[0])
-
-        row2 = self._conn.execute(
-            "SELECT COALESCE(SUM(credits), 0)"
-            " FROM credit_entries"
-            " WHERE action NOT IN (?, ?)",
-            (
-                ActionType.LLM_SUMMARIZE_OWN.value,
-                ActionType.LLM_SUMMARIZE_PEER.value,
-            ),
-        ).fetchone()
-        non_llm = float(row2[0])
-
-        # Cap LLM credits at 60 % of total contribution
-        total_uncapped = non_llm + llm_raw
-        if total_uncapped > 0 and llm_raw / total_uncapped > LLM_CREDIT_CAP_RATIO:
-            llm_capped = non_llm * (LLM_CREDIT_CAP_RATIO / (1 - LLM_CREDIT_CAP_RATIO))
-        else:
-            llm_capped = llm_raw
-
-        return non_llm + llm_capped
+        _, _, llm_raw, non_llm, _, _ = self._totals()
+        return _capped_score(llm_raw, non_llm)
 
     def tier(self) -> ContributionTier:
         """Current contribution tier based on score."""
@@ -477,28 +892,8 @@ class CreditLedger(SQLiteStore):
 
     def stats(self) -> LedgerStats:
         """Full ledger summary including grace/debt state."""
-        row_llm = self._conn.execute(
-            "SELECT COALESCE(SUM(credits), 0)"
-            " FROM credit_entries"
-            " WHERE action IN (?, ?)",
-            (
-                ActionType.LLM_SUMMARIZE_OWN.value,
-                ActionType.LLM_SUMMARIZE_PEER.value,
-            ),
-        ).fetchone()
-        row_non = self._conn.execute(
-            "SELECT COALESCE(SUM(credits), 0)"
-            " FROM credit_entries"
-            " WHERE action NOT IN (?, ?)",
-            (
-                ActionType.LLM_SUMMARIZE_OWN.value,
-                ActionType.LLM_SUMMARIZE_PEER.value,
-            ),
-        ).fetchone()
-
-        earned = self.total_earned()
-        spent = self.total_spent()
-        score = self.contribution_score()
+        earned, spent, llm, non_llm, _, _ = self._totals()
+        score = _capped_score(llm, non_llm)
         t = _score_to_tier(score)
         allowance = self.search_allowance()
 
@@ -509,8 +904,8 @@ class CreditLedger(SQLiteStore):
             contribution_score=round(score, 4),
             tier=t,
             search_cost=allowance.search_cost,
-            llm_credits=round(float(row_llm[0]), 4),
-            non_llm_credits=round(float(row_non[0]), 4),
+            llm_credits=round(llm, 4),
+            non_llm_credits=round(non_llm, 4),
             credit_state=allowance.state,
             grace_remaining_hours=allowance.grace_remaining_hours,
             debt_amount=allowance.debt_amount,
@@ -542,18 +937,25 @@ class CreditLedger(SQLiteStore):
         ]
 
     def signed_entries(self) -> list[CreditEntry]:
-        """Return all entries with non-empty signatures (chronological).
+        """Return all provable entries, in Merkle leaf order.
 
-        Used by the credit verification module to build Merkle proofs.
+        An entry is provable when it carries its own signature or belongs
+        to a sealed epoch (``epoch_id`` set; signed via the epoch root).
         Entries without signatures (recorded before signing was enabled)
-        are excluded.
+        and entries of the still-open epoch are excluded.
         """
+        return self._entry_rows(
+            "WHERE c.mmr_leaf IS NOT NULL ORDER BY c.mmr_leaf",
+        )
+
+    def _entry_rows(
+        self, clause: str, params: tuple[object, ...] = ()
+    ) -> list[CreditEntry]:
         rows = self._conn.execute(
-            """SELECT entry_id, action, quantity, weight, multiplier, credits,
-                      timestamp, note, entry_hash, signature
-               FROM credit_entries
-               WHERE entry_hash != '' AND signature != ''
-               ORDER BY timestamp ASC""",
+            "SELECT c.entry_id, c.action, c.quantity, c.weight, c.multiplier,"
+            " c.credits, c.timestamp, c.note, c.entry_hash, c.signature,"
+            f" c.epoch_id, c.mmr_leaf FROM credit_entries c {clause}",
+            params,
         ).fetchall()
         return [
             CreditEntry(
@@ -567,10 +969,364 @@ class CreditLedger(SQLiteStore):
                 note=r[7],
                 entry_hash=r[8],
                 signature=r[9],
+                epoch_id=r[10],
+                leaf_index=r[11],
             )
             for r in rows
         ]
 
+    # --- Checkpoints -------------------------------------------------------
+
+    def checkpoint(self, *, key_pair: KeyPairLike | None = None) -> CreditCheckpoint:
+        """Record a hash-chained checkpoint of the current running totals.
+
+        Runs automatically every *checkpoint_interval* entries; call it
+        directly (e.g. before :meth:`compact`) to checkpoint now.
+
+        Args:
+            key_pair: Optional key pair; when given the checkpoint hash is
+                signed so peers can verify it.
+
+        Returns:
+            The new checkpoint, or the latest one if nothing was recorded
+            since it was taken.
+        """
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            prev = self.last_checkpoint()
+            earned, spent, llm, non_llm, entries, spends = self._totals()
+            if prev is not None and (prev.entries, prev.spends) == (entries, spends):
+                self._conn.execute("COMMIT")
+                return prev
+
+            last_entry_id = self._conn.execute(
+                "SELECT COALESCE(MAX(entry_id), 0) FROM credit_entries"
+            ).fetchone()[0]
+            last_spend_id = self._conn.execute(
+                "SELECT COALESCE(MAX(spend_id), 0) FROM credit_spending"
+            ).fetchone()[0]
+            action_totals = {
+                r[0]: float(r[1])
+                for r in self._conn.execute(
+                    "SELECT action, credits FROM credit_action_totals"
+                )
+            }
+            segment_hash, _ = self._scan_segment(prev, last_entry_id, last_spend_id)
+            prev_hash = prev.checkpoint_hash if prev else ""
+            now = time.time()
+            canonical = _checkpoint_canonical(
+                prev_hash,
+                last_entry_id,
+                last_spend_id,
+                entries,
+                spends,
+                earned,
+                spent,
+                llm,
+                non_llm,
+                action_totals,
+                segment_hash,
+                now,
+            )
+            checkpoint_hash = content_hash(canonical)
+            sig_hex = key_pair.sign(canonical).hex() if key_pair is not None else ""
+            cursor = self._conn.execute(
+                """INSERT INTO credit_checkpoints
+                   (last_entry_id, last_spend_id, entries, spends, total_earned,
+                    total_spent, llm_earned, other_earned, action_totals,
+                    segment_hash, prev_hash, checkpoint_hash, signature,
+                    timestamp)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    last_entry_id,
+                    last_spend_id,
+                    entries,
+                    spends,
+                    earned,
+                    spent,
+                    llm,
+                    non_llm,
+                    _action_totals_json(action_totals),
+                    segment_hash,
+                    prev_hash,
+                    checkpoint_hash,
+                    sig_hex,
+                    now,
+                ),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            with contextlib.suppress(Exception):
+                self._conn.execute("ROLLBACK")
+            raise
+
+        self._checkpoint_entries = entries
+        logger.info(
+            "credit_checkpoint",
+            checkpoint_id=cursor.lastrowid,
+            entries=entries,
+            balance=round(earned - spent, 4),
+            hash=checkpoint_hash[:16],
+        )
+        return CreditCheckpoint(
+            checkpoint_id=int(cursor.lastrowid or 0),
+            last_entry_id=last_entry_id,
+            last_spend_id=last_spend_id,
+            entries=entries,
+            spends=spends,
+            total_earned=earned,
+            total_spent=spent,
+            llm_credits=llm,
+            non_llm_credits=non_llm,
+            action_totals=action_totals,
+            segment_hash=segment_hash,
+            prev_hash=prev_hash,
+            checkpoint_hash=checkpoint_hash,
+            timestamp=now,
+            signature=sig_hex,
+        )
+
+    def last_checkpoint(self) -> CreditCheckpoint | None:
+        """Most recent checkpoint, or ``None`` if none was taken yet."""
+        rows = self._checkpoint_rows(
+            "ORDER BY checkpoint_id DESC LIMIT 1",
+        )
+        return rows[0] if rows else None
+
+    def checkpoints(self) -> list[CreditCheckpoint]:
+        """All checkpoints, oldest first."""
+        return self._checkpoint_rows("ORDER BY checkpoint_id ASC")
+
+    def verify_checkpoints(self, *, key_pair: KeyPairLike | None = None) -> bool:
+        """Check the checkpoint chain and the running totals against it.
+
+        - every checkpoint hash matches its contents and links to the
+          previous checkpoint;
+        - for segments whose entries have not been compacted, the entries
+          hash to ``segment_hash`` and sum to the recorded totals;
+        - the live totals equal the last checkpoint plus the entries
+          recorded after it.
+
+        Args:
+            key_pair: When given, signed checkpoints must carry a valid
+                signature from this key.
+
+        Returns:
+            ``True`` if the ledger is consistent.
+        """
+        prev: CreditCheckpoint | None = None
+        for cp in self.checkpoints():
+            canonical = _checkpoint_canonical(
+                cp.prev_hash,
+                cp.last_entry_id,
+                cp.last_spend_id,
+                cp.entries,
+                cp.spends,
+                cp.total_earned,
+                cp.total_spent,
+                cp.llm_credits,
+                cp.non_llm_credits,
+                cp.action_totals,
+                cp.segment_hash,
+                cp.timestamp,
+            )
+            expected_prev = prev.checkpoint_hash if prev else ""
+            if cp.prev_hash != expected_prev or content_hash(canonical) != (
+                cp.checkpoint_hash
+            ):
+                logger.warning(
+                    "credit_checkpoint_invalid",
+                    checkpoint_id=cp.checkpoint_id,
+                    reason="hash_chain",
+                )
+                return False
+            if (
+                key_pair is not None
+                and cp.signature
+                and not key_pair.verify(canonical, bytes.fromhex(cp.signature))
+            ):
+                logger.warning(
+                    "credit_checkpoint_invalid",
+                    checkpoint_id=cp.checkpoint_id,
+                    reason="signature",
+                )
+                return False
+            if not cp.compacted:
+                segment_hash, sums = self._scan_segment(
+                    prev, cp.last_entry_id, cp.last_spend_id
+                )
+                if segment_hash != cp.segment_hash or not _totals_match(
+                    sums, _checkpoint_totals(cp)
+                ):
+                    logger.warning(
+                        "credit_checkpoint_invalid",
+                        checkpoint_id=cp.checkpoint_id,
+                        reason="segment",
+                    )
+                    return False
+            prev = cp
+
+        _, tail = self._scan_segment(prev, None, None)
+        earned, spent, llm, non_llm, entries, spends = self._totals()
+        action_totals = {
+            r[0]: float(r[1])
+            for r in self._conn.execute(
+                "SELECT action, credits FROM credit_action_totals"
+            )
+        }
+        live = (earned, spent, llm, non_llm, entries, spends, action_totals)
+        if not _totals_match(tail, live):
+            logger.warning("credit_checkpoint_invalid", reason="running_totals")
+            return False
+        return True
+
+    def compact(self, *, checkpoint_id: int | None = None) -> int:
+        """Delete entries and spends covered by a checkpoint.
+
+        Totals, balance and tier are unaffected; the checkpoint chain keeps
+        the compacted history verifiable.  Compacted entries no longer
+        appear in :meth:`recent_entries` or :meth:`signed_entries`.
+        Entries of the open epoch are kept until it is sealed.  The
+        Merkle mountain range is never compacted, so roots and proofs for
+        the remaining entries are unaffected.
+
+        Args:
+            checkpoint_id: Compact up to this checkpoint (default: latest).
+
+        Returns:
+            Number of rows removed (0 if there is no checkpoint).
+        """
+        if checkpoint_id is None:
+            cp = self.last_checkpoint()
+        else:
+            rows = self._checkpoint_rows(
+                "WHERE checkpoint_id = ?",
+                (checkpoint_id,),
+            )
+            cp = rows[0] if rows else None
+        if cp is None:
+            return 0
+
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            # Entries of the open epoch are kept until it is sealed;
+            # proofs for the rest come from the mountain range's nodes
+            removed = self._conn.execute(
+                "DELETE FROM credit_entries WHERE entry_id <= ?"
+                " AND (epoch_id IS NULL OR mmr_leaf IS NOT NULL)",
+                (cp.last_entry_id,),
+            ).rowcount
+            removed += self._conn.execute(
+                "DELETE FROM credit_spending WHERE spend_id <= ?",
+                (cp.last_spend_id,),
+            ).rowcount
+            self._conn.execute(
+                "UPDATE credit_checkpoints SET compacted = 1 WHERE checkpoint_id <= ?",
+                (cp.checkpoint_id,),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            with contextlib.suppress(Exception):
+                self._conn.execute("ROLLBACK")
+            raise
+
+        logger.info(
+            "credit_ledger_compacted",
+            checkpoint_id=cp.checkpoint_id,
+            removed=removed,
+        )
+        return removed
+
+    def _checkpoint_rows(
+        self, clause: str, params: tuple[object, ...] = ()
+    ) -> list[CreditCheckpoint]:
+        rows = self._conn.execute(
+            "SELECT checkpoint_id, last_entry_id, last_spend_id, entries, spends,"
+            " total_earned, total_spent, llm_earned, other_earned, action_totals,"
+            " segment_hash, prev_hash, checkpoint_hash, timestamp, signature,"
+            f" compacted FROM credit_checkpoints {clause}",
+            params,
+        ).fetchall()
+        return [
+            CreditCheckpoint(
+                checkpoint_id=r[0],
+                last_entry_id=r[1],
+                last_spend_id=r[2],
+                entries=r[3],
+                spends=r[4],
+                total_earned=r[5],
+                total_spent=r[6],
+                llm_credits=r[7],
+                non_llm_credits=r[8],
+                action_totals=json.loads(r[9]),
+                segment_hash=r[10],
+                prev_hash=r[11],
+                checkpoint_hash=r[12],
+                timestamp=r[13],
+                signature=r[14],
+                compacted=bool(r[15]),
+            )
+            for r in rows
+        ]
+
+    def _scan_segment(
+        self,
+        prev: CreditCheckpoint | None,
+        last_entry_id: int | None,
+        last_spend_id: int | None,
+    ) -> tuple[str, _Totals]:
+        """Hash and re-sum the entries and spends recorded after *prev*.
+
+        Sums continue from *prev*'s totals in insertion order — the same
+        order the triggers add them in — so they reproduce the running
+        totals.  ``None`` bounds scan to the end of the ledger.
+        """
+        after_entry = prev.last_entry_id if prev else 0
+        after_spend = prev.last_spend_id if prev else 0
+        base: _Totals = (
+            _checkpoint_totals(prev) if prev else (0.0, 0.0, 0.0, 0.0, 0, 0, {})
+        )
+        earned, spent, llm, non_llm, entries, spends, actions = base
+        actions = dict(actions)
+        lines: list[str] = []
+
+        entry_rows = self._conn.execute(
+            "SELECT entry_id, action, credits, timestamp, entry_hash"
+            " FROM credit_entries WHERE entry_id > ? AND entry_id <= ?"
+            " ORDER BY entry_id",
+            (after_entry, _MAX_ROWID if last_entry_id is None else last_entry_id),
+        )
+        for entry_id, action, credits, ts, entry_hash in entry_rows:
+            lines.append(f"e|{entry_id}|{action}|{credits}|{ts}|{entry_hash}\n")
+            earned += credits
+            if action in _LLM_ACTION_VALUES:
+                llm += credits
+            else:
+                non_llm += credits
+            actions[action] = actions.get(action, 0.0) + credits
+            entries += 1
+
+        spend_rows = self._conn.execute(
+            "SELECT spend_id, amount, reason, timestamp"
+            " FROM credit_spending WHERE spend_id > ? AND spend_id <= ?"
+            " ORDER BY spend_id",
+            (after_spend, _MAX_ROWID if last_spend_id is None else last_spend_id),
+        )
+        for spend_id, amount, reason, ts in spend_rows:
+            lines.append(f"s|{spend_id}|{amount}|{reason}|{ts}\n")
+            spent += amount
+            spends += 1
+
+        return content_hash("".join(lines)), (
+            earned,
+            spent,
+            llm,
+            non_llm,
+            entries,
+            spends,
+            actions,
+        )
+
     # close() inherited from SQLiteStore
 
     def earnings_by_action(self) -> list[tuple[str, float]]:
@@ -580,9 +1336,8 @@ class CreditLedger(SQLiteStore):
             List of (action, total_credits) tuples, ordered by total desc.
         """
         rows = self._conn.execute(
-            "SELECT action, COALESCE(SUM(credits), 0) AS total "
-            "FROM credit_entries WHERE credits > 0 "
-            "GROUP BY action ORDER BY total DESC",
+            "SELECT action, credits FROM credit_action_totals"
+            " WHERE credits > 0 ORDER BY credits DESC",
         ).fetchall()
         return [(r[0], r[1]) for r in rows]
 
@@ -610,6 +1365,82 @@ def _entry_canonical(
     ).encode()
 
 
+def _epoch_canonical(
+    epoch_id: int, merkle_root: str, leaf_count: int, peer_id: str
+) -> bytes:
+    """Canonical bytes of a sealed epoch root for signing/verification.
+
+    *merkle_root* is the ledger's mountain-range root over its first
+    *leaf_count* provable entries, taken when the epoch was sealed.
+    """
+    return f"epoch|{epoch_id}|{merkle_root}|{leaf_count}|{peer_id}".encode()
+
+
+def _checkpoint_canonical(
+    prev_hash: str,
+    last_entry_id: int,
+    last_spend_id: int,
+    entries: int,
+    spends: int,
+    earned: float,
+    spent: float,
+    llm: float,
+    non_llm: float,
+    action_totals: dict[str, float],
+    segment_hash: str,
+    timestamp: float,
+) -> bytes:
+    """Canonical bytes of a checkpoint for hashing/signing."""
+    return (
+        f"{prev_hash}|{last_entry_id}|{last_spend_id}|{entries}|{spends}|"
+        f"{earned}|{spent}|{llm}|{non_llm}|{_action_totals_json(action_totals)}|"
+        f"{segment_hash}|{timestamp}"
+    ).encode()
+
+
+def _action_totals_json(action_totals: dict[str, float]) -> str:
+    return json.dumps(action_totals, sort_keys=True, separators=(",", ":"))
+
+
+def _checkpoint_totals(cp: CreditCheckpoint) -> _Totals:
+    return (
+        cp.total_earned,
+        cp.total_spent,
+        cp.llm_credits,
+        cp.non_llm_credits,
+        cp.entries,
+        cp.spends,
+        cp.action_totals,
+    )
+
+
+def _totals_match(a: _Totals, b: _Totals) -> bool:
+    """Compare totals; counts exactly, credits up to float rounding.
+
+    Totals backfilled with ``SUM()`` may differ from a sequential re-sum
+    in the last bits, so credit amounts are compared with a tolerance.
+    """
+
+    def close(x: float, y: float) -> bool:
+        return math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-6)
+
+    if a[4:6] != b[4:6] or a[6].keys() != b[6].keys():
+        return False
+    return all(close(x, y) for x, y in zip(a[:4], b[:4], strict=True)) and all(
+        close(a[6][k], b[6][k]) for k in a[6]
+    )
+
+
+def _capped_score(llm_raw: float, non_llm: float) -> float:
+    """Contribution score with LLM credits capped at the allowed share."""
+    total_uncapped = non_llm + llm_raw
+    if total_uncapped > 0 and llm_raw / total_uncapped > LLM_CREDIT_CAP_RATIO:
+        llm_capped = non_llm * (LLM_CREDIT_CAP_RATIO / (1 - LLM_CREDIT_CAP_RATIO))
+    else:
+        llm_capped = llm_raw
+    return non_llm + llm_capped
+
+
 def _score_to_tier(score: float) -> ContributionTier:
     for threshold, tier, _ in TIER_THRESHOLDS:
         if score >= threshold:
@@ -116,6 +116,28 @@ class CreditEntry:
     note: str
     entry_hash: str = ""
     signature: str = ""
+    epoch_id: int | None = None  # set when signed via a sealed epoch
+    leaf_index: int | None = None  # position in the ledger's Merkle range
+
+
+@dataclass(frozen=True)
+class CreditEpoch:
+    """Batch of entries signed together through their Merkle root.
+
+    Entries recorded in epoch mode are stored unsigned; sealing the
+    epoch appends them to the ledger's Merkle mountain range and signs
+    its root (over the first *leaf_count* entries), and each entry
+    remains individually provable with a membership proof against it.
+    """
+
+    epoch_id: int
+    entry_count: int
+    merkle_root: str
+    signature: str
+    peer_id: str
+    opened_at: float
+    sealed_at: float | None = None
+    leaf_count: int = 0
 
 
 @dataclass(frozen=True)
@@ -131,6 +153,34 @@ class SearchAllowance:
     debt_amount: float  # 0.0 when NORMAL
 
 
+@dataclass(frozen=True)
+class CreditCheckpoint:
+    """Verifiable snapshot of the ledger's running totals.
+
+    ``segment_hash`` digests every entry and spend recorded since the
+    previous checkpoint; ``checkpoint_hash`` chains it to the previous
+    checkpoint so the history stays verifiable after old entries are
+    compacted away.
+    """
+
+    checkpoint_id: int
+    last_entry_id: int
+    last_spend_id: int
+    entries: int
+    spends: int
+    total_earned: float
+    total_spent: float
+    llm_credits: float
+    non_llm_credits: float
+    action_totals: dict[str, float]
+    segment_hash: str
+    prev_hash: str
+    checkpoint_hash: str
+    timestamp: float
+    signature: str = ""
+    compacted: bool = False
+
+
 @dataclass(frozen=True)
 class LedgerStats:
     """Summary statistics for a peer's credit ledger."""
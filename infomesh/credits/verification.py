@@ -1,8 +1,10 @@
 """P2P credit verification via signed entries and Merkle proofs.
 
 Each credit entry can be signed with the node's Ed25519 private key at
-recording time.  A Merkle tree is built over entry hashes, enabling
-other peers to:
+recording time — or, in the ledger's epoch mode, recorded unsigned and
+covered by a single signature over the Merkle root of its *epoch*
+(see :meth:`~infomesh.credits.ledger.CreditLedger.seal_epoch`).  A
+Merkle tree is built over entry hashes, enabling other peers to:
 
 1.  Verify individual entry **signatures** (prove the node really
     created each entry, not fabricated post-hoc).
@@ -25,7 +27,9 @@ The response contains:
 
 The verifier checks:
 - Root signature matches the peer's public key.
-- Each sampled entry's signature is valid.
+- Each sampled entry's signature is valid — for epoch entries, the
+  epoch root signature is valid and a membership proof links the entry
+  hash to that root.
 - Each sampled entry's Merkle proof is valid against the root.
 - Entry hashes are correctly derived from entry data.
 """
@@ -39,7 +43,13 @@ from typing import Any
 
 import structlog
 
-from infomesh.credits.ledger import CreditEntry, CreditLedger, _entry_canonical
+from infomesh.credits.ledger import (
+    CreditEntry,
+    CreditEpoch,
+    CreditLedger,
+    _entry_canonical,
+    _epoch_canonical,
+)
 from infomesh.hashing import content_hash
 from infomesh.trust.merkle import (
     MerkleTree,
@@ -88,9 +98,11 @@ class CreditProofBuilder:
         if result.verified:
             print("Credits are legit")
 
-    The builder reads all *signed* entries from the ledger, builds a
-    Merkle tree over their entry hashes, signs the root, and selects a
-    random sample of entries+proofs for the verifier to spot-check.
+    The builder signs the root of the ledger's persistent Merkle
+    mountain range over all *signed* entries and selects a random sample
+    of entries+proofs for the verifier to spot-check.  Roots and proofs
+    are read from the range in O(log N), so the cost does not grow with
+    the size of the ledger.
     """
 
     def __init__(self, ledger: CreditLedger, key_pair: KeyPairLike) -> None:
@@ -114,39 +126,43 @@ class CreditProofBuilder:
         Returns:
             Dict suitable for msgpack serialization / P2P transport.
         """
-        entries = self._ledger.signed_entries()
-        if not entries:
+        # Make entries of the open epoch provable too
+        self._ledger.seal_epoch(self._key_pair)
+        entry_count = self._ledger.proof_leaf_count
+        if entry_count == 0:
             return self._empty_proof(request_id)
 
-        # Build Merkle tree from entry hashes
-        entry_hashes = [e.entry_hash for e in entries]
-        tree = MerkleTree()
-        tree.build(entry_hashes)
-
         # Sign the Merkle root
+        merkle_root = self._ledger.proof_root()
         root_payload = _root_canonical(
-            tree.root_hash,
-            len(entries),
+            merkle_root,
+            entry_count,
             self._key_pair.peer_id,
         )
         root_signature = self._key_pair.sign(root_payload)
 
-        # Select random sample
-        sample_indices = _select_sample(len(entries), sample_size)
+        # Select random sample among entries not yet compacted away
+        first = self._ledger.first_proof_leaf()
+        sample_indices = [
+            first + i for i in _select_sample(entry_count - first, sample_size)
+        ]
         sample_entries: list[dict[str, Any]] = []
         sample_proofs: list[dict[str, Any]] = []
-
-        for idx in sample_indices:
-            entry = entries[idx]
-            sample_entries.append(_entry_to_dict(entry))
-            proof = tree.get_proof(idx)
+        epochs: dict[int, CreditEpoch | None] = {}
+
+        for entry in self._ledger.entries_at_leaves(sample_indices):
+            assert entry.leaf_index is not None
+            entry_dict = _entry_to_dict(entry)
+            if entry.epoch_id is not None:
+                if entry.epoch_id not in epochs:
+                    epochs[entry.epoch_id] = self._ledger.get_epoch(entry.epoch_id)
+                entry_dict["epoch"] = self._epoch_proof(
+                    epochs[entry.epoch_id], entry.leaf_index
+                )
+            sample_entries.append(entry_dict)
+            proof = self._ledger.entry_proof(entry.leaf_index)
             sample_proofs.append(serialize_proof(proof))
 
-        # Action breakdown
-        breakdown: dict[str, float] = {}
-        for e in entries:
-            breakdown[e.action] = breakdown.get(e.action, 0.0) + e.credits
-
         stats = self._ledger.stats()
 
         result = {
@@ -154,9 +170,9 @@ class CreditProofBuilder:
             "request_id": request_id,
             "total_earned": stats.total_earned,
             "total_spent": stats.total_spent,
-            "action_breakdown": breakdown,
-            "entry_count": len(entries),
-            "merkle_root": tree.root_hash,
+            "action_breakdown": dict(self._ledger.earnings_by_action()),
+            "entry_count": entry_count,
+            "merkle_root": merkle_root,
             "root_signature": root_signature.hex(),
             "sample_entries": sample_entries,
             "sample_proofs": sample_proofs,
@@ -167,12 +183,27 @@ class CreditProofBuilder:
         logger.info(
             "credit_proof_built",
             peer_id=self._key_pair.peer_id,
-            entry_count=len(entries),
+            entry_count=entry_count,
             sample_size=len(sample_entries),
-            root=tree.root_hash[:16],
+            root=merkle_root[:16],
         )
         return result
 
+    def _epoch_proof(
+        self, epoch: CreditEpoch | None, leaf_index: int
+    ) -> dict[str, Any]:
+        """Signed epoch root plus the entry's membership proof against it."""
+        if epoch is None:
+            return {}
+        proof = self._ledger.entry_proof(leaf_index, leaf_count=epoch.leaf_count)
+        return {
+            "epoch_id": epoch.epoch_id,
+            "leaf_count": epoch.leaf_count,
+            "merkle_root": epoch.merkle_root,
+            "signature": epoch.signature,
+            "proof": serialize_proof(proof),
+        }
+
     def _empty_proof(self, request_id: str) -> dict[str, Any]:
         """Return a valid proof for an empty ledger."""
         return {
@@ -287,6 +318,8 @@ class CreditProofBuilder:
         invalid_sigs = 0
         valid_proofs_count = 0
         invalid_proofs_count = 0
+        # (epoch payload, signature) → verified; epochs repeat across samples
+        epoch_sigs: dict[tuple[bytes, str], bool] = {}
 
         for i, entry_data in enumerate(sample_entries):
             # Check that entry_hash matches recomputed hash
@@ -305,13 +338,23 @@ class CreditProofBuilder:
                 invalid_sigs += 1
                 continue
 
-            # Verify Ed25519 signature over canonical data
-            try:
-                entry_sig = bytes.fromhex(entry_data["signature"])
-                pub_key.verify(entry_sig, canonical)
-                valid_sigs += 1
-            except Exception:
-                invalid_sigs += 1
+            # Verify Ed25519 signature over canonical data, or the signed
+            # root of the entry's epoch
+            epoch_data = entry_data.get("epoch")
+            if epoch_data is not None:
+                if _verify_epoch_entry(
+                    expected_hash, epoch_data, peer_id, pub_key, epoch_sigs
+                ):
+                    valid_sigs += 1
+                else:
+                    invalid_sigs += 1
+            else:
+                try:
+                    entry_sig = bytes.fromhex(entry_data["signature"])
+                    pub_key.verify(entry_sig, canonical)
+                    valid_sigs += 1
+                except Exception:
+                    invalid_sigs += 1
 
             # Verify Merkle membership proof
             if i < len(sample_proofs):
@@ -368,6 +411,38 @@ def _root_canonical(root_hash: str, entry_count: int, peer_id: str) -> bytes:
     return f"{root_hash}|{entry_count}|{peer_id}".encode()
 
 
+def _verify_epoch_entry(
+    entry_hash: str,
+    epoch_data: dict[str, Any],
+    peer_id: str,
+    pub_key: Any,
+    epoch_sigs: dict[tuple[bytes, str], bool],
+) -> bool:
+    """Check an epoch entry: signed epoch root + membership proof."""
+    try:
+        epoch_id = int(epoch_data["epoch_id"])
+        epoch_root = epoch_data["merkle_root"]
+        proof = deserialize_proof(epoch_data["proof"])
+    except Exception:
+        return False
+    if proof.root_hash != epoch_root or not MerkleTree.verify_document(
+        entry_hash, proof
+    ):
+        return False
+    payload = _epoch_canonical(
+        epoch_id, epoch_root, int(epoch_data.get("leaf_count", 0)), peer_id
+    )
+    signature = str(epoch_data.get("signature", ""))
+    key = (payload, signature)
+    if key not in epoch_sigs:
+        try:
+            pub_key.verify(bytes.fromhex(signature), payload)
+            epoch_sigs[key] = True
+        except Exception:
+            epoch_sigs[key] = False
+    return epoch_sigs[key]
+
+
 def _select_sample(total: int, sample_size: int) -> list[int]:
     """Select random sample indices, capping at total."""
     if total <= sample_size:
@@ -17,17 +17,6 @@ from infomesh.config import Config
 
 logger = structlog.get_logger()
 
-# Shared SQL expression for extracting domain from URL
-_DOMAIN_EXPR = """SUBSTR(
-    url,
-    INSTR(url, '://') + 3,
-    CASE
-        WHEN INSTR(SUBSTR(url, INSTR(url, '://') + 3), '/') > 0
-        THEN INSTR(SUBSTR(url, INSTR(url, '://') + 3), '/') - 1
-        ELSE LENGTH(url)
-    END
-)"""
-
 
 @dataclass
 class RecentDoc:
@@ -115,37 +104,31 @@ class DashboardDataCache:
 
             one_hour_ago = time.time() - 3600
 
-            # Combined query: total count, pages last hour, last crawl time
+            # Totals come from the per-domain counters maintained by
+            # LocalStore, so no query below scans the documents table.
             # COALESCE wraps SUM/MAX because they return NULL on empty tables.
             row = conn.execute(
-                "SELECT COUNT(*) AS cnt, "
-                "COALESCE(SUM(CASE WHEN crawled_at > ?"
-                " THEN 1 ELSE 0 END), 0) AS recent, "
-                "COALESCE(MAX(crawled_at), 0) AS last_ts "
-                "FROM documents",
-                (one_hour_ago,),
+                "SELECT COALESCE(SUM(doc_count), 0) AS cnt, COUNT(*) AS domains "
+                "FROM domain_stats",
             ).fetchone()
             doc_count = row["cnt"] if row else 0
+            domain_count = row["domains"] if row else 0
+
+            # Range scans on idx_documents_crawled_at
+            row = conn.execute(
+                "SELECT COUNT(*) AS recent, "
+                "(SELECT COALESCE(MAX(crawled_at), 0) FROM documents) AS last_ts "
+                "FROM documents WHERE crawled_at > ?",
+                (one_hour_ago,),
+            ).fetchone()
             pages_last_hour = row["recent"] if row else 0
             last_crawl_at = float(row["last_ts"]) if row else 0.0
 
-            # Top domains (GROUP BY)
             domain_rows = conn.execute(
-                f"""SELECT
-                       {_DOMAIN_EXPR} AS domain,
-                       COUNT(*) AS cnt
-                   FROM documents
-                   GROUP BY domain
-                   ORDER BY cnt DESC
-                   LIMIT 7""",
+                "SELECT domain, doc_count AS cnt FROM domain_stats "
+                "ORDER BY doc_count DESC LIMIT 7",
             ).fetchall()
 
-            # Distinct domain count
-            row_dc = conn.execute(
-                f"SELECT COUNT(DISTINCT {_DOMAIN_EXPR}) AS cnt FROM documents",
-            ).fetchone()
-            domain_count = row_dc["cnt"] if row_dc else 0
-
             # Recent documents for LiveLog feed (last 10)
             recent_rows = conn.execute(
                 "SELECT doc_id, url, title, crawled_at "
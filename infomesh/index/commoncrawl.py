@@ -17,19 +17,29 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import gzip
 import io
+import multiprocessing
+import os
 import re
+import tempfile
 import time
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Collection, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol
+from urllib.parse import urlparse
 
 import httpx
 import structlog
 
 from infomesh.crawler import create_ssl_context
 from infomesh.crawler.dedup import DeduplicatorDB
+from infomesh.crawler.lang_detect import detect_language
+from infomesh.crawler.simhash import simhash
 from infomesh.hashing import content_hash
 from infomesh.index.local_store import LocalStore
 from infomesh.types import VectorStoreLike
@@ -39,15 +49,20 @@ logger = structlog.get_logger()
 # Maximum text size per document (100KB)
 _MAX_TEXT_SIZE = 102_400
 
-# Maximum WET payload size to hold in memory. The importer still parses WET
-# files in-memory, so keep both compressed downloads and decompressed text bound.
-_MAX_WET_FILE_BYTES = 256 * 1024 * 1024
+# Maximum (decompressed) WET input size.  Input is streamed, so this guards
+# disk and import time rather than memory; a standard segment is ~400 MiB.
+_MAX_WET_FILE_BYTES = 4 * 1024 * 1024 * 1024
 _WET_CHUNK_SIZE = 1024 * 1024
 
+# Records are handed to parser workers in blocks of about this many bytes
+_WET_BATCH_BYTES = 4 * 1024 * 1024
+
 # WARC record boundary
 _WARC_RECORD_RE = re.compile(r"^WARC/1\.0\r?\n", re.MULTILINE)
 _WARC_HEADER_RE = re.compile(r"^([A-Za-z-]+):\s*(.+?)\s*$", re.MULTILINE)
 
+_GZIP_MAGIC = b"\x1f\x8b"
+
 
 class _BinaryReader(Protocol):
     def read(self, size: int = -1) -> bytes: ...
@@ -64,34 +79,56 @@ def _too_large_message(source: str, limit: int | None = None) -> str:
     return f"WET input exceeds {_format_bytes(max_bytes)} limit: {source}"
 
 
-def _read_binary_limited(
+def _record_boundary(buffer: bytearray, limit: int) -> int:
+    """Offset of the last record start at or before *limit* (else the first after).
+
+    Returns -1 if *buffer* holds no record start past offset 0.
+    """
+    for marker in (b"\nWARC/1.0\n", b"\nWARC/1.0\r\n"):
+        pos = buffer.rfind(marker, 0, limit + len(marker))
+        if pos >= 0:
+            return pos + 1
+    for marker in (b"\nWARC/1.0\n", b"\nWARC/1.0\r\n"):
+        pos = buffer.find(marker, limit)
+        if pos >= 0:
+            return pos + 1
+    return -1
+
+
+def iter_wet_blocks(
     stream: _BinaryReader,
     source: str,
     *,
-    limit: int | None = None,
-) -> bytes:
-    """Read a binary stream while enforcing a hard byte limit."""
-    max_bytes = _MAX_WET_FILE_BYTES if limit is None else limit
-    chunks: list[bytes] = []
-    total = 0
+    block_bytes: int = _WET_BATCH_BYTES,
+) -> Iterator[bytes]:
+    """Split a WET byte stream into blocks of whole WARC records.
+
+    Reads *stream* incrementally (multi-member gzip streams are
+    decompressed on the fly by :mod:`gzip`) and cuts at the last record
+    boundary once about *block_bytes* are buffered, so memory stays
+    bounded regardless of the input size.
 
+    Raises:
+        ValueError: If more than ``_MAX_WET_FILE_BYTES`` are read.
+    """
+    buffer = bytearray()
+    total = 0
     while True:
         chunk = stream.read(_WET_CHUNK_SIZE)
         if not chunk:
             break
         total += len(chunk)
-        if total > max_bytes:
-            raise ValueError(_too_large_message(source, max_bytes))
-        chunks.append(chunk)
-
-    return b"".join(chunks)
-
-
-def _decode_gzip_limited(data: bytes, source: str) -> str:
-    """Decode gzip content while bounding the decompressed payload size."""
-    with gzip.GzipFile(fileobj=io.BytesIO(data)) as stream:
-        raw = _read_binary_limited(stream, source)
-    return raw.decode("utf-8", errors="replace")
+        if total > _MAX_WET_FILE_BYTES:
+            raise ValueError(_too_large_message(source))
+        buffer += chunk
+        while len(buffer) >= block_bytes:
+            cut = _record_boundary(buffer, block_bytes)
+            if cut <= 0:
+                break  # a single record larger than the block: read on
+            yield bytes(buffer[:cut])
+            del buffer[:cut]
+    if buffer:
+        yield bytes(buffer)
 
 
 @dataclass(frozen=True)
@@ -104,6 +141,7 @@ class ImportStats:
     skipped_too_short: int
     skipped_error: int
     elapsed_ms: float
+    skipped_language: int = 0
 
 
 @dataclass
@@ -173,6 +211,70 @@ def parse_wet_content(data: str) -> list[WETRecord]:
     return records
 
 
+@dataclass(frozen=True)
+class _PreparedRecord:
+    """A WET record with everything except dedup precomputed by a worker."""
+
+    url: str
+    title: str
+    text: str
+    language: str
+    text_hash: str
+    raw_hash: str
+    fingerprint: int
+
+
+@dataclass
+class _BatchResult:
+    records: list[_PreparedRecord] = field(default_factory=list)
+    total: int = 0
+    too_short: int = 0
+    wrong_language: int = 0
+    errors: int = 0
+
+
+def _record_title(record: WETRecord) -> str:
+    """Derive a title from the first line of text, else from the URL."""
+    title = record.text.split("\n", 1)[0][:200].strip()
+    if not title or len(title) < 5:
+        parsed = urlparse(record.url)
+        title = parsed.path.rsplit("/", 1)[-1] or parsed.netloc
+    return title
+
+
+def _prepare_block(block: bytes, languages: frozenset[str] | None) -> _BatchResult:
+    """Parse, filter and fingerprint one block of WET records.
+
+    Runs in a worker process; everything here is CPU-bound and
+    independent of index state.
+    """
+    result = _BatchResult()
+    for record in parse_wet_content(block.decode("utf-8", errors="replace")):
+        result.total += 1
+        try:
+            if len(record.text.strip()) < 50:
+                result.too_short += 1
+                continue
+            language = detect_language(record.text[:2000]).language
+            if languages is not None and language not in languages:
+                result.wrong_language += 1
+                continue
+            result.records.append(
+                _PreparedRecord(
+                    url=record.url,
+                    title=_record_title(record),
+                    text=record.text,
+                    language=language,
+                    text_hash=content_hash(record.text),
+                    raw_hash=content_hash(record.url + record.date),
+                    fingerprint=simhash(record.text),
+                )
+            )
+        except Exception:  # noqa: BLE001
+            result.errors += 1
+    return result
+
+
 class CommonCrawlImporter:
     """Import documents from Common Crawl WET files or URL lists.
 
@@ -192,108 +294,161 @@ class CommonCrawlImporter:
         self._dedup = dedup or DeduplicatorDB()
         self._vector_store = vector_store
 
-    async def import_wet_file(self, path_or_url: str) -> ImportStats:
+    async def import_wet_file(
+        self,
+        path_or_url: str,
+        *,
+        workers: int | None = None,
+        languages: Collection[str] | None = None,
+    ) -> ImportStats:
         """Import documents from a WET file (local or remote).
 
+        The file is streamed in blocks of whole records; a pool of worker
+        processes parses them, detects language and computes hashes and
+        SimHash fingerprints, while this process deduplicates and inserts
+        each block in a single transaction.  Remote files are first
+        downloaded to a temporary file.
+
         Args:
             path_or_url: Local file path or HTTP(S) URL to a .wet or .wet.gz file.
+            workers: Parser processes (default: CPU count; 0 parses
+                inline, as do inputs smaller than one block).
+            languages: If given, only import records detected as one of
+                these ISO language codes.
 
         Returns:
             ImportStats with counts of processed records.
         """
         start = time.monotonic()
+        langs = frozenset(languages) if languages is not None else None
+        if workers is None:
+            workers = os.cpu_count() or 1
 
+        downloaded: Path | None = None
+        path = path_or_url
         if path_or_url.startswith(("http://", "https://")):
-            data = await self._download_wet(path_or_url)
-        else:
-            data = self._read_local_wet(path_or_url)
-
-        records = parse_wet_content(data)
+            downloaded = await self._download_wet(path_or_url)
+            path = str(downloaded)
 
+        totals = _BatchResult()
         imported = 0
         skipped_dup = 0
-        skipped_short = 0
-        skipped_err = 0
-
-        for record in records:
-            try:
-                if len(record.text.strip()) < 50:
-                    skipped_short += 1
-                    continue
-
-                text_hash = content_hash(record.text)
-
-                if self._dedup.is_content_seen(text_hash):
-                    skipped_dup += 1
-                    continue
-
-                if self._dedup.is_near_duplicate(record.text):
-                    skipped_dup += 1
-                    continue
-
-                # Derive title from first line or URL
-                title = record.text.split("\n", 1)[0][:200].strip()
-                if not title or len(title) < 5:
-                    from urllib.parse import urlparse
-
-                    parsed = urlparse(record.url)
-                    title = parsed.path.rsplit("/", 1)[-1] or parsed.netloc
-
-                raw_hash = content_hash(record.url + record.date)
-
-                doc_id = self._store.add_document(
-                    url=record.url,
-                    title=title,
-                    text=record.text,
-                    raw_html_hash=raw_hash,
-                    text_hash=text_hash,
-                    language=None,
+        pool: Executor | None = None
+        try:
+            # Small inputs fit in a block or two: not worth starting processes
+            if workers > 0 and Path(path).stat().st_size >= _WET_BATCH_BYTES:
+                pool = ProcessPoolExecutor(
+                    workers, mp_context=multiprocessing.get_context("spawn")
                 )
-
-                if doc_id is None:
-                    skipped_dup += 1
-                    continue
-
-                self._dedup.mark_seen(record.url, text_hash, record.text)
-
-                # Optional vector indexing
-                if self._vector_store is not None and doc_id is not None:
-                    from infomesh.index.vector_store import VectorStore
-
-                    if isinstance(self._vector_store, VectorStore):
-                        self._vector_store.add_document(
-                            doc_id=doc_id,
-                            url=record.url,
-                            title=title,
-                            text=record.text,
-                            language=None,
+            loop = asyncio.get_running_loop()
+            pending: deque[asyncio.Future[_BatchResult]] = deque()
+            with _open_wet(path) as stream:
+                for block in iter_wet_blocks(
+                    stream, path_or_url, block_bytes=_WET_BATCH_BYTES
+                ):
+                    if pool is None:
+                        batch = _prepare_block(block, langs)
+                    else:
+                        pending.append(
+                            loop.run_in_executor(pool, _prepare_block, block, langs)
                         )
-
-                imported += 1
-
-            except Exception:
-                logger.debug("wet_record_error", url=record.url, exc_info=True)
-                skipped_err += 1
+                        if len(pending) <= workers * 2:
+                            continue
+                        batch = await pending.popleft()
+                    added, dups = self._apply_batch(batch, totals)
+                    imported += added
+                    skipped_dup += dups
+                while pending:
+                    added, dups = self._apply_batch(await pending.popleft(), totals)
+                    imported += added
+                    skipped_dup += dups
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            if downloaded is not None:
+                downloaded.unlink(missing_ok=True)
 
         elapsed = (time.monotonic() - start) * 1000
 
         logger.info(
             "wet_import_complete",
-            total=len(records),
+            total=totals.total,
             imported=imported,
             skipped_dup=skipped_dup,
-            skipped_short=skipped_short,
+            skipped_short=totals.too_short,
+            skipped_language=totals.wrong_language,
+            elapsed_ms=round(elapsed),
         )
 
         return ImportStats(
-            total_records=len(records),
+            total_records=totals.total,
             imported=imported,
             skipped_duplicate=skipped_dup,
-            skipped_too_short=skipped_short,
-            skipped_error=skipped_err,
+            skipped_too_short=totals.too_short,
+            skipped_error=totals.errors,
             elapsed_ms=elapsed,
+            skipped_language=totals.wrong_language,
         )
 
+    def _apply_batch(
+        self, batch: _BatchResult, totals: _BatchResult
+    ) -> tuple[int, int]:
+        """Deduplicate and insert one prepared block.
+
+        Returns:
+            ``(imported, skipped_duplicate)`` for the block.
+        """
+        totals.total += batch.total
+        totals.too_short += batch.too_short
+        totals.wrong_language += batch.wrong_language
+        totals.errors += batch.errors
+
+        fresh: list[_PreparedRecord] = []
+        for record in batch.records:
+            if self._dedup.is_content_seen(record.text_hash) or (
+                self._dedup.is_near_duplicate(
+                    record.text, fingerprint=record.fingerprint
+                )
+            ):
+                continue
+            # Marked before insert so later records in the block see it
+            self._dedup.mark_seen(
+                record.url,
+                record.text_hash,
+                record.text,
+                commit=False,
+                fingerprint=record.fingerprint,
+            )
+            fresh.append(record)
+
+        ids = self._store.add_documents(
+            {
+                "url": r.url,
+                "title": r.title,
+                "text": r.text,
+                "raw_html_hash": r.raw_hash,
+                "text_hash": r.text_hash,
+                "language": r.language,
+            }
+            for r in fresh
+        )
+        self._dedup.flush()
+
+        imported = 0
+        for record, doc_id in zip(fresh, ids, strict=True):
+            if doc_id is None:
+                continue
+            imported += 1
+            if self._vector_store is not None:
+                self._vector_store.add_document(
+                    doc_id=doc_id,
+                    url=record.url,
+                    title=record.title,
+                    text=record.text,
+                    language=record.language,
+                )
+        return imported, len(batch.records) - imported
+
     async def import_url_list(
         self,
         path: str | Path,
@@ -354,48 +509,49 @@ class CommonCrawlImporter:
             elapsed_ms=elapsed,
         )
 
-    async def _download_wet(self, url: str) -> str:
-        """Download a WET file from a URL (supports .gz)."""
-        async with httpx.AsyncClient(
-            timeout=120.0, verify=create_ssl_context()
-        ) as client:
-            async with client.stream("GET", url) as resp:
-                resp.raise_for_status()
-
-                content_length = resp.headers.get("content-length")
-                if content_length is not None:
-                    try:
-                        declared_size = int(content_length)
-                    except ValueError:
-                        declared_size = 0
-                    if declared_size > _MAX_WET_FILE_BYTES:
-                        raise ValueError(_too_large_message(url))
-
-                chunks: list[bytes] = []
-                total = 0
-                async for chunk in resp.aiter_bytes(chunk_size=_WET_CHUNK_SIZE):
-                    total += len(chunk)
-                    if total > _MAX_WET_FILE_BYTES:
-                        raise ValueError(_too_large_message(url))
-                    chunks.append(chunk)
-
-            raw = b"".join(chunks)
-
-            if url.endswith(".gz"):
-                return _decode_gzip_limited(raw, url)
-            return raw.decode("utf-8", errors="replace")
-
-    def _read_local_wet(self, path: str) -> str:
-        """Read a local WET file (supports .gz)."""
-        source = str(path)
-        file_size = Path(path).stat().st_size
-        if file_size > _MAX_WET_FILE_BYTES:
-            raise ValueError(_too_large_message(source))
+    async def _download_wet(self, url: str) -> Path:
+        """Stream a WET file from a URL into a temporary file.
 
-        if path.endswith(".gz"):
-            with open(path, "rb") as f:
-                compressed = _read_binary_limited(f, source)
-            return _decode_gzip_limited(compressed, source)
-        with open(path, "rb") as f:
-            raw = _read_binary_limited(f, source)
-        return raw.decode("utf-8", errors="replace")
+        Returns:
+            Path of the temporary file; the caller deletes it.
+        """
+        fd, tmp_name = tempfile.mkstemp(suffix=".wet")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                async with (
+                    httpx.AsyncClient(
+                        timeout=120.0, verify=create_ssl_context()
+                    ) as client,
+                    client.stream("GET", url) as resp,
+                ):
+                    resp.raise_for_status()
+
+                    content_length = resp.headers.get("content-length")
+                    if content_length is not None:
+                        try:
+                            declared_size = int(content_length)
+                        except ValueError:
+                            declared_size = 0
+                        if declared_size > _MAX_WET_FILE_BYTES:
+                            raise ValueError(_too_large_message(url))
+
+                    total = 0
+                    async for chunk in resp.aiter_bytes(chunk_size=_WET_CHUNK_SIZE):
+                        total += len(chunk)
+                        if total > _MAX_WET_FILE_BYTES:
+                            raise ValueError(_too_large_message(url))
+                        out.write(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return tmp_path
+
+
+def _open_wet(path: str) -> io.BufferedReader | gzip.GzipFile:
+    """Open a WET file for streaming, transparently decompressing gzip."""
+    if Path(path).stat().st_size > _MAX_WET_FILE_BYTES:
+        raise ValueError(_too_large_message(path))
+    with open(path, "rb") as probe:
+        compressed = probe.read(2) == _GZIP_MAGIC
+    return gzip.open(path, "rb") if compressed else open(path, "rb")  # noqa: SIM115
@@ -0,0 +1,315 @@
+"""Background embedding queue — batches vector-store writes off the crawl path.
+
+Encoding one document per model call leaves most of sentence-transformers'
+throughput unused on CPU, and it runs synchronously inside
+:func:`infomesh.services.index_document`, so every crawled page waited for
+its embedding.  :class:`EmbeddingQueue` wraps a vector store, returns from
+``add_document`` immediately, and a worker thread encodes pending
+documents in batches of up to *batch_size* (or whatever has arrived after
+*max_delay* seconds) with a single bulk upsert per batch.
+
+Backpressure: at most *max_pending* documents wait in the queue.
+Producers on the event loop ``await`` :meth:`EmbeddingQueue.wait_for_capacity`
+before fetching more pages, which slows crawling down to the embedding
+rate without blocking the loop.  ``add_document`` itself never blocks: a
+document arriving at a full queue anyway is skipped for vector search (it
+remains in the FTS5 index) and counted in
+:attr:`EmbeddingQueueStats.dropped`.
+
+Usage::
+
+    vectors = EmbeddingQueue(VectorStore(persist_dir=...), batch_size=32)
+    vectors.add_document(doc_id=1, url="...", title="...", text="...")
+    vectors.flush()  # wait until everything queued so far is written
+    vectors.close()  # drains the queue, then closes the store
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import structlog
+
+from infomesh.index.vector_store import VectorDocument
+
+logger = structlog.get_logger()
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_DELAY = 0.5
+DEFAULT_MAX_PENDING = 2048
+
+
+class BatchVectorStore(Protocol):
+    """Vector store that accepts bulk writes."""
+
+    def add_documents(self, docs: list[VectorDocument]) -> None: ...
+
+    def delete_document(self, doc_id: int) -> None: ...
+
+    def search(self, query: str, *, limit: int = 10, min_score: float = 0.0) -> Any: ...
+
+    def get_stats(self) -> dict[str, Any]: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass
+class EmbeddingQueueStats:
+    """Embedding throughput counters."""
+
+    enqueued: int = 0
+    embedded: int = 0
+    batches: int = 0
+    dropped: int = 0
+    failed: int = 0
+    embed_seconds: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        """Documents embedded per second of model + write time."""
+        if self.embed_seconds <= 0:
+            return 0.0
+        return self.embedded / self.embed_seconds
+
+    @property
+    def avg_batch_size(self) -> float:
+        if self.batches == 0:
+            return 0.0
+        return self.embedded / self.batches
+
+    def to_dict(self) -> dict[str, float]:
+        """Flatten counters for logging / metrics export."""
+        return {
+            "enqueued": self.enqueued,
+            "embedded": self.embedded,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "avg_batch_size": round(self.avg_batch_size, 1),
+            "docs_per_second": round(self.docs_per_second, 1),
+        }
+
+
+class EmbeddingQueue:
+    """Asynchronous, batching front-end for a vector store.
+
+    Implements the same ``add_document`` / ``delete_document`` /
+    ``search`` / ``get_stats`` / ``close`` surface as
+    :class:`~infomesh.index.vector_store.VectorStore`, so it can be
+    passed anywhere a vector store is expected.
+
+    Args:
+        store: Underlying store; must provide ``add_documents``.
+        batch_size: Maximum documents per model call.
+        max_delay: Maximum seconds a document waits for a batch to fill.
+        max_pending: Queue capacity.  Producers should
+            :meth:`wait_for_capacity` first; documents added to a full
+            queue are dropped.
+    """
+
+    def __init__(
+        self,
+        store: BatchVectorStore,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._store = store
+        self._batch_size = max(1, batch_size)
+        self._max_delay = max_delay
+        self._max_pending = max(1, max_pending)
+
+        # doc_id → (enqueued_at, doc); re-adding a pending doc replaces it
+        self._pending: OrderedDict[int, tuple[float, VectorDocument]] = OrderedDict()
+        self._in_batch = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        # Serializes bulk writes with deletes so a delete is never undone
+        # by a batch that was already being embedded
+        self._write_lock = threading.Lock()
+        self._stats = EmbeddingQueueStats()
+
+        self._thread = threading.Thread(
+            target=self._run, name="embedding-queue", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def stats(self) -> EmbeddingQueueStats:
+        return self._stats
+
+    @property
+    def pending(self) -> int:
+        """Documents queued or currently being embedded."""
+        with self._cond:
+            return len(self._pending) + self._in_batch
+
+    # ------------------------------------------------------------------
+    # Vector store interface
+    # ------------------------------------------------------------------
+
+    def add_document(
+        self,
+        doc_id: int,
+        url: str,
+        title: str,
+        text: str,
+        *,
+        language: str | None = None,
+    ) -> None:
+        """Queue a document for embedding and return immediately.
+
+        Never blocks: if the queue is full the document is dropped.
+        """
+        doc = VectorDocument(doc_id, url, title, text, language)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("EmbeddingQueue is closed")
+            if doc_id in self._pending:
+                enqueued_at, _ = self._pending[doc_id]
+                self._pending[doc_id] = (enqueued_at, doc)
+                return
+            if len(self._pending) >= self._max_pending:
+                self._stats.dropped += 1
+                logger.warning(
+                    "embedding_queue_full",
+                    doc_id=doc_id,
+                    pending=len(self._pending),
+                    dropped=self._stats.dropped,
+                )
+                return
+            self._pending[doc_id] = (time.monotonic(), doc)
+            self._stats.enqueued += 1
+            self._cond.notify_all()
+
+    async def wait_for_capacity(self, timeout: float | None = None) -> bool:
+        """Wait (without blocking the event loop) until the queue has room.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if there is room (or the queue is closed), False on timeout.
+        """
+        with self._cond:
+            if self._has_capacity():
+                return True
+        if timeout is not None and timeout <= 0:
+            return False
+        return await asyncio.to_thread(self._wait_for_capacity_blocking, timeout)
+
+    def _has_capacity(self) -> bool:
+        return self._closed or len(self._pending) < self._max_pending
+
+    def _wait_for_capacity_blocking(self, timeout: float | None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(self._has_capacity, timeout)
+
+    def delete_document(self, doc_id: int) -> None:
+        """Cancel a pending add and remove the document from the store."""
+        with self._cond:
+            self._pending.pop(doc_id, None)
+            self._cond.notify_all()
+        with self._write_lock:
+            self._store.delete_document(doc_id)
+
+    def search(self, query: str, *, limit: int = 10, min_score: float = 0.0) -> Any:
+        """Search the underlying store (documents still queued are not visible)."""
+        return self._store.search(query, limit=limit, min_score=min_score)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Underlying store statistics plus queue counters."""
+        stats = dict(self._store.get_stats())
+        stats["pending_embeddings"] = self.pending
+        stats["embedding"] = self._stats.to_dict()
+        return stats
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every document queued so far has been written.
+
+        Returns:
+            True if the queue drained, False on timeout.
+        """
+        with self._cond:
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(
+                    lambda: not self._pending and self._in_batch == 0, timeout
+                )
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self) -> None:
+        """Embed everything still queued, stop the worker and close the store."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._store.close()
+        logger.info("embedding_queue_closed", **self._stats.to_dict())
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _next_batch(self) -> list[VectorDocument] | None:
+        """Wait until a batch is due; return None once closed and drained."""
+        with self._cond:
+            while True:
+                if self._pending:
+                    oldest_at = next(iter(self._pending.values()))[0]
+                    wait = oldest_at + self._max_delay - time.monotonic()
+                    if (
+                        len(self._pending) >= self._batch_size
+                        or self._closed
+                        or self._flush_waiters
+                        or wait <= 0
+                    ):
+                        break
+                    self._cond.wait(wait)
+                elif self._closed:
+                    return None
+                else:
+                    self._cond.wait()
+
+            batch: list[VectorDocument] = []
+            while self._pending and len(batch) < self._batch_size:
+                _, (_, doc) = self._pending.popitem(last=False)
+                batch.append(doc)
+            self._in_batch = len(batch)
+            # Room freed for producers waiting in wait_for_capacity
+            self._cond.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while (batch := self._next_batch()) is not None:
+            start = time.monotonic()
+            try:
+                with self._write_lock:
+                    self._store.add_documents(batch)
+            except Exception:  # noqa: BLE001
+                self._stats.failed += len(batch)
+                logger.warning("embedding_batch_failed", docs=len(batch), exc_info=True)
+            else:
+                self._stats.embedded += len(batch)
+                self._stats.batches += 1
+                self._stats.embed_seconds += time.monotonic() - start
+                logger.debug(
+                    "embedding_batch_written",
+                    docs=len(batch),
+                    elapsed_ms=round((time.monotonic() - start) * 1000, 1),
+                )
+            finally:
+                with self._cond:
+                    self._in_batch = 0
+                    self._cond.notify_all()
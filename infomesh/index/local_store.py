@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 import time
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
 import structlog
 
 from infomesh.compression.zstd import Compressor
+from infomesh.index.vocabulary import TermVocabulary
+
+if TYPE_CHECKING:
+    from infomesh.search.facets import FacetCounts
 
 logger = structlog.get_logger()
 
@@ -24,6 +32,128 @@ _ALLOWED_TOKENIZERS = frozenset(
 )
 
 
+# Passage rows use rowid = doc_id * stride + seq, so one document's
+# passages form a contiguous rowid range (cheap to look up and delete).
+_PASSAGE_ROWID_STRIDE = 1024
+# Passage length used for snippets (matches select_best_passage)
+PASSAGE_MAX_LENGTH = 300
+_PASSAGE_FALLBACK_LENGTH = 200
+
+# Term vocabulary refresh policy.  Rebuilds always run in a background
+# thread while the previous snapshot keeps serving.  Below
+# _VOCAB_SMALL_INDEX_DOCS documents any change triggers one after at most
+# _VOCAB_DEBOUNCE_SECONDS; above it, once enough documents changed or the
+# snapshot got old.
+_VOCAB_SMALL_INDEX_DOCS = 10_000
+_VOCAB_DEBOUNCE_SECONDS = 2.0
+_VOCAB_REFRESH_MIN_CHANGES = 500
+_VOCAB_REFRESH_SECONDS = 600.0
+# Served until the first snapshot has been built
+_EMPTY_VOCAB = TermVocabulary(())
+
+# Re-indexes a document in FTS5 when its row changes.  Kept as a constant
+# because the domain backfill drops it temporarily.
+_DOCUMENTS_AU_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+        INSERT INTO documents_fts(documents_fts, rowid, title, text)
+        VALUES ('delete', old.doc_id, old.title, old.text);
+        INSERT INTO documents_fts(rowid, title, text)
+        VALUES (new.doc_id, new.title, new.text);
+    END;
+"""
+
+# Per-domain counters, kept in step with ``documents`` by triggers so the
+# dashboard and domain listings never scan the corpus.
+_DOMAIN_STATS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS domain_stats (
+        domain TEXT PRIMARY KEY,
+        doc_count INTEGER NOT NULL DEFAULT 0,
+        text_bytes INTEGER NOT NULL DEFAULT 0,
+        js_count INTEGER NOT NULL DEFAULT 0,
+        last_crawled_at REAL NOT NULL DEFAULT 0
+    );
+
+    CREATE TRIGGER IF NOT EXISTS domain_stats_ai AFTER INSERT ON documents BEGIN
+        INSERT INTO domain_stats
+            (domain, doc_count, text_bytes, js_count, last_crawled_at)
+        VALUES (
+            new.domain, 1, length(CAST(new.text AS BLOB)),
+            COALESCE(new.js_required, 0), new.crawled_at
+        )
+        ON CONFLICT(domain) DO UPDATE SET
+            doc_count = doc_count + 1,
+            text_bytes = text_bytes + excluded.text_bytes,
+            js_count = js_count + excluded.js_count,
+            last_crawled_at = MAX(last_crawled_at, excluded.last_crawled_at);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS domain_stats_ad AFTER DELETE ON documents BEGIN
+        UPDATE domain_stats SET
+            doc_count = doc_count - 1,
+            text_bytes = text_bytes - length(CAST(old.text AS BLOB)),
+            js_count = js_count - COALESCE(old.js_required, 0)
+        WHERE domain = old.domain;
+        DELETE FROM domain_stats WHERE domain = old.domain AND doc_count <= 0;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS domain_stats_au
+    AFTER UPDATE OF text, js_required, last_recrawl_at ON documents BEGIN
+        UPDATE domain_stats SET
+            text_bytes = text_bytes
+                - length(CAST(old.text AS BLOB))
+                + length(CAST(new.text AS BLOB)),
+            js_count = js_count
+                - COALESCE(old.js_required, 0)
+                + COALESCE(new.js_required, 0),
+            last_crawled_at = MAX(
+                last_crawled_at, COALESCE(new.last_recrawl_at, new.crawled_at)
+            )
+        WHERE domain = new.domain;
+    END;
+"""
+
+# Narrow copy of the facet columns, one short row per document, so facet
+# aggregation joins FTS matches against dense pages instead of reading
+# past ``text`` in every ``documents`` row.
+_DOC_FACETS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS doc_facets (
+        doc_id INTEGER PRIMARY KEY,
+        domain TEXT NOT NULL DEFAULT '',
+        language TEXT,
+        crawled_at REAL NOT NULL DEFAULT 0
+    );
+
+    CREATE TRIGGER IF NOT EXISTS doc_facets_ai AFTER INSERT ON documents BEGIN
+        INSERT OR REPLACE INTO doc_facets (doc_id, domain, language, crawled_at)
+        VALUES (new.doc_id, new.domain, new.language, new.crawled_at);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS doc_facets_ad AFTER DELETE ON documents BEGIN
+        DELETE FROM doc_facets WHERE doc_id = old.doc_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS doc_facets_au
+    AFTER UPDATE OF domain, language, crawled_at ON documents BEGIN
+        UPDATE doc_facets SET
+            domain = new.domain,
+            language = new.language,
+            crawled_at = new.crawled_at
+        WHERE doc_id = new.doc_id;
+    END;
+"""
+
+# Facet aggregation scans FTS matches in doc_id ranges, starting at this
+# width and resizing each range to fit the remaining time budget; once
+# the budget is spent the counts so far are extrapolated.
+_FACET_CHUNK_DOCS = 262_144
+DEFAULT_FACET_TIME_BUDGET = 0.5
+
+
+def url_domain(url: str) -> str:
+    """Host part of *url* as stored in ``documents.domain`` (lowercased)."""
+    return urlparse(url).netloc.lower()
+
+
 @dataclass(frozen=True)
 class IndexedDocument:
     """A document stored in the local index."""
@@ -44,6 +174,7 @@ class IndexedDocument:
     last_recrawl_at: float | None = None
     change_frequency: float = 0.0
     js_required: int = 0  # 1 if JS rendering was needed
+    domain: str = ""
 
 
 @dataclass(frozen=True)
@@ -59,6 +190,17 @@ class SearchResult:
     crawled_at: float
 
 
+@dataclass(frozen=True)
+class DomainStats:
+    """Per-domain counters maintained alongside the index."""
+
+    domain: str
+    doc_count: int
+    text_bytes: int
+    js_count: int
+    last_crawled_at: float
+
+
 class LocalStore:
     """SQLite FTS5 based local document store and search index.
 
@@ -98,6 +240,13 @@ class LocalStore:
         self._compressor: Compressor | None = None
         if compression_enabled:
             self._compressor = Compressor(level=compression_level)
+        self._vocab: TermVocabulary | None = None
+        self._vocab_docs = 0
+        self._vocab_built_at = 0.0
+        self._vocab_changes = 0
+        self._vocab_lock = threading.Lock()
+        self._vocab_refreshing = False
+        self._vocab_thread: threading.Thread | None = None
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -133,12 +282,24 @@ class LocalStore:
                 VALUES ('delete', old.doc_id, old.title, old.text);
             END;
 
-            CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
-                INSERT INTO documents_fts(documents_fts, rowid, title, text)
-                VALUES ('delete', old.doc_id, old.title, old.text);
-                INSERT INTO documents_fts(rowid, title, text)
-                VALUES (new.doc_id, new.title, new.text);
+            {_DOCUMENTS_AU_TRIGGER}
+
+            -- Snippet passages, split once at index time
+            CREATE VIRTUAL TABLE IF NOT EXISTS passages_fts USING fts5(
+                text,
+                tokenize='{self._tokenizer}'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS documents_passages_ad
+            AFTER DELETE ON documents BEGIN
+                DELETE FROM passages_fts
+                WHERE rowid >= old.doc_id * {_PASSAGE_ROWID_STRIDE}
+                  AND rowid < (old.doc_id + 1) * {_PASSAGE_ROWID_STRIDE};
             END;
+
+            -- Per-term document frequencies, maintained by FTS5 itself
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_vocab
+            USING fts5vocab(documents_fts, row);
         """)
         self._conn.commit()
 
@@ -188,13 +349,68 @@ class LocalStore:
                 "js_required",
                 "ALTER TABLE documents ADD COLUMN js_required INTEGER DEFAULT 0",
             ),
+            (
+                "domain",
+                "ALTER TABLE documents ADD COLUMN domain TEXT NOT NULL DEFAULT ''",
+            ),
         ]
         for col, ddl in migrations:
             if col not in existing:
                 self._conn.execute(ddl)
                 logger.info("schema_migrated", column=col)
+        if "domain" not in existing:
+            self._backfill_domains()
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_recrawl_due ON documents"
+            f"{self._RECRAWL_DUE_SQL} WHERE stale_count < 3"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_domain ON documents(domain)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_crawled_at"
+            " ON documents(crawled_at)"
+        )
+        has_domain_stats = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'domain_stats'"
+        ).fetchone()
+        self._conn.executescript(_DOMAIN_STATS_SCHEMA)
+        if not has_domain_stats:
+            self._conn.execute(
+                "INSERT INTO domain_stats"
+                " (domain, doc_count, text_bytes, js_count, last_crawled_at)"
+                " SELECT domain, COUNT(*), SUM(length(CAST(text AS BLOB))),"
+                " SUM(COALESCE(js_required, 0)), MAX(crawled_at)"
+                " FROM documents GROUP BY domain"
+            )
+        has_doc_facets = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'doc_facets'"
+        ).fetchone()
+        self._conn.executescript(_DOC_FACETS_SCHEMA)
+        if not has_doc_facets:
+            self._conn.execute(
+                "INSERT INTO doc_facets (doc_id, domain, language, crawled_at)"
+                " SELECT doc_id, domain, language, crawled_at FROM documents"
+            )
         self._conn.commit()
 
+    def _backfill_domains(self) -> None:
+        """Fill ``documents.domain`` for rows written before the column existed.
+
+        The FTS update trigger is dropped meanwhile so that setting the
+        domain does not re-index every document.
+        """
+        rows = self._conn.execute("SELECT doc_id, url FROM documents").fetchall()
+        if not rows:
+            return
+        self._conn.execute("DROP TRIGGER IF EXISTS documents_au")
+        self._conn.executemany(
+            "UPDATE documents SET domain = ? WHERE doc_id = ?",
+            [(url_domain(row["url"]), row["doc_id"]) for row in rows],
+        )
+        self._conn.execute(_DOCUMENTS_AU_TRIGGER)
+        logger.info("schema_backfilled", column="domain", rows=len(rows))
+
     def add_document(
         self,
         url: str,
@@ -205,6 +421,8 @@ class LocalStore:
         *,
         language: str | None = None,
         js_required: bool = False,
+        etag: str | None = None,
+        last_modified: str | None = None,
     ) -> int | None:
         """Add a document to the local index.
 
@@ -216,22 +434,95 @@ class LocalStore:
             text_hash: SHA-256 of extracted text.
             language: ISO language code.
             js_required: Whether the page needed JS rendering.
+            etag: ``ETag`` response header, for conditional recrawl.
+            last_modified: ``Last-Modified`` response header.
 
         Returns:
             Document ID if inserted, None if duplicate.
         """
+        doc_id = self._insert_document(
+            url,
+            title,
+            text,
+            raw_html_hash,
+            text_hash,
+            language=language,
+            js_required=js_required,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if doc_id is None:
+            logger.debug("doc_duplicate", url=url)
+            return None
+        self._conn.commit()
+        self._vocab_changes += 1
+        logger.info("doc_indexed", doc_id=doc_id, url=url, text_len=len(text))
+        return doc_id
+
+    def add_documents(self, docs: Iterable[Mapping[str, Any]]) -> list[int | None]:
+        """Add many documents in a single transaction (bulk import).
+
+        Each mapping carries :meth:`add_document`'s arguments by name
+        (``url``, ``title``, ``text``, ``raw_html_hash``, ``text_hash``
+        and optionally ``language``, ``js_required``, ``etag``,
+        ``last_modified``).
+
+        Returns:
+            One entry per input document: its ID, or None if duplicate.
+        """
+        ids: list[int | None] = []
+        try:
+            for doc in docs:
+                ids.append(
+                    self._insert_document(
+                        str(doc["url"]),
+                        str(doc["title"]),
+                        str(doc["text"]),
+                        str(doc["raw_html_hash"]),
+                        str(doc["text_hash"]),
+                        language=doc.get("language"),
+                        js_required=bool(doc.get("js_required", False)),
+                        etag=doc.get("etag"),
+                        last_modified=doc.get("last_modified"),
+                    )
+                )
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            raise
+        added = sum(1 for doc_id in ids if doc_id is not None)
+        self._vocab_changes += added
+        logger.debug("docs_indexed", added=added, duplicates=len(ids) - added)
+        return ids
+
+    def _insert_document(
+        self,
+        url: str,
+        title: str,
+        text: str,
+        raw_html_hash: str,
+        text_hash: str,
+        *,
+        language: str | None,
+        js_required: bool,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> int | None:
+        """Insert one document and its passages without committing."""
+        compressed = None
+        if self._compressor:
+            compressed = self._compressor.compress_text(text)
         try:
-            compressed = None
-            if self._compressor:
-                compressed = self._compressor.compress_text(text)
             cursor = self._conn.execute(
                 """INSERT INTO documents
-                   (url, title, text, compressed_text,
+                   (url, domain, title, text, compressed_text,
                     language, raw_html_hash,
-                    text_hash, crawled_at, js_required)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    text_hash, crawled_at, js_required,
+                    etag, last_modified)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     url,
+                    url_domain(url),
                     title,
                     text,
                     compressed,
@@ -240,15 +531,16 @@ class LocalStore:
                     text_hash,
                     time.time(),
                     1 if js_required else 0,
+                    etag,
+                    last_modified,
                 ),
             )
-            self._conn.commit()
-            doc_id = cursor.lastrowid
-            logger.info("doc_indexed", doc_id=doc_id, url=url, text_len=len(text))
-            return doc_id
         except sqlite3.IntegrityError:
-            logger.debug("doc_duplicate", url=url)
             return None
+        doc_id = cursor.lastrowid
+        if doc_id is not None:
+            self._index_passages(doc_id, text)
+        return doc_id
 
     def search(
         self,
@@ -282,36 +574,15 @@ class LocalStore:
         offset = max(0, min(offset, 10000))
 
         try:
-            # Build dynamic WHERE clause beyond FTS MATCH
-            extra_conditions: list[str] = []
-            params: list[object] = [query]
-
-            if language:
-                extra_conditions.append("d.language = ?")
-                params.append(language)
-            if date_from is not None:
-                extra_conditions.append("d.crawled_at >= ?")
-                params.append(date_from)
-            if date_to is not None:
-                extra_conditions.append("d.crawled_at <= ?")
-                params.append(date_to)
-
-            # Domain filtering via URL substring matching
-            if include_domains:
-                placeholders = ", ".join("?" for _ in include_domains)
-                # Extract domain from URL for matching
-                extra_conditions.append(f"{self._DOMAIN_SQL} IN ({placeholders})")
-                params.extend(include_domains)
-            if exclude_domains:
-                placeholders = ", ".join("?" for _ in exclude_domains)
-                extra_conditions.append(f"{self._DOMAIN_SQL} NOT IN ({placeholders})")
-                params.extend(exclude_domains)
-
-            where_extra = ""
-            if extra_conditions:
-                where_extra = " AND " + " AND ".join(extra_conditions)
-
-            params.extend([limit, offset])
+            where_extra, filter_params = self._filter_sql(
+                "d",
+                language=language,
+                date_from=date_from,
+                date_to=date_to,
+                include_domains=include_domains,
+                exclude_domains=exclude_domains,
+            )
+            params = [query, *filter_params, limit, offset]
 
             rows = self._conn.execute(
                 f"""SELECT
@@ -351,19 +622,314 @@ class LocalStore:
             logger.error("search_error", query=query, error=str(exc))
             return []
 
+    @staticmethod
+    def _filter_sql(
+        alias: str,
+        *,
+        language: str | None = None,
+        date_from: float | None = None,
+        date_to: float | None = None,
+        include_domains: list[str] | None = None,
+        exclude_domains: list[str] | None = None,
+    ) -> tuple[str, list[object]]:
+        """Build the ``AND ...`` clause for search filters beyond FTS MATCH.
+
+        *alias* names a table with ``language``, ``crawled_at`` and
+        ``domain`` columns (``documents`` or ``doc_facets``).
+        """
+        conditions: list[str] = []
+        params: list[object] = []
+        if language:
+            conditions.append(f"{alias}.language = ?")
+            params.append(language)
+        if date_from is not None:
+            conditions.append(f"{alias}.crawled_at >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            conditions.append(f"{alias}.crawled_at <= ?")
+            params.append(date_to)
+
+        # Domain filtering on the indexed ``domain`` column
+        if include_domains:
+            placeholders = ", ".join("?" for _ in include_domains)
+            conditions.append(f"{alias}.domain IN ({placeholders})")
+            params.extend(dom.lower() for dom in include_domains)
+        if exclude_domains:
+            placeholders = ", ".join("?" for _ in exclude_domains)
+            conditions.append(f"{alias}.domain NOT IN ({placeholders})")
+            params.extend(dom.lower() for dom in exclude_domains)
+
+        if not conditions:
+            return "", params
+        return " AND " + " AND ".join(conditions), params
+
+    def facet_counts(
+        self,
+        query: str,
+        *,
+        language: str | None = None,
+        date_from: float | None = None,
+        date_to: float | None = None,
+        include_domains: list[str] | None = None,
+        exclude_domains: list[str] | None = None,
+        max_domains: int = 20,
+        time_budget: float = DEFAULT_FACET_TIME_BUDGET,
+        now: float | None = None,
+    ) -> FacetCounts:
+        """Count domain, language and date facets over *all* matches of *query*.
+
+        Takes the same filters as :meth:`search`.  Matches are aggregated
+        in SQL from ``doc_facets``, one doc_id range at a time; if
+        *time_budget* seconds run out before the whole index is covered,
+        the counts so far are scaled up to the full range and the result
+        is marked ``approximate``.
+
+        Args:
+            query: FTS5 query, as passed to :meth:`search`.
+            max_domains: Max domain facets to return.
+            time_budget: Seconds to spend before extrapolating.
+            now: Reference time for date buckets (default: current time).
+
+        Returns:
+            FacetCounts for the query (empty on an invalid query).
+        """
+        from collections import Counter
+
+        from infomesh.search.facets import DATE_BUCKETS, FacetCounts
+
+        now = time.time() if now is None else now
+        where_extra, filter_params = self._filter_sql(
+            "f",
+            language=language,
+            date_from=date_from,
+            date_to=date_to,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+        )
+        # Same cut-offs as compute_facets: age ≤ 1, 7, 30, 365 days
+        bucket_sql = (
+            "CASE WHEN f.crawled_at <= 0 OR f.crawled_at > ? THEN 'unknown'"
+            + "".join(
+                f" WHEN f.crawled_at >= ? THEN '{name}'" for name, _ in DATE_BUCKETS
+            )
+            + " ELSE 'older' END"
+        )
+        bucket_params = [now, *(now - days * 86400 for _, days in DATE_BUCKETS)]
+        sql = f"""SELECT f.domain, f.language, {bucket_sql} AS bucket, COUNT(*)
+                  FROM documents_fts
+                  JOIN doc_facets f ON f.doc_id = documents_fts.rowid
+                  WHERE documents_fts MATCH ?
+                    AND documents_fts.rowid >= ? AND documents_fts.rowid < ?
+                    {where_extra}
+                  GROUP BY 1, 2, 3"""
+
+        domains: Counter[str] = Counter()
+        languages: Counter[str] = Counter()
+        dates: Counter[str] = Counter()
+        total = 0
+        # Separate subqueries: each is a single b-tree seek
+        row = self._conn.execute(
+            "SELECT (SELECT MIN(doc_id) FROM doc_facets),"
+            " (SELECT MAX(doc_id) FROM doc_facets)"
+        ).fetchone()
+        first, last = (row[0], row[1]) if row and row[0] is not None else (1, 0)
+        started = time.monotonic()
+        deadline = started + time_budget
+        lo = first
+        chunk = _FACET_CHUNK_DOCS
+        try:
+            while lo <= last:
+                hi = lo + chunk
+                for domain, lang, bucket, count in self._conn.execute(
+                    sql, (*bucket_params, query, lo, hi, *filter_params)
+                ):
+                    if domain:
+                        domains[domain] += count
+                    if lang:
+                        languages[lang] += count
+                    dates[bucket] += count
+                    total += count
+                lo = hi
+                clock = time.monotonic()
+                if clock >= deadline:
+                    break
+                # Each range costs a fresh FTS query, so take as much of
+                # the remaining budget's worth of doc_ids as fits at once
+                rate = (lo - first) / max(clock - started, 1e-6)
+                chunk = max(chunk, int(rate * (deadline - clock) * 0.8))
+        except sqlite3.OperationalError as exc:
+            logger.error("facet_error", query=query, error=str(exc))
+            return FacetCounts()
+
+        approximate = lo <= last
+        if approximate:
+            scale = (last - first + 1) / (lo - first)
+            for counter in (domains, languages, dates):
+                for key in counter:
+                    counter[key] = round(counter[key] * scale)
+            total = round(total * scale)
+            logger.debug("facet_budget_exhausted", query=query, scale=round(scale, 2))
+
+        return FacetCounts(
+            domains=dict(domains.most_common(max_domains)),
+            languages=dict(languages.most_common()),
+            date_ranges=dict(dates),
+            total=total,
+            approximate=approximate,
+        )
+
+    # ── Passages (snippets) ──────────────────────────────────────────
+
+    def _index_passages(self, doc_id: int, text: str) -> None:
+        """Split *text* into snippet passages and (re)write them.
+
+        Does not commit; callers commit with the document write.
+        """
+        from infomesh.search.passage import split_passages
+
+        lo = doc_id * _PASSAGE_ROWID_STRIDE
+        self._conn.execute(
+            "DELETE FROM passages_fts WHERE rowid >= ? AND rowid < ?",
+            (lo, lo + _PASSAGE_ROWID_STRIDE),
+        )
+        passages = split_passages(text, max_length=PASSAGE_MAX_LENGTH)
+        if not passages and text.strip():
+            passages = [text.strip()]
+        self._conn.executemany(
+            "INSERT INTO passages_fts(rowid, text) VALUES (?, ?)",
+            [
+                (lo + seq, passage[:PASSAGE_MAX_LENGTH])
+                for seq, passage in enumerate(passages[:_PASSAGE_ROWID_STRIDE])
+            ],
+        )
+
+    def best_passages(self, doc_ids: list[int], query: str) -> dict[int, str]:
+        """Return the most query-relevant stored passage for each document.
+
+        Candidate passages come from one FTS5 query over the passage
+        table (restricted to each document's rowid range) and are scored
+        with :func:`~infomesh.search.passage.score_passage`, so the cost
+        depends on the number of matching passages rather than on
+        document length.  Documents with no matching passage get the
+        start of their first passage.  Documents indexed before passages
+        existed are split on first use.
+
+        Args:
+            doc_ids: Documents to select passages for.
+            query: User search query.
+
+        Returns:
+            Mapping of doc_id to passage text (missing documents omitted).
+        """
+        from infomesh.search.passage import _tokenize, score_passage
+
+        tokens = _tokenize(query)
+        doc_ids = list(dict.fromkeys(doc_ids))
+        if not tokens or not doc_ids:
+            return {}
+
+        match = " OR ".join(f'"{t}"' for t in dict.fromkeys(tokens))
+        best: dict[int, tuple[float, float, str]] = {}
+        try:
+            for rowid, text, rank in self._matching_passages(doc_ids, match):
+                doc_id = rowid // _PASSAGE_ROWID_STRIDE
+                key = (score_passage(text, tokens), -rank, text)
+                if doc_id not in best or key[:2] > best[doc_id][:2]:
+                    best[doc_id] = key
+        except sqlite3.OperationalError as exc:
+            logger.debug("passage_search_error", query=query, error=str(exc))
+        result = {d: v[2] for d, v in best.items() if v[0] > 0}
+
+        missing = [d for d in doc_ids if d not in result]
+        if missing:
+            result.update(self._fallback_passages(missing, tokens))
+        return result
+
+    def _matching_passages(
+        self, doc_ids: list[int], match: str
+    ) -> list[tuple[int, str, float]]:
+        stride = _PASSAGE_ROWID_STRIDE
+        part = (
+            "SELECT rowid, text, bm25(passages_fts) FROM passages_fts "
+            "WHERE passages_fts MATCH ? AND rowid >= ? AND rowid < ?"
+        )
+        params: list[object] = []
+        for doc_id in doc_ids:
+            params.extend((match, doc_id * stride, (doc_id + 1) * stride))
+        rows = self._conn.execute(
+            " UNION ALL ".join([part] * len(doc_ids)), params
+        ).fetchall()
+        return [(int(r[0]), str(r[1]), float(r[2])) for r in rows]
+
+    def _fallback_passages(
+        self, doc_ids: list[int], tokens: list[str]
+    ) -> dict[int, str]:
+        """Leading passage for unmatched docs; backfills unsplit documents."""
+        from infomesh.search.passage import score_passage
+
+        stride = _PASSAGE_ROWID_STRIDE
+        placeholders = ", ".join("?" for _ in doc_ids)
+        rows = self._conn.execute(
+            f"SELECT rowid, text FROM passages_fts WHERE rowid IN ({placeholders})",
+            [d * stride for d in doc_ids],
+        ).fetchall()
+        result = {
+            int(r[0]) // stride: str(r[1])[:_PASSAGE_FALLBACK_LENGTH] for r in rows
+        }
+
+        backfilled = False
+        for doc_id in doc_ids:
+            if doc_id in result:
+                continue
+            doc = self.get_document(doc_id)
+            if doc is None or not doc.text:
+                continue
+            self._index_passages(doc_id, doc.text)
+            backfilled = True
+            lo = doc_id * stride
+            passages = [
+                str(r[0])
+                for r in self._conn.execute(
+                    "SELECT text FROM passages_fts WHERE rowid >= ? AND rowid < ? "
+                    "ORDER BY rowid",
+                    (lo, lo + stride),
+                )
+            ]
+            scored = max(passages, key=lambda p: score_passage(p, tokens))
+            if score_passage(scored, tokens) > 0:
+                result[doc_id] = scored
+            else:
+                result[doc_id] = doc.text[:_PASSAGE_FALLBACK_LENGTH]
+        if backfilled:
+            self._conn.commit()
+        return result
+
     def suggest(self, prefix: str, *, limit: int = 10) -> list[str]:
-        """Return title-based search suggestions for a prefix.
+        """Return search suggestions (autocomplete) for a prefix.
 
-        Uses a simple LIKE query on indexed document titles.
+        Completes the last word of *prefix* from the term vocabulary,
+        most frequent terms first, keeping the preceding words.  Falls
+        back to a title ``LIKE`` scan when no vocabulary is available
+        (trigram tokenizer).
 
         Args:
             prefix: Partial query text.
             limit: Maximum suggestions.
 
         Returns:
-            List of matching title strings.
+            List of suggested query strings.
         """
         limit = max(1, min(limit, 50))
+        vocab = self.vocabulary()
+        if vocab is not None:
+            head, _, last = prefix[:100].lower().rpartition(" ")
+            if not last:
+                return []
+            head = " ".join(head.split())
+            return [
+                f"{head} {term}" if head else term
+                for term in vocab.complete(last, limit=limit)
+            ]
         safe = prefix.replace("%", "").replace("_", "")[:100]
         try:
             rows = self._conn.execute(
@@ -376,6 +942,93 @@ class LocalStore:
         except sqlite3.OperationalError:
             return []
 
+    def vocabulary(self) -> TermVocabulary | None:
+        """Term vocabulary of the index, for spelling correction and autocomplete.
+
+        Built from the ``documents_vocab`` table in a background thread,
+        first on demand and then again (debounced) as documents change.
+        Never rebuilds on the caller's thread: until the first build
+        finishes an empty vocabulary is returned, and afterwards the
+        previous snapshot keeps serving while a refresh runs.
+
+        Returns:
+            The current vocabulary, or None with the trigram tokenizer
+            (whose terms are not words).
+        """
+        if self._tokenizer == "trigram":
+            return None
+        vocab = self._vocab
+        if vocab is None:
+            self._refresh_vocabulary_in_background()
+            return _EMPTY_VOCAB
+        if self._vocab_changes:
+            age = time.monotonic() - self._vocab_built_at
+            if (
+                (
+                    self._vocab_docs < _VOCAB_SMALL_INDEX_DOCS
+                    and age >= _VOCAB_DEBOUNCE_SECONDS
+                )
+                or self._vocab_changes
+                >= max(_VOCAB_REFRESH_MIN_CHANGES, self._vocab_docs // 10)
+                or age > _VOCAB_REFRESH_SECONDS
+            ):
+                self._refresh_vocabulary_in_background()
+        return vocab
+
+    def refresh_vocabulary(self) -> TermVocabulary:
+        """Rebuild the term vocabulary now (blocking)."""
+        return self._build_vocabulary(self._conn)
+
+    def _build_vocabulary(self, conn: sqlite3.Connection) -> TermVocabulary:
+        changes = self._vocab_changes
+        start = time.monotonic()
+        rows = conn.execute(
+            "SELECT term, doc FROM documents_vocab "
+            "WHERE length(term) >= 2 AND term NOT GLOB '[0-9]*'"
+        )
+        vocab = TermVocabulary((row[0], row[1]) for row in rows)
+        docs = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        with self._vocab_lock:
+            self._vocab = vocab
+            self._vocab_docs = int(docs)
+            self._vocab_built_at = time.monotonic()
+            self._vocab_changes = max(0, self._vocab_changes - changes)
+        logger.debug(
+            "vocabulary_built",
+            terms=len(vocab),
+            documents=docs,
+            elapsed_ms=round((time.monotonic() - start) * 1000, 1),
+        )
+        return vocab
+
+    def _refresh_vocabulary_in_background(self) -> None:
+        with self._vocab_lock:
+            if self._vocab_refreshing:
+                return
+            self._vocab_refreshing = True
+
+        def _run() -> None:
+            try:
+                if self._db_path == ":memory:":
+                    # A second connection would open a different database
+                    self._build_vocabulary(self._conn)
+                    return
+                conn = sqlite3.connect(self._db_path)
+                try:
+                    conn.execute("PRAGMA busy_timeout=5000")
+                    self._build_vocabulary(conn)
+                finally:
+                    conn.close()
+            except Exception:  # noqa: BLE001
+                logger.warning("vocabulary_refresh_failed", exc_info=True)
+            finally:
+                self._vocab_refreshing = False
+
+        self._vocab_thread = threading.Thread(
+            target=_run, name="vocabulary-refresh", daemon=True
+        )
+        self._vocab_thread.start()
+
     def _row_to_document(self, row: sqlite3.Row) -> IndexedDocument:
         """Convert a database row to an IndexedDocument, decompressing if needed."""
         data = dict(row)
@@ -418,6 +1071,7 @@ class LocalStore:
         if cur.rowcount > 0:
             # FTS5 cleanup handled by AFTER DELETE trigger (documents_ad)
             self._conn.commit()
+            self._vocab_changes += 1
             return True
         return False
 
@@ -426,14 +1080,9 @@ class LocalStore:
         row = self._conn.execute("SELECT COUNT(*) as count FROM documents").fetchone()
         return {"document_count": row["count"] if row else 0}
 
-    # SQL expression to extract domain from a URL column.
-    _DOMAIN_SQL = """SUBSTR(
-        url, INSTR(url, '://') + 3,
-        CASE WHEN INSTR(SUBSTR(url, INSTR(url, '://') + 3), '/') > 0
-             THEN INSTR(SUBSTR(url, INSTR(url, '://') + 3), '/') - 1
-             ELSE LENGTH(url)
-        END
-    )"""
+    # SQL expression for when a document is next due for recrawl.
+    # Backed by ``idx_documents_recrawl_due``; keep the two in sync.
+    _RECRAWL_DUE_SQL = "(COALESCE(last_recrawl_at, crawled_at) + recrawl_interval)"
 
     def get_top_domains(self, limit: int = 7) -> list[tuple[str, int]]:
         """Return top domains by document count.
@@ -442,11 +1091,11 @@ class LocalStore:
             List of (domain, count) tuples, ordered by count descending.
         """
         rows = self._conn.execute(
-            f"SELECT {self._DOMAIN_SQL} AS domain, COUNT(*) AS cnt "
-            "FROM documents GROUP BY domain ORDER BY cnt DESC LIMIT ?",
+            "SELECT domain, doc_count FROM domain_stats "
+            "ORDER BY doc_count DESC LIMIT ?",
             (limit,),
         ).fetchall()
-        return [(r["domain"], r["cnt"]) for r in rows]
+        return [(r["domain"], r["doc_count"]) for r in rows]
 
     def get_js_required_domains(self, limit: int = 20) -> list[tuple[str, int, int]]:
         """Return domains with JS-required pages.
@@ -456,23 +1105,35 @@ class LocalStore:
             ordered by JS ratio descending.
         """
         rows = self._conn.execute(
-            f"SELECT {self._DOMAIN_SQL} AS domain, "
-            "SUM(CASE WHEN js_required = 1 THEN 1 ELSE 0 END) AS js_cnt, "
-            "COUNT(*) AS total "
-            "FROM documents GROUP BY domain "
-            "HAVING js_cnt > 0 "
-            "ORDER BY CAST(js_cnt AS REAL) / total DESC "
+            "SELECT domain, js_count, doc_count FROM domain_stats "
+            "WHERE js_count > 0 "
+            "ORDER BY CAST(js_count AS REAL) / doc_count DESC "
             "LIMIT ?",
             (limit,),
         ).fetchall()
-        return [(r["domain"], r["js_cnt"], r["total"]) for r in rows]
+        return [(r["domain"], r["js_count"], r["doc_count"]) for r in rows]
 
     def get_domain_count(self) -> int:
         """Return the number of distinct domains in the index."""
+        row = self._conn.execute("SELECT COUNT(*) AS cnt FROM domain_stats").fetchone()
+        return row["cnt"] if row else 0
+
+    def get_domain_stats(self, domain: str) -> DomainStats | None:
+        """Return the maintained counters for one domain, if indexed."""
         row = self._conn.execute(
-            f"SELECT COUNT(DISTINCT {self._DOMAIN_SQL}) AS cnt FROM documents",
+            "SELECT domain, doc_count, text_bytes, js_count, last_crawled_at "
+            "FROM domain_stats WHERE domain = ?",
+            (domain.lower(),),
         ).fetchone()
-        return row["cnt"] if row else 0
+        if row is None:
+            return None
+        return DomainStats(
+            domain=row["domain"],
+            doc_count=row["doc_count"],
+            text_bytes=row["text_bytes"],
+            js_count=row["js_count"],
+            last_crawled_at=row["last_crawled_at"],
+        )
 
     def export_documents(self) -> list[dict[str, object]]:
         """Export all documents as a list of dicts (for snapshot/backup).
@@ -480,22 +1141,35 @@ class LocalStore:
         Returns column subset: url, title, text, language,
         raw_html_hash, text_hash, crawled_at — ordered by doc_id.
         """
-        rows = self._conn.execute(
-            "SELECT url, title, text, language, raw_html_hash, text_hash, crawled_at "
-            "FROM documents ORDER BY doc_id"
-        ).fetchall()
-        return [
-            {
-                "url": row["url"],
-                "title": row["title"],
-                "text": row["text"],
-                "language": row["language"],
-                "raw_html_hash": row["raw_html_hash"],
-                "text_hash": row["text_hash"],
-                "crawled_at": row["crawled_at"],
-            }
-            for row in rows
-        ]
+        return list(self.iter_documents())
+
+    def iter_documents(self, *, batch_size: int = 1000) -> Iterator[dict[str, object]]:
+        """Stream all documents in :meth:`export_documents` form.
+
+        Reads *batch_size* rows at a time (keyset pagination on
+        ``doc_id``), so memory use does not grow with the index.
+        """
+        last_id = 0
+        while True:
+            rows = self._conn.execute(
+                "SELECT doc_id, url, title, text, language, "
+                "raw_html_hash, text_hash, crawled_at "
+                "FROM documents WHERE doc_id > ? ORDER BY doc_id LIMIT ?",
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield {
+                    "url": row["url"],
+                    "title": row["title"],
+                    "text": row["text"],
+                    "language": row["language"],
+                    "raw_html_hash": row["raw_html_hash"],
+                    "text_hash": row["text_hash"],
+                    "crawled_at": row["crawled_at"],
+                }
+            last_id = rows[-1]["doc_id"]
 
     def get_documents_for_publish(
         self,
@@ -523,6 +1197,8 @@ class LocalStore:
 
     def close(self) -> None:
         """Close the database connection."""
+        if self._vocab_thread is not None:
+            self._vocab_thread.join()
         self._conn.close()
 
     def optimize(self) -> None:
@@ -590,6 +1266,10 @@ class LocalStore:
             if val is not None:
                 sets.append(f"{col} = ?")
                 params.append(val)
+        # Reads prefer compressed_text, so it must track the new text
+        if text is not None and self._compressor:
+            sets.append("compressed_text = ?")
+            params.append(self._compressor.compress_text(text))
 
         if not sets:
             return False
@@ -597,8 +1277,16 @@ class LocalStore:
         params.append(url)
         sql = f"UPDATE documents SET {', '.join(sets)} WHERE url = ?"
         cursor = self._conn.execute(sql, params)
-        self._conn.commit()
         updated = cursor.rowcount > 0
+        if updated and text is not None:
+            row = self._conn.execute(
+                "SELECT doc_id FROM documents WHERE url = ?", (url,)
+            ).fetchone()
+            if row is not None:
+                self._index_passages(int(row["doc_id"]), text)
+        self._conn.commit()
+        if updated and (text is not None or title is not None):
+            self._vocab_changes += 1
         if updated:
             logger.debug("doc_updated", url=url, fields=list(_field_map.keys()))
         return updated
@@ -613,18 +1301,41 @@ class LocalStore:
         self._conn.commit()
         deleted = cursor.rowcount > 0
         if deleted:
+            self._vocab_changes += 1
             logger.info("doc_soft_deleted", url=url)
         return deleted
 
-    def get_recrawl_candidates(self, *, limit: int = 200) -> list[dict[str, object]]:
+    def get_recrawl_candidates(
+        self,
+        *,
+        limit: int = 200,
+        due_before: float | None = None,
+    ) -> list[dict[str, object]]:
         """Retrieve documents eligible for recrawl consideration.
 
+        Args:
+            limit: Maximum rows to return.
+            due_before: When set, only return documents whose next
+                recrawl (last recrawl or first crawl + ``recrawl_interval``)
+                is due at or before this timestamp, most overdue first.
+
         Returns rows with recrawl metadata as dicts.
         """
-        rows = self._conn.execute(
-            """SELECT doc_id, url, text_hash, etag, last_modified,
+        columns = """doc_id, url, text_hash, etag, last_modified,
                       recrawl_interval, stale_count, change_frequency,
-                      crawled_at, last_recrawl_at
+                      crawled_at, last_recrawl_at"""
+        if due_before is not None:
+            rows = self._conn.execute(
+                f"""SELECT {columns}
+                   FROM documents
+                   WHERE stale_count < 3 AND {self._RECRAWL_DUE_SQL} <= ?
+                   ORDER BY {self._RECRAWL_DUE_SQL}
+                   LIMIT ?""",
+                (due_before, limit),
+            ).fetchall()
+            return [dict(row) for row in rows]
+        rows = self._conn.execute(
+            f"""SELECT {columns}
                FROM documents
                WHERE stale_count < 3
                ORDER BY last_recrawl_at ASC NULLS FIRST
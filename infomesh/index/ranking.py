@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import math
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -29,6 +29,10 @@ WEIGHT_AUTHORITY = 0.15
 # Bonus weights — additive on top of the core score:
 WEIGHT_TITLE_MATCH = 0.15  # query terms in title
 WEIGHT_URL_PATH = 0.05  # query terms in URL path
+WEIGHT_FEEDBACK = 0.10  # learned click/citation boost (may be negative)
+
+# Raw feedback boost giving a feedback score of tanh(1) ≈ 0.76.
+FEEDBACK_BOOST_SCALE: float = 3.0
 
 # Freshness half-life in seconds (7 days).
 # After one half-life the freshness component drops to 50 %.
@@ -58,6 +62,7 @@ class RankedResult:
     peer_id: str | None = None
     title_match_score: float = 0.0
     url_path_score: float = 0.0
+    feedback_score: float = 0.0
 
 
 # --- Scoring helpers -----------------------------------------------------
@@ -101,6 +106,22 @@ def normalize_bm25(score: float, *, max_score: float = 1.0) -> float:
     return score / (score + max_score)
 
 
+def feedback_score(boost: float) -> float:
+    """Squash a raw feedback boost into ``(-1, 1)``.
+
+    Boosts from :class:`~infomesh.search.feedback.FeedbackStore` are
+    unbounded sums of fetch (+1), skip (−0.3) and citation (+2) signals;
+    ``tanh`` keeps a heavily-clicked URL from outweighing relevance.
+
+    Args:
+        boost: Raw boost score (0.0 when the URL has no feedback).
+
+    Returns:
+        Feedback score in ``(-1, 1)``.
+    """
+    return math.tanh(boost / FEEDBACK_BOOST_SCALE)
+
+
 def combined_score(
     bm25: float,
     freshness: float,
@@ -109,17 +130,19 @@ def combined_score(
     *,
     title_match: float = 0.0,
     url_path: float = 0.0,
+    feedback: float = 0.0,
     w_bm25: float = WEIGHT_BM25,
     w_fresh: float = WEIGHT_FRESHNESS,
     w_trust: float = WEIGHT_TRUST,
     w_authority: float = WEIGHT_AUTHORITY,
     w_title: float = WEIGHT_TITLE_MATCH,
     w_url: float = WEIGHT_URL_PATH,
+    w_feedback: float = WEIGHT_FEEDBACK,
 ) -> float:
     """Compute the weighted sum of ranking signals.
 
     Core signals (BM25, freshness, trust, authority) plus additive
-    bonuses for title match and URL path relevance.
+    bonuses for title match, URL path relevance and user feedback.
 
     Args:
         bm25: Normalized BM25 score ``[0, 1]``.
@@ -128,12 +151,14 @@ def combined_score(
         authority: Domain authority score ``[0, 1]``.
         title_match: Title-query overlap ``[0, 1]``.
         url_path: URL path-query overlap ``[0, 1]``.
+        feedback: Feedback score ``(-1, 1)`` (see :func:`feedback_score`).
         w_bm25: Weight for relevance.
         w_fresh: Weight for freshness.
         w_trust: Weight for trust.
         w_authority: Weight for domain authority.
         w_title: Weight for title match bonus.
         w_url: Weight for URL path bonus.
+        w_feedback: Weight for feedback bonus.
 
     Returns:
         Combined score (higher is better).
@@ -145,6 +170,7 @@ def combined_score(
         + w_authority * authority
         + w_title * title_match
         + w_url * url_path
+        + w_feedback * feedback
     )
 
 
@@ -173,6 +199,7 @@ def rank_results(
     *,
     limit: int = 10,
     now: float | None = None,
+    boosts: Mapping[str, float] | None = None,
 ) -> list[RankedResult]:
     """Rank a list of search candidates by composite score.
 
@@ -186,6 +213,8 @@ def rank_results(
         candidates: Raw search candidates (from local or remote).
         limit: Maximum results to return.
         now: Override current timestamp for testing.
+        boosts: Optional ``url → raw feedback boost`` map (e.g.
+            ``FeedbackStore.boost_map()``); URLs not in it get none.
 
     Returns:
         Sorted list of :class:`RankedResult`.
@@ -201,6 +230,8 @@ def rank_results(
     for c in candidates:
         norm_bm25 = normalize_bm25(c.bm25_raw, max_score=max_bm25)
         fresh = freshness_score(c.crawled_at, now=now)
+        boost = boosts.get(c.url, 0.0) if boosts else 0.0
+        feedback = feedback_score(boost) if boost else 0.0
         combo = combined_score(
             norm_bm25,
             fresh,
@@ -208,6 +239,7 @@ def rank_results(
             c.authority,
             title_match=c.title_match,
             url_path=c.url_path,
+            feedback=feedback,
         )
         scored.append(
             RankedResult(
@@ -224,6 +256,7 @@ def rank_results(
                 peer_id=c.peer_id,
                 title_match_score=round(c.title_match, 6),
                 url_path_score=round(c.url_path, 6),
+                feedback_score=round(feedback, 6),
             )
         )
 
@@ -246,6 +279,7 @@ def rank_local_results(
     query_tokens: list[str] | None = None,
     limit: int = 10,
     now: float | None = None,
+    boosts: Mapping[str, float] | None = None,
 ) -> list[RankedResult]:
     """Convenience wrapper: rank LocalStore SearchResult objects.
 
@@ -258,6 +292,7 @@ def rank_local_results(
         query_tokens: Lowercased query tokens for title/URL scoring.
         limit: Maximum results.
         now: Override timestamp.
+        boosts: Optional ``url → raw feedback boost`` map.
 
     Returns:
         Ranked results.
@@ -282,4 +317,4 @@ def rank_local_results(
         )
         for r in results
     ]
-    return rank_results(candidates, limit=limit, now=now)
+    return rank_results(candidates, limit=limit, now=now, boosts=boosts)
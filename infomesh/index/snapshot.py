@@ -1,27 +1,45 @@
 """Index snapshot export/import — zstd-compressed portable index packs.
 
-Export creates a single ``.infomesh-snapshot`` file containing:
-  1. A metadata header (JSON, zstd compressed)
-  2. All documents from the SQLite local store (msgpack, zstd compressed)
+Export writes a single ``.infomesh-snapshot`` file made of independently
+compressed chunks of documents, so neither export nor import ever holds
+more than a few chunks in memory, and import can decompress chunks in
+parallel and insert each one in a single transaction.
 
-Import reads a snapshot file and merges documents into the local index,
-skipping duplicates by ``text_hash``.
-
-File format::
+File format (version 2)::
 
+    [8 bytes: magic b"IMSNAP\\x00\\x02"]
     [4 bytes: header length (big-endian uint32)]
-    [header_length bytes: zstd-compressed JSON metadata]
-    [remaining bytes: zstd-compressed msgpack array of documents]
+    [header_length bytes: zstd-compressed JSON header]
+    repeated for each chunk:
+        [4 bytes: payload length (big-endian uint32)]
+        [4 bytes: document count (big-endian uint32)]
+        [payload: zstd-compressed msgpack array of documents]
+    [manifest: zstd-compressed JSON — totals plus, per chunk, its
+     offset, length, document count and SHA-256 of the payload]
+    [8 bytes: manifest offset (big-endian uint64)]
+    [4 bytes: manifest length (big-endian uint32)]
+    [8 bytes: magic]
+
+Version 1 files (one header followed by a single compressed msgpack
+array) are still imported, subject to the in-memory size limits below.
+Import merges documents into the local index, skipping duplicates by
+``text_hash``.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import struct
+import threading
 import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import msgpack
 import structlog
@@ -34,11 +52,25 @@ logger = structlog.get_logger()
 
 # Snapshot file magic / extension
 SNAPSHOT_EXTENSION = ".infomesh-snapshot"
+_MAGIC = b"IMSNAP\x00\x02"
 
 # Current format version
-_FORMAT_VERSION = 1
+_FORMAT_VERSION = 2
+
+_CHUNK_HEADER = struct.Struct(">II")
+_FOOTER = struct.Struct(">QI8s")
+
+# Chunks close at whichever limit is reached first
+DEFAULT_CHUNK_DOCUMENTS = 1000
+_CHUNK_MAX_RAW_BYTES = 16 * 1024 * 1024
+
+# Per-chunk import guards (streamed formats never load the whole file)
+_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+_MAX_CHUNK_DOCUMENTS = 100_000
+_MAX_MANIFEST_LEN = 64 * 1024 * 1024
 
-# Admin import guard: snapshots are read into memory after this check.
+# Legacy (version 1) import guard: those snapshots are read into memory
+# after this check.
 _MAX_SNAPSHOT_FILE_BYTES = 1024 * 1024 * 1024
 _MAX_HEADER_LEN = 10 * 1024 * 1024
 _MAX_SNAPSHOT_DOCUMENTS = 100_000
@@ -55,89 +87,219 @@ class SnapshotStats:
     elapsed_ms: float
 
 
+def _default_workers() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class _ThreadCompressors(threading.local):
+    """One zstd context per worker thread (contexts are not thread-safe)."""
+
+    def __init__(self, level: int) -> None:
+        self.compressor = Compressor(level=level)
+
+
+def _chunk_documents(
+    docs: Iterator[dict[str, object]], chunk_documents: int
+) -> Iterator[list[dict[str, object]]]:
+    chunk: list[dict[str, object]] = []
+    raw_bytes = 0
+    for doc in docs:
+        chunk.append(doc)
+        raw_bytes += len(str(doc.get("text", ""))) + 256
+        if len(chunk) >= chunk_documents or raw_bytes >= _CHUNK_MAX_RAW_BYTES:
+            yield chunk
+            chunk = []
+            raw_bytes = 0
+    if chunk:
+        yield chunk
+
+
 def export_snapshot(
     store: LocalStore,
     output_path: Path | str,
     *,
     compression_level: int = LEVEL_SNAPSHOT,
+    chunk_documents: int = DEFAULT_CHUNK_DOCUMENTS,
+    workers: int | None = None,
 ) -> SnapshotStats:
     """Export the entire local index to a zstd-compressed snapshot file.
 
+    Documents are streamed from the store and compressed chunk by chunk
+    on a small thread pool; the file is written to a temporary path and
+    renamed into place when complete.
+
     Args:
         store: Local document store to export from.
         output_path: Destination file path.
         compression_level: zstd compression level (default: 12).
+        chunk_documents: Maximum documents per chunk.
+        workers: Compression threads (default: up to 4).
 
     Returns:
         SnapshotStats with export metrics.
     """
     start = time.monotonic()
     output_path = Path(output_path)
-    compressor = Compressor(level=compression_level)
-
-    # Collect all documents
-    documents = store.export_documents()
-
-    # Build metadata header
-    metadata = {
-        "format_version": _FORMAT_VERSION,
-        "created_at": time.time(),
-        "document_count": len(documents),
-    }
-    header_bytes = compressor.compress(json.dumps(metadata).encode("utf-8"))
-
-    # Serialize documents with msgpack then compress
-    doc_bytes = compressor.compress(msgpack.packb(documents, use_bin_type=True))
-
-    # Write file: [header_len (4 bytes)] [header] [documents]
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "wb") as f:
-        f.write(struct.pack(">I", len(header_bytes)))
-        f.write(header_bytes)
-        f.write(doc_bytes)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    workers = workers or _default_workers()
+    local = _ThreadCompressors(compression_level)
+    created_at = time.time()
+
+    def _pack(chunk: list[dict[str, object]]) -> tuple[bytes, int]:
+        payload = local.compressor.compress(msgpack.packb(chunk, use_bin_type=True))
+        return payload, len(chunk)
+
+    entries: list[dict[str, Any]] = []
+    document_count = 0
+    try:
+        with (
+            open(tmp_path, "wb") as f,
+            ThreadPoolExecutor(workers, thread_name_prefix="snapshot") as pool,
+        ):
+            header = Compressor(level=compression_level).compress(
+                json.dumps(
+                    {
+                        "format_version": _FORMAT_VERSION,
+                        "created_at": created_at,
+                        "chunk_documents": chunk_documents,
+                    }
+                ).encode("utf-8")
+            )
+            f.write(_MAGIC)
+            f.write(struct.pack(">I", len(header)))
+            f.write(header)
+
+            def _write(future: Future[tuple[bytes, int]]) -> None:
+                nonlocal document_count
+                payload, count = future.result()
+                entries.append(
+                    {
+                        "offset": f.tell(),
+                        "length": len(payload),
+                        "documents": count,
+                        "sha256": hashlib.sha256(payload).hexdigest(),
+                    }
+                )
+                f.write(_CHUNK_HEADER.pack(len(payload), count))
+                f.write(payload)
+                document_count += count
+
+            pending: deque[Future[tuple[bytes, int]]] = deque()
+            for chunk in _chunk_documents(store.iter_documents(), chunk_documents):
+                pending.append(pool.submit(_pack, chunk))
+                if len(pending) > workers * 2:
+                    _write(pending.popleft())
+            while pending:
+                _write(pending.popleft())
+
+            manifest = Compressor(level=compression_level).compress(
+                json.dumps(
+                    {
+                        "format_version": _FORMAT_VERSION,
+                        "created_at": created_at,
+                        "document_count": document_count,
+                        "chunks": entries,
+                    }
+                ).encode("utf-8")
+            )
+            manifest_offset = f.tell()
+            f.write(manifest)
+            f.write(_FOOTER.pack(manifest_offset, len(manifest), _MAGIC))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     elapsed = (time.monotonic() - start) * 1000
     file_size = output_path.stat().st_size
 
     logger.info(
         "snapshot_exported",
-        documents=len(documents),
+        documents=document_count,
+        chunks=len(entries),
         file_size=file_size,
         path=str(output_path),
     )
 
     return SnapshotStats(
-        total_documents=len(documents),
-        exported=len(documents),
+        total_documents=document_count,
+        exported=document_count,
         skipped=0,
         file_size_bytes=file_size,
         elapsed_ms=elapsed,
     )
 
 
+def _is_chunked(f: IO[bytes]) -> bool:
+    f.seek(0)
+    chunked = f.read(len(_MAGIC)) == _MAGIC
+    f.seek(0)
+    return chunked
+
+
+def _read_manifest(f: IO[bytes], compressor: Compressor) -> dict[str, Any]:
+    """Read and validate the trailing manifest of a chunked snapshot."""
+    file_size = f.seek(0, os.SEEK_END)
+    if file_size < len(_MAGIC) + _FOOTER.size:
+        raise ValueError("Snapshot file is truncated (missing manifest)")
+    f.seek(file_size - _FOOTER.size)
+    manifest_offset, manifest_len, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+    if magic != _MAGIC:
+        raise ValueError("Snapshot file is truncated (missing manifest)")
+    if manifest_len > _MAX_MANIFEST_LEN or (
+        manifest_offset + manifest_len + _FOOTER.size != file_size
+    ):
+        raise ValueError("Snapshot manifest is corrupt")
+    f.seek(manifest_offset)
+    manifest = json.loads(
+        compressor.decompress(f.read(manifest_len), max_output_size=_MAX_MANIFEST_LEN)
+    )
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("chunks"), list):
+        raise ValueError("Snapshot manifest is corrupt")
+    _check_version(manifest)
+    return manifest
+
+
+def _check_version(metadata: dict[str, Any]) -> None:
+    fmt_version = metadata.get("format_version", 0)
+    if fmt_version > _FORMAT_VERSION:
+        raise ValueError(
+            f"Snapshot format version {fmt_version} is newer"
+            f" than supported ({_FORMAT_VERSION})"
+        )
+
+
+def _read_legacy_header(f: IO[bytes], compressor: Compressor) -> dict[str, Any]:
+    header_prefix = f.read(4)
+    if len(header_prefix) != 4:
+        raise ValueError("Snapshot file is too small to contain a header")
+    header_len = struct.unpack(">I", header_prefix)[0]
+    if header_len > _MAX_HEADER_LEN:
+        raise ValueError(
+            f"Snapshot header too large: {header_len} bytes (max {_MAX_HEADER_LEN})"
+        )
+    return dict(json.loads(compressor.decompress(f.read(header_len))))
+
+
 def read_snapshot_metadata(snapshot_path: Path | str) -> dict[str, Any]:
-    """Read only the metadata header from a snapshot file.
+    """Read only the metadata (header or manifest totals) from a snapshot file.
 
     Args:
         snapshot_path: Path to the snapshot file.
 
     Returns:
-        Metadata dictionary.
+        Metadata dictionary with ``format_version``, ``created_at`` and
+        ``document_count`` (plus ``chunk_count`` for chunked snapshots).
     """
     compressor = Compressor(level=LEVEL_SNAPSHOT)
     with open(snapshot_path, "rb") as f:
-        header_prefix = f.read(4)
-        if len(header_prefix) != 4:
-            raise ValueError("Snapshot file is too small to contain a header")
-        header_len = struct.unpack(">I", header_prefix)[0]
-        if header_len > _MAX_HEADER_LEN:
-            raise ValueError(
-                f"Snapshot header too large: {header_len} bytes (max {_MAX_HEADER_LEN})"
-            )
-        header_compressed = f.read(header_len)
-
-    header_json = compressor.decompress(header_compressed)
-    return dict(json.loads(header_json))
+        if not _is_chunked(f):
+            return _read_legacy_header(f, compressor)
+        manifest = _read_manifest(f, compressor)
+    chunks = manifest.pop("chunks")
+    manifest["chunk_count"] = len(chunks)
+    return manifest
 
 
 def import_snapshot(
@@ -145,119 +307,148 @@ def import_snapshot(
     snapshot_path: Path | str,
     *,
     vector_store: VectorStoreLike | None = None,
+    workers: int | None = None,
 ) -> SnapshotStats:
     """Import documents from a snapshot file into the local index.
 
     Skips documents that already exist (by text_hash). Optionally also
-    indexes into the vector store.
+    indexes into the vector store.  Chunks are checksum-verified and
+    decompressed on a thread pool, a few at a time, and each chunk is
+    inserted in one transaction.
 
     Args:
         store: Local document store to import into.
         snapshot_path: Path to the snapshot file.
-        vector_store: Optional VectorStore instance.
+        vector_store: Optional vector store to index imported documents in.
+        workers: Decompression threads (default: up to 4).
 
     Returns:
         SnapshotStats with import metrics.
+
+    Raises:
+        ValueError: If the file is malformed, fails a checksum, or
+            exceeds the import limits.
     """
     start = time.monotonic()
     snapshot_path = Path(snapshot_path)
-    compressor = Compressor(level=LEVEL_SNAPSHOT)
-
     file_size = snapshot_path.stat().st_size
-    if file_size > _MAX_SNAPSHOT_FILE_BYTES:
-        raise ValueError(
-            f"Snapshot file too large: {file_size} bytes "
-            f"(max {_MAX_SNAPSHOT_FILE_BYTES})"
-        )
-
-    with open(snapshot_path, "rb") as f:
-        header_prefix = f.read(4)
-        if len(header_prefix) != 4:
-            raise ValueError("Snapshot file is too small to contain a header")
-        header_len = struct.unpack(">I", header_prefix)[0]
-        if header_len > _MAX_HEADER_LEN:
-            raise ValueError(
-                f"Snapshot header too large: {header_len} bytes (max {_MAX_HEADER_LEN})"
-            )
-        header_compressed = f.read(header_len)
-        doc_compressed = f.read()
-
-    # Parse header
-    header_json = compressor.decompress(header_compressed)
-    metadata = json.loads(header_json)
-
-    fmt_version = metadata.get("format_version", 0)
-    if fmt_version > _FORMAT_VERSION:
-        raise ValueError(
-            f"Snapshot format version {fmt_version} is newer"
-            f" than supported ({_FORMAT_VERSION})"
-        )
-
-    document_count = metadata.get("document_count", 0)
-    if isinstance(document_count, int) and document_count > _MAX_SNAPSHOT_DOCUMENTS:
-        raise ValueError(
-            f"Snapshot document count too large: {document_count} "
-            f"(max {_MAX_SNAPSHOT_DOCUMENTS})"
-        )
-
-    # Decompress and unpack documents
-    doc_bytes = compressor.decompress(doc_compressed)
-    from infomesh.p2p.protocol import _SAFE_UNPACK
-
-    documents = msgpack.unpackb(doc_bytes, raw=False, **_SAFE_UNPACK)
-    if not isinstance(documents, list):
-        raise ValueError("Snapshot document payload must be a list")
-    if len(documents) > _MAX_SNAPSHOT_DOCUMENTS:
-        raise ValueError(
-            f"Snapshot document count too large: {len(documents)} "
-            f"(max {_MAX_SNAPSHOT_DOCUMENTS})"
-        )
 
     imported = 0
     skipped = 0
-
-    for doc in documents:
-        doc_id = store.add_document(
-            url=doc["url"],
-            title=doc["title"],
-            text=doc["text"],
-            raw_html_hash=doc["raw_html_hash"],
-            text_hash=doc["text_hash"],
-            language=doc.get("language"),
+    total = 0
+    with open(snapshot_path, "rb") as f:
+        chunks = (
+            _iter_chunks(f, workers or _default_workers())
+            if _is_chunked(f)
+            else _iter_legacy(f, file_size)
         )
-
-        if doc_id is None:
-            skipped += 1
-            continue
-
-        imported += 1
-
-        # Also index in vector store
-        if vector_store is not None:
-            from infomesh.index.vector_store import VectorStore
-
-            if isinstance(vector_store, VectorStore):
-                vector_store.add_document(
-                    doc_id=doc_id,
-                    url=doc["url"],
-                    title=doc["title"],
-                    text=doc["text"],
-                    language=doc.get("language"),
-                )
+        for docs in chunks:
+            total += len(docs)
+            ids = store.add_documents(docs)
+            for doc, doc_id in zip(docs, ids, strict=True):
+                if doc_id is None:
+                    skipped += 1
+                    continue
+                imported += 1
+                if vector_store is not None:
+                    vector_store.add_document(
+                        doc_id=doc_id,
+                        url=doc["url"],
+                        title=doc["title"],
+                        text=doc["text"],
+                        language=doc.get("language"),
+                    )
 
     elapsed = (time.monotonic() - start) * 1000
     logger.info(
         "snapshot_imported",
         imported=imported,
         skipped=skipped,
-        total=len(documents),
+        total=total,
         path=str(snapshot_path),
     )
 
     return SnapshotStats(
-        total_documents=len(documents),
+        total_documents=total,
         exported=imported,
         skipped=skipped,
         file_size_bytes=file_size,
         elapsed_ms=elapsed,
     )
+
+
+def _unpack_documents(payload: bytes, compressor: Compressor) -> list[Any]:
+    from infomesh.p2p.protocol import _SAFE_UNPACK
+
+    documents = msgpack.unpackb(
+        compressor.decompress(payload), raw=False, **_SAFE_UNPACK
+    )
+    if not isinstance(documents, list):
+        raise ValueError("Snapshot document payload must be a list")
+    return documents
+
+
+def _iter_chunks(f: IO[bytes], workers: int) -> Iterator[list[Any]]:
+    """Yield the document lists of a chunked snapshot, in file order."""
+    local = _ThreadCompressors(LEVEL_SNAPSHOT)
+    manifest = _read_manifest(f, local.compressor)
+
+    def _read(entry: dict[str, Any]) -> tuple[bytes, int]:
+        length = int(entry["length"])
+        if length > _MAX_CHUNK_BYTES:
+            raise ValueError(
+                f"Snapshot chunk too large: {length} bytes (max {_MAX_CHUNK_BYTES})"
+            )
+        f.seek(int(entry["offset"]))
+        payload_len, count = _CHUNK_HEADER.unpack(f.read(_CHUNK_HEADER.size))
+        payload = f.read(length)
+        if payload_len != length or len(payload) != length:
+            raise ValueError("Snapshot chunk is truncated")
+        if count > _MAX_CHUNK_DOCUMENTS or count != entry["documents"]:
+            raise ValueError("Snapshot chunk document count is invalid")
+        if hashlib.sha256(payload).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Snapshot chunk checksum mismatch at {entry['offset']}")
+        return payload, count
+
+    def _decode(payload: bytes, count: int) -> list[Any]:
+        documents = _unpack_documents(payload, local.compressor)
+        if len(documents) != count:
+            raise ValueError("Snapshot chunk document count is invalid")
+        return documents
+
+    with ThreadPoolExecutor(workers, thread_name_prefix="snapshot") as pool:
+        pending: deque[Future[list[Any]]] = deque()
+        for entry in manifest["chunks"]:
+            pending.append(pool.submit(_decode, *_read(entry)))
+            if len(pending) > workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _iter_legacy(f: IO[bytes], file_size: int) -> Iterator[list[Any]]:
+    """Yield the documents of a version 1 snapshot (read whole, size-capped)."""
+    if file_size > _MAX_SNAPSHOT_FILE_BYTES:
+        raise ValueError(
+            f"Snapshot file too large: {file_size} bytes "
+            f"(max {_MAX_SNAPSHOT_FILE_BYTES})"
+        )
+    compressor = Compressor(level=LEVEL_SNAPSHOT)
+    metadata = _read_legacy_header(f, compressor)
+    _check_version(metadata)
+
+    document_count = metadata.get("document_count", 0)
+    if isinstance(document_count, int) and document_count > _MAX_SNAPSHOT_DOCUMENTS:
+        raise ValueError(
+            f"Snapshot document count too large: {document_count} "
+            f"(max {_MAX_SNAPSHOT_DOCUMENTS})"
+        )
+
+    documents = _unpack_documents(f.read(), compressor)
+    if len(documents) > _MAX_SNAPSHOT_DOCUMENTS:
+        raise ValueError(
+            f"Snapshot document count too large: {len(documents)} "
+            f"(max {_MAX_SNAPSHOT_DOCUMENTS})"
+        )
+    for i in range(0, len(documents), DEFAULT_CHUNK_DOCUMENTS):
+        yield documents[i : i + DEFAULT_CHUNK_DOCUMENTS]
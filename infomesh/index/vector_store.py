@@ -10,10 +10,14 @@ Enable via ``config.index.vector_search = true``.
 
 from __future__ import annotations
 
+import threading
 import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -26,6 +30,155 @@ logger = structlog.get_logger()
 DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
 
+# Characters of title + text fed to the embedder
+_EMBED_CHARS = 2000
+
+
+def load_embedder(model_name: str) -> object:
+    """Load a sentence-transformers model.
+
+    Raises:
+        ImportError: If sentence-transformers is not installed.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as exc:
+        msg = (
+            "sentence-transformers is required for vector search. "
+            "Install with: uv sync --extra vector"
+        )
+        raise ImportError(msg) from exc
+
+    model = SentenceTransformer(model_name)
+    logger.info("embedding_model_loaded", model=model_name)
+    return model
+
+
+def embed_text(title: str, text: str) -> str:
+    """Text fed to the embedder for a document (title + leading text)."""
+    return f"{title}. {text}"[:_EMBED_CHARS]
+
+
+# Query embeddings kept by the shared cache
+DEFAULT_QUERY_CACHE_SIZE = 1024
+
+
+@dataclass
+class QueryCacheStats:
+    """Query-embedding cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Flatten counters for logging / metrics export."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class QueryEmbeddingCache:
+    """Bounded LRU of query embeddings keyed on (model, normalized query).
+
+    Encoding a query is the dominant cost of a vector search on CPU, and
+    the same query is often repeated (pagination, retries, hybrid + RAG
+    over one question).  Queries are normalized with NFC and whitespace
+    collapsing only — case is kept, since cased models embed it.
+
+    Thread-safe.  Cached vectors are shared between callers and must not
+    be modified in place.
+
+    Args:
+        max_entries: Maximum cached embeddings.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_QUERY_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = QueryCacheStats()
+
+    @property
+    def stats(self) -> QueryCacheStats:
+        return self._stats
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(unicodedata.normalize("NFC", query).split())
+
+    def get_or_compute(
+        self,
+        model_name: str,
+        query: str,
+        compute: Callable[[str], Any],
+    ) -> Any:
+        """Return the cached embedding for *query*, computing it on a miss.
+
+        Args:
+            model_name: Embedding model identifier (part of the key).
+            query: Raw query text.
+            compute: Called with the normalized query on a miss.
+        """
+        text = self.normalize(query)
+        key = (model_name, text)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return self._entries[key]
+            self._stats.misses += 1
+
+        vector = compute(text)
+        if hasattr(vector, "setflags"):
+            vector.setflags(write=False)
+
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return vector
+
+    def clear(self) -> None:
+        """Drop all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_query_cache: QueryEmbeddingCache | None = None
+
+
+def shared_query_cache() -> QueryEmbeddingCache:
+    """Return the process-wide query-embedding cache used by vector stores."""
+    global _shared_query_cache  # noqa: PLW0603
+    if _shared_query_cache is None:
+        _shared_query_cache = QueryEmbeddingCache()
+    return _shared_query_cache
+
+
+@dataclass(frozen=True)
+class VectorDocument:
+    """A document waiting to be embedded (see :meth:`VectorStore.add_documents`)."""
+
+    doc_id: int
+    url: str
+    title: str
+    text: str
+    language: str | None = None
+
+
 @dataclass(frozen=True)
 class VectorSearchResult:
     """A single result from the vector store."""
@@ -42,7 +195,8 @@ class VectorStore:
 
     Documents are embedded using sentence-transformers and stored in a
     persistent ChromaDB collection. Queries are embedded at search time
-    and matched via cosine similarity.
+    (through a shared :class:`QueryEmbeddingCache`) and matched via
+    cosine similarity.
 
     Usage::
 
@@ -56,9 +210,12 @@ class VectorStore:
         persist_dir: Path | str | None = None,
         model_name: str = DEFAULT_MODEL,
         collection_name: str = "infomesh_docs",
+        *,
+        query_cache: QueryEmbeddingCache | None = None,
     ) -> None:
         self._persist_dir = str(persist_dir) if persist_dir else None
         self._model_name = model_name
+        self._query_cache = query_cache or shared_query_cache()
         self._collection_name = collection_name
 
         # Lazy-load heavy dependencies so non-vector builds stay fast
@@ -104,24 +261,16 @@ class VectorStore:
     def _get_embedder(self) -> object:
         """Lazy-load the sentence-transformer model on first use."""
         if self._embedder is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-            except ImportError as exc:
-                msg = (
-                    "sentence-transformers is required for vector search. "
-                    "Install with: uv sync --extra vector"
-                )
-                raise ImportError(msg) from exc
-
-            self._embedder = SentenceTransformer(self._model_name)
-            logger.info("embedding_model_loaded", model=self._model_name)
+            self._embedder = load_embedder(self._model_name)
         return self._embedder
 
     def _embed(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for a list of texts."""
         model = self._get_embedder()
         # sentence-transformers returns numpy arrays — convert to lists
-        embeddings = model.encode(texts, show_progress_bar=False)  # type: ignore[attr-defined]
+        embeddings = model.encode(  # type: ignore[attr-defined]
+            texts, batch_size=max(1, min(len(texts), 64)), show_progress_bar=False
+        )
         return [emb.tolist() for emb in embeddings]
 
     # ------------------------------------------------------------------
@@ -150,30 +299,45 @@ class VectorStore:
             text: Full extracted text (will be truncated for embedding).
             language: ISO language code.
         """
+        self.add_documents([VectorDocument(doc_id, url, title, text, language)])
+        logger.debug("vector_doc_added", doc_id=doc_id, url=url)
+
+    def add_documents(self, docs: list[VectorDocument]) -> None:
+        """Embed and upsert several documents in one model call.
+
+        Encoding a batch is several times faster per document than
+        encoding one at a time on CPU, and the collection is written in
+        a single upsert.
+
+        Args:
+            docs: Documents to add or update.
+        """
         assert self._collection is not None
+        if not docs:
+            return
 
         # Combine title + text for richer embedding
-        embed_text = f"{title}. {text}"[:2000]
-        embeddings = self._embed([embed_text])
-
-        str_id = str(doc_id)
-        metadata: dict[str, str | int | float] = {
-            "url": url,
-            "title": title,
-            "text_preview": text[:500],
-        }
-        if language:
-            metadata["language"] = language
+        embed_texts = [embed_text(d.title, d.text) for d in docs]
+        embeddings = self._embed(embed_texts)
+
+        metadatas: list[dict[str, str | int | float]] = []
+        for d in docs:
+            metadata: dict[str, str | int | float] = {
+                "url": d.url,
+                "title": d.title,
+                "text_preview": d.text[:500],
+            }
+            if d.language:
+                metadata["language"] = d.language
+            metadatas.append(metadata)
 
         self._collection.upsert(
-            ids=[str_id],
+            ids=[str(d.doc_id) for d in docs],
             embeddings=embeddings,
-            metadatas=[metadata],
-            documents=[embed_text],
+            metadatas=metadatas,
+            documents=embed_texts,
         )
 
-        logger.debug("vector_doc_added", doc_id=doc_id, url=url)
-
     def delete_document(self, doc_id: int) -> None:
         """Remove a document from the vector store."""
         assert self._collection is not None
@@ -211,7 +375,11 @@ class VectorStore:
             logger.info("vector_search", query=query[:80], results=0, elapsed_ms=0.0)
             return []
 
-        query_embedding = self._embed([query])
+        query_embedding = [
+            self._query_cache.get_or_compute(
+                self._model_name, query, lambda q: self._embed([q])[0]
+            )
+        ]
 
         raw = self._collection.query(
             query_embeddings=query_embedding,
@@ -257,13 +425,14 @@ class VectorStore:
     # Stats & lifecycle
     # ------------------------------------------------------------------
 
-    def get_stats(self) -> dict[str, int | str]:
+    def get_stats(self) -> dict[str, int | str | float]:
         """Get vector store statistics."""
         assert self._collection is not None
         return {
             "document_count": self._collection.count(),
             "model": self._model_name,
             "collection": self._collection_name,
+            "query_cache_hit_rate": round(self._query_cache.stats.hit_rate, 4),
         }
 
     def close(self) -> None:
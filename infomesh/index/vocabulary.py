@@ -0,0 +1,202 @@
+"""Term vocabulary with SymSpell spelling correction and prefix completion.
+
+Built from the FTS5 index's own vocabulary (an ``fts5vocab`` table over
+``documents_fts``), so it contains exactly the terms a query can match,
+each weighted by its document frequency.
+
+- **Spelling correction** uses a SymSpell-style deletion index: every
+  term is indexed under all strings obtained by deleting up to
+  *max_distance* characters (fewer for short terms) from its first
+  ``_PREFIX_LENGTH`` characters.
+  A lookup generates the same deletions of the input and verifies the
+  few candidates that share one, instead of computing edit distance
+  against the whole vocabulary.
+- **Autocomplete** bisects a sorted term list for the prefix range; the
+  top completions for every 1- and 2-character prefix (the only ranges
+  large enough to matter) are precomputed.
+
+Instances are immutable snapshots; :class:`~infomesh.index.local_store.LocalStore`
+rebuilds and swaps them as the index grows.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+from collections.abc import Iterable
+
+# Most frequent terms kept (bounds memory of the deletion index)
+DEFAULT_MAX_TERMS = 50_000
+DEFAULT_MAX_DISTANCE = 2
+# Only the first N characters are indexed for deletions (SymSpell)
+_PREFIX_LENGTH = 7
+# Completions precomputed per short prefix
+_TOP_PER_SHORT_PREFIX = 50
+_SHORT_PREFIX_MAX = 2
+
+
+def _allowed_distance(word: str, max_distance: int) -> int:
+    """Edit budget for *word*: none below 3 chars, 1 up to 5, then the max.
+
+    Short words have too many near neighbours for two edits to be a
+    useful correction (and they would dominate the deletion index).
+    """
+    if len(word) < 3:
+        return 0
+    if len(word) <= 5:
+        return min(1, max_distance)
+    return max_distance
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """All strings reachable from *word* by deleting ≤ *max_distance* chars."""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        nxt: set[str] = set()
+        for w in frontier:
+            if len(w) <= 1:
+                continue
+            for i in range(len(w)):
+                nxt.add(w[:i] + w[i + 1 :])
+        nxt -= result
+        result |= nxt
+        frontier = nxt
+    return result
+
+
+def _bounded_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein (optimal string alignment) distance, capped.
+
+    Returns ``limit + 1`` as soon as the distance is known to exceed
+    *limit*.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        curr = [i] + [0] * len(b)
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            value = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                value = min(value, prev2[j - 2] + 1)
+            curr[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        prev2, prev = prev, curr
+    return prev[-1]
+
+
+class TermVocabulary:
+    """Immutable term → document-frequency vocabulary with lookup indexes.
+
+    Args:
+        terms: ``(term, document_frequency)`` pairs (terms lowercased).
+        max_terms: Keep only the most frequent *max_terms* terms.
+        max_distance: Largest edit distance :meth:`correct` supports.
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[tuple[str, int]],
+        *,
+        max_terms: int = DEFAULT_MAX_TERMS,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+    ) -> None:
+        self._max_distance = max_distance
+        top = heapq.nlargest(max_terms, terms, key=lambda t: t[1])
+        self._df: dict[str, int] = {term: df for term, df in top}
+        self._sorted = sorted(self._df)
+
+        self._short: dict[str, list[str]] = {}
+        by_freq = sorted(self._df, key=lambda t: (-self._df[t], t))
+        for term in by_freq:
+            for n in range(1, min(_SHORT_PREFIX_MAX, len(term)) + 1):
+                bucket = self._short.setdefault(term[:n], [])
+                if len(bucket) < _TOP_PER_SHORT_PREFIX:
+                    bucket.append(term)
+
+        # Most keys map to a single term; storing it bare instead of in
+        # a one-element list roughly halves the index's memory.
+        self._deletion_index: dict[str, str | list[str]] = {}
+        index = self._deletion_index
+        for term in self._df:
+            budget = _allowed_distance(term, max_distance)
+            for key in _deletes(term[:_PREFIX_LENGTH], budget):
+                entry = index.get(key)
+                if entry is None:
+                    index[key] = term
+                elif isinstance(entry, str):
+                    index[key] = [entry, term]
+                else:
+                    entry.append(term)
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def __contains__(self, term: object) -> bool:
+        return term in self._df
+
+    def frequency(self, term: str) -> int:
+        """Document frequency of *term* (0 if unknown)."""
+        return self._df.get(term, 0)
+
+    def complete(self, prefix: str, *, limit: int = 10) -> list[str]:
+        """Terms starting with *prefix*, most frequent first."""
+        prefix = prefix.lower()
+        if not prefix or limit <= 0:
+            return []
+        if len(prefix) <= _SHORT_PREFIX_MAX and limit <= _TOP_PER_SHORT_PREFIX:
+            return self._short.get(prefix, [])[:limit]
+        lo = bisect.bisect_left(self._sorted, prefix)
+        hi = bisect.bisect_left(self._sorted, prefix + "\U0010ffff", lo)
+        return heapq.nsmallest(
+            limit, self._sorted[lo:hi], key=lambda t: (-self._df[t], t)
+        )
+
+    def correct(self, word: str, *, max_distance: int | None = None) -> str | None:
+        """Closest known term to *word*, or None.
+
+        Candidates are ranked by edit distance, then document frequency.
+        Known words are returned unchanged.  The edit budget shrinks for
+        short words (none below 3 characters, one up to 5), bounded by
+        the shorter of the two words.
+        """
+        word = word.lower()
+        if not word:
+            return None
+        if word in self._df:
+            return word
+        limit = _allowed_distance(
+            word,
+            min(
+                self._max_distance if max_distance is None else max_distance,
+                self._max_distance,
+            ),
+        )
+        if limit == 0:
+            return None
+        best: tuple[int, int, str] | None = None
+        seen: set[str] = set()
+        for key in _deletes(word[:_PREFIX_LENGTH], limit):
+            entry = self._deletion_index.get(key)
+            if entry is None:
+                continue
+            for term in (entry,) if isinstance(entry, str) else entry:
+                if term in seen:
+                    continue
+                seen.add(term)
+                term_limit = min(limit, _allowed_distance(term, limit))
+                if abs(len(term) - len(word)) > term_limit:
+                    continue
+                dist = _bounded_distance(word, term, term_limit)
+                if dist > term_limit:
+                    continue
+                rank = (dist, -self._df[term], term)
+                if best is None or rank < best:
+                    best = rank
+        return best[2] if best else None
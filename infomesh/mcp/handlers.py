@@ -363,10 +363,10 @@ def _postprocess_search_text(
                 )
         except Exception:  # noqa: BLE001
             pass
-        vocab = store.suggest(original_query[:20], limit=50) if store else []
-        suggestion = did_you_mean(original_query, vocab)
-        if suggestion:
-            text += f'\n\nDid you mean: "{suggestion}"?'
+        vocab = store.vocabulary() if store else None
+        suggestions = did_you_mean(original_query, vocab) if vocab else []
+        if suggestions:
+            text += f'\n\nDid you mean: "{suggestions[0]}"?'
 
     if fmt != "json" and text != "No results found." and config.mcp.show_attribution:
         text += _SEARCH_ATTRIBUTION
@@ -394,6 +394,7 @@ async def handle_search(
     query_cache: QueryCache,
     sessions: SessionStore,
     analytics: AnalyticsTracker,
+    feedback_store: Any | None = None,
 ) -> list[TextContent]:
     """Handle search / search_local tool calls."""
     parsed = _preprocess_search_query(arguments)
@@ -408,6 +409,11 @@ async def handle_search(
     t0 = time.monotonic()
     deduct_search_cost(ledger)
     authority_fn = link_graph.url_authority if link_graph else None
+    boosts = (
+        feedback_store.boost_map()
+        if feedback_store is not None and config.search.feedback_tracking
+        else None
+    )
 
     query = parsed.query
     limit = parsed.limit
@@ -428,6 +434,7 @@ async def handle_search(
             authority_fn=authority_fn,
             vector_store=vector_store,
             network_search_fn=nsf,
+            boosts=boosts,
         )
         if dist.remote_count > 0:
             peer_map: dict[str, list[PeerResult]] = {}
@@ -489,6 +496,7 @@ async def handle_search(
             limit=limit,
             offset=parsed.offset,
             authority_fn=authority_fn,
+            boosts=boosts,
             **parsed.filters,
         )
         if llm_backend is not None:
@@ -1450,6 +1458,7 @@ async def handle_web_search(
     query_cache: QueryCache,
     sessions: SessionStore,
     analytics: AnalyticsTracker,
+    feedback_store: Any | None = None,
 ) -> list[TextContent]:
     """Unified web search — replaces 6 legacy search tools.
 
@@ -1542,6 +1551,7 @@ async def handle_web_search(
         query_cache=query_cache,
         sessions=sessions,
         analytics=analytics,
+        feedback_store=feedback_store,
     )
 
     # ── Optionally fetch full content for each result ──
@@ -113,6 +113,7 @@ def _create_app(
         link_graph = ctx.link_graph
         ledger = ctx.ledger
         credit_sync_manager = ctx.credit_sync_manager
+        feedback_store = ctx.feedback_store
     except Exception:
         ctx.close()
         raise
@@ -167,6 +168,7 @@ def _create_app(
                 distributed_index=distributed_index,
                 p2p_node=p2p_node,
                 credit_sync_manager=credit_sync_manager,
+                feedback_store=feedback_store,
             )
         except Exception:
             logger.exception("tool_unhandled_error", tool=name)
@@ -201,6 +203,7 @@ def _create_app(
         distributed_index: Any,
         p2p_node: Any,
         credit_sync_manager: Any,
+        feedback_store: Any,
     ) -> list[TextContent]:
         match name:
             # ── New consolidated tools ─────────────────
@@ -218,6 +221,7 @@ def _create_app(
                     query_cache=query_cache,
                     sessions=sessions,
                     analytics=analytics,
+                    feedback_store=feedback_store,
                 )
             case "status":
                 return handle_status(
@@ -248,6 +252,7 @@ def _create_app(
                     query_cache=query_cache,
                     sessions=sessions,
                     analytics=analytics,
+                    feedback_store=feedback_store,
                 )
             case "fetch_page":
                 return await handle_fetch(
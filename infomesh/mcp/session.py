@@ -223,10 +223,11 @@ class WebhookRegistry:
             url: str,
         ) -> bool:
             try:
-                from infomesh.security import SSRFError, validate_url
+                from infomesh.security import SSRFError, validate_url_async
 
-                # Re-validate with DNS resolution to block rebinding
-                validate_url(url, resolve_dns=True)
+                # Re-validate with DNS resolution to block rebinding; the
+                # pinned transport connects to the address checked here.
+                await validate_url_async(url)
                 resp = await client.post(url, json=body)
                 return resp.status_code < 400
             except SSRFError:
@@ -236,6 +237,10 @@ class WebhookRegistry:
                 logger.debug("webhook_failed", url=url)
                 return False
 
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        from infomesh.resolver import PinnedDNSTransport
+
+        async with httpx.AsyncClient(
+            timeout=5.0, transport=PinnedDNSTransport()
+        ) as client:
             results = await asyncio.gather(*(_post(client, u) for u in self._urls))
         return sum(results)
@@ -4,6 +4,7 @@ Provides a high-level interface over libp2p's KadDHT for:
 - Publishing and querying inverted-index entries.
 - Crawl lock acquisition and release.
 - Content attestation storage.
+- Shared robots.txt records.
 
 **NOTE**: py-libp2p uses **trio** (not asyncio).  All methods in this
 module are trio-async and must be called from a trio context.
@@ -31,6 +32,7 @@ logger = structlog.get_logger()
 # DHT key prefixes
 _PREFIX_CRAWL_LOCK = "/infomesh/lock/"
 _PREFIX_ATTESTATION = "/infomesh/att/"
+_PREFIX_ROBOTS = "/infomesh/robots/"
 
 # Lock TTL default (5 minutes)
 _LOCK_TTL_SECONDS = 300
@@ -323,6 +325,48 @@ class InfoMeshDHT:
             logger.exception("attestation_get_failed", url=url)
             return None
 
+    # ─── Shared robots.txt ─────────────────────────────────
+
+    async def publish_robots(self, domain: str, record: dict[str, Any]) -> bool:
+        """Publish a robots.txt cache record for *domain*.
+
+        Args:
+            domain: Domain netloc (e.g. "example.com").
+            record: Entry from ``RobotsCache.export_entry``.
+
+        Returns:
+            True if published.
+        """
+        key = f"{_PREFIX_ROBOTS}{content_hash(domain.lower())}"
+        value = msgpack.packb({**record, "peer_id": self._peer_id}, use_bin_type=True)
+        try:
+            await self._dht.put_value(key, value)  # type: ignore[attr-defined]
+            self._stats.puts_performed += 1
+            return True
+        except Exception:
+            logger.exception("robots_publish_failed", domain=domain)
+            return False
+
+    async def get_robots(self, domain: str) -> dict[str, Any] | None:
+        """Retrieve a peer-published robots.txt record for *domain*.
+
+        Returns:
+            Record dict, or None if absent or for a different domain.
+        """
+        key = f"{_PREFIX_ROBOTS}{content_hash(domain.lower())}"
+        try:
+            raw = await self._dht.get_value(key)  # type: ignore[attr-defined]
+            self._stats.gets_performed += 1
+            if raw is None:
+                return None
+            record = safe_unpackb(raw)
+        except Exception:
+            logger.exception("robots_get_failed", domain=domain)
+            return None
+        if not isinstance(record, dict) or record.get("domain") != domain:
+            return None
+        return record
+
     # ─── Generic DHT operations ────────────────────────────
 
     async def put(self, key: str, value: bytes) -> bool:
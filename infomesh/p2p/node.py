@@ -21,7 +21,6 @@ Usage::
 
 from __future__ import annotations
 
-import hashlib
 import threading
 import time
 from dataclasses import dataclass, field
@@ -55,7 +54,13 @@ from infomesh.p2p.protocol import (
 )
 from infomesh.p2p.replication import Replicator
 from infomesh.p2p.routing import QueryRouter
-from infomesh.p2p.sybil import SubnetLimiter, compute_pow_hash, generate_pow
+from infomesh.p2p.sybil import (
+    DEFAULT_DIFFICULTY_BITS,
+    SubnetLimiter,
+    load_cached_pow,
+    load_or_generate_pow,
+    save_cached_pow,
+)
 from infomesh.p2p.throttle import BandwidthThrottle
 from infomesh.version_check import PeerVersionTracker
 
@@ -65,6 +70,7 @@ logger = structlog.get_logger()
 _ROUTING_REFRESH_INTERVAL = 300  # Refresh routing table every 5 min
 _STATUS_WRITE_INTERVAL = 10  # Write status file every 10 s
 _CREDIT_SYNC_INTERVAL = 300  # Credit sync every 5 min
+_ROBOTS_DHT_TIMEOUT = 2.0  # Peer robots lookups must beat a direct fetch
 
 
 class NodeState(StrEnum):
@@ -443,6 +449,59 @@ class InfoMeshNode:
             logger.exception("publish_network_failed", documents=len(documents))
             return 0
 
+    async def get_robots(self, domain: str) -> dict[str, object] | None:
+        """Fetch a peer-published robots.txt record (asyncio-safe).
+
+        Uses a short timeout: past it, fetching robots.txt from the
+        origin is cheaper than waiting on the DHT.
+        """
+        record = await self._call_dht("get_robots", domain, timeout=_ROBOTS_DHT_TIMEOUT)
+        return record if isinstance(record, dict) else None
+
+    async def publish_robots(self, domain: str, record: dict[str, object]) -> bool:
+        """Publish a robots.txt record to the DHT (asyncio-safe)."""
+        return bool(
+            await self._call_dht(
+                "publish_robots", domain, record, timeout=_ROBOTS_DHT_TIMEOUT
+            )
+        )
+
+    async def _call_dht(self, method: str, *args: object, timeout: float) -> object:
+        """Run an ``InfoMeshDHT`` coroutine on the trio loop from asyncio.
+
+        Returns None when P2P is not running, on timeout, or on error.
+        """
+        if (
+            self._dht is None
+            or self._trio_token is None
+            or self._state != NodeState.RUNNING
+        ):
+            return None
+
+        import asyncio
+
+        def _sync_bridge() -> object:
+            import trio
+
+            async def _do() -> object:
+                return await getattr(self._dht, method)(*args)
+
+            return trio.from_thread.run(
+                _do,
+                trio_token=self._trio_token,  # type: ignore[arg-type]
+            )
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(_sync_bridge), timeout=timeout
+            )
+        except TimeoutError:
+            logger.debug("dht_bridge_timeout", method=method, timeout=timeout)
+            return None
+        except Exception:  # noqa: BLE001
+            logger.debug("dht_bridge_failed", method=method, exc_info=True)
+            return None
+
     # ─── Lifecycle ─────────────────────────────────────────
 
     def start(self, *, blocking: bool = False) -> None:
@@ -608,29 +667,17 @@ class InfoMeshNode:
 
         pub_key_bytes = key_pair.public_key.to_bytes()  # type: ignore[attr-defined]
         pow_cache_path = self._config.node.data_dir / "keys" / "pow_cache.bin"
-        cached_nonce = self._load_cached_pow(pow_cache_path, pub_key_bytes)
-
-        if cached_nonce is not None:
-            pow_hash = compute_pow_hash(pub_key_bytes, cached_nonce)
-            self._pow_nonce = cached_nonce
-            node_id = pow_hash.hex()[:40]
-            logger.info(
-                "pow_cached",
-                nonce=cached_nonce,
-                node_id=node_id,
-            )
-        else:
-            logger.info("pow_generating", difficulty=20)
-            pow_result = generate_pow(pub_key_bytes, difficulty_bits=20)
-            self._pow_nonce = pow_result.nonce
-            node_id = pow_result.hash_hex[:40]
-            logger.info(
-                "pow_complete",
-                nonce=pow_result.nonce,
-                node_id=node_id,
-                elapsed=round(pow_result.elapsed_seconds, 1),
-            )
-            self._save_cached_pow(pow_cache_path, pub_key_bytes, pow_result.nonce)
+        # Cached across restarts; a new key grinds on every core
+        pow_result = load_or_generate_pow(
+            pub_key_bytes, pow_cache_path, DEFAULT_DIFFICULTY_BITS
+        )
+        self._pow_nonce = pow_result.nonce
+        logger.info(
+            "pow_complete",
+            nonce=pow_result.nonce,
+            node_id=pow_result.hash_hex[:40],
+            elapsed=round(pow_result.elapsed_seconds, 1),
+        )
 
         listen_addr = Multiaddr(
             f"/ip4/{self._config.node.listen_address}"
@@ -1144,57 +1191,19 @@ class InfoMeshNode:
     ) -> int | None:
         """Load cached PoW nonce if it matches the current public key.
 
-        The cache file stores:
-        ``pub_key_hash (32 bytes) + nonce (8 bytes LE) + difficulty (1 byte)``.
-        Falls back to 40-byte legacy format (assumes difficulty=20).
-        Returns the nonce if valid, None otherwise.
+        See :func:`infomesh.p2p.sybil.load_cached_pow`.
         """
-        import struct
-
-        if not cache_path.exists():
-            return None
-        try:
-            data = cache_path.read_bytes()
-            if len(data) == 41:
-                stored_hash = data[:32]
-                nonce = struct.unpack("<Q", data[32:40])[0]
-                difficulty = data[40]
-            elif len(data) == 40:
-                stored_hash = data[:32]
-                nonce = struct.unpack("<Q", data[32:])[0]
-                difficulty = 20
-            else:
-                return None
-            expected_hash = hashlib.sha256(pub_key_bytes).digest()
-            if stored_hash != expected_hash:
-                return None
-            # Verify the cached nonce is still valid
-            pow_hash = compute_pow_hash(pub_key_bytes, nonce)
-            from infomesh.p2p.sybil import _count_leading_zero_bits_fast
-
-            if _count_leading_zero_bits_fast(pow_hash) >= difficulty:
-                return int(nonce)
-            return None
-        except Exception:
-            return None
+        return load_cached_pow(cache_path, pub_key_bytes)
 
     @staticmethod
     def _save_cached_pow(
         cache_path: Path,
         pub_key_bytes: bytes,
         nonce: int,
-        difficulty: int = 20,
+        difficulty: int = DEFAULT_DIFFICULTY_BITS,
     ) -> None:
         """Persist PoW nonce to disk for fast restart."""
-        import struct
-
-        try:
-            key_hash = hashlib.sha256(pub_key_bytes).digest()
-            cache_path.write_bytes(
-                key_hash + struct.pack("<Q", nonce) + bytes([difficulty])
-            )
-        except Exception:
-            logger.debug("pow_cache_save_failed", path=str(cache_path))
+        save_cached_pow(cache_path, pub_key_bytes, nonce, difficulty)
 
     # ─── Public API (thread-safe) ──────────────────────────
 
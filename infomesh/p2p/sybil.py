@@ -4,6 +4,9 @@ PoW Node ID:
   Nodes must prove computational work to join the network.
   The hash of (public_key_bytes + nonce) must have N leading zero bits.
   Default difficulty: 20 bits (~30 sec on avg CPU).
+  The nonce search is split into ranges ground by a process pool, and
+  a found proof is cached on disk per public key, so only the first
+  start with a new key pays for it.
 
 Subnet Rate Limiting:
   Max K nodes per /24 subnet in any DHT routing bucket.
@@ -12,12 +15,16 @@ Subnet Rate Limiting:
 
 from __future__ import annotations
 
+import concurrent.futures
 import hashlib
 import ipaddress
+import multiprocessing
+import os
 import struct
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
+from pathlib import Path
 
 import structlog
 
@@ -29,6 +36,14 @@ DEFAULT_DIFFICULTY_BITS = 20
 # Max nodes per /24 subnet per DHT routing bucket
 DEFAULT_MAX_PER_SUBNET = 3
 
+# Nonces per work unit handed to a worker process (~0.1 s of hashing);
+# bounds how long workers keep grinding after a proof is found
+_POW_CHUNK = 1 << 17
+# Below this difficulty the expected work is smaller than process startup
+_POW_PARALLEL_MIN_BITS = 16
+
+_NONCE = struct.Struct("<Q")
+
 
 @dataclass(frozen=True)
 class ProofOfWork:
@@ -73,23 +88,61 @@ def compute_pow_hash(public_key_bytes: bytes, nonce: int) -> bytes:
     return hashlib.sha256(public_key_bytes + struct.pack("<Q", nonce)).digest()
 
 
+def _pow_target(difficulty_bits: int) -> bytes:
+    """Smallest 32-byte digest with fewer than *difficulty_bits* leading zeros.
+
+    A digest meets the difficulty iff it compares below this value, which
+    is a single C-level bytes comparison in the hot loop.
+    """
+    if difficulty_bits <= 0:
+        return b"\xff" * 32 + b"\x00"  # every digest compares below
+    if difficulty_bits >= 256:
+        return b"\x00" * 32  # unreachable
+    return (1 << (256 - difficulty_bits)).to_bytes(33, "big")[1:]
+
+
+def _search_nonces(
+    public_key_bytes: bytes, difficulty_bits: int, start: int, stop: int
+) -> tuple[int, bytes] | None:
+    """Return the first ``(nonce, hash)`` in ``[start, stop)`` meeting the target."""
+    target = _pow_target(difficulty_bits)
+    prefix = hashlib.sha256(public_key_bytes)
+    pack = _NONCE.pack
+    for nonce in range(start, stop):
+        h = prefix.copy()
+        h.update(pack(nonce))
+        digest = h.digest()
+        if digest < target:
+            return nonce, digest
+    return None
+
+
 def generate_pow(
     public_key_bytes: bytes,
     difficulty_bits: int = DEFAULT_DIFFICULTY_BITS,
     *,
     max_nonce: int = 2**48,
     progress_interval: int = 1_000_000,
+    workers: int | None = None,
 ) -> ProofOfWork:
     """Generate a proof-of-work for a node's public key.
 
     Finds a nonce such that SHA-256(public_key || nonce) has at least
     `difficulty_bits` leading zero bits.
 
+    With more than one worker, the nonce space is cut into chunks of
+    ``_POW_CHUNK`` ground by a process pool; as soon as one chunk yields
+    a valid nonce the queued chunks are cancelled, so wall time scales
+    down with the number of cores.  The nonce found is then not
+    necessarily the smallest valid one — any valid nonce is a proof.
+
     Args:
         public_key_bytes: Raw Ed25519 public key (32 bytes).
         difficulty_bits: Required leading zero bits (default: 20).
         max_nonce: Maximum nonce to try before giving up.
         progress_interval: Log progress every N hashes.
+        workers: Worker processes (default: CPU count, or 1 for
+            difficulties below ``_POW_PARALLEL_MIN_BITS``).
 
     Returns:
         ProofOfWork with the valid nonce and metadata.
@@ -97,44 +150,121 @@ def generate_pow(
     Raises:
         RuntimeError: If max_nonce reached without finding valid hash.
     """
+    if workers is None:
+        workers = (
+            (os.cpu_count() or 1) if difficulty_bits >= _POW_PARALLEL_MIN_BITS else 1
+        )
+    # No more processes than there are chunks to hand out
+    workers = min(workers, -(-max_nonce // _POW_CHUNK))
     start = time.monotonic()
-    nonce = 0
-
-    while nonce < max_nonce:
-        hash_bytes = compute_pow_hash(public_key_bytes, nonce)
-        leading_zeros = _count_leading_zero_bits_fast(hash_bytes)
-
-        if leading_zeros >= difficulty_bits:
-            elapsed = time.monotonic() - start
-            hash_hex = hash_bytes.hex()
-            logger.info(
-                "pow_found",
-                nonce=nonce,
-                difficulty=difficulty_bits,
-                leading_zeros=leading_zeros,
-                elapsed_seconds=round(elapsed, 2),
-                hash_rate=round(nonce / elapsed) if elapsed > 0 else 0,
-            )
-            return ProofOfWork(
-                nonce=nonce,
-                difficulty_bits=difficulty_bits,
-                hash_hex=hash_hex,
-                elapsed_seconds=elapsed,
-            )
+    if workers > 1:
+        found, tried = _generate_parallel(
+            public_key_bytes, difficulty_bits, max_nonce, progress_interval, workers
+        )
+    else:
+        found, tried = _generate_serial(
+            public_key_bytes, difficulty_bits, max_nonce, progress_interval
+        )
+    if found is None:
+        msg = f"PoW failed: no valid nonce found in {max_nonce} attempts"
+        raise RuntimeError(msg)
+
+    nonce, hash_bytes = found
+    elapsed = time.monotonic() - start
+    logger.info(
+        "pow_found",
+        nonce=nonce,
+        difficulty=difficulty_bits,
+        leading_zeros=_count_leading_zero_bits_fast(hash_bytes),
+        workers=workers,
+        elapsed_seconds=round(elapsed, 2),
+        hash_rate=round(tried / elapsed) if elapsed > 0 else 0,
+    )
+    return ProofOfWork(
+        nonce=nonce,
+        difficulty_bits=difficulty_bits,
+        hash_hex=hash_bytes.hex(),
+        elapsed_seconds=elapsed,
+    )
 
-        if nonce > 0 and nonce % progress_interval == 0:
-            elapsed = time.monotonic() - start
-            logger.debug(
-                "pow_progress",
-                nonces_tried=nonce,
-                elapsed_seconds=round(elapsed, 2),
-                hash_rate=round(nonce / elapsed) if elapsed > 0 else 0,
-            )
 
-        nonce += 1
+def _generate_serial(
+    public_key_bytes: bytes,
+    difficulty_bits: int,
+    max_nonce: int,
+    progress_interval: int,
+) -> tuple[tuple[int, bytes] | None, int]:
+    """Grind nonces in order on this thread; returns (result, nonces tried)."""
+    start = time.monotonic()
+    step = max(1, progress_interval)
+    for lo in range(0, max_nonce, step):
+        hi = min(lo + step, max_nonce)
+        found = _search_nonces(public_key_bytes, difficulty_bits, lo, hi)
+        if found is not None:
+            return found, found[0] + 1
+        elapsed = time.monotonic() - start
+        logger.debug(
+            "pow_progress",
+            nonces_tried=hi,
+            elapsed_seconds=round(elapsed, 2),
+            hash_rate=round(hi / elapsed) if elapsed > 0 else 0,
+        )
+    return None, max_nonce
+
 
-    msg = f"PoW failed: no valid nonce found in {max_nonce} attempts"
-    raise RuntimeError(msg)
+def _generate_parallel(
+    public_key_bytes: bytes,
+    difficulty_bits: int,
+    max_nonce: int,
+    progress_interval: int,
+    workers: int,
+) -> tuple[tuple[int, bytes] | None, int]:
+    """Grind nonce chunks on a process pool; returns (result, nonces tried)."""
+    start = time.monotonic()
+    ctx = multiprocessing.get_context("spawn")
+    chunks = iter(range(0, max_nonce, _POW_CHUNK))
+    tried = 0
+    next_progress = progress_interval
+    with concurrent.futures.ProcessPoolExecutor(workers, mp_context=ctx) as pool:
+        pending: dict[concurrent.futures.Future[tuple[int, bytes] | None], int] = {}
+
+        def submit() -> None:
+            lo = next(chunks, None)
+            if lo is not None:
+                hi = min(lo + _POW_CHUNK, max_nonce)
+                future = pool.submit(
+                    _search_nonces, public_key_bytes, difficulty_bits, lo, hi
+                )
+                pending[future] = hi - lo
+
+        # Two chunks per worker keep every process busy between results
+        for _ in range(workers * 2):
+            submit()
+        try:
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    tried += pending.pop(future)
+                    found = future.result()
+                    if found is not None:
+                        return found, tried
+                    submit()
+                if tried >= next_progress:
+                    next_progress += progress_interval
+                    elapsed = time.monotonic() - start
+                    logger.debug(
+                        "pow_progress",
+                        nonces_tried=tried,
+                        elapsed_seconds=round(elapsed, 2),
+                        hash_rate=round(tried / elapsed) if elapsed > 0 else 0,
+                    )
+        finally:
+            # Early cancellation: drop queued chunks; running ones finish
+            # within one chunk
+            pool.shutdown(wait=False, cancel_futures=True)
+    return None, tried
 
 
 def verify_pow(
@@ -174,6 +304,98 @@ def derive_node_id(public_key_bytes: bytes, nonce: int) -> str:
     return hash_bytes.hex()[:40]
 
 
+# ─── PoW cache ─────────────────────────────────────────────
+
+
+def load_cached_pow(
+    cache_path: Path,
+    public_key_bytes: bytes,
+    *,
+    difficulty_bits: int = 0,
+) -> int | None:
+    """Load a cached PoW nonce if it is valid for *public_key_bytes*.
+
+    The cache file stores:
+    ``pub_key_hash (32 bytes) + nonce (8 bytes LE) + difficulty (1 byte)``.
+    Falls back to 40-byte legacy format (assumes difficulty=20).
+
+    Args:
+        cache_path: Cache file written by :func:`save_cached_pow`.
+        public_key_bytes: The key the proof must belong to.
+        difficulty_bits: Minimum difficulty the proof must meet (the
+            stored difficulty is also enforced).
+
+    Returns:
+        The nonce if the cached proof is valid, None otherwise.
+    """
+    try:
+        data = cache_path.read_bytes()
+    except OSError:
+        return None
+    if len(data) == 41:
+        stored_hash, nonce, difficulty = data[:32], data[32:40], data[40]
+    elif len(data) == 40:
+        stored_hash, nonce, difficulty = data[:32], data[32:], 20
+    else:
+        return None
+    if stored_hash != hashlib.sha256(public_key_bytes).digest():
+        return None
+    value = int(_NONCE.unpack(nonce)[0])
+    if verify_pow(public_key_bytes, value, max(difficulty, difficulty_bits)):
+        return value
+    return None
+
+
+def save_cached_pow(
+    cache_path: Path,
+    public_key_bytes: bytes,
+    nonce: int,
+    difficulty_bits: int = DEFAULT_DIFFICULTY_BITS,
+) -> None:
+    """Persist a PoW nonce for fast restarts (best effort, atomic)."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        tmp.write_bytes(
+            hashlib.sha256(public_key_bytes).digest()
+            + _NONCE.pack(nonce)
+            + bytes([difficulty_bits])
+        )
+        os.replace(tmp, cache_path)
+    except OSError:
+        logger.debug("pow_cache_save_failed", path=str(cache_path))
+
+
+def load_or_generate_pow(
+    public_key_bytes: bytes,
+    cache_path: Path,
+    difficulty_bits: int = DEFAULT_DIFFICULTY_BITS,
+    *,
+    workers: int | None = None,
+) -> ProofOfWork:
+    """Return the cached proof for this key, or generate and cache one.
+
+    A cached proof is reused only if it belongs to the same public key
+    and meets *difficulty_bits*; otherwise a new one is ground with
+    :func:`generate_pow` (on *workers* processes) and saved.
+    """
+    nonce = load_cached_pow(
+        cache_path, public_key_bytes, difficulty_bits=difficulty_bits
+    )
+    if nonce is not None:
+        logger.info("pow_cached", nonce=nonce)
+        return ProofOfWork(
+            nonce=nonce,
+            difficulty_bits=difficulty_bits,
+            hash_hex=compute_pow_hash(public_key_bytes, nonce).hex(),
+            elapsed_seconds=0.0,
+        )
+    logger.info("pow_generating", difficulty=difficulty_bits)
+    result = generate_pow(public_key_bytes, difficulty_bits, workers=workers)
+    save_cached_pow(cache_path, public_key_bytes, result.nonce, difficulty_bits)
+    return result
+
+
 # ─── Subnet Rate Limiting ──────────────────────────────────
 
 
@@ -0,0 +1,327 @@
+"""Async DNS resolver with TTL + negative caching and IP-pinned HTTP transport.
+
+``socket.getaddrinfo`` blocks the event loop, so a slow resolver used to
+freeze the crawler, MCP server and dashboard together.  ``AsyncResolver``
+runs lookups through the loop's executor-backed ``getaddrinfo``, caches
+answers (and failures) per hostname, and coalesces concurrent lookups for
+the same host into one query.
+
+The same resolver is shared by SSRF validation
+(:func:`infomesh.security.validate_url_async`) and by
+:class:`PinnedDNSTransport`, an ``httpx`` transport that connects to the
+exact IP address it has just validated.  A hostname therefore cannot pass
+the SSRF check with a public address and then be re-resolved to a private
+one when the socket is opened (DNS rebinding).
+
+Usage::
+
+    resolver = shared_resolver()
+    await validate_url_async(url, resolver=resolver)
+    client = httpx.AsyncClient(transport=PinnedDNSTransport(resolver))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import httpcore
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+# Default cache lifetimes — getaddrinfo does not expose record TTLs
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_NEGATIVE_TTL_SECONDS = 60.0
+DEFAULT_TIMEOUT_SECONDS = 5.0
+_MAX_CACHE_ENTRIES = 10_000
+
+
+class DNSResolutionError(OSError):
+    """Raised when a hostname cannot be resolved (possibly from cache)."""
+
+
+@dataclass
+class ResolverStats:
+    """Resolver cache and latency counters."""
+
+    lookups: int = 0
+    cache_hits: int = 0
+    negative_hits: int = 0
+    coalesced: int = 0
+    failures: int = 0
+    queries: int = 0
+    total_query_ms: float = 0.0
+    max_query_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from cache (positive or negative)."""
+        if self.lookups == 0:
+            return 0.0
+        return (self.cache_hits + self.negative_hits) / self.lookups
+
+    @property
+    def avg_query_ms(self) -> float:
+        """Mean latency of lookups that actually reached the system resolver."""
+        if self.queries == 0:
+            return 0.0
+        return self.total_query_ms / self.queries
+
+    def to_dict(self) -> dict[str, float]:
+        """Flatten counters for logging / metrics export."""
+        return {
+            "lookups": self.lookups,
+            "cache_hits": self.cache_hits,
+            "negative_hits": self.negative_hits,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "queries": self.queries,
+            "hit_rate": round(self.hit_rate, 4),
+            "avg_query_ms": round(self.avg_query_ms, 2),
+            "max_query_ms": round(self.max_query_ms, 2),
+        }
+
+
+@dataclass
+class _CacheEntry:
+    addresses: tuple[str, ...]
+    error: str | None
+    expires_at: float
+
+
+class AsyncResolver:
+    """Non-blocking hostname resolver with positive and negative caching.
+
+    Args:
+        ttl: Seconds to cache successful lookups.
+        negative_ttl: Seconds to cache failed lookups.
+        timeout: Per-query timeout in seconds.
+        max_entries: LRU capacity of the hostname cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_entries: int = _MAX_CACHE_ENTRIES,
+    ) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._timeout = timeout
+        self._max_entries = max_entries
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[tuple[str, ...]]] = {}
+        self._stats = ResolverStats()
+
+    @property
+    def stats(self) -> ResolverStats:
+        return self._stats
+
+    @property
+    def size(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self._cache.clear()
+
+    async def resolve(self, host: str) -> tuple[str, ...]:
+        """Resolve *host* to its IP addresses.
+
+        IP literals are returned as-is without touching the cache.
+
+        Raises:
+            DNSResolutionError: If resolution fails (or failed recently).
+        """
+        host = host.strip("[]").lower()
+        try:
+            ipaddress.ip_address(host)
+            return (host,)
+        except ValueError:
+            pass
+
+        self._stats.lookups += 1
+        entry = self._cache.get(host)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._cache.move_to_end(host)
+                if entry.error is not None:
+                    self._stats.negative_hits += 1
+                    raise DNSResolutionError(entry.error)
+                self._stats.cache_hits += 1
+                return entry.addresses
+            del self._cache[host]
+
+        pending = self._inflight.get(host)
+        if pending is not None:
+            self._stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[tuple[str, ...]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[host] = future
+        try:
+            addresses = await self._query(host)
+        except BaseException as exc:
+            # Wake coalesced waiters even if this lookup was cancelled
+            shared_exc = (
+                exc
+                if isinstance(exc, DNSResolutionError)
+                else DNSResolutionError(f"DNS resolution aborted for '{host}'")
+            )
+            future.set_exception(shared_exc)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(host, None)
+        future.set_result(addresses)
+        return addresses
+
+    async def _query(self, host: str) -> tuple[str, ...]:
+        """Run one real lookup and record the outcome in the cache."""
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        try:
+            infos = await asyncio.wait_for(
+                loop.getaddrinfo(host, None, type=socket.SOCK_STREAM),
+                timeout=self._timeout,
+            )
+        except (OSError, TimeoutError) as exc:
+            self._record_query(start)
+            self._stats.failures += 1
+            reason = "timed out" if isinstance(exc, TimeoutError) else str(exc)
+            message = f"DNS resolution failed for '{host}': {reason}"
+            self._store(host, (), message, self._negative_ttl)
+            raise DNSResolutionError(message) from exc
+        self._record_query(start)
+
+        addresses = tuple(dict.fromkeys(str(info[4][0]) for info in infos))
+        if not addresses:
+            message = f"DNS resolution returned no addresses for '{host}'"
+            self._stats.failures += 1
+            self._store(host, (), message, self._negative_ttl)
+            raise DNSResolutionError(message)
+        self._store(host, addresses, None, self._ttl)
+        return addresses
+
+    def _record_query(self, start: float) -> None:
+        elapsed_ms = (time.monotonic() - start) * 1000
+        self._stats.queries += 1
+        self._stats.total_query_ms += elapsed_ms
+        self._stats.max_query_ms = max(self._stats.max_query_ms, elapsed_ms)
+
+    def _store(
+        self,
+        host: str,
+        addresses: tuple[str, ...],
+        error: str | None,
+        ttl: float,
+    ) -> None:
+        if len(self._cache) >= self._max_entries:
+            self._cache.popitem(last=False)
+        self._cache[host] = _CacheEntry(
+            addresses=addresses,
+            error=error,
+            expires_at=time.monotonic() + ttl,
+        )
+
+
+_shared: AsyncResolver | None = None
+
+
+def shared_resolver() -> AsyncResolver:
+    """Return the process-wide resolver shared by SSRF checks and transports."""
+    global _shared  # noqa: PLW0603
+    if _shared is None:
+        _shared = AsyncResolver()
+    return _shared
+
+
+# ── IP-pinned HTTP transport ──────────────────────────────────────
+
+
+class _PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """httpcore backend that resolves and validates before every connect.
+
+    The TCP connection is opened to the validated IP, while httpcore keeps
+    using the original hostname for TLS SNI/certificate checks and the
+    ``Host`` header.
+    """
+
+    def __init__(
+        self, resolver: AsyncResolver, inner: httpcore.AsyncNetworkBackend
+    ) -> None:
+        self._resolver = resolver
+        self._inner = inner
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        from infomesh.security import resolve_public_addresses
+
+        addresses = await resolve_public_addresses(host, resolver=self._resolver)
+        last_exc: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._inner.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_exc = exc
+        assert last_exc is not None
+        raise last_exc
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._inner.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+
+class PinnedDNSTransport(httpx.AsyncHTTPTransport):
+    """``httpx`` transport that connects only to SSRF-validated addresses.
+
+    Every new connection (including redirect hops) resolves its host via
+    the shared :class:`AsyncResolver`, rejects private/reserved addresses
+    with :class:`~infomesh.security.SSRFError`, and connects to the IP that
+    passed the check.  Accepts the same keyword arguments as
+    ``httpx.AsyncHTTPTransport``.
+    """
+
+    def __init__(self, resolver: AsyncResolver | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        pool = self._pool
+        if isinstance(pool, httpcore.AsyncConnectionPool):
+            pool._network_backend = _PinnedNetworkBackend(  # noqa: SLF001
+                resolver or shared_resolver(),
+                pool._network_backend,  # noqa: SLF001
+            )
+        else:  # pragma: no cover - proxies resolve on the proxy side
+            logger.debug("pinned_dns_transport_unpinned", pool=type(pool).__name__)
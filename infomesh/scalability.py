@@ -3,7 +3,7 @@
 Features:
 - #49: Connection pooling for SQLite
 - #51: Batch document ingest
-- #54: Bloom filter for URL dedup
+- #54: Bloom filter for URL dedup (fixed-size and scalable)
 - #55: Incremental index rebuild
 """
 
@@ -199,38 +199,206 @@ class BloomFilter:
         self._bits = bytearray((self._size + 7) // 8)
         self._count = 0
 
+    @staticmethod
+    def _base_hashes(item: str) -> tuple[int, int]:
+        """Split one 128-bit digest into the two double-hashing seeds."""
+        digest = hashlib.md5(item.encode(), usedforsecurity=False).digest()
+        return (
+            int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little"),
+        )
+
+    def _positions(self, h1: int, h2: int) -> list[int]:
+        """Derive ``k`` bit positions from two base hashes."""
+        return [(h1 + i * h2) % self._size for i in range(self._num_hashes)]
+
     def _hashes(self, item: str) -> list[int]:
         """Generate hash positions for an item."""
-        h1 = int.from_bytes(
-            hashlib.md5(item.encode(), usedforsecurity=False).digest()[:8],
-            "little",
-        )
-        h2 = int.from_bytes(
-            hashlib.md5(item.encode(), usedforsecurity=False).digest()[8:],
-            "little",
+        return self._positions(*self._base_hashes(item))
+
+    def _add_hashed(self, h1: int, h2: int) -> None:
+        for pos in self._positions(h1, h2):
+            self._bits[pos // 8] |= 1 << (pos % 8)
+        self._count += 1
+
+    def _contains_hashed(self, h1: int, h2: int) -> bool:
+        return all(
+            (self._bits[pos // 8] >> (pos % 8)) & 1 for pos in self._positions(h1, h2)
         )
-        return [(h1 + i * h2) % self._size for i in range(self._num_hashes)]
 
     def add(self, item: str) -> None:
         """Add an item to the filter."""
-        for pos in self._hashes(item):
-            self._bits[pos // 8] |= 1 << (pos % 8)
-        self._count += 1
+        self._add_hashed(*self._base_hashes(item))
 
     def __contains__(self, item: str) -> bool:
         """Check if an item might be in the filter."""
-        return all(
-            (self._bits[pos // 8] >> (pos % 8)) & 1 for pos in self._hashes(item)
-        )
+        return self._contains_hashed(*self._base_hashes(item))
 
     def __len__(self) -> int:
         return self._count
 
+    @property
+    def capacity(self) -> int:
+        """Number of items the filter was sized for."""
+        return self._capacity
+
     @property
     def size_bytes(self) -> int:
         """Memory usage in bytes."""
         return len(self._bits)
 
+    @property
+    def estimated_fp_rate(self) -> float:
+        """Expected false-positive rate at the current fill level."""
+        if self._size == 0 or self._count == 0:
+            return 0.0
+        fill = 1.0 - math.exp(-self._num_hashes * self._count / self._size)
+        return float(fill**self._num_hashes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the filter state (for msgpack persistence)."""
+        return {
+            "capacity": self._capacity,
+            "fp_rate": self._fp_rate,
+            "size": self._size,
+            "num_hashes": self._num_hashes,
+            "count": self._count,
+            "bits": bytes(self._bits),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BloomFilter:
+        """Restore a filter produced by :meth:`to_dict`."""
+        bf = cls.__new__(cls)
+        bf._capacity = int(data["capacity"])
+        bf._fp_rate = float(data["fp_rate"])
+        bf._size = int(data["size"])
+        bf._num_hashes = int(data["num_hashes"])
+        bf._count = int(data["count"])
+        bf._bits = bytearray(data["bits"])
+        if len(bf._bits) != (bf._size + 7) // 8:
+            msg = "bloom filter bit array does not match its declared size"
+            raise ValueError(msg)
+        return bf
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows by stacking sub-filters.
+
+    Follows Almeida et al. (2007): when the newest stage reaches its
+    capacity a new stage is added with ``growth``× the capacity and a
+    ``tightening``× smaller false-positive rate, so the compound rate stays
+    below *fp_rate* no matter how many items are added.  Each item is
+    hashed once; all stages reuse the same two base hashes.
+
+    Args:
+        initial_capacity: Capacity of the first stage.
+        fp_rate: Upper bound on the compound false-positive rate.
+        growth: Capacity multiplier between stages.
+        tightening: False-positive multiplier between stages.
+    """
+
+    _FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        initial_capacity: int = 100_000,
+        fp_rate: float = 0.01,
+        *,
+        growth: int = 2,
+        tightening: float = 0.5,
+    ) -> None:
+        self._fp_rate = fp_rate
+        self._growth = growth
+        self._tightening = tightening
+        # Geometric series: sum(p0 * r^i) = p0 / (1 - r) = fp_rate
+        self._filters = [
+            BloomFilter(max(1, initial_capacity), fp_rate * (1 - tightening))
+        ]
+
+    def add(self, item: str) -> None:
+        """Add an item, opening a new stage when the current one is full."""
+        last = self._filters[-1]
+        if len(last) >= last.capacity:
+            last = BloomFilter(
+                last.capacity * self._growth,
+                last._fp_rate * self._tightening,  # noqa: SLF001
+            )
+            self._filters.append(last)
+        last._add_hashed(*BloomFilter._base_hashes(item))  # noqa: SLF001
+
+    def __contains__(self, item: str) -> bool:
+        """Check if an item might be in any stage."""
+        h1, h2 = BloomFilter._base_hashes(item)  # noqa: SLF001
+        return any(
+            f._contains_hashed(h1, h2)  # noqa: SLF001
+            for f in reversed(self._filters)
+        )
+
+    def __len__(self) -> int:
+        return sum(len(f) for f in self._filters)
+
+    @property
+    def num_stages(self) -> int:
+        """Number of stacked sub-filters."""
+        return len(self._filters)
+
+    @property
+    def size_bytes(self) -> int:
+        """Memory usage in bytes across all stages."""
+        return sum(f.size_bytes for f in self._filters)
+
+    @property
+    def estimated_fp_rate(self) -> float:
+        """Expected compound false-positive rate at the current fill level."""
+        miss = 1.0
+        for f in self._filters:
+            miss *= 1.0 - f.estimated_fp_rate
+        return 1.0 - miss
+
+    def to_bytes(self) -> bytes:
+        """Serialize all stages with msgpack."""
+        import msgpack  # type: ignore[import-untyped]
+
+        packed: bytes = msgpack.packb(
+            {
+                "v": self._FORMAT_VERSION,
+                "fp_rate": self._fp_rate,
+                "growth": self._growth,
+                "tightening": self._tightening,
+                "filters": [f.to_dict() for f in self._filters],
+            },
+            use_bin_type=True,
+        )
+        return packed
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ScalableBloomFilter:
+        """Restore a filter produced by :meth:`to_bytes`.
+
+        Raises:
+            ValueError: If the payload is malformed or from another version.
+        """
+        import msgpack
+
+        try:
+            raw = msgpack.unpackb(data, raw=False)
+        except Exception as exc:  # noqa: BLE001
+            msg = f"invalid bloom filter payload: {exc}"
+            raise ValueError(msg) from exc
+        if not isinstance(raw, dict) or raw.get("v") != cls._FORMAT_VERSION:
+            msg = "unsupported bloom filter format"
+            raise ValueError(msg)
+        sbf = cls.__new__(cls)
+        sbf._fp_rate = float(raw["fp_rate"])
+        sbf._growth = int(raw["growth"])
+        sbf._tightening = float(raw["tightening"])
+        sbf._filters = [BloomFilter.from_dict(f) for f in raw["filters"]]
+        if not sbf._filters:
+            msg = "bloom filter payload has no stages"
+            raise ValueError(msg)
+        return sbf
+
 
 # ── #55: Incremental index rebuild ───────────────────────────────
 
@@ -1,7 +1,8 @@
 """Faceted search, result clustering, and highlighting.
 
 Features:
-- #6: Faceted search (domain, language, date facet counts)
+- #6: Faceted search (domain, language, date facet counts) — per result
+  page here; corpus-wide via ``LocalStore.facet_counts``
 - #7: Search result clustering by topic
 - #9: Query term highlighting in snippets
 - #93: Search result dedup for returned results
@@ -18,14 +19,29 @@ from infomesh.index.ranking import RankedResult
 
 # ── #6: Faceted search ─────────────────────────────────────────────
 
+# Date facet buckets: (name, max age in days), newest first.  Older
+# documents fall in "older"; missing or future crawl times in "unknown".
+DATE_BUCKETS: tuple[tuple[str, int], ...] = (
+    ("today", 1),
+    ("this_week", 7),
+    ("this_month", 30),
+    ("this_year", 365),
+)
+
 
 @dataclass
 class FacetCounts:
-    """Facet count aggregation from search results."""
+    """Facet count aggregation from search results.
+
+    ``total`` is the number of documents counted; ``approximate`` is set
+    when the store ran out of time and extrapolated the counts.
+    """
 
     domains: dict[str, int] = field(default_factory=dict)
     languages: dict[str, int] = field(default_factory=dict)
     date_ranges: dict[str, int] = field(default_factory=dict)
+    total: int = 0
+    approximate: bool = False
 
     def to_dict(self) -> dict[str, dict[str, int]]:
         return {
@@ -46,7 +62,10 @@ def compute_facets(
     *,
     max_domains: int = 20,
 ) -> FacetCounts:
-    """Compute facet counts from search results.
+    """Compute facet counts from a page of search results.
+
+    Only *results* are counted; for counts over every match of a query
+    use ``LocalStore.facet_counts``.
 
     Args:
         results: Ranked search results.
@@ -77,20 +96,18 @@ def compute_facets(
         age_days = (now - r.crawled_at) / 86400 if r.crawled_at else -1
         if age_days < 0:
             date_counter["unknown"] += 1
-        elif age_days <= 1:
-            date_counter["today"] += 1
-        elif age_days <= 7:
-            date_counter["this_week"] += 1
-        elif age_days <= 30:
-            date_counter["this_month"] += 1
-        elif age_days <= 365:
-            date_counter["this_year"] += 1
         else:
-            date_counter["older"] += 1
+            date_counter[
+                next(
+                    (name for name, days in DATE_BUCKETS if age_days <= days),
+                    "older",
+                )
+            ] += 1
 
     facets.domains = dict(domain_counter.most_common(max_domains))
     facets.languages = dict(lang_counter)
     facets.date_ranges = dict(date_counter)
+    facets.total = len(results)
     return facets
 
 
@@ -8,6 +8,11 @@ Tracks implicit quality signals from MCP tool usage patterns:
 All signals are stored locally in SQLite (never shared via P2P).
 Query text is stored as SHA-256 hash only — zero plaintext leakage.
 
+Ranking reads boosts through :meth:`FeedbackStore.boost_map`, an
+in-memory ``url → boost`` map that is loaded once, updated in place by
+this store's own writes, and topped up from rows changed by other
+processes every few seconds, so no query does per-result lookups.
+
 Privacy:
 - Opt-out via config: ``[search] feedback_tracking = false``
 - All data local-only, never transmitted
@@ -18,7 +23,9 @@ from __future__ import annotations
 import hashlib
 import sqlite3
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 import structlog
 
@@ -29,6 +36,7 @@ logger = structlog.get_logger()
 _REFORMULATION_WINDOW = 60.0  # seconds — re-search within this = poor results
 _BOOST_DECAY = 0.95  # EMA factor for URL boost scores
 _MAX_SIGNALS = 100_000  # max signal rows before pruning old entries
+_BOOST_REFRESH_INTERVAL = 5.0  # seconds between boost-map refresh queries
 
 
 # ── Data types ──────────────────────────────────────────────────────────
@@ -70,6 +78,10 @@ class FeedbackStore:
         self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA busy_timeout=3000")
+        # In-memory url → boost map, built on first boost_map() call
+        self._boosts: dict[str, float] | None = None
+        self._boosts_since = 0.0  # newest url_boosts.updated_at loaded
+        self._boosts_checked = 0.0  # monotonic time of the last refresh
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -98,6 +110,9 @@ class FeedbackStore:
                 cite_count INTEGER NOT NULL DEFAULT 0,
                 updated_at REAL NOT NULL
             );
+
+            CREATE INDEX IF NOT EXISTS idx_boosts_updated
+                ON url_boosts(updated_at);
         """)
         self._conn.commit()
 
@@ -218,6 +233,9 @@ class FeedbackStore:
                     url,
                 ),
             )
+            score = new_score
+        if self._boosts is not None:
+            self._boosts[url] = score
 
     def get_boost(self, url: str) -> float:
         """Get the boost score for a URL (0.0 if unknown)."""
@@ -227,6 +245,33 @@ class FeedbackStore:
         ).fetchone()
         return float(row[0]) if row else 0.0
 
+    def boost_map(self) -> Mapping[str, float]:
+        """Read-only ``url → boost_score`` map for ranking.
+
+        The first call loads every boost; later calls re-read only rows
+        updated since the last load, at most every
+        ``_BOOST_REFRESH_INTERVAL`` seconds (writes made through this
+        store are applied immediately).
+        """
+        boosts = self._boosts
+        if boosts is None:
+            boosts = self._boosts = {}
+            self._refresh_boosts(boosts)
+        elif time.monotonic() - self._boosts_checked >= _BOOST_REFRESH_INTERVAL:
+            self._refresh_boosts(boosts)
+        return MappingProxyType(boosts)
+
+    def _refresh_boosts(self, boosts: dict[str, float]) -> None:
+        """Merge url_boosts rows changed since the last refresh."""
+        rows = self._conn.execute(
+            "SELECT url, boost_score, updated_at FROM url_boosts WHERE updated_at >= ?",
+            (self._boosts_since,),
+        ).fetchall()
+        for url, score, updated_at in rows:
+            boosts[url] = score
+            self._boosts_since = max(self._boosts_since, updated_at)
+        self._boosts_checked = time.monotonic()
+
     def get_url_stats(self, url: str) -> URLBoost | None:
         """Get full feedback stats for a URL."""
         row = self._conn.execute(
@@ -14,6 +14,8 @@ import re
 from collections import Counter
 from dataclasses import dataclass, field
 
+from infomesh.index.vocabulary import TermVocabulary
+
 # ── #2: Multilingual stop words ────────────────────────────────────
 
 STOP_WORDS: dict[str, frozenset[str]] = {
@@ -824,7 +826,7 @@ def _edit_distance(s1: str, s2: str) -> int:
 
 def did_you_mean(
     query: str,
-    vocabulary: list[str],
+    vocabulary: list[str] | TermVocabulary,
     *,
     max_distance: int = 2,
     max_suggestions: int = 3,
@@ -833,7 +835,10 @@ def did_you_mean(
 
     Args:
         query: User query string.
-        vocabulary: Known terms from the index.
+        vocabulary: Known terms from the index.  A
+            :class:`~infomesh.index.vocabulary.TermVocabulary` is looked up
+            through its deletion index (preferring frequent terms); a
+            plain list is scanned.
         max_distance: Maximum edit distance for suggestions.
         max_suggestions: Maximum number of suggestions.
 
@@ -846,6 +851,13 @@ def did_you_mean(
     for tok in tokens:
         if tok in vocabulary:
             continue
+        if isinstance(vocabulary, TermVocabulary):
+            word = vocabulary.correct(tok, max_distance=max_distance)
+            if word is not None:
+                corrected = query.replace(tok, word)
+                if corrected != query and corrected not in suggestions:
+                    suggestions.append(corrected)
+            continue
         candidates: list[tuple[int, str]] = []
         for word in vocabulary:
             dist = _edit_distance(tok, word)
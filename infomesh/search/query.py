@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import re
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from math import isfinite
 from typing import TYPE_CHECKING, Any
@@ -91,11 +91,12 @@ def search_local(
     date_to: float | None = None,
     include_domains: list[str] | None = None,
     exclude_domains: list[str] | None = None,
+    boosts: Mapping[str, float] | None = None,
 ) -> QueryResult:
     """Search the local FTS5 index with full ranking.
 
     Applies BM25 + freshness + trust + domain authority ranking
-    to FTS5 results.
+    (plus feedback boosts, when given) to FTS5 results.
 
     Args:
         store: Local document store.
@@ -108,6 +109,8 @@ def search_local(
         date_to: Unix timestamp — only include older docs.
         include_domains: Restrict to these domains.
         exclude_domains: Exclude these domains.
+        boosts: Optional in-memory ``url → feedback boost`` map, e.g.
+            ``FeedbackStore.boost_map()``.
 
     Returns:
         QueryResult with ranked search results.
@@ -164,6 +167,7 @@ def search_local(
         authority_fn=authority_fn,
         query_tokens=query_tokens,
         limit=limit,
+        boosts=boosts,
     )
 
     # Passage selection: re-select snippets from full text for top results
@@ -196,32 +200,34 @@ def _enhance_snippets(
 ) -> None:
     """Replace FTS5 snippets with passage-selected snippets.
 
-    Loads full document text for the top results and selects the
-    most relevant passage as the snippet.  Mutates the list in-place
-    by replacing RankedResult objects (frozen dataclass → new instance).
+    Best passages for the top results come from the store's passage
+    index in one query (see :meth:`LocalStore.best_passages`).  Mutates
+    the list in-place by replacing RankedResult objects (frozen
+    dataclass → new instance).
 
     Args:
-        store: Local document store (for full-text retrieval).
+        store: Local document store (for passage retrieval).
         results: Ranked results list (modified in-place).
         query: Original user query.
         max_enhance: Maximum results to enhance (to limit I/O).
     """
-    from infomesh.search.passage import _tokenize, select_best_passage
+    from infomesh.search.passage import _tokenize
 
     query_tokens = set(_tokenize(query))
 
+    targets: dict[int, int] = {}  # result index → doc_id
     for i, r in enumerate(results[:max_enhance]):
         snippet_tokens = set(_tokenize(r.snippet))
         if len(r.snippet) >= 80 and query_tokens & snippet_tokens:
             continue
-
-        doc = store.get_document(
-            int(r.doc_id) if isinstance(r.doc_id, str) else r.doc_id,
-        )
-        if doc is None or not doc.text:
-            continue
-
-        passage = select_best_passage(doc.text, query, max_length=300)
+        targets[i] = int(r.doc_id) if isinstance(r.doc_id, str) else r.doc_id
+    if not targets:
+        return
+
+    passages = store.best_passages(list(targets.values()), query)
+    for i, doc_id in targets.items():
+        r = results[i]
+        passage = passages.get(doc_id, "")
         if passage and len(passage) > len(r.snippet):
             # Replace with better passage snippet
             results[i] = RankedResult(
@@ -255,7 +261,7 @@ def search_hybrid(
 
     Args:
         store: Local FTS5 document store.
-        vector_store: VectorStore instance (from infomesh.index.vector_store).
+        vector_store: Vector backend (ChromaDB, NumPy or an embedding queue).
         query: User search query.
         limit: Maximum results.
         fts_weight: Weight for FTS results in RRF fusion.
@@ -265,7 +271,6 @@ def search_hybrid(
     Returns:
         HybridResult with merged results from both engines.
     """
-    from infomesh.index.vector_store import VectorStore
     from infomesh.search.merge import merge_results
 
     start = time.monotonic()
@@ -275,9 +280,9 @@ def search_hybrid(
     fts_results = store.search(sanitized, limit=limit)
 
     # Vector semantic search
-    if not isinstance(vector_store, VectorStore):
+    if not callable(getattr(vector_store, "search", None)):
         raise TypeError(
-            f"vector_store must be a VectorStore, got {type(vector_store).__name__}"
+            f"vector_store must provide search(), got {type(vector_store).__name__}"
         )
     vec_results = vector_store.search(query, limit=limit)
 
@@ -394,6 +399,7 @@ async def search_distributed(
     authority_fn: Callable[[str], float] | None = None,
     vector_store: VectorStoreLike | None = None,
     network_search_fn: (Callable[[str, list[str], int], Any] | None) = None,
+    boosts: Mapping[str, float] | None = None,
 ) -> DistributedResult:
     """Search local index + P2P network, merge results.
 
@@ -416,6 +422,7 @@ async def search_distributed(
             ``(query, keywords, limit) -> list[dict]`` that fans out
             search requests to peers via the P2P QueryRouter.
             Each dict has: url, title, snippet, score, peer_id, doc_id.
+        boosts: Optional ``url → feedback boost`` map for local ranking.
 
     Returns:
         DistributedResult with merged local + remote results.
@@ -431,6 +438,7 @@ async def search_distributed(
         query,
         limit=limit,
         authority_fn=authority_fn,
+        boosts=boosts,
     )
 
     # 2. Extract keywords
@@ -9,10 +9,15 @@ from __future__ import annotations
 import ipaddress
 import re
 import socket
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import structlog
 
+if TYPE_CHECKING:
+    from infomesh.resolver import AsyncResolver
+
 logger = structlog.get_logger()
 
 # Maximum URL length to prevent abuse
@@ -126,6 +131,54 @@ def validate_url(url: str, *, resolve_dns: bool = False) -> str:
     return url
 
 
+async def validate_url_async(
+    url: str,
+    *,
+    resolver: AsyncResolver | None = None,
+) -> tuple[str, ...]:
+    """Validate *url* and its resolved addresses without blocking the loop.
+
+    Same checks as ``validate_url(url, resolve_dns=True)``, but DNS goes
+    through the cached :class:`~infomesh.resolver.AsyncResolver` shared
+    with :class:`~infomesh.resolver.PinnedDNSTransport`, so the fetch that
+    follows reuses this lookup instead of resolving the host again.
+
+    Args:
+        url: URL string to validate.
+        resolver: Resolver to use (defaults to the shared instance).
+
+    Returns:
+        The validated public IP addresses of the URL's host.
+
+    Raises:
+        SSRFError: If the URL fails any validation check.
+    """
+    validate_url(url)
+    hostname = urlparse(url).hostname or ""
+    return await resolve_public_addresses(hostname, resolver=resolver)
+
+
+async def resolve_public_addresses(
+    hostname: str,
+    *,
+    resolver: AsyncResolver | None = None,
+) -> tuple[str, ...]:
+    """Resolve *hostname* and verify every address is public.
+
+    Raises:
+        SSRFError: If resolution fails or any address is private/reserved.
+    """
+    from infomesh.resolver import DNSResolutionError, shared_resolver
+
+    active = resolver or shared_resolver()
+    try:
+        addresses = await active.resolve(hostname)
+    except DNSResolutionError as exc:
+        raise SSRFError(str(exc)) from exc
+    _check_addresses(hostname, addresses)
+    return addresses
+
+
 def validate_url_post_redirect(final_url: str) -> str:
     """Validate a URL after HTTP redirect resolution.
 
@@ -158,11 +211,15 @@ def _check_resolved_ip(hostname: str) -> None:
     except socket.gaierror as exc:
         raise SSRFError(f"DNS resolution failed for '{hostname}': {exc}") from exc
 
-    for _family, _type, _proto, _canonname, sockaddr in infos:
-        ip_str = sockaddr[0]
+    _check_addresses(hostname, (str(info[4][0]) for info in infos))
+
+
+def _check_addresses(hostname: str, addresses: Iterable[str]) -> None:
+    """Raise if any resolved address of *hostname* is private/reserved."""
+    for ip_str in addresses:
         try:
             ip = ipaddress.ip_address(ip_str)
-            if _is_blocked_ip(ip):
-                raise SSRFError(f"Hostname '{hostname}' resolves to private IP {ip}")
         except ValueError:
             continue
+        if _is_blocked_ip(ip):
+            raise SSRFError(f"Hostname '{hostname}' resolves to private IP {ip}")
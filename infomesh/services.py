@@ -10,25 +10,31 @@ Extracted from CLI and MCP handlers to enforce SRP:
 from __future__ import annotations
 
 import contextlib
+import dataclasses
 import time
+import weakref
 from dataclasses import dataclass
+from typing import cast
 
 import structlog
 
 from infomesh.config import Config, NodeRole, load_config
-from infomesh.crawler.dedup import DeduplicatorDB
+from infomesh.crawler.dedup import DeduplicatorDB, normalize_url
+from infomesh.crawler.frontier import SQLiteFrontier
+from infomesh.crawler.intelligence import RobotsCache
 from infomesh.crawler.parser import ParsedPage
-from infomesh.crawler.robots import RobotsChecker
+from infomesh.crawler.robots import ROBOTS_CACHE_TTL, RobotsChecker
 from infomesh.crawler.scheduler import Scheduler
 from infomesh.crawler.worker import CrawlWorker
 from infomesh.credits.github_identity import resolve_github_email
-from infomesh.credits.ledger import CreditLedger
+from infomesh.credits.ledger import DEFAULT_EPOCH_SIZE, CreditLedger
 from infomesh.index.link_graph import LinkGraph
 from infomesh.index.local_store import LocalStore
 from infomesh.p2p.keys import ensure_keys
 from infomesh.resources.governor import ResourceGovernor
 from infomesh.resources.profiles import get_profile
 from infomesh.security import SSRFError, validate_url
+from infomesh.singleflight import SingleFlight
 from infomesh.types import KeyPairLike, VectorStoreLike
 
 logger = structlog.get_logger()
@@ -96,6 +102,8 @@ def index_document(
         text_hash=page.text_hash,
         language=page.language,
         js_required=js_required,
+        etag=page.etag,
+        last_modified=page.last_modified,
     )
 
     if vector_store is not None and doc_id is not None:
@@ -300,7 +308,26 @@ async def fetch_page_async(
     if cached.success:
         return cached
 
-    # Live crawl
+    # Live crawl — concurrent requests for the same URL share one fetch
+    fetched = await _flights_for(worker).fetch.run(
+        normalize_url(url),
+        lambda: _live_fetch(url, store=store, worker=worker, vector_store=vector_store),
+    )
+    if fetched.success:
+        fetched = dataclasses.replace(
+            fetched, text=_truncate_to_bytes(fetched.text, max_size_bytes)
+        )
+    return fetched
+
+
+async def _live_fetch(
+    url: str,
+    *,
+    store: LocalStore,
+    worker: CrawlWorker,
+    vector_store: VectorStoreLike | None,
+) -> FetchPageResult:
+    """Crawl and index *url*; the returned text is not truncated."""
     result = await worker.crawl_url(url)
 
     # HTTP paywall detection
@@ -326,7 +353,7 @@ async def fetch_page_async(
             success=True,
             title=result.page.title,
             url=url,
-            text=_truncate_to_bytes(result.page.text, max_size_bytes),
+            text=result.page.text,
             is_cached=False,
             is_paywall=paywall,
             crawled_at=time.time(),
@@ -335,6 +362,37 @@ async def fetch_page_async(
     return FetchPageResult(success=False, url=url, error=result.error)
 
 
+# ─── Single-flight: coalesce concurrent fetches of one URL ───
+
+# Seconds a successful fetch/crawl result is reused for repeat callers
+_FLIGHT_RESULT_TTL = 30.0
+
+
+class _WorkerFlights:
+    """Per-worker single-flight groups for live fetches and crawls."""
+
+    def __init__(self) -> None:
+        self.fetch: SingleFlight[FetchPageResult] = SingleFlight(
+            ttl=_FLIGHT_RESULT_TTL, cacheable=lambda r: r.success
+        )
+        self.crawl: SingleFlight[CrawlAndIndexResult] = SingleFlight(
+            ttl=_FLIGHT_RESULT_TTL, cacheable=lambda r: r.success
+        )
+
+
+# Keyed by worker so results never leak between independent crawlers
+_flights: weakref.WeakKeyDictionary[object, _WorkerFlights] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _flights_for(worker: object) -> _WorkerFlights:
+    flights = _flights.get(worker)
+    if flights is None:
+        flights = _flights[worker] = _WorkerFlights()
+    return flights
+
+
 # ─── crawl_and_index: crawl + link graph + index in one call ───
 
 
@@ -366,8 +424,39 @@ async def crawl_and_index(
     """Crawl a URL, update link graph, and index the page.
 
     Single entry point for the crawl→link-graph→index pipeline,
-    eliminates duplication between MCP and CLI handlers.
+    eliminates duplication between MCP and CLI handlers.  Concurrent
+    calls for the same URL and depth share one crawl; ``force`` skips
+    recently cached results but still joins a crawl already in flight.
     """
+    return await _flights_for(worker).crawl.run(
+        (normalize_url(url), depth),
+        lambda: _crawl_and_index(
+            url,
+            worker=worker,
+            store=store,
+            vector_store=vector_store,
+            p2p_node=p2p_node,
+            distributed_index=distributed_index,
+            link_graph=link_graph,
+            depth=depth,
+            force=force,
+        ),
+        use_cache=not force,
+    )
+
+
+async def _crawl_and_index(
+    url: str,
+    *,
+    worker: CrawlWorker,
+    store: LocalStore,
+    vector_store: VectorStoreLike | None,
+    p2p_node: object | None,
+    distributed_index: object | None,
+    link_graph: LinkGraph | None,
+    depth: int,
+    force: bool,
+) -> CrawlAndIndexResult:
     from infomesh.crawler.worker import CrawlResult  # avoid circular
 
     result: CrawlResult = await worker.crawl_url(url, depth=depth, force=force)
@@ -426,6 +515,29 @@ async def crawl_and_index(
 # ─── AppContext: unified component factory ─────────────────
 
 
+def open_vector_backend(config: Config) -> object:
+    """Open the vector store selected by ``index.vector_backend``.
+
+    Raises:
+        ImportError: If the backend's optional dependencies are missing.
+    """
+    if config.index.vector_backend == "numpy":
+        from infomesh.index.numpy_vector_store import NumpyVectorStore
+
+        return NumpyVectorStore(
+            persist_dir=config.node.data_dir / "vectors",
+            model_name=config.index.embedding_model,
+            dtype=config.index.vector_dtype,
+        )
+
+    from infomesh.index.vector_store import VectorStore
+
+    return VectorStore(
+        persist_dir=config.node.data_dir / "chroma",
+        model_name=config.index.embedding_model,
+    )
+
+
 class AppContext:
     """Wire up all InfoMesh components from Config.
 
@@ -433,6 +545,11 @@ class AppContext:
     CLI commands and the MCP server.  Call ``close()`` or use as
     a context manager to release resources.
 
+    Pass ``persistent_frontier=True`` only from the process that owns
+    the continuous crawl loop: it keeps pending URLs in
+    ``<data_dir>/frontier.db`` across restarts, and opening it releases
+    any leases left by a previous run.
+
     Usage::
 
         ctx = AppContext(config)
@@ -446,6 +563,7 @@ class AppContext:
         config: Config | None = None,
         *,
         apply_os_priority: bool = False,
+        persistent_frontier: bool = False,
     ) -> None:
         self.config = config or load_config()
         c = self.config
@@ -484,12 +602,22 @@ class AppContext:
 
         if role in (NodeRole.FULL, NodeRole.CRAWLER):
             self.dedup = DeduplicatorDB(str(c.node.data_dir / "dedup.db"))
-            self.robots = RobotsChecker(c.crawl.user_agent)
+            self.robots = RobotsChecker(
+                c.crawl.user_agent,
+                store=RobotsCache(
+                    ROBOTS_CACHE_TTL, db_path=c.node.data_dir / "robots.db"
+                ),
+            )
             self.scheduler = Scheduler(
                 politeness_delay=c.crawl.politeness_delay,
                 urls_per_hour=c.crawl.urls_per_hour,
                 pending_per_domain=c.crawl.pending_per_domain,
                 max_depth=c.crawl.max_depth,
+                frontier=(
+                    SQLiteFrontier(c.node.data_dir / "frontier.db")
+                    if persistent_frontier
+                    else None
+                ),
             )
             self.worker = CrawlWorker(c.crawl, self.scheduler, self.dedup, self.robots)
 
@@ -513,25 +641,36 @@ class AppContext:
             self.link_graph = LinkGraph(str(c.node.data_dir / "links.db"))
 
             try:
+                # Epoch mode: crawl credits are signed once per epoch root
+                # instead of once per page
                 self.ledger = CreditLedger(
                     c.node.data_dir / "credits.db",
                     owner_email=self.github_email,
+                    epoch_size=DEFAULT_EPOCH_SIZE,
                 )
             except Exception:  # noqa: BLE001
                 logger.warning("credit_ledger_unavailable")
 
             if c.index.vector_search:
                 try:
-                    from infomesh.index.vector_store import VectorStore
+                    from infomesh.index.embedding_queue import (
+                        BatchVectorStore,
+                        EmbeddingQueue,
+                    )
 
-                    self.vector_store = VectorStore(  # type: ignore[assignment]
-                        persist_dir=c.node.data_dir / "chroma",
-                        model_name=c.index.embedding_model,
+                    # Embeddings are computed in batches on a background
+                    # thread so indexing never waits for the model
+                    self.vector_store = EmbeddingQueue(  # type: ignore[assignment]
+                        cast("BatchVectorStore", open_vector_backend(c)),
+                        batch_size=c.index.embedding_batch_size,
+                        max_delay=c.index.embedding_batch_delay,
+                        max_pending=c.index.embedding_queue_size,
                     )
-                except ImportError:
+                except ImportError as exc:
                     logger.warning(
                         "vector_search_unavailable",
-                        reason="chromadb not installed",
+                        backend=c.index.vector_backend,
+                        reason=str(exc),
                     )
 
         # ── Index submit (crawler → indexer bridge) ────────
@@ -631,10 +770,17 @@ class AppContext:
         if self.vector_store is not None:
             self.vector_store.close()
         if self.ledger is not None:
+            if self.key_pair is not None:
+                with contextlib.suppress(Exception):
+                    self.ledger.seal_epoch(self.key_pair)
             self.ledger.close()
         if self.link_graph is not None:
             self.link_graph.close()
         self.store.close()
+        if self.scheduler is not None:
+            self.scheduler.close()
+        if self.robots is not None:
+            self.robots.close()
         if self.dedup is not None:
             self.dedup.close()
 
@@ -0,0 +1,138 @@
+"""Single-flight call coalescing with a short-lived result cache.
+
+When many coroutines ask for the same expensive result at once (e.g. an
+MCP client firing several ``fetch_page`` calls for one URL), only the
+first actually runs the work; the rest await the same task and receive
+the same result.  Completed results are kept for a few seconds so a
+burst that straddles completion does not trigger a second run.
+
+The work runs in its own task, so a caller that is cancelled does not
+abort the shared call for everyone else.  Exceptions are propagated to
+every waiter but never cached.
+
+Usage::
+
+    flight: SingleFlight[FetchPageResult] = SingleFlight(ttl=30.0)
+    result = await flight.run(normalize_url(url), lambda: fetch(url))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+DEFAULT_RESULT_TTL_SECONDS = 30.0
+_MAX_CACHED_RESULTS = 1024
+
+
+@dataclass
+class SingleFlightStats:
+    """Call coalescing counters."""
+
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    cache_hits: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Flatten counters for logging / metrics export."""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+        }
+
+
+class SingleFlight[T]:
+    """Coalesce concurrent calls that share a key.
+
+    Args:
+        ttl: Seconds a completed result is reused (0 disables caching).
+        max_entries: LRU capacity of the result cache.
+        cacheable: Optional predicate; results for which it returns
+            False are shared with concurrent callers but not cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_RESULT_TTL_SECONDS,
+        max_entries: int = _MAX_CACHED_RESULTS,
+        cacheable: Callable[[T], bool] | None = None,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._cacheable = cacheable
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+        self._results: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._stats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return self._stats
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        *,
+        use_cache: bool = True,
+    ) -> T:
+        """Return the result for *key*, running *factory* at most once.
+
+        Args:
+            key: Coalescing key (e.g. a normalized URL).
+            factory: Zero-argument callable producing the awaitable work.
+            use_cache: If False, skip cached results (but still join a
+                call that is already in flight).
+        """
+        self._stats.calls += 1
+        if use_cache:
+            cached = self._results.get(key)
+            if cached is not None:
+                expires_at, value = cached
+                if expires_at > time.monotonic():
+                    self._results.move_to_end(key)
+                    self._stats.cache_hits += 1
+                    return value
+                del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats.coalesced += 1
+        else:
+            self._stats.executions += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+
+    def forget(self, key: Hashable) -> None:
+        """Drop a cached result so the next call runs again."""
+        self._results.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached results (in-flight calls are unaffected)."""
+        self._results.clear()
+
+    def _finish(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        if task.exception() is not None:  # marks it retrieved
+            return
+        value = task.result()
+        if self._ttl <= 0 or (self._cacheable and not self._cacheable(value)):
+            return
+        if key not in self._results and len(self._results) >= self._max_entries:
+            self._results.popitem(last=False)
+        self._results[key] = (time.monotonic() + self._ttl, value)
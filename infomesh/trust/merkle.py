@@ -5,6 +5,10 @@ Provides:
 - Generate membership proofs (O(log N) hashes).
 - Verify proofs without full index download.
 - Periodic root hash for DHT publication.
+- :class:`MerkleMountainRange` — an append-only, SQLite-persisted
+  variant for ever-growing logs (the credit ledger): O(log N) appends,
+  roots and proofs without loading the leaves.  Its proofs are plain
+  :class:`MerkleProof` objects checked by :meth:`MerkleTree.verify_proof`.
 
 Layer 1: SHA-256(document)       — per-document integrity  (attestation.py)
 Layer 2: Ed25519 signature       — origin proof             (attestation.py)
@@ -15,6 +19,7 @@ Layer 4: DHT root publication    — time-based snapshots     (integration)
 from __future__ import annotations
 
 import hashlib
+import sqlite3
 import time
 from dataclasses import dataclass
 from enum import StrEnum
@@ -289,6 +294,200 @@ class MerkleTree:
         )
 
 
+class MerkleMountainRange:
+    """Append-only Merkle mountain range stored in a SQLite table.
+
+    Nodes are kept in post-order (every node is written once, right after
+    its children), so appending a leaf only writes the leaf plus the
+    parents it completes — O(log N), with the left siblings taken from
+    the cached peaks.  The root "bags" the peaks right to left::
+
+        root = H(peak_0 || H(peak_1 || … H(peak_{k-1} || peak_k)))
+
+    so a membership proof is the path to the leaf's peak followed by the
+    bagged peaks on its right and the peaks on its left — the same
+    ``(sibling, side)`` steps :meth:`MerkleTree.verify_proof` checks.
+    Roots and proofs can also be produced for any earlier leaf count,
+    since appending never changes existing nodes.
+
+    The caller owns the transaction: nodes are written through *conn*
+    without committing, so they commit (or roll back) together with
+    whatever the leaf records.  Call :meth:`reload` after a rollback.
+
+    Args:
+        conn: Open SQLite connection.
+        table: Table holding the nodes (created if missing).
+    """
+
+    def __init__(self, conn: sqlite3.Connection, *, table: str = "mmr_nodes") -> None:
+        if not table.isidentifier():
+            raise ValueError(f"invalid table name: {table!r}")
+        self._conn = conn
+        self._table = table
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(pos INTEGER PRIMARY KEY, hash BLOB NOT NULL)"
+        )
+        self._leaf_count = 0
+        self._peaks: list[str] = []
+        self.reload()
+
+    @property
+    def leaf_count(self) -> int:
+        return self._leaf_count
+
+    def reload(self) -> None:
+        """Re-read the size and peaks from the table."""
+        row = self._conn.execute(
+            f"SELECT COALESCE(MAX(pos) + 1, 0) FROM {self._table}"
+        ).fetchone()
+        self._leaf_count = _mmr_leaves_for_size(int(row[0]))
+        self._peaks = self._fetch([pos for pos, _ in _mmr_peaks(self._leaf_count)])
+
+    def append(self, data: str) -> int:
+        """Append a leaf for *data* and return its leaf index."""
+        index = self._leaf_count
+        pos = 2 * index - index.bit_count()
+        current = _hash_leaf(data)
+        rows = [(pos, bytes.fromhex(current))]
+        # Leaf n completes one parent per trailing 1-bit of n
+        height = 0
+        while (index >> height) & 1:
+            current = _hash_pair(self._peaks.pop(), current)
+            pos += 1
+            rows.append((pos, bytes.fromhex(current)))
+            height += 1
+        self._conn.executemany(
+            f"INSERT INTO {self._table} (pos, hash) VALUES (?, ?)", rows
+        )
+        self._peaks.append(current)
+        self._leaf_count += 1
+        return index
+
+    def root(self, leaf_count: int | None = None) -> str:
+        """Root over the first *leaf_count* leaves (default: all)."""
+        peaks = self._peaks_at(leaf_count)
+        return _bag_peaks(peaks)
+
+    def get_proof(
+        self, leaf_index: int, *, leaf_count: int | None = None
+    ) -> MerkleProof:
+        """Membership proof for *leaf_index* against :meth:`root` (*leaf_count*).
+
+        Raises:
+            IndexError: If *leaf_index* is outside the first *leaf_count*
+                leaves.
+        """
+        count = self._leaf_count if leaf_count is None else leaf_count
+        if not 0 <= leaf_index < count <= self._leaf_count:
+            raise IndexError(f"leaf_index {leaf_index} out of range [0, {count})")
+
+        peaks = _mmr_peaks(count)
+        peak_idx, local = _mmr_locate(leaf_index, peaks)
+        height = peaks[peak_idx][1]
+
+        # Sibling positions from the leaf up to its peak
+        pos = 2 * leaf_index - leaf_index.bit_count()
+        leaf_pos = pos
+        steps: list[tuple[int, str]] = []
+        for level in range(height):
+            span = (1 << (level + 1)) - 1
+            if (local >> level) & 1:
+                steps.append((pos - span, ProofSide.LEFT))
+                pos += 1
+            else:
+                steps.append((pos + span, ProofSide.RIGHT))
+                pos += span + 1
+
+        peak_positions = [p for p, _ in peaks]
+        hashes = self._fetch([leaf_pos] + [p for p, _ in steps] + peak_positions)
+        leaf_hash = hashes[0]
+        sibling_hashes = hashes[1 : 1 + len(steps)]
+        peak_hashes = hashes[1 + len(steps) :]
+
+        path = [(h, side) for h, (_, side) in zip(sibling_hashes, steps, strict=True)]
+        if peak_idx < len(peak_hashes) - 1:
+            path.append((_bag_peaks(peak_hashes[peak_idx + 1 :]), ProofSide.RIGHT))
+        for left_peak in reversed(peak_hashes[:peak_idx]):
+            path.append((left_peak, ProofSide.LEFT))
+
+        return MerkleProof(
+            doc_hash=leaf_hash,
+            proof_path=tuple(path),
+            root_hash=_bag_peaks(peak_hashes),
+            leaf_index=leaf_index,
+        )
+
+    def _peaks_at(self, leaf_count: int | None) -> list[str]:
+        if leaf_count is None or leaf_count == self._leaf_count:
+            return self._peaks
+        if not 0 <= leaf_count <= self._leaf_count:
+            raise IndexError(f"leaf_count {leaf_count} exceeds {self._leaf_count}")
+        return self._fetch([pos for pos, _ in _mmr_peaks(leaf_count)])
+
+    def _fetch(self, positions: list[int]) -> list[str]:
+        """Node hashes at *positions*, in the same order."""
+        if not positions:
+            return []
+        unique = sorted(set(positions))
+        found: dict[int, str] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(unique), 500):
+            chunk = unique[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            for pos, digest in self._conn.execute(
+                f"SELECT pos, hash FROM {self._table} WHERE pos IN ({marks})",
+                chunk,
+            ):
+                found[pos] = bytes(digest).hex()
+        return [found[p] for p in positions]
+
+
+def _mmr_peaks(leaf_count: int) -> list[tuple[int, int]]:
+    """``(position, height)`` of each peak, left to right."""
+    peaks: list[tuple[int, int]] = []
+    offset = 0
+    for height in range(leaf_count.bit_length() - 1, -1, -1):
+        if leaf_count & (1 << height):
+            size = (1 << (height + 1)) - 1
+            peaks.append((offset + size - 1, height))
+            offset += size
+    return peaks
+
+
+def _mmr_locate(leaf_index: int, peaks: list[tuple[int, int]]) -> tuple[int, int]:
+    """Index of the peak holding *leaf_index*, and the leaf's offset in it."""
+    first_leaf = 0
+    for peak_idx, (_, height) in enumerate(peaks):
+        if leaf_index < first_leaf + (1 << height):
+            return peak_idx, leaf_index - first_leaf
+        first_leaf += 1 << height
+    raise IndexError(f"leaf_index {leaf_index} beyond the last peak")
+
+
+def _mmr_leaves_for_size(size: int) -> int:
+    """Leaf count of a range with *size* nodes."""
+    leaves = 0
+    for height in range(size.bit_length(), -1, -1):
+        tree = (1 << (height + 1)) - 1
+        if size >= tree:
+            size -= tree
+            leaves += 1 << height
+    if size:
+        raise ValueError("node count does not match a complete mountain range")
+    return leaves
+
+
+def _bag_peaks(peaks: list[str]) -> str:
+    """Fold peak hashes right to left into a single root ("" if empty)."""
+    if not peaks:
+        return ""
+    root = peaks[-1]
+    for peak in reversed(peaks[:-1]):
+        root = _hash_pair(peak, root)
+    return root
+
+
 def serialize_merkle_root(root: MerkleRoot) -> dict[str, Any]:
     """Serialize a MerkleRoot to a dict for msgpack/JSON."""
     return {
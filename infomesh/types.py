@@ -62,6 +62,10 @@ class VectorStoreLike(Protocol):
         """Add a document to the vector index."""
         ...
 
+    def delete_document(self, doc_id: int) -> None:
+        """Remove a document from the vector index."""
+        ...
+
     def search(self, query: str, limit: int = 10) -> list[Any]:
         """Return the *limit* most similar results for *query*."""
         ...
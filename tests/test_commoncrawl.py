@@ -9,6 +9,7 @@ import pytest
 from infomesh.crawler.dedup import DeduplicatorDB
 from infomesh.index.commoncrawl import (
     CommonCrawlImporter,
+    iter_wet_blocks,
     parse_wet_content,
 )
 from infomesh.index.local_store import LocalStore
@@ -216,7 +217,8 @@ class TestCommonCrawlImporter:
 
         assert stats.imported == 2
 
-    def test_read_local_wet_rejects_oversized_plain_file(
+    @pytest.mark.asyncio()
+    async def test_import_rejects_oversized_plain_file(
         self,
         store: LocalStore,
         dedup: DeduplicatorDB,
@@ -229,9 +231,10 @@ class TestCommonCrawlImporter:
 
         importer = CommonCrawlImporter(store, dedup)
         with pytest.raises(ValueError, match="WET input exceeds"):
-            importer._read_local_wet(str(wet_path))
+            await importer.import_wet_file(str(wet_path), workers=0)
 
-    def test_read_local_wet_rejects_gzip_expansion_over_limit(
+    @pytest.mark.asyncio()
+    async def test_import_rejects_gzip_expansion_over_limit(
         self,
         store: LocalStore,
         dedup: DeduplicatorDB,
@@ -248,7 +251,7 @@ class TestCommonCrawlImporter:
 
         importer = CommonCrawlImporter(store, dedup)
         with pytest.raises(ValueError, match="WET input exceeds"):
-            importer._read_local_wet(str(wet_path))
+            await importer.import_wet_file(str(wet_path), workers=0)
 
     @pytest.mark.asyncio()
     async def test_download_wet_rejects_oversized_response(
@@ -301,3 +304,82 @@ class TestCommonCrawlImporter:
         importer = CommonCrawlImporter(store, dedup)
         with pytest.raises(ValueError, match="WET input exceeds"):
             await importer._download_wet("https://example.com/large.wet")
+
+
+def _synthetic_wet(count: int) -> str:
+    return "".join(
+        "WARC/1.0\n"
+        "WARC-Type: conversion\n"
+        f"WARC-Target-URI: https://bulk{i}.example/page\n"
+        "WARC-Date: 2024-01-15T10:30:00Z\n"
+        "Content-Length: 100\n"
+        "\n"
+        f"Synthetic record {i} describing topic {i * 7919} in some detail. "
+        + " ".join(f"word{(i * 31 + j) % 997}" for j in range(40))
+        + "\n\n"
+        for i in range(count)
+    )
+
+
+class TestStreamingWETImport:
+    """Streaming block reader and parallel import."""
+
+    def test_blocks_end_on_record_boundaries(self) -> None:
+        import io
+
+        data = _synthetic_wet(50).encode()
+        blocks = list(iter_wet_blocks(io.BytesIO(data), "mem", block_bytes=2048))
+        assert len(blocks) > 5
+        assert b"".join(blocks) == data
+        assert all(block.startswith(b"WARC/1.0") for block in blocks)
+        parsed = [r.url for b in blocks for r in parse_wet_content(b.decode())]
+        assert parsed == [r.url for r in parse_wet_content(data.decode())]
+
+    @pytest.mark.asyncio()
+    async def test_multi_member_gzip(self, tmp_path: Path) -> None:
+        import gzip
+
+        wet_path = tmp_path / "members.wet.gz"
+        with open(wet_path, "wb") as f:
+            for part in (_SAMPLE_WET, _synthetic_wet(3)):
+                f.write(gzip.compress(part.encode()))
+
+        store = LocalStore(db_path=tmp_path / "members.db")
+        importer = CommonCrawlImporter(store, DeduplicatorDB(":memory:"))
+        stats = await importer.import_wet_file(str(wet_path), workers=0)
+        assert stats.imported == 5
+        assert store.get_document_by_url("https://bulk2.example/page") is not None
+        store.close()
+
+    @pytest.mark.asyncio()
+    async def test_worker_processes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        wet_path = tmp_path / "bulk.wet"
+        wet_path.write_text(_synthetic_wet(120), encoding="utf-8")
+        monkeypatch.setattr("infomesh.index.commoncrawl._WET_BATCH_BYTES", 4096)
+
+        store = LocalStore(db_path=tmp_path / "bulk.db")
+        importer = CommonCrawlImporter(store, DeduplicatorDB(":memory:"))
+        stats = await importer.import_wet_file(str(wet_path), workers=2)
+        assert stats.total_records == 120
+        assert stats.imported + stats.skipped_duplicate == 120
+        assert stats.imported > 100
+        doc = store.get_document_by_url("https://bulk7.example/page")
+        assert doc is not None
+        assert doc.language == "en"
+        store.close()
+
+    @pytest.mark.asyncio()
+    async def test_language_filter(self, tmp_path: Path) -> None:
+        wet_path = tmp_path / "sample.wet"
+        wet_path.write_text(_SAMPLE_WET, encoding="utf-8")
+
+        store = LocalStore(db_path=tmp_path / "lang.db")
+        importer = CommonCrawlImporter(store, DeduplicatorDB(":memory:"))
+        stats = await importer.import_wet_file(
+            str(wet_path), workers=0, languages={"ko"}
+        )
+        assert stats.imported == 0
+        assert stats.skipped_language == 2
+        store.close()
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from infomesh.crawler.dedup import DeduplicatorDB, content_hash, normalize_url
+from infomesh.config import CrawlConfig
+from infomesh.crawler.dedup import (
+    DeduplicatorDB,
+    content_hash,
+    normalize_url,
+    url_key,
+)
 from infomesh.crawler.intelligence import (
     CrawlSpeedTuner,
     RobotsCache,
@@ -21,7 +29,12 @@ from infomesh.crawler.parser import (
     extract_canonical,
     extract_links,
 )
-from infomesh.crawler.robots import _CRAWL_DELAY_RE, _SITEMAP_RE, RobotsChecker
+from infomesh.crawler.robots import (
+    _CRAWL_DELAY_RE,
+    _SITEMAP_RE,
+    PEER_ROBOTS_MAX_TTL,
+    RobotsChecker,
+)
 from infomesh.crawler.scheduler import DomainState, Scheduler
 from infomesh.crawler.seeds import load_seeds
 from infomesh.resources.governor import DegradeLevel
@@ -88,6 +101,163 @@ class TestDeduplicatorDB:
         assert db.is_content_seen("hash1")
         db.close()
 
+    def test_precomputed_fingerprint_skips_rehash(self) -> None:
+        db = DeduplicatorDB()
+        text = "Shared boilerplate paragraph about crawling and indexing pages"
+        with patch("infomesh.crawler.dedup.simhash") as mock_simhash:
+            db.mark_seen("https://example.com/a", "h1", text, fingerprint=1234)
+            assert db.is_near_duplicate(text, fingerprint=1235)
+            mock_simhash.assert_not_called()
+        db.close()
+
+    def test_near_duplicate_index_survives_restart(self, tmp_path: Path) -> None:
+        text = "A long enough article body about distributed search engines " * 5
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        db.mark_seen("https://example.com/a", "h1", text)
+        db.close()
+
+        reopened = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        assert reopened.is_near_duplicate(text)
+        reopened.close()
+
+    def test_writes_are_group_committed(self, tmp_path: Path) -> None:
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"), batch_size=3)
+        db.mark_seen("https://example.com/1", "h1")
+        db.mark_seen("https://example.com/2", "h2")
+        assert db.pending_writes == 2
+        # Buffered rows are already visible to lookups
+        assert db.is_url_seen("https://example.com/1")
+        assert db.is_content_seen("h2")
+        db.mark_seen("https://example.com/3", "h3")
+        assert db.pending_writes == 0
+        (count,) = db._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()
+        assert count == 3
+        db.close()
+
+    def test_group_commit_on_interval(self) -> None:
+        db = DeduplicatorDB(batch_size=1000, batch_interval=0.0)
+        db.mark_seen("https://example.com/1", "h1")
+        assert db.pending_writes == 0
+        db.close()
+
+    def test_close_commits_pending(self, tmp_path: Path) -> None:
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"), batch_size=1000)
+        db.mark_seen("https://example.com/1", "h1")
+        db.close()
+        reopened = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        assert reopened.is_content_seen("h1")
+        reopened.close()
+
+    def test_filter_unseen_collapses_equivalent_urls(self) -> None:
+        db = DeduplicatorDB()
+        db.mark_seen("https://example.com/seen", "h1")
+        links = [
+            "https://example.com/new",
+            "https://EXAMPLE.com/new#frag",
+            "https://example.com/seen/",
+            "https://example.com/other?utm_source=x",
+        ]
+        assert db.filter_unseen(links) == [
+            "https://example.com/new",
+            "https://example.com/other?utm_source=x",
+        ]
+        db.close()
+
+    def test_url_key_is_cached(self) -> None:
+        key = url_key("https://example.com/cached-page")
+        assert url_key("https://example.com/cached-page") is key
+        assert key.url_hash == content_hash(key.normalized)
+
+    def test_url_filter_answers_misses_in_memory(self) -> None:
+        db = DeduplicatorDB()
+        db.mark_seen("https://example.com/seen", "h1")
+        for i in range(50):
+            assert not db.is_url_seen(f"https://example.com/new/{i}")
+        assert db.is_url_seen("https://example.com/seen")
+        stats = db.url_filter_stats()
+        assert stats["lookups"] == 51
+        assert stats["sqlite_lookups_saved"] + stats["false_positives"] == 50
+        db.close()
+
+    def test_url_filter_persists_and_replays(self, tmp_path: Path) -> None:
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        db.mark_seen("https://example.com/a", "h1")
+        db.save_url_filter()
+        # Rows written after the last save must be replayed on reopen
+        db.mark_seen("https://example.com/b", "h2")
+        db.flush()
+        db._conn.close()
+
+        reopened = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        assert reopened.is_url_seen("https://example.com/a")
+        assert reopened.is_url_seen("https://example.com/b")
+        reopened.close()
+
+    def test_url_filter_rebuilds_from_corrupt_file(self, tmp_path: Path) -> None:
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        db.mark_seen("https://example.com/a", "h1")
+        db.close()
+        (tmp_path / "dedup.bloom").write_bytes(b"garbage")
+
+        reopened = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        assert reopened.is_url_seen("https://example.com/a")
+        reopened.close()
+
+    def test_timer_commits_idle_buffer(self) -> None:
+        db = DeduplicatorDB(batch_size=100, batch_interval=0.05)
+        db.mark_seen("https://example.com/idle", "h1")
+        assert db.pending_writes == 1
+        deadline = time.monotonic() + 5.0
+        while db.pending_writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert db.pending_writes == 0
+        row = db._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()
+        assert row[0] == 1
+        db.close()
+
+    def test_url_filter_rebuilds_when_ahead_of_db(self, tmp_path: Path) -> None:
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        for i in range(3):
+            db.mark_seen(f"https://example.com/{i}", f"h{i}")
+        db.close()
+        bloom = (tmp_path / "dedup.bloom").read_bytes()
+        # Replace the database with a smaller one but keep the old filter
+        other = DeduplicatorDB(str(tmp_path / "other.db"))
+        other.mark_seen("https://other.example/x", "hx")
+        other.close()
+        for name in ("dedup.db", "dedup.db-wal", "dedup.db-shm"):
+            (tmp_path / name).unlink(missing_ok=True)
+        (tmp_path / "other.db").replace(tmp_path / "dedup.db")
+        (tmp_path / "dedup.bloom").write_bytes(bloom)
+
+        restored = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        assert restored.is_url_seen("https://other.example/x")
+        restored.close()
+
+    def test_simhash_array_backfilled_from_sqlite(self, tmp_path: Path) -> None:
+        text = "Pre-existing page indexed before the fingerprint array " * 5
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        db.mark_seen("https://example.com/a", "h1", text)
+        db.close()
+        for suffix in (".fp", ".ids"):
+            (tmp_path / f"dedup.simhash{suffix}").unlink(missing_ok=True)
+
+        upgraded = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        assert upgraded.is_near_duplicate(text)
+        upgraded.close()
+
+    def test_simhash_array_durable_with_commit(self, tmp_path: Path) -> None:
+        text = "Committed page whose fingerprint must survive a crash " * 5
+        db = DeduplicatorDB(str(tmp_path / "dedup.db"), batch_size=1)
+        db.mark_seen("https://example.com/a", "h1", text)
+        assert db.pending_writes == 0
+        # Simulate a crash: the old instance is never flushed or closed
+        crashed = DeduplicatorDB(str(tmp_path / "dedup.db"))
+        assert crashed.is_url_seen("https://example.com/a")
+        assert crashed.is_near_duplicate(text)
+        crashed.close()
+        db._conn.close()
+
 
 class TestSeeds:
     """Tests for seed URL loading."""
@@ -349,6 +519,199 @@ class TestRobotsChecker:
         assert checker.get_crawl_delay("x.com") is None
 
 
+class TestRobotsPersistence:
+    """Persistent and peer-shared robots.txt cache."""
+
+    @staticmethod
+    def _client(status: int, text: str = "") -> AsyncMock:
+        resp = MagicMock()
+        resp.status_code = status
+        resp.text = text
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=resp)
+        return client
+
+    @classmethod
+    def _slow_client(cls, status: int, text: str = "") -> AsyncMock:
+        """Client whose fetches take long enough for a peer to answer first."""
+        client = cls._client(status, text)
+        resp = client.get.return_value
+
+        async def _get(*args: object, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(30)
+            return resp
+
+        client.get.side_effect = _get
+        return client
+
+    @pytest.mark.asyncio
+    async def test_rules_survive_restart(self, tmp_path: Path) -> None:
+        db = tmp_path / "robots.db"
+        robots_text = "User-agent: *\nDisallow: /private\nCrawl-delay: 4\n"
+        first = RobotsChecker("TestBot", store=RobotsCache(db_path=db))
+        await first.is_allowed(self._client(200, robots_text), "https://a.test/")
+        first.close()
+
+        second = RobotsChecker("TestBot", store=RobotsCache(db_path=db))
+        client = self._client(500)
+        assert await second.is_allowed(client, "https://a.test/private/x") is False
+        assert await second.is_allowed(client, "https://a.test/public") is True
+        assert second.get_crawl_delay("a.test") == 4.0
+        client.get.assert_not_called()
+        assert second.stats.store_hits == 1
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_not_persisted(self, tmp_path: Path) -> None:
+        store = RobotsCache(db_path=tmp_path / "robots.db")
+        checker = RobotsChecker("TestBot", store=store)
+        await checker.is_allowed(self._client(503), "https://a.test/")
+        assert store.get("a.test") is None
+        checker.close()
+
+    @pytest.mark.asyncio
+    async def test_peer_record_beats_slow_origin(self) -> None:
+        source = RobotsCache()
+        entry = source.put(
+            "a.test", True, robots_txt="User-agent: *\nDisallow: /admin\n"
+        )
+        peers = AsyncMock()
+        peers.get_robots = AsyncMock(return_value=RobotsCache.export_entry(entry))
+        store = RobotsCache()
+        checker = RobotsChecker("TestBot", store=store, peers=peers)
+        client = self._slow_client(200, "")
+
+        allowed = await asyncio.wait_for(
+            checker.is_allowed(client, "https://a.test/admin"), timeout=5
+        )
+        assert allowed is False
+        assert checker.stats.peer_hits == 1
+        assert store.get("a.test") is not None
+
+    @pytest.mark.asyncio
+    async def test_origin_does_not_wait_for_slow_peer(self) -> None:
+        peer_started = asyncio.Event()
+        peer_cancelled = asyncio.Event()
+
+        async def _get_robots(domain: str) -> dict[str, object] | None:
+            peer_started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                peer_cancelled.set()
+                raise
+            return {"domain": domain, "robots_txt": ""}
+
+        peers = AsyncMock()
+        peers.get_robots = AsyncMock(side_effect=_get_robots)
+        peers.publish_robots = AsyncMock(return_value=True)
+        checker = RobotsChecker("TestBot", peers=peers)
+        client = self._client(200, "User-agent: *\nDisallow: /admin\n")
+
+        allowed = await asyncio.wait_for(
+            checker.is_allowed(client, "https://a.test/admin"), timeout=5
+        )
+        assert allowed is False
+        await asyncio.sleep(0)
+        assert peer_started.is_set()
+        assert peer_cancelled.is_set()
+        assert checker.stats.peer_hits == 0
+
+    def test_peer_sharing_is_opt_in(self) -> None:
+        assert CrawlConfig().robots_peer_sharing is False
+
+    @pytest.mark.asyncio
+    async def test_peer_record_expires_to_origin(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        source = RobotsCache(ttl_seconds=86400)
+        entry = source.put(
+            "a.test", True, robots_txt="User-agent: *\nDisallow: /admin\n"
+        )
+        peers = AsyncMock()
+        peers.get_robots = AsyncMock(return_value=RobotsCache.export_entry(entry))
+        peers.publish_robots = AsyncMock(return_value=True)
+        checker = RobotsChecker("TestBot", store=RobotsCache(), peers=peers)
+        slow_client = self._slow_client(200, "User-agent: *\nAllow: /\n")
+        assert await checker.is_allowed(slow_client, "https://a.test/admin") is False
+
+        # One peer-served period later the origin is fetched, not the peer
+        later = PEER_ROBOTS_MAX_TTL + 1
+        real_time, real_monotonic = time.time, time.monotonic
+        monkeypatch.setattr(time, "time", lambda: real_time() + later)
+        monkeypatch.setattr(time, "monotonic", lambda: real_monotonic() + later)
+        client = self._client(200, "User-agent: *\nAllow: /\n")
+        assert await checker.is_allowed(client, "https://a.test/admin") is True
+        client.get.assert_awaited_once()
+        assert peers.get_robots.await_count == 1
+        assert checker.stats.peer_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_is_published_to_peers(self) -> None:
+        peers = AsyncMock()
+        peers.get_robots = AsyncMock(return_value=None)
+        peers.publish_robots = AsyncMock(return_value=True)
+        checker = RobotsChecker("TestBot", peers=peers)
+
+        await checker.is_allowed(
+            self._client(200, "User-agent: *\nAllow: /\n"), "https://a.test/"
+        )
+        await asyncio.sleep(0)
+
+        peers.publish_robots.assert_awaited_once()
+        domain, record = peers.publish_robots.await_args.args
+        assert domain == "a.test"
+        assert "Allow: /" in record["robots_txt"]
+
+    def test_peer_entries_ttl_is_capped(self) -> None:
+        cache = RobotsCache(ttl_seconds=86400)
+        imported = cache.import_from_dht(
+            [
+                {
+                    "domain": "a.test",
+                    "allowed": True,
+                    "robots_txt": "",
+                    "expires_at": time.time() + 86400,
+                }
+            ],
+            max_ttl=60,
+        )
+        assert imported == 1
+        entry = cache.get("a.test")
+        assert entry is not None
+        assert entry.expires_at <= time.time() + 60
+
+    def test_malformed_peer_entries_are_skipped(self) -> None:
+        good = {"domain": "ok.test", "allowed": True, "robots_txt": ""}
+        bad = [
+            {**good, "domain": "a.test", "crawl_delay": "fast"},
+            {**good, "domain": "b.test", "crawl_delay": float("nan")},
+            {**good, "domain": "c.test", "crawl_delay": -1},
+            {**good, "domain": "d.test", "allowed": "no"},
+            {**good, "domain": "e.test", "sitemaps": [1, 2]},
+            {**good, "domain": "f.test", "expires_at": "later"},
+            {**good, "domain": 42},
+            "not-a-record",
+        ]
+        cache = RobotsCache()
+        assert cache.import_from_dht([*bad, good]) == 1  # type: ignore[list-item]
+        assert cache.size == 1
+        assert cache.get("ok.test") is not None
+
+    @pytest.mark.asyncio
+    async def test_malformed_peer_record_falls_back_to_origin(self) -> None:
+        peers = AsyncMock()
+        peers.get_robots = AsyncMock(
+            return_value={"domain": "a.test", "robots_txt": "", "crawl_delay": "fast"}
+        )
+        checker = RobotsChecker("TestBot", peers=peers)
+        client = self._client(200, "User-agent: *\nDisallow: /admin\n")
+
+        assert await checker.is_allowed(client, "https://a.test/admin") is False
+        client.get.assert_awaited_once()
+        assert checker.stats.peer_hits == 0
+
+
 # ── Scheduler Crawl-delay tests ─────────────────────────────────────
 
 
@@ -408,6 +771,71 @@ class TestSchedulerCrawlDelay:
         assert "new.test" in sched._domains
 
 
+class TestSchedulerReadyQueue:
+    """Per-domain queues: a slow domain must not block eligible ones."""
+
+    @pytest.mark.asyncio
+    async def test_slow_domain_does_not_block_others(self) -> None:
+        sched = Scheduler(politeness_delay=0.0, urls_per_hour=0)
+        sched.set_crawl_delay("slow.test", 30.0)
+        sched._domains["slow.test"].last_request_at = time.monotonic()
+        await sched.add_url("https://slow.test/1")
+        await sched.add_url("https://fast-a.test/1")
+        await sched.add_url("https://fast-b.test/1")
+
+        first = await asyncio.wait_for(sched.get_url(), timeout=1.0)
+        second = await asyncio.wait_for(sched.get_url(), timeout=1.0)
+
+        assert {first[0], second[0]} == {
+            "https://fast-a.test/1",
+            "https://fast-b.test/1",
+        }
+        assert sched.pending_count == 1
+        assert sched.queued_domains == 1
+
+    @pytest.mark.asyncio
+    async def test_same_domain_still_respects_delay(self) -> None:
+        sched = Scheduler(politeness_delay=0.2, urls_per_hour=0)
+        await sched.add_url("https://example.com/a")
+        await sched.add_url("https://example.com/b")
+
+        start = time.monotonic()
+        assert (await sched.get_url())[0] == "https://example.com/a"
+        assert (await sched.get_url())[0] == "https://example.com/b"
+        assert time.monotonic() - start >= 0.19
+
+    @pytest.mark.asyncio
+    async def test_round_robins_between_eligible_domains(self) -> None:
+        sched = Scheduler(politeness_delay=0.05, urls_per_hour=0)
+        for i in range(2):
+            await sched.add_url(f"https://a.test/{i}")
+            await sched.add_url(f"https://b.test/{i}")
+
+        order = [(await sched.get_url())[0] for _ in range(4)]
+
+        assert order == [
+            "https://a.test/0",
+            "https://b.test/0",
+            "https://a.test/1",
+            "https://b.test/1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_waiting_get_url_wakes_on_add(self) -> None:
+        sched = Scheduler(politeness_delay=0.0, urls_per_hour=0)
+        task = asyncio.create_task(sched.get_url())
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        await sched.add_url("https://example.com/page", depth=2)
+
+        assert await asyncio.wait_for(task, timeout=1.0) == (
+            "https://example.com/page",
+            2,
+        )
+        assert sched.pending_count == 0
+
+
 class TestCrawlWorkerCleanup:
     """Tests for scheduler cleanup on all worker exit paths."""
 
@@ -457,6 +885,40 @@ class TestCrawlWorkerCleanup:
         assert sched._domains["example.com"].pending_count == 0
         dedup.close()
 
+    @pytest.mark.asyncio
+    async def test_success_keeps_http_validators(self) -> None:
+        from infomesh.config import CrawlConfig
+        from infomesh.crawler.worker import CrawlWorker
+
+        sched = Scheduler(urls_per_hour=0)
+        dedup = DeduplicatorDB()
+        worker = CrawlWorker(
+            CrawlConfig(respect_robots=False, max_depth=1),
+            sched,
+            dedup,
+            RobotsChecker("TestBot"),
+        )
+        body = "Validators are stored so recrawls can be conditional. " * 10
+        resp = httpx.Response(
+            200,
+            text=f"<html><head><title>T</title></head><body><p>{body}</p></body></html>",
+            headers={
+                "content-type": "text/html",
+                "etag": '"abc"',
+                "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+        )
+        worker._fetch_with_retry = AsyncMock(return_value=resp)
+
+        with patch("infomesh.crawler.worker.validate_url_async", AsyncMock()):
+            result = await worker.crawl_url("https://example.com/page", depth=1)
+
+        assert result.success and result.page is not None
+        assert result.page.etag == '"abc"'
+        assert result.page.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+        await worker.close()
+        dedup.close()
+
 
 # ── Retry backoff tests ─────────────────────────────────────────────
 
@@ -773,6 +1235,9 @@ class TestReseedQueue:
 
         dedup = MagicMock()
         dedup.is_url_seen = MagicMock(side_effect=_is_url_seen)
+        dedup.filter_unseen = MagicMock(
+            side_effect=lambda urls: [u for u in urls if not _is_url_seen(u)]
+        )
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -853,6 +1318,20 @@ class TestCrawlLoopGovernorBackpressure:
         assert paused is True
         mock_sleep.assert_awaited_once_with(10)
 
+    @pytest.mark.asyncio
+    async def test_full_embedding_queue_pauses_crawl(self) -> None:
+        from infomesh.crawler.crawl_loop import _wait_for_embedding_capacity
+        from infomesh.index.embedding_queue import EmbeddingQueue
+
+        queue = MagicMock(spec=EmbeddingQueue)
+        queue.wait_for_capacity = AsyncMock(side_effect=[False, True])
+        ctx = MagicMock()
+        ctx.vector_store = queue
+
+        await _wait_for_embedding_capacity(ctx, MagicMock())
+
+        assert queue.wait_for_capacity.await_count == 2
+
     @pytest.mark.asyncio
     async def test_throttle_delay_increases_as_factor_drops(self) -> None:
         from infomesh.crawler.crawl_loop import _apply_governor_backpressure
@@ -392,6 +392,166 @@ class TestLedgerMigration:
         lg2.close()
 
 
+# ─── Epoch signing ────────────────────────────────────────
+
+
+class TestEpochSigning:
+    """Entries batched into epochs signed once over their Merkle root."""
+
+    def test_epoch_entries_are_unsigned_until_sealed(self, key_pair: KeyPair):
+        ledger = CreditLedger(epoch_size=3)
+        try:
+            ledger.record_action(ActionType.CRAWL, key_pair=key_pair)
+            ledger.record_action(ActionType.CRAWL, key_pair=key_pair)
+            assert all(e.signature == "" for e in ledger.recent_entries())
+            assert ledger.signed_entries() == []
+
+            ledger.record_action(ActionType.CRAWL, key_pair=key_pair)  # seals
+            entries = ledger.signed_entries()
+            assert len(entries) == 3
+            assert {e.epoch_id for e in entries} == {1}
+            epoch = ledger.get_epoch(1)
+            assert epoch is not None
+            assert epoch.entry_count == 3
+            assert epoch.sealed_at is not None
+            assert ledger.seal_epoch(key_pair) is None  # nothing open
+        finally:
+            ledger.close()
+
+    def test_epoch_proof_round_trip(self, key_pair: KeyPair):
+        ledger = CreditLedger(epoch_size=4)
+        try:
+            for i in range(10):
+                ledger.record_action(
+                    ActionType.CRAWL, note=f"page_{i}", key_pair=key_pair
+                )
+            # Individually signed entries still mix with epoch entries
+            ledger._epoch_size = 0
+            ledger.record_action(ActionType.QUERY_PROCESS, key_pair=key_pair)
+
+            proof = CreditProofBuilder(ledger, key_pair).build_proof(sample_size=20)
+            # The open epoch (entries 9–10) is sealed before proving
+            assert proof["entry_count"] == 11
+            assert sum("epoch" in e for e in proof["sample_entries"]) == 10
+
+            result = CreditProofBuilder.verify_proof(proof)
+            assert result.verified is True
+            assert result.valid_signatures == 11
+        finally:
+            ledger.close()
+
+    def test_tampered_epoch_detected(self, key_pair: KeyPair):
+        ledger = CreditLedger(epoch_size=2)
+        try:
+            for _ in range(2):
+                ledger.record_action(ActionType.CRAWL, key_pair=key_pair)
+            proof = CreditProofBuilder(ledger, key_pair).build_proof()
+
+            forged = dict(proof)
+            forged["sample_entries"] = [dict(e) for e in proof["sample_entries"]]
+            epoch = dict(forged["sample_entries"][0]["epoch"])
+            epoch["leaf_count"] = 2000
+            forged["sample_entries"][0]["epoch"] = epoch
+            result = CreditProofBuilder.verify_proof(forged)
+            assert result.verified is False
+            assert result.invalid_signatures == 1
+        finally:
+            ledger.close()
+
+    def test_open_epoch_survives_reopen(self, key_pair: KeyPair, tmp_path):
+        db = tmp_path / "credits.db"
+        ledger = CreditLedger(db, epoch_size=3)
+        ledger.record_action(ActionType.CRAWL, key_pair=key_pair)
+        ledger.close()
+
+        ledger = CreditLedger(db, epoch_size=3)
+        ledger.record_action(ActionType.CRAWL, key_pair=key_pair)
+        ledger.record_action(ActionType.CRAWL, key_pair=key_pair)
+        assert len(ledger.signed_entries()) == 3
+        ledger.close()
+
+
+# ─── Persistent Merkle range ──────────────────────────────
+
+
+class TestMerkleRangeProofs:
+    """Proofs served from the ledger's persistent Merkle mountain range."""
+
+    def test_proof_survives_reopen_and_compaction(self, key_pair: KeyPair, tmp_path):
+        db = tmp_path / "credits.db"
+        ledger = CreditLedger(db)
+        for i in range(12):
+            ledger.record_action(ActionType.CRAWL, note=f"p{i}", key_pair=key_pair)
+        root = ledger.proof_root()
+        ledger.close()
+
+        ledger = CreditLedger(db)
+        try:
+            assert ledger.proof_root() == root
+            ledger.checkpoint()
+            ledger.record_action(ActionType.CRAWL, note="late", key_pair=key_pair)
+            assert ledger.compact() == 12
+
+            proof = CreditProofBuilder(ledger, key_pair).build_proof(sample_size=5)
+            assert proof["entry_count"] == 13
+            assert len(proof["sample_entries"]) == 1  # only the survivor
+            result = CreditProofBuilder.verify_proof(proof)
+            assert result.verified is True
+            assert result.valid_proofs == 1
+        finally:
+            ledger.close()
+
+    def test_existing_signed_entries_are_backfilled(self, key_pair: KeyPair, tmp_path):
+        db = tmp_path / "credits.db"
+        ledger = CreditLedger(db)
+        for i in range(5):
+            ledger.record_action(ActionType.CRAWL, note=f"p{i}", key_pair=key_pair)
+        # Simulate a ledger written before the Merkle range existed
+        ledger._conn.execute("UPDATE credit_entries SET mmr_leaf = NULL")
+        ledger._conn.execute("DROP TABLE credit_mmr")
+        ledger._conn.commit()
+        ledger.close()
+
+        ledger = CreditLedger(db)
+        try:
+            assert ledger.proof_leaf_count == 5
+            assert [e.leaf_index for e in ledger.signed_entries()] == list(range(5))
+            proof = CreditProofBuilder(ledger, key_pair).build_proof(sample_size=5)
+            assert CreditProofBuilder.verify_proof(proof).verified is True
+        finally:
+            ledger.close()
+
+    def test_legacy_epoch_entries_become_provable(self, key_pair: KeyPair, tmp_path):
+        db = tmp_path / "credits.db"
+        ledger = CreditLedger(db, epoch_size=3)
+        for i in range(6):
+            ledger.record_action(ActionType.CRAWL, note=f"p{i}", key_pair=key_pair)
+        # Simulate epochs sealed over standalone per-epoch trees
+        ledger._conn.execute("UPDATE credit_entries SET mmr_leaf = NULL")
+        ledger._conn.execute("UPDATE credit_epochs SET leaf_count = 0")
+        ledger._conn.execute("DROP TABLE credit_mmr")
+        ledger._conn.commit()
+        legacy_sigs = ledger._conn.execute(
+            "SELECT epoch_id, signature FROM credit_epochs ORDER BY epoch_id"
+        ).fetchall()
+        ledger.close()
+
+        ledger = CreditLedger(db, epoch_size=3)
+        try:
+            proof = CreditProofBuilder(ledger, key_pair).build_proof(sample_size=6)
+            assert proof["entry_count"] == 6
+            assert len(proof["sample_entries"]) == 6
+            assert CreditProofBuilder.verify_proof(proof).verified is True
+            kept = ledger._conn.execute(
+                "SELECT epoch_id, signature FROM credit_epochs"
+                " WHERE epoch_id <= ? ORDER BY epoch_id",
+                (legacy_sigs[-1][0],),
+            ).fetchall()
+            assert kept == legacy_sigs
+        finally:
+            ledger.close()
+
+
 # ─── End-to-end round-trip ────────────────────────────────
 
 
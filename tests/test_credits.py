@@ -370,3 +370,93 @@ class TestSearchAllowance:
         assert stats.credit_state == CreditState.NORMAL
         assert stats.debt_amount == 0.0
         assert stats.grace_remaining_hours is None
+
+
+# --- Running totals & checkpoints ------------------------------------------
+
+
+class TestRunningTotals:
+    def test_totals_track_entries_and_spends(self, ledger: CreditLedger):
+        ledger.record_action(ActionType.CRAWL, 10.0)
+        ledger.record_action(ActionType.LLM_SUMMARIZE_OWN, 2.0)
+        ledger.spend(1.5)
+        assert ledger.total_earned() == pytest.approx(13.0)
+        assert ledger.total_spent() == pytest.approx(1.5)
+        assert ledger.balance() == pytest.approx(11.5)
+        assert ledger.earnings_by_action() == [("crawl", 10.0), ("llm_own", 3.0)]
+        stats = ledger.stats()
+        assert stats.llm_credits == pytest.approx(3.0)
+        assert stats.non_llm_credits == pytest.approx(10.0)
+
+    def test_existing_ledger_is_backfilled(self, tmp_path):
+        db = tmp_path / "credits.db"
+        lg = CreditLedger(db)
+        lg.record_action(ActionType.CRAWL, 4.0)
+        lg.record_action(ActionType.LLM_SUMMARIZE_PEER, 1.0)
+        lg.spend(1.0)
+        # Simulate a ledger created before running totals existed
+        lg._conn.executescript(
+            "DROP TRIGGER credit_totals_entry_ai;"
+            "DROP TRIGGER credit_totals_spend_ai;"
+            "DROP TABLE credit_totals;"
+            "DROP TABLE credit_action_totals;"
+        )
+        lg.close()
+
+        lg = CreditLedger(db)
+        assert lg.balance() == pytest.approx(5.0)
+        assert lg.stats().llm_credits == pytest.approx(2.0)
+        lg.record_action(ActionType.CRAWL, 1.0)
+        assert lg.balance() == pytest.approx(6.0)
+        assert lg.verify_checkpoints()
+        lg.close()
+
+    def test_checkpoint_compact_keeps_totals(self, ledger: CreditLedger):
+        for _ in range(5):
+            ledger.record_action(ActionType.CRAWL, 2.0)
+        ledger.spend(3.0)
+        cp = ledger.checkpoint()
+        assert cp.entries == 5
+        assert cp.total_earned == pytest.approx(10.0)
+        assert ledger.checkpoint() == cp  # nothing new → same checkpoint
+
+        ledger.record_action(ActionType.QUERY_PROCESS, 4.0)
+        second = ledger.checkpoint()
+        assert second.prev_hash == cp.checkpoint_hash
+        assert ledger.verify_checkpoints()
+
+        before = ledger.stats()
+        assert ledger.compact() == 7
+        assert ledger.recent_entries() == []
+        assert ledger.stats() == before
+        ledger.record_action(ActionType.CRAWL, 1.0)
+        assert ledger.balance() == pytest.approx(10.0)
+        assert ledger.verify_checkpoints()
+        assert all(c.compacted for c in ledger.checkpoints())
+
+    def test_tampering_is_detected(self, ledger: CreditLedger):
+        ledger.record_action(ActionType.CRAWL, 2.0)
+        ledger.checkpoint()
+        ledger._conn.execute("UPDATE credit_entries SET credits = 200")
+        ledger._conn.commit()
+        assert not ledger.verify_checkpoints()
+
+    def test_inflated_totals_are_detected(self, ledger: CreditLedger):
+        ledger.record_action(ActionType.CRAWL, 2.0)
+        ledger._conn.execute("UPDATE credit_totals SET earned = 5000")
+        ledger._conn.commit()
+        assert not ledger.verify_checkpoints()
+
+    def test_automatic_signed_checkpoints(self):
+        from infomesh.p2p.keys import KeyPair
+
+        key_pair = KeyPair.generate()
+        lg = CreditLedger(checkpoint_interval=3)
+        for _ in range(7):
+            lg.record_action(ActionType.CRAWL, 1.0, key_pair=key_pair)
+        checkpoints = lg.checkpoints()
+        assert [c.entries for c in checkpoints] == [3, 6]
+        assert all(c.signature for c in checkpoints)
+        assert lg.verify_checkpoints(key_pair=key_pair)
+        assert not lg.verify_checkpoints(key_pair=KeyPair.generate())
+        lg.close()
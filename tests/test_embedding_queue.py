@@ -0,0 +1,144 @@
+"""Tests for the batching background embedding queue."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from infomesh.index.embedding_queue import EmbeddingQueue
+from infomesh.index.vector_store import VectorDocument
+
+
+class _FakeStore:
+    """Records bulk writes; optionally blocks until released."""
+
+    def __init__(self, *, block: bool = False) -> None:
+        self.batches: list[list[int]] = []
+        self.deleted: list[int] = []
+        self.closed = False
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def add_documents(self, docs: list[VectorDocument]) -> None:
+        self.release.wait(5)
+        self.batches.append([d.doc_id for d in docs])
+
+    def delete_document(self, doc_id: int) -> None:
+        self.deleted.append(doc_id)
+
+    def search(self, query: str, *, limit: int = 10, min_score: float = 0.0) -> Any:
+        return [query, limit]
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"document_count": sum(len(b) for b in self.batches)}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _add(queue: EmbeddingQueue, doc_id: int) -> None:
+    queue.add_document(
+        doc_id=doc_id, url=f"https://x.test/{doc_id}", title="t", text="x"
+    )
+
+
+class TestEmbeddingQueue:
+    def test_documents_are_written_in_batches(self) -> None:
+        store = _FakeStore()
+        queue = EmbeddingQueue(store, batch_size=4, max_delay=60.0)
+        for i in range(10):
+            _add(queue, i)
+
+        assert queue.flush(timeout=5)
+        assert sorted(i for b in store.batches for i in b) == list(range(10))
+        assert max(len(b) for b in store.batches) == 4
+        assert queue.stats.embedded == 10
+        queue.close()
+
+    def test_partial_batch_written_after_max_delay(self) -> None:
+        store = _FakeStore()
+        queue = EmbeddingQueue(store, batch_size=100, max_delay=0.01)
+        _add(queue, 1)
+
+        for _ in range(500):
+            if store.batches:
+                break
+            time.sleep(0.01)
+        assert store.batches == [[1]]
+        queue.close()
+
+    def test_full_queue_drops_without_blocking(self) -> None:
+        store = _FakeStore(block=True)
+        queue = EmbeddingQueue(store, batch_size=1, max_delay=0.0, max_pending=1)
+        _add(queue, 1)  # picked up by the worker, which blocks
+        for _ in range(500):
+            if queue.stats.enqueued and not queue._pending:
+                break
+            time.sleep(0.01)
+        _add(queue, 2)  # fills the queue
+        start = time.monotonic()
+        _add(queue, 3)  # no room: dropped at once
+
+        assert time.monotonic() - start < 0.1
+        assert queue.stats.dropped == 1
+        store.release.set()
+        queue.close()
+        assert [i for b in store.batches for i in b] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_capacity_until_worker_frees_room(self) -> None:
+        store = _FakeStore(block=True)
+        queue = EmbeddingQueue(store, batch_size=1, max_delay=0.0, max_pending=1)
+        _add(queue, 1)  # picked up by the worker, which blocks
+        for _ in range(500):
+            if queue.stats.enqueued and not queue._pending:
+                break
+            time.sleep(0.01)
+        _add(queue, 2)  # fills the queue
+        assert await queue.wait_for_capacity(timeout=0) is False
+        assert await queue.wait_for_capacity(timeout=0.05) is False
+
+        store.release.set()
+        assert await queue.wait_for_capacity(timeout=5.0) is True
+        _add(queue, 3)
+        queue.close()
+        assert queue.stats.dropped == 0
+        assert [i for b in store.batches for i in b] == [1, 2, 3]
+
+    def test_delete_cancels_pending_add(self) -> None:
+        store = _FakeStore()
+        queue = EmbeddingQueue(store, batch_size=100, max_delay=60.0)
+        _add(queue, 1)
+        _add(queue, 2)
+        queue.delete_document(1)
+        queue.flush(timeout=5)
+
+        assert store.batches == [[2]]
+        assert store.deleted == [1]
+        queue.close()
+
+    def test_close_drains_and_closes_store(self) -> None:
+        store = _FakeStore()
+        queue = EmbeddingQueue(store, batch_size=100, max_delay=60.0)
+        _add(queue, 1)
+        queue.close()
+
+        assert store.batches == [[1]]
+        assert store.closed
+
+    def test_stats_and_search_delegate(self) -> None:
+        store = _FakeStore()
+        queue = EmbeddingQueue(store)
+        _add(queue, 1)
+        queue.flush(timeout=5)
+
+        stats = queue.get_stats()
+        assert stats["document_count"] == 1
+        assert stats["pending_embeddings"] == 0
+        assert stats["embedding"]["batches"] == 1
+        assert queue.search("q", limit=3) == ["q", 3]
+        queue.close()
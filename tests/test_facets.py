@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import time
+
+import pytest
+
+from infomesh.index import local_store
+from infomesh.index.local_store import LocalStore
 from infomesh.index.ranking import RankedResult
 from infomesh.search.facets import (
     cluster_results,
@@ -54,6 +60,82 @@ class TestComputeFacets:
         assert facets.domains == {}
 
 
+class TestStoreFacets:
+    def _store(self) -> LocalStore:
+        store = LocalStore()
+        for i in range(30):
+            store.add_document(
+                url=f"https://site{i % 3}.example/{i}",
+                title=f"Python page {i}",
+                text=f"python tutorial number {i}",
+                raw_html_hash=f"rh{i}",
+                text_hash=f"th{i}",
+                language="en" if i % 2 else "de",
+            )
+        store.add_document(
+            url="https://other.example/rust",
+            title="Rust",
+            text="rust ownership",
+            raw_html_hash="rh-rust",
+            text_hash="th-rust",
+            language="en",
+        )
+        return store
+
+    def test_counts_cover_all_matches(self) -> None:
+        store = self._store()
+        assert len(store.search("python", limit=5)) == 5
+        facets = store.facet_counts("python")
+        assert facets.total == 30
+        assert not facets.approximate
+        assert facets.domains == {
+            "site0.example": 10,
+            "site1.example": 10,
+            "site2.example": 10,
+        }
+        assert facets.languages == {"en": 15, "de": 15}
+        assert facets.date_ranges == {"today": 30}
+        store.close()
+
+    def test_filters_and_date_buckets(self) -> None:
+        store = self._store()
+        now = time.time()
+        # Crawl time changes reach the facet table through its trigger
+        store._conn.execute(
+            "UPDATE documents SET crawled_at = ? WHERE url LIKE '%site0%'",
+            (now - 3 * 86400,),
+        )
+        store._conn.commit()
+        facets = store.facet_counts("python", now=now, language="de")
+        assert facets.total == 15
+        assert facets.languages == {"de": 15}
+        assert facets.date_ranges["this_week"] == 5
+        facets = store.facet_counts("python", exclude_domains=["site0.example"])
+        assert set(facets.domains) == {"site1.example", "site2.example"}
+        store.close()
+
+    def test_deleted_documents_leave_facets(self) -> None:
+        store = self._store()
+        doc = store.get_document_by_url("https://other.example/rust")
+        assert doc is not None
+        store.delete_document(doc.doc_id)
+        assert store.facet_counts("rust").total == 0
+        assert store.facet_counts("").domains == {}
+        store.close()
+
+    def test_exhausted_budget_extrapolates(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(local_store, "_FACET_CHUNK_DOCS", 10)
+        store = self._store()
+        facets = store.facet_counts("python", time_budget=0.0)
+        # Only doc_ids 1-10 were scanned, scaled up to all 31
+        assert facets.approximate
+        assert facets.total == 31
+        assert facets.languages == {"en": 16, "de": 16}
+        store.close()
+
+
 class TestClusterResults:
     def test_clusters_by_domain(self) -> None:
         results = [
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+
+from infomesh.search import feedback
 from infomesh.search.feedback import FeedbackStore, URLBoost
 
 
@@ -81,3 +84,36 @@ class TestFeedbackStore:
             assert b2 > b1
         finally:
             store.close()
+
+    def test_boost_map_tracks_own_writes(self) -> None:
+        store = FeedbackStore()
+        try:
+            store.record_fetch("q", "https://a.com", 1)
+            boosts = store.boost_map()
+            assert boosts == {"https://a.com": store.get_boost("https://a.com")}
+            store.record_citation("q", "https://a.com")
+            store.record_skip("q", ["https://b.com"])
+            assert store.boost_map()["https://a.com"] == store.get_boost(
+                "https://a.com"
+            )
+            assert store.boost_map()["https://b.com"] < 0
+        finally:
+            store.close()
+
+    def test_boost_map_refreshes_other_writers(
+        self, tmp_path: object, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db = f"{tmp_path}/feedback.db"
+        reader = FeedbackStore(db)
+        writer = FeedbackStore(db)
+        try:
+            writer.record_fetch("q", "https://a.com", 1)
+            assert reader.boost_map() == {"https://a.com": 1.0}
+            writer.record_citation("q", "https://b.com")
+            # Within the refresh interval the map is served from memory
+            assert "https://b.com" not in reader.boost_map()
+            monkeypatch.setattr(feedback, "_BOOST_REFRESH_INTERVAL", 0.0)
+            assert reader.boost_map()["https://b.com"] == 2.0
+        finally:
+            reader.close()
+            writer.close()
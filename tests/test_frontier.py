@@ -0,0 +1,135 @@
+"""Tests for crawl frontier storage and scheduler resume."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from infomesh.crawler.frontier import MemoryFrontier, SQLiteFrontier
+from infomesh.crawler.scheduler import Scheduler
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def frontier(request: pytest.FixtureRequest, tmp_path: Path):
+    f = (
+        MemoryFrontier()
+        if request.param == "memory"
+        else SQLiteFrontier(tmp_path / "frontier.db")
+    )
+    yield f
+    f.close()
+
+
+class TestFrontier:
+    def test_priority_then_fifo_within_domain(self, frontier) -> None:
+        frontier.push("a.test", "https://a.test/1", 0)
+        frontier.push("a.test", "https://a.test/2", 1, priority=5)
+        frontier.push("a.test", "https://a.test/3", 0)
+
+        assert frontier.head_priority("a.test") == 5
+        assert frontier.pop("a.test") == ("https://a.test/2", 1)
+        assert frontier.pop("a.test") == ("https://a.test/1", 0)
+        assert frontier.pop("a.test") == ("https://a.test/3", 0)
+        assert frontier.pop("a.test") is None
+        assert len(frontier) == 0
+
+    def test_duplicate_urls_rejected(self, frontier) -> None:
+        assert frontier.push("a.test", "https://a.test/x", 0) is True
+        assert frontier.push("a.test", "https://a.test/x", 0) is False
+        assert len(frontier) == 1
+
+    def test_domain_counts(self, frontier) -> None:
+        frontier.push("a.test", "https://a.test/1", 0)
+        frontier.push("a.test", "https://a.test/2", 0)
+        frontier.push("b.test", "https://b.test/1", 0)
+        assert frontier.domain_counts() == {"a.test": 2, "b.test": 1}
+
+    def test_memory_frontier_is_bounded(self) -> None:
+        f = MemoryFrontier(max_size=2)
+        assert f.push("a.test", "https://a.test/1", 0)
+        assert f.push("b.test", "https://b.test/1", 0)
+        assert not f.push("c.test", "https://c.test/1", 0)
+
+
+class TestSQLiteFrontierPersistence:
+    def test_queued_urls_survive_restart(self, tmp_path: Path) -> None:
+        db = tmp_path / "frontier.db"
+        f = SQLiteFrontier(db)
+        f.push("a.test", "https://a.test/1", 2, priority=1)
+        f.push("b.test", "https://b.test/1", 0)
+        f.close()
+
+        f = SQLiteFrontier(db)
+        assert len(f) == 2
+        assert f.pop("a.test") == ("https://a.test/1", 2)
+        f.close()
+
+    def test_uncompleted_leases_are_released(self, tmp_path: Path) -> None:
+        db = tmp_path / "frontier.db"
+        f = SQLiteFrontier(db)
+        f.push("a.test", "https://a.test/done", 0)
+        f.push("a.test", "https://a.test/inflight", 0)
+        assert f.pop("a.test") == ("https://a.test/done", 0)
+        f.complete("https://a.test/done")
+        assert f.pop("a.test") == ("https://a.test/inflight", 0)
+        f.close()  # simulated crash before complete()
+
+        f = SQLiteFrontier(db)
+        assert f.domain_counts() == {"a.test": 1}
+        assert f.pop("a.test") == ("https://a.test/inflight", 0)
+        f.close()
+
+    def test_complete_ignores_queued_urls(self, tmp_path: Path) -> None:
+        f = SQLiteFrontier(tmp_path / "frontier.db")
+        f.push("a.test", "https://a.test/1", 0)
+        f.complete("https://a.test/1")
+        assert len(f) == 1
+        f.close()
+
+
+class TestSchedulerWithFrontier:
+    @pytest.mark.asyncio
+    async def test_scheduler_resumes_from_disk(self, tmp_path: Path) -> None:
+        db = tmp_path / "frontier.db"
+        sched = Scheduler(
+            politeness_delay=0.0, urls_per_hour=0, frontier=SQLiteFrontier(db)
+        )
+        await sched.add_url("https://a.test/1", depth=1)
+        await sched.add_url("https://b.test/1", depth=3)
+        sched.close()
+
+        sched = Scheduler(
+            politeness_delay=0.0, urls_per_hour=0, frontier=SQLiteFrontier(db)
+        )
+        assert sched.pending_count == 2
+        assert sched.queued_domains == 2
+        assert sched._domains["a.test"].pending_count == 1
+
+        got = {await asyncio.wait_for(sched.get_url(), 1.0) for _ in range(2)}
+        assert got == {("https://a.test/1", 1), ("https://b.test/1", 3)}
+        sched.close()
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_domain_served_first(self) -> None:
+        sched = Scheduler(politeness_delay=0.0, urls_per_hour=0)
+        await sched.add_url("https://low.test/1")
+        await sched.add_url("https://high.test/1", priority=10)
+
+        url, _ = await asyncio.wait_for(sched.get_url(), 1.0)
+        assert url == "https://high.test/1"
+
+    @pytest.mark.asyncio
+    async def test_mark_done_completes_lease(self, tmp_path: Path) -> None:
+        db = tmp_path / "frontier.db"
+        frontier = SQLiteFrontier(db)
+        sched = Scheduler(politeness_delay=0.0, urls_per_hour=0, frontier=frontier)
+        await sched.add_url("https://a.test/1")
+        url, _ = await sched.get_url()
+        sched.mark_done(url)
+        sched.close()
+
+        reopened = SQLiteFrontier(db)
+        assert len(reopened) == 0
+        reopened.close()
@@ -150,8 +150,9 @@ def test_suggest_sanitizes_prefixes() -> None:
         raw_html_hash="suggest-rh",
         text_hash="suggest-th",
     )
+    store.refresh_vocabulary()
 
-    assert any("Python" in suggestion for suggestion in store.suggest("pyth"))
+    assert store.suggest("PYTH")[0] == "python"
     assert store.suggest("xyznonexistent") == []
     assert isinstance(store.suggest("test%_string"), list)
     store.close()
@@ -402,3 +403,175 @@ def test_get_recrawl_candidates_limit() -> None:
     candidates = store.get_recrawl_candidates(limit=3)
     assert len(candidates) == 3
     store.close()
+
+
+def _long_text() -> str:
+    return "\n\n".join(
+        f"Paragraph {i} covers subject{i} with enough filler words to count."
+        for i in range(60)
+    )
+
+
+def test_best_passages_from_passage_index() -> None:
+    """The best passage comes from the passage table, not the full text."""
+    store = LocalStore(compression_enabled=True)
+    doc_id = store.add_document(
+        url="https://example.com/long",
+        title="Long",
+        text=_long_text(),
+        raw_html_hash="h",
+        text_hash="t1",
+    )
+    assert doc_id is not None
+
+    passages = store.best_passages([doc_id], "subject42")
+    assert passages[doc_id].startswith("Paragraph 42 ")
+
+    # No matching passage: fall back to the start of the document
+    fallback = store.best_passages([doc_id], "unrelated")
+    assert fallback[doc_id].startswith("Paragraph 0 ")
+    store.close()
+
+
+def test_passages_follow_updates_and_deletes() -> None:
+    store = LocalStore()
+    doc_id = store.add_document(
+        url="https://example.com/p",
+        title="P",
+        text=_long_text(),
+        raw_html_hash="h",
+        text_hash="t1",
+    )
+    assert doc_id is not None
+    store.update_document(
+        "https://example.com/p",
+        text="A completely rewritten page about zebras and their stripes.",
+    )
+    assert "zebras" in store.best_passages([doc_id], "zebras")[doc_id]
+    assert store.best_passages([doc_id], "subject3")[doc_id].startswith("A compl")
+
+    store.delete_document(doc_id)
+    count = store._conn.execute("SELECT COUNT(*) FROM passages_fts").fetchone()[0]
+    assert count == 0
+    assert store.best_passages([doc_id], "zebras") == {}
+    store.close()
+
+
+def test_best_passages_backfills_older_documents() -> None:
+    """Documents indexed before the passage table existed are split lazily."""
+    store = LocalStore()
+    doc_id = store.add_document(
+        url="https://example.com/old",
+        title="Old",
+        text=_long_text(),
+        raw_html_hash="h",
+        text_hash="t1",
+    )
+    assert doc_id is not None
+    store._conn.execute("DELETE FROM passages_fts")
+    store._conn.commit()
+
+    assert store.best_passages([doc_id], "subject7")[doc_id].startswith("Paragraph 7 ")
+    # Now served from the passage index
+    assert store.best_passages([doc_id], "subject8")[doc_id].startswith("Paragraph 8 ")
+    store.close()
+
+
+def test_domain_stats_maintained_incrementally() -> None:
+    """Per-domain counters follow inserts, updates and deletes."""
+    store = LocalStore()
+    ids = [
+        store.add_document(
+            url=f"https://{host}/page{i}",
+            title=f"Page {i}",
+            text=f"Document number {i}",
+            raw_html_hash=f"rh{i}",
+            text_hash=f"th{i}",
+            js_required=i == 0,
+        )
+        for i, host in enumerate(["Docs.Example.com", "docs.example.com", "other.org"])
+    ]
+    assert store.get_domain_count() == 2
+    assert store.get_top_domains() == [("docs.example.com", 2), ("other.org", 1)]
+    assert store.get_js_required_domains() == [("docs.example.com", 1, 2)]
+
+    stats = store.get_domain_stats("docs.example.com")
+    assert stats is not None
+    assert stats.doc_count == 2
+    assert stats.text_bytes == len("Document number 0") + len("Document number 1")
+
+    store.update_document("https://docs.example.com/page1", text="Short")
+    stats = store.get_domain_stats("docs.example.com")
+    assert stats is not None
+    assert stats.text_bytes == len("Document number 0") + len("Short")
+
+    assert ids[2] is not None
+    store.delete_document(ids[2])
+    assert store.get_domain_stats("other.org") is None
+    assert store.get_domain_count() == 1
+    store.close()
+
+
+def test_domain_filter_uses_indexed_column() -> None:
+    """Domain filters match the stored host case-insensitively via its index."""
+    store = LocalStore()
+    for i, host in enumerate(["a.example", "b.example"]):
+        store.add_document(
+            url=f"https://{host}/python",
+            title="Python",
+            text="Python tutorial",
+            raw_html_hash=f"rh{i}",
+            text_hash=f"th{i}",
+        )
+    only_a = store.search("python", include_domains=["A.example"])
+    assert [r.url for r in only_a] == ["https://a.example/python"]
+    not_a = store.search("python", exclude_domains=["a.example"])
+    assert [r.url for r in not_a] == ["https://b.example/python"]
+
+    plan = " ".join(
+        str(row[3])
+        for row in store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM documents WHERE domain = ?",
+            ("a.example",),
+        )
+    )
+    assert "idx_documents_domain" in plan
+    store.close()
+
+
+def test_domain_column_backfilled_on_upgrade(tmp_path) -> None:
+    """Databases created before the domain column get it filled on open."""
+    db = tmp_path / "index.db"
+    store = LocalStore(db_path=db)
+    store.add_document(
+        url="https://old.example/page",
+        title="Old",
+        text="Legacy document",
+        raw_html_hash="rh",
+        text_hash="th",
+    )
+    # Simulate the previous schema
+    store._conn.executescript(
+        """
+        DROP TRIGGER domain_stats_ai;
+        DROP TRIGGER domain_stats_ad;
+        DROP TRIGGER domain_stats_au;
+        DROP TABLE domain_stats;
+        DROP TRIGGER doc_facets_ai;
+        DROP TRIGGER doc_facets_ad;
+        DROP TRIGGER doc_facets_au;
+        DROP TABLE doc_facets;
+        DROP INDEX idx_documents_domain;
+        ALTER TABLE documents DROP COLUMN domain;
+        """
+    )
+    store.close()
+
+    store = LocalStore(db_path=db)
+    doc = store.get_document_by_url("https://old.example/page")
+    assert doc is not None
+    assert doc.domain == "old.example"
+    assert store.get_top_domains() == [("old.example", 1)]
+    assert [r.url for r in store.search("legacy")] == ["https://old.example/page"]
+    assert store.facet_counts("legacy").domains == {"old.example": 1}
+    store.close()
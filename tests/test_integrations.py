@@ -16,6 +16,7 @@ import json
 import pytest_asyncio  # noqa: F401
 
 from infomesh.crawler.url_assigner import UrlAssigner, _xor_distance
+from infomesh.hashing import content_hash
 from infomesh.index.local_store import LocalStore
 from infomesh.p2p.protocol import PeerPointer
 from infomesh.p2p.throttle import BandwidthBucket, BandwidthThrottle
@@ -172,6 +173,45 @@ class TestUrlAssigner:
         assigner.add_peer("peer_B")
         assert assigner.known_peers == 2
 
+    @staticmethod
+    def _brute_force_owner(assigner: UrlAssigner, url: str) -> str:
+        url_hash = content_hash(url)
+        return min(
+            assigner._peers,
+            key=lambda p: _xor_distance(url_hash, assigner._peers[p]),
+        )
+
+    def test_routing_matches_linear_scan(self) -> None:
+        assigner = UrlAssigner("peer_A")
+        for i in range(500):
+            assigner.add_peer(f"peer_{i}")
+        for i in range(0, 500, 3):
+            assigner.remove_peer(f"peer_{i}")
+        urls = [f"https://site{i % 40}.example/page/{i}" for i in range(400)]
+        expected = [self._brute_force_owner(assigner, url) for url in urls]
+        assert assigner.closest_peers(urls) == expected
+        assert [assigner.closest_peer(url) for url in urls] == expected
+        # Peer churn after the table was built is picked up
+        assigner.remove_peer(expected[0])
+        assigner.add_peer("peer_new")
+        assert assigner.closest_peers(urls[:50]) == [
+            self._brute_force_owner(assigner, url) for url in urls[:50]
+        ]
+
+    def test_assign_many_and_filter_use_batch_routing(self) -> None:
+        assigner = UrlAssigner("peer_A")
+        assigner.add_peer("peer_B")
+        assigner.add_peer("peer_C")
+        urls = [f"https://example.com/{i}" for i in range(100)]
+        assignments = assigner.assign_many(urls, depth=1)
+        assert [a.url for a in assignments] == urls
+        assert all(a.depth == 1 for a in assignments)
+        owners = [a.assigner_peer_id for a in assignments]
+        assert owners == [assigner.closest_peer(url) for url in urls]
+        assert assigner.filter_local_urls(urls) == [
+            url for url, owner in zip(urls, owners, strict=True) if owner == "peer_A"
+        ]
+
 
 # ── Distributed search tests ────────────────────────────────────
 
@@ -187,8 +187,8 @@ class TestWebhookRegistrySecurity:
         with (
             patch("httpx.AsyncClient") as mock_client_cls,
             patch(
-                "infomesh.security.validate_url",
-                return_value="https://hooks.example.com/1",
+                "infomesh.security.validate_url_async",
+                AsyncMock(return_value=("93.184.216.34",)),
             ),
         ):
             mock_client = AsyncMock()
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import hashlib
+import sqlite3
 
 import pytest
 
 from infomesh.trust.merkle import (
+    MerkleMountainRange,
     MerkleProof,
     MerkleTree,
     ProofSide,
@@ -443,3 +445,68 @@ class TestPerformMerkleAudit:
         assert result.auditor_peer_id == "aud-X"
         assert result.target_peer_id == "tgt-Y"
         assert result.url == "https://example.com"
+
+
+class TestMerkleMountainRange:
+    @pytest.fixture
+    def conn(self):
+        conn = sqlite3.connect(":memory:")
+        yield conn
+        conn.close()
+
+    def test_empty(self, conn):
+        mmr = MerkleMountainRange(conn)
+        assert mmr.leaf_count == 0
+        assert mmr.root() == ""
+        with pytest.raises(IndexError):
+            mmr.get_proof(0)
+
+    def test_power_of_two_matches_tree(self, conn):
+        hashes = _sample_hashes(16)
+        mmr = MerkleMountainRange(conn)
+        for h in hashes:
+            mmr.append(h)
+        tree = MerkleTree()
+        tree.build(hashes)
+        assert mmr.root() == tree.root_hash
+
+    def test_proofs_for_current_and_earlier_roots(self, conn):
+        hashes = _sample_hashes(37)
+        mmr = MerkleMountainRange(conn)
+        roots = []
+        for h in hashes:
+            mmr.append(h)
+            roots.append(mmr.root())
+        for count in (1, 2, 3, 8, 21, 37):
+            assert mmr.root(count) == roots[count - 1]
+            for i in range(count):
+                proof = mmr.get_proof(i, leaf_count=count)
+                assert proof.root_hash == roots[count - 1]
+                assert MerkleTree.verify_document(hashes[i], proof)
+        proof = mmr.get_proof(5)
+        assert not MerkleTree.verify_document(hashes[6], proof)
+
+    def test_persisted_state_reloads(self, conn):
+        mmr = MerkleMountainRange(conn, table="log_mmr")
+        for h in _sample_hashes(11):
+            mmr.append(h)
+        conn.commit()
+        reopened = MerkleMountainRange(conn, table="log_mmr")
+        assert reopened.leaf_count == 11
+        assert reopened.root() == mmr.root()
+        assert reopened.append("next") == 11
+
+    def test_reload_after_rollback(self, conn):
+        mmr = MerkleMountainRange(conn)
+        mmr.append("a")
+        conn.commit()
+        root = mmr.root()
+        mmr.append("b")
+        conn.rollback()
+        mmr.reload()
+        assert mmr.leaf_count == 1
+        assert mmr.root() == root
+
+    def test_rejects_bad_table_name(self, conn):
+        with pytest.raises(ValueError):
+            MerkleMountainRange(conn, table="nodes; DROP TABLE x")
@@ -0,0 +1,170 @@
+"""Tests for the in-process NumPy vector backend."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from infomesh.index.numpy_vector_store import NumpyVectorStore  # noqa: E402
+from infomesh.index.vector_store import (  # noqa: E402
+    QueryEmbeddingCache,
+    VectorDocument,
+)
+
+
+class _BagOfWordsEmbedder:
+    """Deterministic stand-in for a sentence-transformers model."""
+
+    dim = 64
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def encode(self, texts: list[str], **_: object) -> np.ndarray:
+        self.calls += 1
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().replace(".", " ").split():
+                h = int.from_bytes(hashlib.sha1(word.encode()).digest()[:4], "little")
+                out[i, h % self.dim] += 1.0
+        return out
+
+
+def _store(path: Path | None = None, **kwargs: object) -> NumpyVectorStore:
+    return NumpyVectorStore(
+        path,
+        embedder=_BagOfWordsEmbedder(),
+        query_cache=QueryEmbeddingCache(),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _docs() -> list[VectorDocument]:
+    return [
+        VectorDocument(1, "https://x.test/py", "Python", "python programming code"),
+        VectorDocument(2, "https://x.test/pasta", "Pasta", "boil water cook noodles"),
+        VectorDocument(3, "https://x.test/rust", "Rust", "rust programming memory"),
+    ]
+
+
+@pytest.fixture(params=["float32", "int8"])
+def dtype(request: pytest.FixtureRequest) -> str:
+    return request.param
+
+
+class TestNumpyVectorStore:
+    def test_search_ranks_by_similarity(self, dtype: str) -> None:
+        store = _store(dtype=dtype)
+        store.add_documents(_docs())
+
+        results = store.search("python code", limit=2)
+        assert [r.url for r in results][0] == "https://x.test/py"
+        assert results[0].doc_id == "1"
+        assert results[0].score > results[1].score
+        assert store.get_stats()["document_count"] == 3
+        store.close()
+
+    def test_upsert_and_delete(self) -> None:
+        store = _store()
+        store.add_documents(_docs())
+        store.add_document(2, "https://x.test/pasta", "Python", "python code")
+        store.delete_document(1)
+
+        results = store.search("python code", limit=3)
+        assert results[0].doc_id == "2"
+        assert all(r.doc_id != "1" for r in results)
+        assert store.get_stats()["document_count"] == 2
+
+        # Freed row is reused rather than growing the matrix
+        store.add_document(9, "https://x.test/new", "New", "fresh")
+        assert store._n_rows == 3
+        store.close()
+
+    def test_min_score_and_empty_index(self) -> None:
+        store = _store()
+        assert store.search("anything") == []
+        store.add_documents(_docs())
+        assert store.search("python", min_score=1.1) == []
+        store.close()
+
+    def test_persists_across_reopen(self, tmp_path: Path, dtype: str) -> None:
+        store = _store(tmp_path, dtype=dtype)
+        store.add_documents(_docs())
+        store.delete_document(3)
+        store.close()
+
+        reopened = _store(tmp_path, dtype=dtype)
+        assert reopened.get_stats()["document_count"] == 2
+        assert reopened.search("boil noodles", limit=1)[0].doc_id == "2"
+        reopened.close()
+
+    def test_model_change_resets_index(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        store.add_documents(_docs())
+        store.close()
+
+        other = NumpyVectorStore(
+            tmp_path,
+            model_name="other-model",
+            embedder=_BagOfWordsEmbedder(),
+        )
+        assert other.get_stats()["document_count"] == 0
+        other.close()
+
+    def test_grows_past_initial_capacity(self) -> None:
+        store = _store()
+        store.add_documents(
+            [
+                VectorDocument(i, f"https://x.test/{i}", "t", f"w{i}")
+                for i in range(3000)
+            ]
+        )
+        assert store.get_stats()["document_count"] == 3000
+        assert store.search("w2999", limit=1)[0].doc_id == "2999"
+        store.close()
+
+    def test_repeated_query_skips_model(self) -> None:
+        store = _store()
+        store.add_documents(_docs())
+        embedder = store._embedder
+        calls = embedder.calls  # type: ignore[attr-defined]
+
+        first = store.search("python  code", limit=2)
+        second = store.search(" python code ", limit=2)
+
+        assert first == second
+        assert embedder.calls == calls + 1  # type: ignore[attr-defined]
+        assert store.get_stats()["query_cache_hit_rate"] == 0.5
+        store.close()
+
+
+class TestNumpyVectorStoreLatency:
+    def test_100k_query_is_fast(self) -> None:
+        store = _store()
+        rng = np.random.default_rng(0)
+        dim, n = 384, 100_000
+        matrix = rng.standard_normal((n, dim)).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Load the matrix directly; embedding 100k docs is not under test
+        store._dim = dim
+        store._grow(n)
+        store._matrix[:n] = matrix
+        store._live[:n] = True
+        store._rows = {i: i for i in range(n)}
+        store._n_rows = n
+
+        q = matrix[123]
+        store._top_k(q, 10)  # warm up
+        start = time.perf_counter()
+        for _ in range(5):
+            rows, _ = store._top_k(q, 10)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / 5
+
+        assert rows[0] == 123
+        assert elapsed_ms < 200  # generous bound for shared CI machines
+        store.close()
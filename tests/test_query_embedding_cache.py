@@ -0,0 +1,41 @@
+"""Tests for the shared query-embedding LRU."""
+
+from __future__ import annotations
+
+from infomesh.index.vector_store import QueryEmbeddingCache, shared_query_cache
+
+
+class TestQueryEmbeddingCache:
+    def test_hit_skips_compute(self) -> None:
+        cache = QueryEmbeddingCache()
+        calls: list[str] = []
+
+        def compute(text: str) -> list[float]:
+            calls.append(text)
+            return [1.0, 0.0]
+
+        assert cache.get_or_compute("m", "  hello   world ", compute) == [1.0, 0.0]
+        assert cache.get_or_compute("m", "hello world", compute) == [1.0, 0.0]
+        assert calls == ["hello world"]
+        assert cache.stats.hits == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_keyed_by_model_and_case(self) -> None:
+        cache = QueryEmbeddingCache()
+        cache.get_or_compute("a", "Query", lambda _: [1.0])
+        assert cache.get_or_compute("b", "Query", lambda _: [2.0]) == [2.0]
+        assert cache.get_or_compute("a", "query", lambda _: [3.0]) == [3.0]
+        assert cache.size == 3
+
+    def test_lru_eviction(self) -> None:
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.get_or_compute("m", "a", lambda _: [1.0])
+        cache.get_or_compute("m", "b", lambda _: [2.0])
+        cache.get_or_compute("m", "a", lambda _: [9.0])  # refresh "a"
+        cache.get_or_compute("m", "c", lambda _: [3.0])  # evicts "b"
+
+        assert cache.get_or_compute("m", "a", lambda _: [9.0]) == [1.0]
+        assert cache.get_or_compute("m", "b", lambda _: [4.0]) == [4.0]
+
+    def test_shared_instance(self) -> None:
+        assert shared_query_cache() is shared_query_cache()
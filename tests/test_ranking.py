@@ -17,6 +17,7 @@ from infomesh.index.ranking import (
     RankedResult,
     _RawCandidate,
     combined_score,
+    feedback_score,
     freshness_score,
     normalize_bm25,
     rank_results,
@@ -200,3 +201,22 @@ class TestRankResults:
         assert 0.0 <= r.trust_score <= 1.0
         assert 0.0 <= r.authority_score <= 1.0
         assert 0.0 <= r.combined_score <= 1.0
+
+    def test_feedback_boosts_reorder_ties(self):
+        now = time.time()
+        candidates = [
+            _make_candidate(doc_id="a", url="https://a.com", bm25=5.0, crawled_at=now),
+            _make_candidate(doc_id="b", url="https://b.com", bm25=5.0, crawled_at=now),
+            _make_candidate(doc_id="c", url="https://c.com", bm25=5.0, crawled_at=now),
+        ]
+        boosts = {"https://b.com": 3.0, "https://a.com": -0.3}
+        results = rank_results(candidates, now=now, boosts=boosts)
+        assert [r.doc_id for r in results] == ["b", "c", "a"]
+        assert results[0].feedback_score == pytest.approx(feedback_score(3.0), 1e-5)
+        assert results[1].feedback_score == 0.0
+        assert rank_results(candidates, now=now)[0].feedback_score == 0.0
+
+    def test_feedback_score_is_bounded(self):
+        assert feedback_score(0.0) == 0.0
+        assert 0.99 < feedback_score(30.0) < 1.0
+        assert -1.0 < feedback_score(-30.0) < -0.99
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import hashlib
 import time
+from pathlib import Path
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
 
+from infomesh.crawler.parser import ParsedPage
 from infomesh.crawler.recrawl import (
     INTERVAL_HIGH,
     INTERVAL_LOW,
@@ -15,11 +18,17 @@ from infomesh.crawler.recrawl import (
     INTERVAL_STATIC,
     STALE_THRESHOLD,
     RecrawlCandidate,
+    RecrawlEngine,
+    RecrawlOutcome,
+    RecrawlStats,
     compute_recrawl_interval,
     recrawl_url,
     select_candidates,
     update_change_frequency,
 )
+from infomesh.crawler.scheduler import Scheduler
+from infomesh.index.local_store import LocalStore
+from infomesh.services import index_document
 
 # ── compute_recrawl_interval ────────────────────────────────────────────
 
@@ -346,3 +355,158 @@ class TestRecrawlUrl:
         assert (
             captured_headers.get("if-modified-since") == "Wed, 01 Jan 2025 12:00:00 GMT"
         )
+
+
+# ── RecrawlEngine ───────────────────────────────────────────────────────
+
+_HTML = (
+    "<html><head><title>{title}</title></head><body><article>"
+    "<p>{body}</p></article></body></html>"
+)
+_BODY = "Conditional requests let unchanged pages cost almost nothing. " * 8
+
+
+def _index_page(store: LocalStore, url: str, text: str) -> None:
+    page = ParsedPage(
+        url=url,
+        title="Original",
+        text=text,
+        language="en",
+        raw_html_hash="raw",
+        text_hash=hashlib.sha256(text.encode()).hexdigest(),
+        etag='"v1"',
+        last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+    )
+    index_document(page, store)
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    s = LocalStore(db_path=tmp_path / "index.db")
+    yield s
+    s.close()
+
+
+class TestRecrawlEngine:
+    def test_index_document_persists_validators(self, store: LocalStore) -> None:
+        _index_page(store, "https://a.test/page", _BODY)
+        doc = store.get_document_by_url("https://a.test/page")
+        assert doc is not None
+        assert doc.etag == '"v1"'
+        assert doc.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_not_modified_refreshes_metadata(self, store: LocalStore) -> None:
+        _index_page(store, "https://a.test/page", _BODY)
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(304, headers={"etag": '"v1"'})
+
+        engine = RecrawlEngine(store)
+        now = time.time() + 8 * 24 * 3600
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            outcomes = await engine.run_cycle(c, now=now)
+
+        assert [o.status for o in outcomes] == ["not_modified"]
+        assert seen[0].headers["if-none-match"] == '"v1"'
+        doc = store.get_document_by_url("https://a.test/page")
+        assert doc is not None
+        assert doc.last_recrawl_at == now
+        assert doc.recrawl_interval == INTERVAL_STATIC
+        assert engine.stats.not_modified_304 == 1
+        assert engine.stats.not_modified_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_changed_page_is_reindexed(self, store: LocalStore) -> None:
+        _index_page(store, "https://a.test/page", _BODY)
+        new_body = "A completely rewritten article about freshness. " * 8
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                text=_HTML.format(title="Rewritten", body=new_body),
+                headers={"content-type": "text/html", "etag": '"v2"'},
+            )
+
+        engine = RecrawlEngine(store)
+        now = time.time() + 8 * 24 * 3600
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            outcomes = await engine.run_cycle(c, now=now)
+
+        assert [o.status for o in outcomes] == ["updated"]
+        doc = store.get_document_by_url("https://a.test/page")
+        assert doc is not None
+        assert "rewritten article" in doc.text
+        assert doc.etag == '"v2"'
+        assert doc.change_frequency > 0
+        assert store.search("rewritten")
+
+    @pytest.mark.asyncio
+    async def test_same_domain_requests_are_spaced(self, store: LocalStore) -> None:
+        for i in range(3):
+            _index_page(store, f"https://a.test/p{i}", f"{_BODY} page {i}")
+        times: list[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            times.append(time.monotonic())
+            return httpx.Response(304)
+
+        engine = RecrawlEngine(store, scheduler=Scheduler(politeness_delay=0.1))
+        now = time.time() + 8 * 24 * 3600
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            outcomes = await engine.run_cycle(c, now=now)
+
+        assert len(outcomes) == 3
+        gaps = [b - a for a, b in zip(times, times[1:], strict=False)]
+        assert all(gap >= 0.09 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_deleted_page_drops_vector_entry(self, store: LocalStore) -> None:
+        _index_page(store, "https://a.test/gone", _BODY)
+        store.update_document("https://a.test/gone", stale_count=2)
+        doc = store.get_document_by_url("https://a.test/gone")
+        assert doc is not None
+        vectors = MagicMock()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404)
+
+        engine = RecrawlEngine(store, vector_store=vectors)
+        now = time.time() + 8 * 24 * 3600
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            outcomes = await engine.run_cycle(c, now=now)
+
+        assert [o.status for o in outcomes] == ["deleted"]
+        assert store.get_document_by_url("https://a.test/gone") is None
+        vectors.delete_document.assert_called_once_with(doc.doc_id)
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_makes_no_requests(self, store: LocalStore) -> None:
+        _index_page(store, "https://a.test/page", _BODY)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("should not fetch")
+
+        engine = RecrawlEngine(store)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            assert await engine.run_cycle(c) == []
+
+
+class TestRecrawlStats:
+    def test_bytes_saved_uses_mean_full_response(self) -> None:
+        stats = RecrawlStats()
+        stats.record(
+            RecrawlOutcome(
+                url="u", status="updated", http_status=200, bytes_received=1000
+            )
+        )
+        stats.record(
+            RecrawlOutcome(
+                url="u", status="not_modified", http_status=304, bytes_received=0
+            )
+        )
+        assert stats.bytes_saved == 1000
+        assert stats.not_modified_rate == 0.5
+        assert stats.to_dict()["updated"] == 1
@@ -0,0 +1,152 @@
+"""Tests for the async DNS resolver and IP-pinned transport."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpcore
+import pytest
+
+from infomesh.resolver import (
+    AsyncResolver,
+    DNSResolutionError,
+    PinnedDNSTransport,
+    _PinnedNetworkBackend,
+)
+from infomesh.security import SSRFError, validate_url_async
+
+
+def _addrinfo(*ips: str) -> list[tuple[Any, ...]]:
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0)) for ip in ips]
+
+
+class _FakeLoop:
+    """Stand-in for the running loop's ``getaddrinfo``."""
+
+    def __init__(self, answers: dict[str, list[tuple[Any, ...]]]) -> None:
+        self.answers = answers
+        self.calls: list[str] = []
+
+    async def getaddrinfo(self, host: str, *_: Any, **__: Any) -> Any:
+        self.calls.append(host)
+        await asyncio.sleep(0)
+        if host not in self.answers:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return self.answers[host]
+
+
+def _patch_loop(fake: _FakeLoop) -> None:
+    # pytest-asyncio gives each test a fresh loop, so this does not leak
+    loop = asyncio.get_running_loop()
+    loop.getaddrinfo = fake.getaddrinfo  # type: ignore[method-assign]
+
+
+class TestAsyncResolver:
+    async def test_caches_positive_answers(self) -> None:
+        fake = _FakeLoop({"example.com": _addrinfo("93.184.216.34")})
+        _patch_loop(fake)
+        resolver = AsyncResolver()
+
+        assert await resolver.resolve("example.com") == ("93.184.216.34",)
+        assert await resolver.resolve("EXAMPLE.com") == ("93.184.216.34",)
+        assert fake.calls == ["example.com"]
+        assert resolver.stats.cache_hits == 1
+        assert resolver.stats.hit_rate == 0.5
+
+    async def test_negative_caching(self) -> None:
+        fake = _FakeLoop({})
+        _patch_loop(fake)
+        resolver = AsyncResolver(negative_ttl=60.0)
+
+        for _ in range(3):
+            with pytest.raises(DNSResolutionError):
+                await resolver.resolve("missing.test")
+        assert fake.calls == ["missing.test"]
+        assert resolver.stats.negative_hits == 2
+        assert resolver.stats.failures == 1
+
+    async def test_expired_entries_are_refreshed(self) -> None:
+        fake = _FakeLoop({"example.com": _addrinfo("93.184.216.34")})
+        _patch_loop(fake)
+        resolver = AsyncResolver(ttl=0.0)
+
+        await resolver.resolve("example.com")
+        await resolver.resolve("example.com")
+        assert len(fake.calls) == 2
+
+    async def test_concurrent_lookups_coalesce(self) -> None:
+        fake = _FakeLoop({"example.com": _addrinfo("93.184.216.34")})
+        _patch_loop(fake)
+        resolver = AsyncResolver()
+
+        results = await asyncio.gather(
+            *(resolver.resolve("example.com") for _ in range(10))
+        )
+        assert all(r == ("93.184.216.34",) for r in results)
+        assert fake.calls == ["example.com"]
+        assert resolver.stats.coalesced == 9
+
+    async def test_ip_literal_bypasses_lookup(self) -> None:
+        resolver = AsyncResolver()
+        assert await resolver.resolve("[2606:4700::1111]") == ("2606:4700::1111",)
+        assert resolver.stats.lookups == 0
+
+
+class TestValidateUrlAsync:
+    async def test_public_address_passes(self) -> None:
+        _patch_loop(_FakeLoop({"example.com": _addrinfo("93.184.216.34")}))
+        addresses = await validate_url_async(
+            "https://example.com/page", resolver=AsyncResolver()
+        )
+        assert addresses == ("93.184.216.34",)
+
+    async def test_private_resolution_blocked(self) -> None:
+        _patch_loop(_FakeLoop({"rebind.test": _addrinfo("10.0.0.5")}))
+        with pytest.raises(SSRFError, match="private IP"):
+            await validate_url_async("https://rebind.test/", resolver=AsyncResolver())
+
+    async def test_dns_failure_is_ssrf_error(self) -> None:
+        _patch_loop(_FakeLoop({}))
+        with pytest.raises(SSRFError, match="DNS resolution failed"):
+            await validate_url_async("https://nope.test/", resolver=AsyncResolver())
+
+    async def test_static_checks_still_apply(self) -> None:
+        with pytest.raises(SSRFError):
+            await validate_url_async("ftp://example.com/", resolver=AsyncResolver())
+
+
+class TestPinnedTransport:
+    async def test_connects_to_validated_ip(self) -> None:
+        _patch_loop(_FakeLoop({"example.com": _addrinfo("93.184.216.34")}))
+        inner = AsyncMock(spec=httpcore.AsyncNetworkBackend)
+        backend = _PinnedNetworkBackend(AsyncResolver(), inner)
+
+        await backend.connect_tcp("example.com", 443, timeout=5.0)
+
+        inner.connect_tcp.assert_awaited_once()
+        assert inner.connect_tcp.await_args.args[:2] == ("93.184.216.34", 443)
+
+    async def test_refuses_private_target(self) -> None:
+        _patch_loop(_FakeLoop({"rebind.test": _addrinfo("127.0.0.1")}))
+        inner = AsyncMock(spec=httpcore.AsyncNetworkBackend)
+        backend = _PinnedNetworkBackend(AsyncResolver(), inner)
+
+        with pytest.raises(SSRFError):
+            await backend.connect_tcp("rebind.test", 80)
+        inner.connect_tcp.assert_not_awaited()
+
+    def test_transport_installs_pinned_backend(self) -> None:
+        resolver = AsyncResolver()
+        transport = PinnedDNSTransport(resolver)
+        backend = transport._pool._network_backend  # type: ignore[union-attr]
+        assert isinstance(backend, _PinnedNetworkBackend)
+        assert backend._resolver is resolver
+
+    async def test_worker_validation_does_not_block_loop(self) -> None:
+        """validate_url_async never calls the blocking socket resolver."""
+        _patch_loop(_FakeLoop({"example.com": _addrinfo("93.184.216.34")}))
+        with patch("socket.getaddrinfo", side_effect=AssertionError("blocking")):
+            await validate_url_async("https://example.com/", resolver=AsyncResolver())
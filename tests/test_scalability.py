@@ -5,7 +5,14 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
-from infomesh.scalability import BloomFilter, ConnectionPool, batch_ingest
+import pytest
+
+from infomesh.scalability import (
+    BloomFilter,
+    ConnectionPool,
+    ScalableBloomFilter,
+    batch_ingest,
+)
 
 
 class TestConnectionPool:
@@ -49,6 +56,43 @@ class TestBloomFilter:
         # Not guaranteed to be False (false positives), but likely
         assert isinstance("never_added" in bf, bool)
 
+    def test_round_trip(self) -> None:
+        bf = BloomFilter(capacity=100, fp_rate=0.01)
+        bf.add("https://example.com")
+        restored = BloomFilter.from_dict(bf.to_dict())
+        assert "https://example.com" in restored
+        assert len(restored) == 1
+
+
+class TestScalableBloomFilter:
+    def test_grows_without_false_negatives(self) -> None:
+        sbf = ScalableBloomFilter(initial_capacity=100, fp_rate=0.01)
+        for i in range(1000):
+            sbf.add(f"url_{i}")
+        assert sbf.num_stages > 1
+        assert all(f"url_{i}" in sbf for i in range(1000))
+        assert len(sbf) == 1000
+
+    def test_false_positive_rate_bounded(self) -> None:
+        sbf = ScalableBloomFilter(initial_capacity=500, fp_rate=0.01)
+        for i in range(5000):
+            sbf.add(f"seen_{i}")
+        false_pos = sum(f"unseen_{i}" in sbf for i in range(5000))
+        assert false_pos / 5000 < 0.03
+        assert sbf.estimated_fp_rate < 0.02
+
+    def test_bytes_round_trip(self) -> None:
+        sbf = ScalableBloomFilter(initial_capacity=10)
+        for i in range(50):
+            sbf.add(f"url_{i}")
+        restored = ScalableBloomFilter.from_bytes(sbf.to_bytes())
+        assert restored.num_stages == sbf.num_stages
+        assert all(f"url_{i}" in restored for i in range(50))
+
+    def test_from_bytes_rejects_garbage(self) -> None:
+        with pytest.raises(ValueError):
+            ScalableBloomFilter.from_bytes(b"not msgpack")
+
 
 class TestBatchIngest:
     def test_basic_ingest(self) -> None:
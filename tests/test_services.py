@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -163,6 +164,8 @@ class TestIndexDocument:
             text_hash="def456",
             language="en",
             js_required=False,
+            etag=None,
+            last_modified=None,
         )
 
     def test_indexes_to_fts_and_vector(self) -> None:
@@ -439,6 +442,40 @@ class TestFetchPageAsync:
         assert result.success is False
         assert "blocked" in (result.error or "")
 
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_one_crawl(self) -> None:
+        store = _mock_store(doc=None)
+        worker = _mock_worker()
+        release = asyncio.Event()
+        crawl_result = MagicMock()
+        crawl_result.success = True
+        crawl_result.page = _make_page(text="x" * 100)
+        crawl_result.error = None
+
+        async def slow_crawl(url: str) -> MagicMock:
+            await release.wait()
+            return crawl_result
+
+        worker.crawl_url.side_effect = slow_crawl
+        tasks = [
+            asyncio.create_task(
+                fetch_page_async(
+                    f"https://Example.com/page#{i}",
+                    store=store,
+                    worker=worker,
+                    max_size_bytes=10 * (i + 1),
+                )
+            )
+            for i in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        worker.crawl_url.assert_awaited_once()
+        store.add_document.assert_called_once()
+        assert [len(r.text) for r in results] == [10, 20, 30, 40, 50]
+
 
 # ─── CrawlAndIndexResult ─────────────────────────────────
 
@@ -568,6 +605,42 @@ class TestCrawlAndIndex:
             force=True,
         )
 
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_crawl(self) -> None:
+        worker = _mock_worker()
+        store = _mock_store()
+        release = asyncio.Event()
+        crawl_result = MagicMock()
+        crawl_result.success = True
+        crawl_result.page = _make_page()
+        crawl_result.discovered_links = []
+        crawl_result.elapsed_ms = 1.0
+
+        async def slow_crawl(url: str, **_: object) -> MagicMock:
+            await release.wait()
+            return crawl_result
+
+        worker.crawl_url.side_effect = slow_crawl
+        tasks = [
+            asyncio.create_task(
+                crawl_and_index("https://example.com/a", worker=worker, store=store)
+            )
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        assert all(r.success for r in results)
+
+        # A repeat shortly afterwards is served from the result cache,
+        # while force=True crawls again.
+        await crawl_and_index("https://example.com/a", worker=worker, store=store)
+        assert worker.crawl_url.await_count == 1
+        await crawl_and_index(
+            "https://example.com/a", worker=worker, store=store, force=True
+        )
+        assert worker.crawl_url.await_count == 2
+
     @pytest.mark.asyncio
     async def test_vector_store_indexed(self) -> None:
         worker = _mock_worker()
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
+from infomesh.crawler import simhash as simhash_mod
 from infomesh.crawler.simhash import (
+    SimHashArrayIndex,
     SimHashIndex,
     hamming_distance,
     is_near_duplicate,
@@ -61,6 +67,24 @@ class TestSimHash:
         assert isinstance(fp, int)
 
 
+class TestVectorizedSimHash:
+    """NumPy batch path must match the reference bit loop exactly."""
+
+    @pytest.mark.skipif(not simhash_mod._HAS_NUMPY, reason="numpy not installed")
+    @pytest.mark.parametrize("n_words", [1, 2, 3, 4, 17, 2000])
+    def test_matches_python_reference(self, n_words: int) -> None:
+        words = [f"word{(i * 7919) % 613}" for i in range(n_words)]
+        shingles = simhash_mod._tokenize(" ".join(words))
+        assert simhash_mod._fingerprint_numpy(
+            shingles
+        ) == simhash_mod._fingerprint_python(shingles)
+
+    def test_known_fingerprint_is_stable(self) -> None:
+        """Guard against drift from fingerprints already stored on disk."""
+        text = "The quick brown fox jumps over the lazy dog"
+        assert simhash(text) == 0x8BAC2707D1FBDCCA
+
+
 class TestHammingDistance:
     """Hamming distance computation."""
 
@@ -152,3 +176,72 @@ class TestSimHashIndex:
         idx.add(2, 42)
         matches = idx.find_near_duplicates(42)
         assert sorted(matches) == [1, 2]
+
+
+@pytest.mark.skipif(not simhash_mod._HAS_NUMPY, reason="numpy not installed")
+class TestSimHashArrayIndex:
+    """NumPy/mmap-backed SimHash index."""
+
+    def test_add_and_find_in_memory(self) -> None:
+        idx = SimHashArrayIndex()
+        idx.add(1, 0b1111)
+        idx.add(2, 0xFFFF_0000_0000_0000)
+        assert idx.find_near_duplicates(0b1110, threshold=1) == [1]
+        assert idx.find_near_duplicates(0b0000, threshold=3) == []
+
+    def test_high_bit_fingerprints(self) -> None:
+        idx = SimHashArrayIndex()
+        fp = (1 << 64) - 1
+        idx.add(7, fp)
+        assert idx.find_near_duplicates(fp ^ 0b11) == [7]
+
+    def test_persists_across_reopen(self, tmp_path: Path) -> None:
+        path = tmp_path / "dedup.simhash"
+        idx = SimHashArrayIndex(path, remap_every=2)
+        assert idx.is_new
+        for i in range(5):
+            idx.add(i, 1 << i)
+        idx.close()
+
+        reopened = SimHashArrayIndex(path)
+        assert not reopened.is_new
+        assert reopened.size == 5
+        assert reopened.find_near_duplicates(1 << 3, threshold=0) == [3]
+        reopened.close()
+
+    def test_sync_writes_through_without_remap(self, tmp_path: Path) -> None:
+        path = tmp_path / "dedup.simhash"
+        idx = SimHashArrayIndex(path)
+        idx.add(1, 42)
+        idx.sync()
+        assert (tmp_path / "dedup.simhash.fp").stat().st_size == 8
+        assert SimHashArrayIndex(path).find_near_duplicates(42, threshold=0) == [1]
+        idx.close()
+
+    def test_truncates_torn_append(self, tmp_path: Path) -> None:
+        path = tmp_path / "dedup.simhash"
+        idx = SimHashArrayIndex(path)
+        idx.add(1, 42)
+        idx.close()
+        # Simulate a crash after the fingerprint write but before the id write
+        with open(tmp_path / "dedup.simhash.fp", "ab") as f:
+            f.write((99).to_bytes(8, "little"))
+
+        reopened = SimHashArrayIndex(path)
+        assert reopened.size == 1
+        assert reopened.find_near_duplicates(99, threshold=0) == []
+        reopened.close()
+
+    def test_remove_and_stats(self) -> None:
+        idx = SimHashArrayIndex()
+        idx.add(1, 100)
+        idx.add(2, 100)
+        idx.add(3, 200)
+        idx.remove(2, 100)
+        assert sorted(idx.find_near_duplicates(100, threshold=0)) == [1]
+        assert idx.get_stats() == {"unique_fingerprints": 2, "total_documents": 2}
+
+    def test_add_many(self) -> None:
+        idx = SimHashArrayIndex()
+        idx.add_many([1, 2], [10, 1 << 63])
+        assert idx.find_near_duplicates(1 << 63, threshold=0) == [2]
@@ -0,0 +1,99 @@
+"""Tests for single-flight call coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from infomesh.singleflight import SingleFlight
+
+
+class _Counter:
+    def __init__(self, result: object = "ok", *, fail: bool = False) -> None:
+        self.calls = 0
+        self.result = result
+        self.fail = fail
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.result
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        work = _Counter()
+        tasks = [asyncio.create_task(flight.run("k", work)) for _ in range(10)]
+        await asyncio.sleep(0)
+        work.release.set()
+
+        assert await asyncio.gather(*tasks) == ["ok"] * 10
+        assert work.calls == 1
+        assert flight.stats.coalesced == 9
+        assert flight.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_result_cached_until_ttl(self) -> None:
+        flight: SingleFlight[object] = SingleFlight(ttl=60.0)
+        work = _Counter()
+        work.release.set()
+
+        await flight.run("k", work)
+        await flight.run("k", work)
+        assert work.calls == 1
+        assert flight.stats.cache_hits == 1
+
+        await flight.run("k", work, use_cache=False)
+        assert work.calls == 2
+
+        flight.forget("k")
+        await flight.run("k", work)
+        assert work.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_results_are_not_kept(self) -> None:
+        flight: SingleFlight[object] = SingleFlight(cacheable=lambda r: r != "ok")
+        work = _Counter()
+        work.release.set()
+
+        await flight.run("k", work)
+        await flight.run("k", work)
+        assert work.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_exceptions_reach_all_waiters_and_are_not_cached(self) -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        work = _Counter(fail=True)
+        tasks = [asyncio.create_task(flight.run("k", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        work.release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert work.calls == 1
+
+        work.fail = False
+        assert await flight.run("k", work) == "ok"
+        assert work.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_shared_call(self) -> None:
+        flight: SingleFlight[object] = SingleFlight()
+        work = _Counter()
+        first = asyncio.create_task(flight.run("k", work))
+        second = asyncio.create_task(flight.run("k", work))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        work.release.set()
+
+        assert await second == "ok"
+        assert first.cancelled()
+        assert work.calls == 1
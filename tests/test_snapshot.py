@@ -5,12 +5,15 @@ from __future__ import annotations
 import json
 import struct
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import msgpack
 import pytest
 
 from infomesh.compression.zstd import LEVEL_SNAPSHOT, Compressor
 from infomesh.index.local_store import LocalStore
 from infomesh.index.snapshot import (
+    _FOOTER,
     _MAX_SNAPSHOT_DOCUMENTS,
     _MAX_SNAPSHOT_FILE_BYTES,
     export_snapshot,
@@ -90,8 +93,9 @@ class TestReadMetadata:
         export_snapshot(store, output)
 
         meta = read_snapshot_metadata(output)
-        assert meta["format_version"] == 1
+        assert meta["format_version"] == 2
         assert meta["document_count"] == 3
+        assert meta["chunk_count"] == 1
         assert "created_at" in meta
 
     def test_rejects_too_small_file(self, tmp_path: Path) -> None:
@@ -207,3 +211,85 @@ class TestImportSnapshot:
                 import_snapshot(new_store, snapshot)
         finally:
             new_store.close()
+
+
+class TestChunkedSnapshot:
+    """Streaming, chunked format (version 2)."""
+
+    def _fill(self, store: LocalStore, count: int) -> None:
+        store.add_documents(
+            {
+                "url": f"https://bulk.example/{i}",
+                "title": f"Bulk {i}",
+                "text": f"Bulk document number {i} about streaming snapshots.",
+                "raw_html_hash": f"braw{i}",
+                "text_hash": f"bhash{i}",
+                "language": "en",
+            }
+            for i in range(count)
+        )
+
+    def test_multi_chunk_roundtrip(self, store: LocalStore, tmp_path: Path) -> None:
+        self._fill(store, 250)
+        snapshot = tmp_path / "chunked.infomesh-snapshot"
+        stats = export_snapshot(store, snapshot, chunk_documents=40, workers=3)
+        assert stats.total_documents == 253
+        assert read_snapshot_metadata(snapshot)["chunk_count"] == 7
+        assert not snapshot.with_name(snapshot.name + ".tmp").exists()
+
+        new_store = LocalStore(db_path=tmp_path / "chunked.db")
+        vectors = MagicMock()
+        stats = import_snapshot(new_store, snapshot, vector_store=vectors, workers=3)
+        assert stats.exported == 253
+        assert new_store.get_stats()["document_count"] == 253
+        assert vectors.add_document.call_count == 253
+        # Chunks are applied in file order
+        urls = [d["url"] for d in new_store.iter_documents(batch_size=17)]
+        assert urls == [d["url"] for d in store.iter_documents()]
+        new_store.close()
+
+    def test_corrupt_chunk_rejected(self, store: LocalStore, tmp_path: Path) -> None:
+        snapshot = tmp_path / "corrupt.infomesh-snapshot"
+        export_snapshot(store, snapshot)
+        data = bytearray(snapshot.read_bytes())
+        manifest_offset, _, _ = _FOOTER.unpack(data[-_FOOTER.size :])
+        data[manifest_offset - 5] ^= 0xFF  # inside the last chunk payload
+        snapshot.write_bytes(bytes(data))
+
+        new_store = LocalStore(db_path=tmp_path / "corrupt.db")
+        with pytest.raises(ValueError, match="checksum"):
+            import_snapshot(new_store, snapshot)
+        new_store.close()
+
+    def test_truncated_file_rejected(self, store: LocalStore, tmp_path: Path) -> None:
+        snapshot = tmp_path / "truncated.infomesh-snapshot"
+        export_snapshot(store, snapshot)
+        snapshot.write_bytes(snapshot.read_bytes()[:-10])
+        with pytest.raises(ValueError, match="truncated"):
+            read_snapshot_metadata(snapshot)
+
+    def test_imports_version_1_snapshot(self, tmp_path: Path) -> None:
+        compressor = Compressor(level=LEVEL_SNAPSHOT)
+        docs = [
+            {
+                "url": "https://legacy.example/",
+                "title": "Legacy",
+                "text": "Snapshot written by an older release",
+                "language": "en",
+                "raw_html_hash": "lraw",
+                "text_hash": "lhash",
+                "crawled_at": 0.0,
+            }
+        ]
+        metadata = {"format_version": 1, "created_at": 0, "document_count": 1}
+        header = compressor.compress(json.dumps(metadata).encode("utf-8"))
+        body = compressor.compress(msgpack.packb(docs, use_bin_type=True))
+        snapshot = tmp_path / "v1.infomesh-snapshot"
+        snapshot.write_bytes(struct.pack(">I", len(header)) + header + body)
+
+        assert read_snapshot_metadata(snapshot)["format_version"] == 1
+        new_store = LocalStore(db_path=tmp_path / "v1.db")
+        stats = import_snapshot(new_store, snapshot)
+        assert stats.exported == 1
+        assert new_store.get_document_by_url("https://legacy.example/") is not None
+        new_store.close()
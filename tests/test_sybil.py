@@ -17,6 +17,9 @@ from infomesh.p2p.sybil import (
     compute_pow_hash,
     derive_node_id,
     generate_pow,
+    load_cached_pow,
+    load_or_generate_pow,
+    save_cached_pow,
     verify_pow,
 )
 
@@ -129,6 +132,24 @@ class TestPowGeneration:
         with pytest.raises(RuntimeError, match="no valid nonce found"):
             generate_pow(key, difficulty_bits=32, max_nonce=100)
 
+    def test_serial_finds_smallest_nonce(self) -> None:
+        key = os.urandom(32)
+        pow_result = generate_pow(key, difficulty_bits=8, workers=1)
+        first = next(n for n in range(1 << 16) if verify_pow(key, n, 8))
+        assert pow_result.nonce == first
+        assert pow_result.hash_hex == compute_pow_hash(key, first).hex()
+
+    def test_parallel_workers_find_valid_nonce(self) -> None:
+        key = os.urandom(32)
+        pow_result = generate_pow(key, difficulty_bits=16, workers=2)
+        assert verify_pow(key, pow_result.nonce, difficulty_bits=16)
+        assert pow_result.hash_hex == compute_pow_hash(key, pow_result.nonce).hex()
+
+    def test_parallel_respects_max_nonce(self) -> None:
+        key = os.urandom(32)
+        with pytest.raises(RuntimeError, match="no valid nonce found"):
+            generate_pow(key, difficulty_bits=40, max_nonce=300_000, workers=2)
+
 
 # ─── PoW Verification Tests ────────────────────────────────
 
@@ -425,6 +446,40 @@ class TestPoWCache:
         loaded = InfoMeshNode._load_cached_pow(cache_path, os.urandom(32))
         assert loaded is None
 
+    def test_cache_requires_difficulty(self, tmp_path: object) -> None:
+        """A proof cached at a lower difficulty is not reused."""
+        from pathlib import Path
+
+        cache_path = Path(str(tmp_path)) / "pow_cache.bin"
+        pub_key = os.urandom(32)
+        pow_result = generate_pow(pub_key, difficulty_bits=8, workers=1)
+        save_cached_pow(cache_path, pub_key, pow_result.nonce, 8)
+
+        assert load_cached_pow(cache_path, pub_key, difficulty_bits=8) == (
+            pow_result.nonce
+        )
+        if not verify_pow(pub_key, pow_result.nonce, 12):
+            assert load_cached_pow(cache_path, pub_key, difficulty_bits=12) is None
+
+    def test_load_or_generate_reuses_cache(self, tmp_path: object) -> None:
+        from pathlib import Path
+
+        cache_path = Path(str(tmp_path)) / "keys" / "pow_cache.bin"
+        pub_key = os.urandom(32)
+        first = load_or_generate_pow(pub_key, cache_path, 10, workers=1)
+        assert cache_path.exists()
+        assert not cache_path.with_suffix(".bin.tmp").exists()
+
+        again = load_or_generate_pow(pub_key, cache_path, 10, workers=1)
+        assert again.nonce == first.nonce
+        assert again.hash_hex == first.hash_hex
+        assert again.elapsed_seconds == 0.0
+
+        other_key = os.urandom(32)
+        other = load_or_generate_pow(other_key, cache_path, 10, workers=1)
+        assert verify_pow(other_key, other.nonce, 10)
+        assert load_cached_pow(cache_path, pub_key) is None
+
     def test_cache_corrupt_file(self, tmp_path: object) -> None:
         """Cache returns None for corrupted data."""
         from pathlib import Path
@@ -6,7 +6,11 @@ import pytest
 
 chromadb = pytest.importorskip("chromadb", reason="chromadb not installed")
 
-from infomesh.index.vector_store import VectorSearchResult, VectorStore  # noqa: E402
+from infomesh.index.vector_store import (  # noqa: E402
+    VectorDocument,
+    VectorSearchResult,
+    VectorStore,
+)
 from infomesh.search.merge import merge_results  # noqa: E402
 
 # ---------------------------------------------------------------------------
@@ -69,6 +73,18 @@ class TestVectorStoreWithEmbeddings:
         assert results[0].url == "https://example.com/python"
         assert results[0].score > 0
 
+    def test_add_documents_batch(self, store: VectorStore) -> None:
+        """Bulk add embeds every document in one call."""
+        store.add_documents(
+            [
+                VectorDocument(1, "https://x.com/a", "Rust", "Systems programming"),
+                VectorDocument(2, "https://x.com/b", "Bread", "Baking sourdough"),
+            ]
+        )
+        assert store.get_stats()["document_count"] == 2
+        results = store.search("memory safe language", limit=1)
+        assert results[0].url == "https://x.com/a"
+
     def test_search_empty_collection(self, store: VectorStore) -> None:
         """Search on empty collection returns empty list."""
         results = store.search("anything", limit=5)
@@ -0,0 +1,186 @@
+"""Tests for the term vocabulary (spelling correction and autocomplete)."""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import string
+import threading
+import time
+
+import pytest
+
+from infomesh.index import local_store
+from infomesh.index.local_store import LocalStore
+from infomesh.index.vocabulary import TermVocabulary
+from infomesh.search.nlp import did_you_mean
+
+
+def _vocab() -> TermVocabulary:
+    return TermVocabulary(
+        [
+            ("python", 120),
+            ("pythonic", 8),
+            ("pyramid", 15),
+            ("programming", 60),
+            ("program", 90),
+            ("tutorial", 40),
+            ("go", 70),
+        ]
+    )
+
+
+class TestTermVocabulary:
+    def test_correct_prefers_closest_then_most_frequent(self) -> None:
+        vocab = _vocab()
+        assert vocab.correct("pyhton") == "python"  # transposition
+        assert vocab.correct("programing") == "programming"
+        assert vocab.correct("progrm") == "program"
+        assert vocab.correct("python") == "python"
+        assert vocab.correct("zzzzzz") is None
+
+    def test_short_words_get_smaller_edit_budget(self) -> None:
+        vocab = _vocab()
+        assert vocab.correct("gx") is None
+        assert vocab.correct("tutoral") == "tutorial"
+        assert vocab.correct("tutxrxal") is not None
+        assert vocab.correct("pyxhxn") == "python"
+        assert TermVocabulary([("cat", 5)]).correct("cxx") is None
+
+    def test_complete_orders_by_frequency(self) -> None:
+        vocab = _vocab()
+        assert vocab.complete("py") == ["python", "pyramid", "pythonic"]
+        assert vocab.complete("pyth", limit=1) == ["python"]
+        assert vocab.complete("PROG") == ["program", "programming"]
+        assert vocab.complete("x") == []
+        assert vocab.complete("") == []
+
+    def test_max_terms_keeps_most_frequent(self) -> None:
+        vocab = TermVocabulary([("common", 10), ("rare", 1)], max_terms=1)
+        assert "common" in vocab
+        assert "rare" not in vocab
+        assert vocab.frequency("common") == 10
+
+    def test_lookups_are_fast_on_large_vocabulary(self) -> None:
+        rng = random.Random(7)
+        words = {
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 12)))
+            for _ in range(20_000)
+        }
+        vocab = TermVocabulary((w, rng.randint(1, 1000)) for w in words)
+        queries = [w[:3] + w[4:] for w in sorted(words)[:500]]
+        start = time.perf_counter()
+        for q in queries:
+            assert vocab.correct(q) is not None
+        per_lookup = (time.perf_counter() - start) / len(queries)
+        assert per_lookup < 0.005
+
+    def test_did_you_mean_uses_vocabulary(self) -> None:
+        assert did_you_mean("pyhton tutorial", _vocab()) == ["python tutorial"]
+        assert did_you_mean("python tutorial", _vocab()) == []
+
+
+class TestStoreVocabulary:
+    def _store(self) -> LocalStore:
+        store = LocalStore()
+        for i, (title, text) in enumerate(
+            [
+                ("Python Guide", "Python programming tutorial"),
+                ("Python Asyncio", "Python concurrency with asyncio"),
+                ("Pyramid Framework", "Pyramid web framework"),
+            ]
+        ):
+            store.add_document(
+                url=f"https://example.com/{i}",
+                title=title,
+                text=text,
+                raw_html_hash=f"rh{i}",
+                text_hash=f"th{i}",
+            )
+        store.refresh_vocabulary()
+        return store
+
+    @staticmethod
+    def _settle(store: LocalStore) -> None:
+        """Trigger a due refresh and wait for the background build."""
+        store.vocabulary()
+        if store._vocab_thread is not None:
+            store._vocab_thread.join()
+
+    def test_vocabulary_weighted_by_document_frequency(self) -> None:
+        store = self._store()
+        vocab = store.vocabulary()
+        assert vocab is not None
+        assert vocab.frequency("python") == 2
+        assert vocab.frequency("pyramid") == 1
+        assert store.suggest("py") == ["python", "pyramid"]
+        store.close()
+
+    def test_suggest_keeps_preceding_words(self) -> None:
+        store = self._store()
+        assert store.suggest("learn  python ASY") == ["learn python asyncio"]
+        assert store.suggest("python ") == []
+        store.close()
+
+    def test_vocabulary_tracks_new_and_deleted_documents(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(local_store, "_VOCAB_DEBOUNCE_SECONDS", 0.0)
+        store = self._store()
+        assert store.suggest("rust") == []
+        doc_id = store.add_document(
+            url="https://example.com/rust",
+            title="Rust Book",
+            text="Rust ownership",
+            raw_html_hash="rh-rust",
+            text_hash="th-rust",
+        )
+        self._settle(store)
+        assert store.suggest("rus") == ["rust"]
+        assert doc_id is not None
+        store.delete_document(doc_id)
+        self._settle(store)
+        assert store.suggest("rus") == []
+        store.close()
+
+    def test_query_path_never_rebuilds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(local_store, "_VOCAB_DEBOUNCE_SECONDS", 0.0)
+        store = LocalStore()
+        builders: list[threading.Thread] = []
+        build = store._build_vocabulary
+
+        def _recording_build(conn: sqlite3.Connection) -> TermVocabulary:
+            builders.append(threading.current_thread())
+            return build(conn)
+
+        monkeypatch.setattr(store, "_build_vocabulary", _recording_build)
+        # First use serves an empty snapshot while the build runs elsewhere
+        assert store.suggest("py") == []
+        self._settle(store)
+        store.add_document(
+            url="https://example.com/py",
+            title="Python",
+            text="Python",
+            raw_html_hash="rh",
+            text_hash="th",
+        )
+        # A write is picked up by a background refresh, not inline
+        assert store.suggest("py") == []
+        self._settle(store)
+        assert store.suggest("py") == ["python"]
+        assert len(builders) == 2
+        assert threading.current_thread() not in builders
+        store.close()
+
+    def test_trigram_store_falls_back_to_titles(self) -> None:
+        store = LocalStore(tokenizer="trigram")
+        store.add_document(
+            url="https://example.com/t",
+            title="Python Guide",
+            text="Python programming",
+            raw_html_hash="rh",
+            text_hash="th",
+        )
+        assert store.vocabulary() is None
+        assert store.suggest("pyth") == ["Python Guide"]
+        store.close()